@@ -0,0 +1,105 @@
+import numpy as np
+
+from enums import BasebandMode, CorrelationType
+from fft_utils import get_correlation_nfft, correlate_complex_spectra
+from generalized_correlation import get_gcc_weight
+from multiresolution_search import decimate
+
+
+# Уровень спектральной плотности относительно максимума, задающий границы полосы, дБ
+BAND_LEVEL_DB = -20.
+# Ширина окна сглаживания спектра при оценке полосы, отсчетов БПФ
+BAND_SMOOTHING_BINS = 9
+# Запас частоты дискретизации комплексной огибающей над шириной полосы
+MIN_COMPLEX_OVERSAMPLING = 1.25
+
+
+def get_analytic_signal(values: np.ndarray):
+    """
+    Расчет аналитического сигнала через преобразование Гильберта в частотной области (по последней оси).
+    """
+    n = np.shape(values)[-1]
+    spectrum = np.fft.fft(values, axis=-1)
+    weights = np.zeros(n)
+    weights[0] = 1.
+    if n % 2 == 0:
+        weights[n // 2] = 1.
+        weights[1:n // 2] = 2.
+    else:
+        weights[1:(n + 1) // 2] = 2.
+    return np.fft.ifft(spectrum * weights, axis=-1)
+
+
+def estimate_band_edges(values: np.ndarray, sampling_rate: float):
+    """
+    Оценка границ полосы, в которой сглаженная спектральная плотность сигнала выше порога, Гц.
+    """
+    spectrum = np.abs(np.fft.rfft(values)) ** 2
+    spectrum = np.convolve(spectrum, np.ones(BAND_SMOOTHING_BINS) / BAND_SMOOTHING_BINS, 'same')
+    freqs = np.fft.rfftfreq(len(values), 1. / sampling_rate)
+    if np.max(spectrum) <= 0:
+        return 0., sampling_rate / 2
+    above = np.flatnonzero(spectrum >= np.max(spectrum) * 10 ** (BAND_LEVEL_DB / 10))
+    return freqs[above[0]], freqs[above[-1]]
+
+
+def get_baseband_parameters(reference: np.ndarray, sampling_rate: float, band: tuple = None):
+    """
+    Центральная частота переноса и коэффициент децимации комплексной огибающей.
+    """
+    # Без известной полосы сигнала она оценивается по спектру опорного сигнала
+    if band is None:
+        band = estimate_band_edges(reference, sampling_rate)
+    low_freq, high_freq = band
+    center_freq = 0.5 * (low_freq + high_freq)
+    bandwidth = max(high_freq - low_freq, sampling_rate / len(reference))
+    factor = int(sampling_rate // (MIN_COMPLEX_OVERSAMPLING * bandwidth))
+    return center_freq, max(factor, 1)
+
+
+def to_baseband(values: np.ndarray, times: np.ndarray, baseband_mode: BasebandMode,
+                center_freq: float, factor: int):
+    """
+    Перенос сигнала на нулевую частоту с фильтрацией и децимацией.
+    """
+    if baseband_mode == BasebandMode.ANALYTIC:
+        signal = get_analytic_signal(values)
+    elif baseband_mode == BasebandMode.IQ:
+        signal = np.asarray(values, dtype=float)
+    else:
+        raise ValueError(f"Неизвестный режим комплексной огибающей: {baseband_mode}")
+
+    # Квадратурное преобразование частоты; зеркальная составляющая подавляется фильтром децимации
+    baseband = signal * np.exp(-2j * np.pi * center_freq * times)
+    return decimate(baseband, factor)
+
+
+def get_baseband_correlation(modulated: list, researched: list,
+                             baseband_mode: BasebandMode = BasebandMode.ANALYTIC,
+                             correlation_type: CorrelationType = CorrelationType.CC, band: tuple = None):
+    """
+    Модуль взаимной корреляционной функции комплексных огибающих на пониженной частоте дискретизации.
+    """
+    if not modulated or not researched:
+        return
+
+    reference = np.asarray(modulated[1], dtype=float)
+    research = np.asarray(researched[1], dtype=float)
+    if len(research) < len(reference) or len(reference) < 2:
+        return
+
+    sampling_rate = 1. / (researched[0][1] - researched[0][0])
+    center_freq, factor = get_baseband_parameters(reference, sampling_rate, band)
+    reference_bb = to_baseband(reference, np.asarray(modulated[0]), baseband_mode, center_freq, factor)
+    research_bb = to_baseband(research, np.asarray(researched[0]), baseband_mode, center_freq, factor)
+
+    lags = len(research_bb) - len(reference_bb) + 1
+    nfft = get_correlation_nfft(len(research_bb), len(reference_bb))
+    research_spectrum = np.fft.fft(research_bb, nfft)
+    reference_spectrum = np.fft.fft(reference_bb, nfft)
+    weight = get_gcc_weight(correlation_type, research_spectrum, reference_spectrum)
+    correlation = correlate_complex_spectra(research_spectrum, reference_spectrum * weight, nfft, lags)
+
+    y = np.abs(correlation).tolist()
+    x = researched[0][::factor][:len(y)]
+    return x, y
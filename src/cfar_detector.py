@@ -0,0 +1,218 @@
+from collections import namedtuple
+
+import numpy as np
+
+from baseband import get_analytic_signal
+from enums import CfarType
+from fft_utils import next_fast_len
+from kernels import get_kernel
+
+
+# Защитные и обучающие ячейки с каждой стороны от проверяемой, в длительностях бита
+CFAR_GUARD_BITS = 1.
+CFAR_TRAINING_BITS = 4.
+# Расчетная вероятность ложной тревоги в ячейке
+CFAR_FALSE_ALARM = 1e-4
+# Ранг порядковой статистики OS-CFAR (доля от количества обучающих ячеек)
+CFAR_OS_RANK = 0.75
+# Количество пиков, возвращаемых детектором
+CFAR_PEAKS_COUNT = 4
+# Максимальное количество значений обучающих ячеек, сортируемых OS-CFAR за один проход
+CFAR_OS_CHUNK_SIZE = 1 << 22
+
+# Пики корреляционной функции: задержки (мс), амплитуды, пороги и признаки обнаружения
+CfarPeaks = namedtuple("CfarPeaks", ["delays", "amplitudes", "thresholds", "detected"])
+
+
+def get_ca_factor(training_count: int, false_alarm: float):
+    """
+    Множитель порога CA-CFAR для квадрата огибающей (экспоненциальное распределение шума).
+    """
+    return training_count * (false_alarm ** (-1. / training_count) - 1.)
+
+
+def get_os_factor(training_count: int, rank: int, false_alarm: float):
+    """
+    Множитель порога OS-CFAR: решение уравнения prod((N - i) / (N - i + a)) = Pfa методом бисекции.
+    """
+    indices = np.arange(rank)
+    log_false_alarm = np.log(false_alarm)
+
+    def log_probability(factor):
+        return np.sum(np.log(training_count - indices) - np.log(training_count - indices + factor))
+
+    low, high = 0., 1.
+    while log_probability(high) > log_false_alarm:
+        high *= 2.
+    for _ in range(100):
+        middle = (low + high) / 2.
+        if log_probability(middle) > log_false_alarm:
+            low = middle
+        else:
+            high = middle
+    return high
+
+
+def get_envelope(values: np.ndarray):
+    """
+    Огибающая сигнала (по последней оси); дополнение нулями исключает циклическое наложение краев.
+    """
+    samples_count = values.shape[-1]
+    pad_width = [(0, 0)] * (values.ndim - 1) + [(0, next_fast_len(2 * samples_count) - samples_count)]
+    return np.abs(get_analytic_signal(np.pad(values, pad_width))[..., :samples_count])
+
+
+def get_cfar_threshold(power: np.ndarray, guard_cells: int, training_cells: int,
+                       cfar_type: CfarType = CfarType.CA, false_alarm: float = CFAR_FALSE_ALARM):
+    """
+    Порог CFAR для каждой ячейки (по последней оси, с поддержкой пакетов).
+
+    Обучающие ячейки берутся с обеих сторон от проверяемой за защитными; на краях сигнал отражается.
+    Оценка шума CA-CFAR рассчитывается скользящими суммами за O(N).
+    """
+    power = np.asarray(power, dtype=float)
+    samples_count = power.shape[-1]
+    margin = guard_cells + training_cells
+    pad_width = [(0, 0)] * (power.ndim - 1) + [(margin, margin)]
+    padded = np.pad(power, pad_width, mode="reflect" if samples_count > margin else "edge")
+    training_count = 2 * training_cells
+
+    if cfar_type == CfarType.CA:
+        cumulative = np.concatenate((np.zeros(power.shape[:-1] + (1,)), np.cumsum(padded, axis=-1)), axis=-1)
+        # Сумма окна длины training_cells, начинающегося с отсчета start (в дополненном сигнале)
+        def window_sum(start):
+            return cumulative[..., start + training_cells:start + training_cells + samples_count] - \
+                cumulative[..., start:start + samples_count]
+        noise = (window_sum(0) + window_sum(margin + guard_cells + 1)) / training_count
+        return get_ca_factor(training_count, false_alarm) * noise
+
+    # OS-CFAR: порядковая статистика обучающих ячеек (по частям, чтобы ограничить объем памяти)
+    rank = max(int(round(CFAR_OS_RANK * training_count)), 1)
+    factor = get_os_factor(training_count, rank, false_alarm)
+    kernel = get_kernel("os_noise")
+    if kernel is not None:
+        rows = np.ascontiguousarray(padded.reshape(-1, padded.shape[-1]))
+        return factor * kernel(rows, samples_count, guard_cells, training_cells, rank).reshape(power.shape)
+
+    windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * margin + 1, axis=-1)
+    chunk_len = max(CFAR_OS_CHUNK_SIZE // (training_count * max(power.size // samples_count, 1)), 1)
+    noise = np.empty(power.shape)
+    for start in range(0, samples_count, chunk_len):
+        chunk = windows[..., start:start + chunk_len, :]
+        training = np.concatenate((chunk[..., :training_cells], chunk[..., -training_cells:]), axis=-1)
+        noise[..., start:start + chunk_len] = np.partition(training, rank - 1, axis=-1)[..., rank - 1]
+    return factor * noise
+
+
+def find_cfar_peaks(values: np.ndarray, guard_cells: int, training_cells: int,
+                    cfar_type: CfarType = CfarType.CA, peaks_count: int = CFAR_PEAKS_COUNT,
+                    false_alarm: float = CFAR_FALSE_ALARM, envelope: bool = True):
+    """
+    Наибольшие пики корреляционной функции (по последней оси, с поддержкой пакетов испытаний).
+
+    Возвращает индексы, амплитуды огибающей, пороги и признаки превышения порога (форма (..., peaks_count));
+    пики отделены друг от друга не менее чем на guard_cells отсчетов.
+    """
+    values = np.asarray(values, dtype=float)
+    amplitude = get_envelope(values) if envelope else np.abs(values)
+    power = amplitude ** 2
+    threshold = get_cfar_threshold(power, guard_cells, training_cells, cfar_type, false_alarm)
+
+    # Последовательный выбор максимумов с исключением окрестности уже выбранных пиков
+    samples_count = values.shape[-1]
+    peaks_count = min(peaks_count, samples_count)
+    kernel = get_kernel("select_peaks")
+    if kernel is not None:
+        rows = np.ascontiguousarray(power.reshape(-1, samples_count))
+        indices = kernel(rows, guard_cells, peaks_count).reshape(power.shape[:-1] + (peaks_count,))
+    else:
+        positions = np.arange(samples_count)
+        remaining = power.copy()
+        indices = []
+        for _ in range(peaks_count):
+            index = np.argmax(remaining, axis=-1)
+            indices.append(index)
+            remaining[np.abs(positions - index[..., None]) <= guard_cells] = -np.inf
+        indices = np.stack(indices, axis=-1)
+
+    peak_power = np.take_along_axis(power, indices, axis=-1)
+    peak_threshold = np.take_along_axis(threshold, indices, axis=-1)
+    return indices, np.sqrt(peak_power), np.sqrt(peak_threshold), peak_power > peak_threshold
+
+
+def detect_correlation_peaks(correlation: list, bit_time: float, cfar_type: CfarType = CfarType.CA,
+                             peaks_count: int = CFAR_PEAKS_COUNT, false_alarm: float = CFAR_FALSE_ALARM,
+                             envelope: bool = True):
+    """
+    Обнаружение прихода опорного сигнала по корреляционной функции [x, y] (x - в секундах).
+
+    Размеры окон CFAR задаются в длительностях бита; задержки возвращаются в мс.
+    """
+    if not correlation or len(correlation[0]) < 2:
+        return
+
+    times = np.asarray(correlation[0])
+    bit_samples = bit_time / (times[1] - times[0])
+    guard_cells = max(int(round(CFAR_GUARD_BITS * bit_samples)), 1)
+    training_cells = max(int(round(CFAR_TRAINING_BITS * bit_samples)), 1)
+    indices, amplitudes, thresholds, detected = find_cfar_peaks(correlation[1], guard_cells, training_cells,
+                                                                cfar_type, peaks_count, false_alarm, envelope)
+    return CfarPeaks(times[indices] * 1000, amplitudes, thresholds, detected)
+
+
+class DetectionCounts:
+    """
+    Накопление исходов обнаружения по испытаниям: обнаруженные приходы сигнала и ложные тревоги
+    """
+    def __init__(self):
+        self.trials_count = 0
+        self.arrivals_count = 0
+        self.detected_count = 0
+        self.false_alarm_trials = 0
+        self.false_alarms_count = 0
+
+    def add(self, peaks: CfarPeaks, arrival_delays: list, tolerance: float):
+        """
+        Учет испытаний (пики могут быть пакетом испытаний): приход считается обнаруженным, если порог превышен
+        пиком в пределах tolerance (мс) от него; остальные превысившие порог пики - ложные тревоги.
+        """
+        peaks_count = np.shape(peaks.delays)[-1]
+        arrivals = np.asarray(arrival_delays, dtype=float)
+        for delays, detected in zip(np.reshape(peaks.delays, (-1, peaks_count)),
+                                    np.reshape(peaks.detected, (-1, peaks_count))):
+            matches = np.abs(delays[detected][:, None] - arrivals[None, :]) <= tolerance
+
+            false_alarms = int(np.sum(~matches.any(axis=1)))
+            self.trials_count += 1
+            self.arrivals_count += len(arrivals)
+            self.detected_count += int(np.sum(matches.any(axis=0)))
+            self.false_alarms_count += false_alarms
+            self.false_alarm_trials += int(false_alarms > 0)
+
+    def get_summary(self):
+        """
+        Вероятность обнаружения прихода, вероятность ложной тревоги в испытании и среднее число ложных тревог.
+        """
+        if not self.trials_count:
+            return None
+        return {
+            "pd": self.detected_count / self.arrivals_count if self.arrivals_count else None,
+            "pfa": self.false_alarm_trials / self.trials_count,
+            "false_alarms": self.false_alarms_count / self.trials_count,
+        }
+
+    def to_dict(self):
+        """
+        Представление для сохранения в кэше результатов.
+        """
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Восстановление из представления, сохраненного в кэше результатов.
+        """
+        counts = cls()
+        for name, value in data.items():
+            setattr(counts, name, value)
+        return counts
@@ -0,0 +1,174 @@
+import re
+from fractions import Fraction
+
+import numpy as np
+
+from enums import NoiseType
+from fft_utils import next_fast_len
+
+
+# Максимальный знаменатель рационального приближения коэффициента растяжения времени
+DOPPLER_MAX_DENOMINATOR = 1000
+# Количество отсчетов входного сигнала в каждую сторону, участвующих в интерполяции
+DOPPLER_FILTER_HALF_TAPS = 8
+# Параметр окна Кайзера интерполирующего фильтра
+DOPPLER_KAISER_BETA = 8.
+# Показатель степени спектральной плотности окрашенного шума (1 / f ** показатель)
+COLORED_NOISE_EXPONENT = 1.
+# Вероятность и относительная амплитуда импульсов импульсного шума
+IMPULSE_PROBABILITY = 0.01
+IMPULSE_AMPLITUDE_RATIO = 10.
+
+
+class ChannelModel:
+    """
+    Модель канала распространения между вставкой опорного сигнала и добавлением шума:
+    многолучевость, доплеровское растяжение времени и вид шума
+    """
+    def __init__(self, paths: list = None, doppler_shift: float = 0., noise_type: NoiseType = NoiseType.WHITE):
+        # Дополнительные лучи (задержка относительно прямого луча, мс; усиление), прямой луч имеет усиление 1
+        self.paths = list(paths) if paths else []
+        # Доплеровский сдвиг несущей, Гц
+        self.doppler_shift = float(doppler_shift)
+        self.noise_type = noise_type
+
+        # Таблицы коэффициентов полифазного фильтра для каждой пары (интерполяция, децимация)
+        self._doppler_filters = {}
+
+    @staticmethod
+    def parse_paths(text: str):
+        """
+        Разбор лучей из строки вида "задержка:усиление; задержка:усиление" (задержка в мс).
+
+        Лучи разделяются точкой с запятой или запятой с пробелом; в числах допускается десятичная запятая.
+        """
+        paths = []
+        for item in re.split(r";|,\s+", text):
+            if not item.strip():
+                continue
+            values = item.split(":")
+            if len(values) != 2:
+                raise ValueError(f"Луч должен задаваться как задержка:усиление, получено: {item.strip()}")
+            delay, gain = (float(value.replace(",", ".")) for value in values)
+            if delay < 0:
+                raise ValueError("Задержка луча не может быть отрицательной")
+            paths.append((delay, gain))
+        return paths
+
+    def get_parameters(self):
+        """
+        Параметры канала для ключей кэша результатов исследования.
+        """
+        return {
+            "paths": [list(path) for path in self.paths],
+            "doppler_shift": self.doppler_shift,
+            "noise_type": self.noise_type.name,
+        }
+
+    def get_arrival_delays(self, time_delay: float, signal_freq: float):
+        """
+        Задержки (мс) приходов опорного сигнала по всем лучам с учетом растяжения времени.
+        """
+        scale = 1. + self.doppler_shift / signal_freq
+        return [(time_delay + delay) / scale for delay in [0.] + [delay for delay, _ in self.paths]]
+
+    def is_transparent(self):
+        """
+        Канал не искажает сигнал (шум при этом может быть не белым).
+        """
+        return not self.paths and self.doppler_shift == 0.
+
+    def get_taps(self, sampling_rate: float):
+        """
+        Импульсная характеристика многолучевого канала на частоте дискретизации.
+        """
+        delays = [int(round(delay * sampling_rate / 1000)) for delay, _ in self.paths]
+        taps = np.zeros(max(delays, default=0) + 1)
+        taps[0] = 1.
+        for delay, (_, gain) in zip(delays, self.paths):
+            taps[delay] += gain
+        return taps
+
+    def _apply_multipath(self, signals: np.ndarray, sampling_rate: float):
+        """
+        Свертка сигналов с импульсной характеристикой канала через БПФ (длина сигналов сохраняется).
+        """
+        taps = self.get_taps(sampling_rate)
+        samples_count = signals.shape[-1]
+        nfft = next_fast_len(samples_count + len(taps) - 1)
+        spectra = np.fft.rfft(signals, nfft, axis=-1) * np.fft.rfft(taps, nfft)
+        return np.fft.irfft(spectra, nfft, axis=-1)[..., :samples_count]
+
+    def _get_doppler_filter(self, up: int, down: int):
+        """
+        Коэффициенты полифазного интерполирующего фильтра (оконный sinc): строка - фаза, столбец - отсчет.
+        """
+        coefficients = self._doppler_filters.get((up, down))
+        if coefficients is None:
+            offsets = np.arange(-DOPPLER_FILTER_HALF_TAPS + 1, DOPPLER_FILTER_HALF_TAPS + 1)
+            # Смещение отсчета фильтра на повышенной частоте дискретизации для каждой фазы и отсчета
+            positions = np.arange(up)[:, None] - offsets[None, :] * up
+            factor = max(up, down)
+            window_position = np.clip(positions / (DOPPLER_FILTER_HALF_TAPS * factor), -1., 1.)
+            window = np.i0(DOPPLER_KAISER_BETA * np.sqrt(1. - window_position ** 2)) / np.i0(DOPPLER_KAISER_BETA)
+            coefficients = np.sinc(positions / factor) * window
+            # Единичный коэффициент передачи на нулевой частоте для каждой фазы
+            coefficients /= np.sum(coefficients, axis=1, keepdims=True)
+            self._doppler_filters[(up, down)] = coefficients
+        return coefficients
+
+    def _apply_doppler(self, signals: np.ndarray, signal_freq: float):
+        """
+        Растяжение (сжатие) времени с коэффициентом 1 + сдвиг / несущая полифазной передискретизацией.
+        """
+        if abs(self.doppler_shift) >= signal_freq:
+            raise ValueError("Доплеровский сдвиг должен быть меньше несущей частоты")
+        scale = Fraction(1. + self.doppler_shift / signal_freq).limit_denominator(DOPPLER_MAX_DENOMINATOR)
+        down, up = scale.numerator, scale.denominator
+        if up == down:
+            return signals
+
+        # Отсчет k выходного сигнала - значение входного в момент k * down / up
+        coefficients = self._get_doppler_filter(up, down)
+        samples_count = signals.shape[-1]
+        positions = np.arange(samples_count) * down
+        bases, phases = positions // up, positions % up
+
+        # Дополнение нулями для отсчетов за пределами сигнала (отсчеты после его конца - нулевые)
+        half = DOPPLER_FILTER_HALF_TAPS
+        padded = np.zeros(signals.shape[:-1] + (samples_count + 3 * half,))
+        padded[..., half:half + samples_count] = signals
+        bases = np.minimum(bases, samples_count + half - 1)
+
+        result = np.zeros(signals.shape)
+        for column, offset in enumerate(range(-half + 1, half + 1)):
+            result += coefficients[phases, column] * padded[..., bases + offset + half]
+        return result
+
+    def apply(self, signals: np.ndarray, sampling_rate: float, signal_freq: float):
+        """
+        Прохождение пакета сигналов (испытания x отсчеты) через канал.
+        """
+        signals = np.asarray(signals, dtype=float)
+        if self.paths:
+            signals = self._apply_multipath(signals, sampling_rate)
+        if self.doppler_shift != 0.:
+            signals = self._apply_doppler(signals, signal_freq)
+        return signals
+
+    def shape_noise(self, noise: np.ndarray, rng: np.random.Generator):
+        """
+        Преобразование белого шума в шум канала (по последней оси); мощность нормируется при добавлении шума.
+        """
+        if self.noise_type == NoiseType.COLORED:
+            spectrum = np.fft.rfft(noise, axis=-1)
+            frequencies = np.arange(spectrum.shape[-1])
+            spectrum[..., 0] = 0.
+            spectrum[..., 1:] /= frequencies[1:] ** (COLORED_NOISE_EXPONENT / 2)
+            return np.fft.irfft(spectrum, noise.shape[-1], axis=-1)
+        if self.noise_type == NoiseType.IMPULSIVE:
+            # Модель Бернулли-Гаусса: редкие импульсы поверх фонового шума
+            impulses = rng.random(noise.shape) < IMPULSE_PROBABILITY
+            amplitude = IMPULSE_AMPLITUDE_RATIO * np.std(noise, axis=-1, keepdims=True)
+            return noise + impulses * amplitude * rng.standard_normal(noise.shape)
+        return noise
@@ -0,0 +1,195 @@
+from functools import lru_cache
+
+import numpy as np
+
+from enums import BitsSourceType
+
+
+# Примитивные полиномы над GF(2): степень -> показатели младших членов полинома x^n + ... + 1
+PRIMITIVE_POLYNOMIALS = {
+    2: (1, 0),
+    3: (1, 0),
+    4: (1, 0),
+    5: (2, 0),
+    6: (1, 0),
+    7: (1, 0),
+    8: (4, 3, 2, 0),
+    9: (4, 0),
+    10: (3, 0),
+    11: (2, 0),
+    12: (6, 4, 1, 0),
+    13: (4, 3, 1, 0),
+    14: (5, 3, 1, 0),
+    15: (1, 0),
+    16: (5, 3, 2, 0),
+}
+
+# Предпочтительные пары полиномов для построения кодов Голда
+GOLD_PREFERRED_PAIRS = {
+    5: ((2, 0), (4, 3, 2, 0)),
+    6: ((1, 0), (5, 2, 1, 0)),
+    7: ((3, 0), (3, 2, 1, 0)),
+    9: ((4, 0), (6, 4, 3, 0)),
+    10: ((3, 0), (8, 3, 2, 0)),
+    11: ((2, 0), (8, 5, 2, 0)),
+}
+
+# Коды Баркера (в биполярной форме)
+BARKER_CODES = {
+    2: (1, -1),
+    3: (1, 1, -1),
+    4: (1, 1, -1, 1),
+    5: (1, 1, 1, -1, 1),
+    7: (1, 1, 1, -1, -1, 1, -1),
+    11: (1, 1, 1, -1, -1, -1, 1, -1, -1, 1, -1),
+    13: (1, 1, 1, 1, 1, -1, -1, 1, 1, -1, 1, -1, 1),
+}
+
+
+@lru_cache(maxsize=None)
+def _lfsr_tables(degree: int, taps: tuple):
+    """
+    Построение байтовых таблиц перехода РСЛОС сразу на degree тактов.
+    """
+    # Образы базисных состояний после degree тактов (столбцы матрицы перехода)
+    columns = []
+    for j in range(degree):
+        state = [0] * degree
+        state[j] = 1
+        for _ in range(degree):
+            feedback = 0
+            for tap in taps:
+                feedback ^= state[tap]
+            state = state[1:] + [feedback]
+        columns.append(sum(bit << i for i, bit in enumerate(state)))
+
+    # Таблицы для каждого байта состояния
+    tables = []
+    for offset in range(0, degree, 8):
+        table = []
+        for value in range(256):
+            acc = 0
+            for bit in range(8):
+                if (value >> bit) & 1 and offset + bit < degree:
+                    acc ^= columns[offset + bit]
+            table.append(acc)
+        tables.append(table)
+    return tables
+
+
+def _run_lfsr(degree: int, taps: tuple, length: int):
+    """
+    Табличная генерация выхода РСЛОС заданной длины из единичного начального состояния.
+    """
+    tables = _lfsr_tables(degree, taps)
+    blocks_count = -(-length // degree)
+    states = np.empty(blocks_count, dtype=np.int64)
+    state = 1
+    for i in range(blocks_count):
+        states[i] = state
+        next_state = 0
+        for byte_idx, table in enumerate(tables):
+            next_state ^= table[(state >> (8 * byte_idx)) & 0xFF]
+        state = next_state
+
+    # За degree тактов на выход последовательно выдвигаются биты текущего состояния
+    bits = (states[:, None] >> np.arange(degree)) & 1
+    return bits.reshape(-1)[:length].astype(np.uint8)
+
+
+@lru_cache(maxsize=None)
+def m_sequence(degree: int, taps: tuple = None):
+    """
+    Получить M-последовательность (максимальной длины) периода 2^degree - 1.
+    """
+    if taps is None:
+        taps = PRIMITIVE_POLYNOMIALS[degree]
+    sequence = _run_lfsr(degree, taps, 2 ** degree - 1)
+    sequence.setflags(write=False)
+    return sequence
+
+
+@lru_cache(maxsize=None)
+def gold_sequence(degree: int, index: int = 0):
+    """
+    Получить код Голда с номером index из семейства периода 2^degree - 1.
+    """
+    first_taps, second_taps = GOLD_PREFERRED_PAIRS[degree]
+    first = m_sequence(degree, first_taps)
+    second = m_sequence(degree, second_taps)
+    index = index % (len(first) + 2)
+    if index == 0:
+        sequence = first.copy()
+    elif index == 1:
+        sequence = second.copy()
+    else:
+        sequence = first ^ np.roll(second, -(index - 2))
+    sequence.setflags(write=False)
+    return sequence
+
+
+@lru_cache(maxsize=None)
+def barker_sequence(length: int):
+    """
+    Получить код Баркера длины length (длины больше 13 - вложенный код из кодов длины 13).
+    """
+    if length in BARKER_CODES:
+        code = np.array(BARKER_CODES[length])
+    else:
+        # Вложенный код Баркера: кронекерово произведение кодов длины 13
+        base = np.array(BARKER_CODES[max(BARKER_CODES)])
+        code = base
+        while len(code) < length:
+            code = np.kron(code, base)
+        if len(code) != length:
+            raise ValueError(f"Нет кода Баркера длины {length}")
+
+    sequence = (code > 0).astype(np.uint8)
+    sequence.setflags(write=False)
+    return sequence
+
+
+def get_code_lengths(bits_source: BitsSourceType, max_length: int):
+    """
+    Допустимые длины (периоды) кодовых последовательностей, не превышающие max_length, по возрастанию.
+    """
+    if bits_source == BitsSourceType.M_SEQUENCE:
+        lengths = [2 ** degree - 1 for degree in PRIMITIVE_POLYNOMIALS]
+    elif bits_source == BitsSourceType.GOLD:
+        lengths = [2 ** degree - 1 for degree in GOLD_PREFERRED_PAIRS]
+    elif bits_source == BitsSourceType.BARKER:
+        lengths = list(BARKER_CODES)
+        nested_len = max(BARKER_CODES) ** 2
+        while nested_len <= max_length:
+            lengths.append(nested_len)
+            nested_len *= max(BARKER_CODES)
+    else:
+        return []
+    return sorted(length for length in lengths if length <= max_length)
+
+
+def get_code_sequence(bits_source: BitsSourceType, bits_count: int, index: int = 0):
+    """
+    Получить кодовую последовательность длины bits_count в виде списка бит.
+
+    Последовательность составляется из целого числа периодов самого длинного подходящего кода:
+    усеченный код теряет свойства авто- и взаимной корреляции. Если bits_count не кратно
+    ни одной длине кода, выдается ValueError.
+    """
+    bits_count = int(bits_count)
+    if bits_source == BitsSourceType.RANDOM:
+        return None
+
+    lengths = get_code_lengths(bits_source, bits_count)
+    code_len = next((length for length in reversed(lengths) if bits_count % length == 0), None)
+    if code_len is None:
+        raise ValueError(f"Количество бит {bits_count} должно быть кратно длине кода {bits_source.name}: "
+                         f"{', '.join(map(str, get_code_lengths(bits_source, 2 * bits_count)))}")
+
+    if bits_source == BitsSourceType.M_SEQUENCE:
+        sequence = m_sequence(code_len.bit_length())
+    elif bits_source == BitsSourceType.GOLD:
+        sequence = gold_sequence(code_len.bit_length(), index)
+    else:
+        sequence = barker_sequence(code_len)
+    return np.tile(sequence, bits_count // code_len).tolist()
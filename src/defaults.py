@@ -1,11 +1,17 @@
+import os
+
+
 # Параметры бокового меню
 MIN_WIDTH = 0
 MAX_WIDTH = 200
 DURATION_SIDE_MENU = 600
 DURATION_MAXIMIZED = 400
-OPEN_MENU_ICON = "../icons/side_menu.png"
-HIDE_MENU_ICON = "../icons/back_menu.png"
-START_PICTURE = "../icons/unn_logo_ru.png"
+OPEN_MENU_ICON = ":/icons/side_menu.png"
+HIDE_MENU_ICON = ":/icons/back_menu.png"
+START_PICTURE = ":/icons/unn_logo_ru.png"
+
+# Задержка автоматической перерисовки после изменения параметров, мс
+REDRAW_DEBOUNCE_INTERVAL = 300
 
 # Параметры задачи
 DEFAULT_SAMPLING_RATE = "8000"
@@ -15,3 +21,36 @@ DEFAULT_BITS_PER_SECOND = "20"
 DEFAULT_TIME_DELAY = "20"
 DEFAULT_SNR = "100"
 DEFAULT_AVERAGE_COUNT = "500"
+
+# Параметры канала распространения
+DEFAULT_MULTIPATH = ""
+DEFAULT_DOPPLER_SHIFT = "0"
+
+# Стиль поля ввода с некорректным значением
+INVALID_INPUT_STYLE = "\nbackground-color: #ffd6d6;"
+
+# Количество испытаний, рассчитываемых при исследовании одним пакетом
+RESEARCH_BATCH_SIZE = 16
+
+# Параметры комплексной огибающей
+# Запас полосы сигнала относительно несущих частот, в единицах скорости передачи
+SIGNAL_BAND_BITRATE_FACTOR = 3.
+
+# Параметры кэша результатов исследования
+RESEARCH_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "cache", "research")
+RESEARCH_CACHE_MAX_SIZE = 16 * 1024 * 1024
+
+# Разрядности АЦП, предлагаемые для целочисленного тракта (None - расчет с плавающей точкой)
+QUANTIZATION_BITS_OPTIONS = (None, 8, 10, 12, 16)
+
+# Параметры истории исследований
+RESULTS_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "cache", "results.sqlite")
+# Количество последних исследований, предлагаемых для сравнения на странице исследования
+RESULTS_HISTORY_SIZE = 20
+
+# Параметры сервиса исследований
+JOB_SERVICE_HOST = "127.0.0.1"
+JOB_SERVICE_PORT = 8765
+JOB_SERVICE_MAX_RUNNING_JOBS = 2
+# Количество хранимых завершенных заданий (более старые удаляются вместе с результатами)
+JOB_SERVICE_MAX_FINISHED_JOBS = 100
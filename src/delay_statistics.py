@@ -0,0 +1,154 @@
+from array import array
+
+import numpy as np
+
+
+# Гистограмма ошибок: диапазон (в длительностях бита в каждую сторону) и количество интервалов
+HISTOGRAM_RANGE_BITS = 2.
+HISTOGRAM_BINS = 40
+# Процентили ошибки оценки задержки
+ERROR_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def get_crb_variance(modulated: list, researched: list, snr: float):
+    """
+    Граница Крамера-Рао для дисперсии оценки задержки (с^2) известного сигнала в белом шуме.
+
+    Дисперсия шума на отсчет задается нормировкой энергии в generate_noise, производная опорного сигнала
+    по времени рассчитывается через спектр: var >= sigma^2 / sum(s'(t)^2). Значения сигналов могут быть
+    пакетами (по последней оси), тогда граница рассчитывается для каждого сигнала пакета.
+    """
+    reference = np.asarray(modulated[1], dtype=float)
+    signal = np.asarray(researched[1], dtype=float)
+    noise_variance = np.sum(signal ** 2, axis=-1) / (10 ** (snr / 10)) / signal.shape[-1]
+
+    reference_len = reference.shape[-1]
+    timestep = modulated[0][1] - modulated[0][0]
+    frequencies = np.fft.rfftfreq(reference_len, timestep)
+    spectrum = np.fft.rfft(reference, axis=-1)
+    # Энергия производной по равенству Парсеваля (компоненты, кроме нулевой и последней, учитываются дважды)
+    weights = np.full(len(frequencies), 2.)
+    weights[0] = 1.
+    if reference_len % 2 == 0:
+        weights[-1] = 1.
+    derivative_energy = np.sum(weights * np.abs(2 * np.pi * frequencies * spectrum) ** 2, axis=-1) / reference_len
+    with np.errstate(divide="ignore"):
+        variance = np.where(derivative_energy > 0, noise_variance / derivative_energy, np.inf)
+    return float(variance) if variance.ndim == 0 else variance
+
+
+class DelayErrorStatistics:
+    """
+    Потоковая статистика ошибок оценки задержки (мс): среднее и дисперсия по Уэлфорду,
+    гистограмма с фиксированными интервалами и компактный массив всех ошибок
+    """
+    def __init__(self, true_delay: float, bit_time: float):
+        self.true_delay = float(true_delay)
+        self.bit_time = float(bit_time)
+
+        # Накопители Уэлфорда
+        self.count = 0
+        self.mean = 0.
+        self.m2 = 0.
+        # Средняя по испытаниям граница Крамера-Рао для дисперсии, мс^2
+        self.crb_sum = 0.
+        self.crb_count = 0
+
+        # Гистограмма ошибок и количество ошибок за ее пределами
+        limit = HISTOGRAM_RANGE_BITS * self.bit_time * 1000
+        self.bin_edges = np.linspace(-limit, limit, HISTOGRAM_BINS + 1)
+        self.histogram = np.zeros(HISTOGRAM_BINS, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+        self.errors = array("f")
+
+    def add(self, delay: float, crb_variance: float = None):
+        """
+        Учет оценки задержки одного испытания (мс) и границы Крамера-Рао для него (с^2).
+        """
+        error = float(delay) - self.true_delay
+        self.count += 1
+        delta = error - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (error - self.mean)
+
+        if error < self.bin_edges[0]:
+            self.underflow += 1
+        elif error >= self.bin_edges[-1]:
+            self.overflow += 1
+        else:
+            bin_width = self.bin_edges[1] - self.bin_edges[0]
+            self.histogram[min(int((error - self.bin_edges[0]) / bin_width), HISTOGRAM_BINS - 1)] += 1
+
+        if crb_variance is not None:
+            self.crb_sum += crb_variance * 1e6
+            self.crb_count += 1
+        self.errors.append(error)
+
+    def merge(self, other):
+        """
+        Объединение с накопителями, рассчитанными по другой части испытаний (формула Чана).
+        """
+        if other.count:
+            count = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / count
+            self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+            self.count = count
+        self.crb_sum += other.crb_sum
+        self.crb_count += other.crb_count
+        self.histogram += other.histogram
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        self.errors.extend(other.errors)
+
+    def get_summary(self):
+        """
+        Итоговые показатели: смещение, СКО, среднеквадратичная ошибка, процентили и граница Крамера-Рао (мс).
+        """
+        if not self.count:
+            return None
+
+        variance = self.m2 / self.count
+        errors = np.frombuffer(self.errors, dtype=np.float32)
+        summary = {
+            "count": self.count,
+            "bias": self.mean,
+            "std": float(np.sqrt(variance)),
+            "rmse": float(np.sqrt(variance + self.mean ** 2)),
+            "crb": float(np.sqrt(self.crb_sum / self.crb_count)) if self.crb_count else None,
+        }
+        for percentile, value in zip(ERROR_PERCENTILES, np.percentile(errors, ERROR_PERCENTILES)):
+            summary[f"p{percentile}"] = float(value)
+        return summary
+
+    def to_dict(self):
+        """
+        Представление для сохранения в кэше результатов.
+        """
+        return {
+            "true_delay": self.true_delay,
+            "bit_time": self.bit_time,
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "crb_sum": self.crb_sum,
+            "crb_count": self.crb_count,
+            "histogram": self.histogram.tolist(),
+            "underflow": self.underflow,
+            "overflow": self.overflow,
+            "errors": [round(error, 4) for error in self.errors],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Восстановление из представления, сохраненного в кэше результатов.
+        """
+        statistics = cls(data["true_delay"], data["bit_time"])
+        for name in ("count", "mean", "m2", "crb_sum", "crb_count", "underflow", "overflow"):
+            setattr(statistics, name, data[name])
+        statistics.histogram = np.array(data["histogram"], dtype=np.int64)
+        statistics.errors = array("f", data["errors"])
+        return statistics
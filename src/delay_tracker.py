@@ -0,0 +1,254 @@
+import argparse
+import time
+import wave
+from collections import deque, namedtuple
+
+import numpy as np
+
+from enums import SignalType, ModulationType
+from fft_utils import next_fast_len, correlate_spectra
+from signals_generator import SignalGenerator
+
+
+# Количество последних обновлений для статистики задержек обработки
+LATENCY_HISTORY_LEN = 1000
+
+# Оценка временной задержки, публикуемая трекером
+DelayEstimate = namedtuple("DelayEstimate", ["time", "delay", "peak", "latency"])
+
+
+class RingBuffer:
+    """
+    Кольцевой буфер отсчетов фиксированной емкости
+    """
+    def __init__(self, capacity: int, dtype=float):
+        self.capacity = int(capacity)
+        self.data = np.zeros(self.capacity, dtype=dtype)
+        self.position = 0
+        self.total_count = 0
+
+    def extend(self, values: np.ndarray):
+        """
+        Добавление отсчетов (старые отсчеты вытесняются).
+        """
+        values = np.asarray(values)[-self.capacity:]
+        first = min(len(values), self.capacity - self.position)
+        self.data[self.position:self.position + first] = values[:first]
+        self.data[:len(values) - first] = values[first:]
+        self.position = (self.position + len(values)) % self.capacity
+        self.total_count += len(values)
+
+    def latest(self, count: int):
+        """
+        Последние count отсчетов в хронологическом порядке.
+        """
+        count = min(int(count), self.capacity, self.total_count)
+        start = (self.position - count) % self.capacity
+        if start + count <= self.capacity:
+            return self.data[start:start + count].copy()
+        return np.concatenate((self.data[start:], self.data[:self.position]))
+
+
+class StreamingDelayTracker:
+    """
+    Отслеживание временной задержки опорного сигнала в непрерывном потоке отсчетов
+    """
+    def __init__(self, modulated: list, sampling_rate: float, window_len: int, update_step: int,
+                 period_len: int = None):
+        self.reference = np.asarray(modulated[1], dtype=float)
+        self.reference_len = len(self.reference)
+        self.sampling_rate = float(sampling_rate)
+        self.window_len = max(int(window_len), self.reference_len)
+        self.update_step = int(update_step)
+        self.period_len = period_len
+
+        # Буфер отсчетов потока и буфер уже рассчитанных значений корреляции по задержкам
+        self.samples = RingBuffer(self.reference_len + 2 * self.update_step)
+        self.correlation = RingBuffer(self.window_len - self.reference_len + 1)
+        self.lags_count = 0
+        self.last_update_count = 0
+
+        # Спектры опорного сигнала для используемых длин БПФ
+        self._spectra = {}
+
+        # Подписчики и статистика
+        self.subscribers = []
+        self.latencies = deque(maxlen=LATENCY_HISTORY_LEN)
+        self.processing_time = 0.
+
+    def subscribe(self, callback):
+        """
+        Подписка на публикуемые оценки задержки.
+        """
+        self.subscribers.append(callback)
+
+    def _get_spectrum(self, nfft: int):
+        """
+        Спектр опорного сигнала заданной длины (с кэшированием).
+        """
+        spectrum = self._spectra.get(nfft)
+        if spectrum is None:
+            spectrum = np.fft.rfft(self.reference, nfft)
+            self._spectra[nfft] = spectrum
+        return spectrum
+
+    def _update_correlation(self):
+        """
+        Рекурсивное обновление: рассчитываются только задержки, ставшие доступными с прошлого обновления.
+        """
+        available_lags = self.samples.total_count - self.reference_len + 1
+        new_lags = available_lags - self.lags_count
+        if new_lags <= 0:
+            return
+
+        # Метод перекрытия с сохранением по отсчетам, затронутым новыми задержками
+        segment = self.samples.latest(new_lags + self.reference_len - 1)
+        nfft = next_fast_len(len(segment))
+        values = correlate_spectra(np.fft.rfft(segment, nfft), self._get_spectrum(nfft), nfft, new_lags)
+        self.correlation.extend(values)
+        self.lags_count = available_lags
+
+    def _estimate(self, arrival_time: float):
+        """
+        Оценка задержки по максимуму корреляции в скользящем окне и ее публикация.
+        """
+        window = self.correlation.latest(self.correlation.capacity)
+        if not len(window):
+            return None
+
+        idx = int(np.argmax(window))
+        lag = self.lags_count - len(window) + idx
+        if self.period_len:
+            lag %= self.period_len
+
+        latency = time.perf_counter() - arrival_time
+        self.latencies.append(latency)
+        estimate = DelayEstimate(time=self.samples.total_count / self.sampling_rate,
+                                 delay=lag / self.sampling_rate * 1000,
+                                 peak=float(window[idx]),
+                                 latency=latency)
+        for callback in self.subscribers:
+            callback(estimate)
+        return estimate
+
+    def push(self, values: np.ndarray):
+        """
+        Добавление блока отсчетов потока; возвращает опубликованные оценки.
+        """
+        arrival_time = time.perf_counter()
+        values = np.asarray(values, dtype=float)
+        estimates = []
+        offset = 0
+        while offset < len(values):
+            # Отсчеты добавляются порциями не больше шага обновления
+            count = min(len(values) - offset,
+                        self.update_step - (self.samples.total_count - self.last_update_count))
+            self.samples.extend(values[offset:offset + count])
+            offset += count
+
+            if self.samples.total_count - self.last_update_count >= self.update_step:
+                self.last_update_count = self.samples.total_count
+                self._update_correlation()
+                estimate = self._estimate(arrival_time)
+                if estimate is not None:
+                    estimates.append(estimate)
+
+        self.processing_time += time.perf_counter() - arrival_time
+        return estimates
+
+    def get_latency_stats(self):
+        """
+        Статистика задержек обработки (мс) и пропускной способности трекера.
+        """
+        if not self.latencies:
+            return {}
+
+        latencies = np.array(self.latencies) * 1000
+        throughput = self.samples.total_count / self.processing_time if self.processing_time > 0 else np.inf
+        return {
+            "mean_ms": float(np.mean(latencies)),
+            "p95_ms": float(np.percentile(latencies, 95)),
+            "max_ms": float(np.max(latencies)),
+            "throughput": float(throughput),
+            "realtime_factor": float(throughput / self.sampling_rate),
+        }
+
+
+def load_stream_file(path: str):
+    """
+    Загрузка отсчетов потока из файла (.npy, .wav или текстового).
+    """
+    if path.endswith(".npy"):
+        return np.load(path).astype(float), None
+    if path.endswith(".wav"):
+        with wave.open(path, "rb") as file:
+            if file.getsampwidth() != 2:
+                raise ValueError("Поддерживаются только 16-битные WAV-файлы")
+            frames = np.frombuffer(file.readframes(file.getnframes()), dtype="<i2")
+            values = frames.reshape(-1, file.getnchannels())[:, 0].astype(float) / 32768.
+            return values, float(file.getframerate())
+    return np.loadtxt(path, dtype=float).reshape(-1), None
+
+
+def replay_stream(values: np.ndarray, sampling_rate: float, block_size: int, realtime: bool = True):
+    """
+    Воспроизведение отсчетов блоками (при необходимости в темпе реального времени).
+    """
+    start = time.perf_counter()
+    for offset in range(0, len(values), block_size):
+        if realtime:
+            delay = start + offset / sampling_rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        yield values[offset:offset + block_size]
+
+
+def generate_stream(signal_generator: SignalGenerator, modulation_type: ModulationType, delays: list):
+    """
+    Синтез непрерывного потока из периодов исследуемого сигнала с меняющейся задержкой опорного.
+    """
+    signal_generator.recalc_parameters()
+    modulated = signal_generator.calc_modulated_signal(SignalType.GENERAL, modulation_type)
+    periods = []
+    for delay in delays:
+        signal_generator.time_delay = float(delay)
+        research = signal_generator.calc_modulated_signal(SignalType.RESEARCH, modulation_type)
+        research = signal_generator.calc_research_signal(modulated, research)
+        periods.append(signal_generator.generate_noise(SignalType.RESEARCH, research)[1])
+    return modulated, np.concatenate(periods), len(periods[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Отслеживание временной задержки в потоке отсчетов")
+    parser.add_argument("--file", default=None, help="Файл с отсчетами потока (.npy, .wav, .txt)")
+    parser.add_argument("--reference", default=None, help="Файл с отсчетами опорного сигнала")
+    parser.add_argument("--sampling-rate", type=float, default=8000.)
+    parser.add_argument("--update-step", type=int, default=800)
+    parser.add_argument("--window", type=int, default=None, help="Длина скользящего окна, отсчетов")
+    parser.add_argument("--realtime", action="store_true", help="Воспроизводить поток в реальном времени")
+    args = parser.parse_args()
+    if args.file and not args.reference:
+        parser.error("для потока из файла (--file) необходим опорный сигнал (--reference)")
+
+    if args.file:
+        values, file_rate = load_stream_file(args.file)
+        reference, _ = load_stream_file(args.reference)
+        sampling_rate = file_rate or args.sampling_rate
+        modulated = [list(np.arange(len(reference)) / sampling_rate), reference]
+        period_len = None
+    else:
+        signal_generator = SignalGenerator(s_r=args.sampling_rate)
+        modulated, values, period_len = generate_stream(signal_generator, ModulationType.PM,
+                                                        [20, 40, 60, 80, 100])
+        sampling_rate = args.sampling_rate
+
+    window_len = args.window or (period_len or len(modulated[1])) + len(modulated[1])
+    tracker = StreamingDelayTracker(modulated, sampling_rate, window_len, args.update_step, period_len)
+    tracker.subscribe(lambda estimate: print(f"t = {estimate.time:.2f} с: задержка {estimate.delay:.2f} мс"))
+    for block in replay_stream(values, sampling_rate, args.update_step, args.realtime):
+        tracker.push(block)
+    print(tracker.get_latency_stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+import argparse
+import bisect
+import math
+import sys
+
+import numpy as np
+
+from enums import SignalType, ModulationType, CorrelationType, BasebandMode
+from fft_utils import next_fast_len, get_correlation_nfft, correlate_spectra
+from research_logic import get_confidence_interval, calc_good_counts
+from random_utils import get_seed_sequence, get_substream
+from signals_generator import SignalGenerator
+
+
+# ОСШ опорного сигнала (см. SignalGenerator.generate_noise)
+GENERAL_SNR = 10.
+# Количество реализаций информационных бит, по которым усредняется прогноз
+PREDICTION_REALIZATIONS = 32
+# Количество конкурирующих максимумов ВКФ, сохраняемых на длительность бита
+PREDICTION_COMPETITORS_PER_BIT = 4
+# Объем выборки из гауссовской модели значений ВКФ для каждой реализации бит
+PREDICTION_MODEL_SAMPLES = 256
+# Вероятность ошибки (по границе объединения), ниже которой выборка из модели не требуется
+PREDICTION_UNION_BOUND = 1e-3
+# Допустимое отклонение прогноза от метода Монте-Карло, в стандартных ошибках разности
+PREDICTION_TOLERANCE = 3.
+
+
+def get_noiseless_profile(signal_generator: SignalGenerator, modulation_type: ModulationType):
+    """
+    Незашумленные сигналы одной реализации и их характеристики: ВКФ, АКФ опорного сигнала и энергии окон.
+    """
+    # Опорный сигнал начинается с нулевой фазы, исследуемый продолжает его фазу (как в calc_research)
+    bits = signal_generator.get_bits(SignalType.GENERAL)
+    research_bits = signal_generator.get_bits(SignalType.RESEARCH)
+    times, values, end_phase = signal_generator.modulate_bits(bits, SignalType.GENERAL, modulation_type)
+    research_times, research_values, _ = signal_generator.modulate_bits(research_bits, SignalType.RESEARCH,
+                                                                        modulation_type, end_phase)
+    if values is None or research_values is None:
+        return None
+    modulated = [times.tolist(), values.tolist()]
+    researched = signal_generator.calc_research_signal(modulated, [research_times.tolist(),
+                                                                   research_values.tolist()])
+    if researched is None:
+        return None
+
+    reference = np.asarray(modulated[1])
+    signal = np.asarray(researched[1])
+    reference_len, lags = len(reference), len(signal) - len(reference) + 1
+
+    # ВКФ и АКФ по БПФ
+    nfft = get_correlation_nfft(len(signal), reference_len)
+    reference_spectrum = np.fft.rfft(reference, nfft)
+    correlation = correlate_spectra(np.fft.rfft(signal, nfft), reference_spectrum, nfft, lags)
+    auto_nfft = next_fast_len(2 * reference_len - 1)
+    autocorrelation = np.fft.irfft(np.abs(np.fft.rfft(reference, auto_nfft)) ** 2, auto_nfft)
+
+    # Энергия исследуемого сигнала в окне длины опорного на каждой задержке
+    cumulative = np.concatenate(([0.], np.cumsum(signal ** 2)))
+    window_energy = cumulative[reference_len:] - cumulative[:lags]
+
+    return {
+        "modulated": modulated,
+        "researched": researched,
+        "times": np.asarray(researched[0][:lags]) * 1000,
+        "correlation": correlation,
+        "autocorrelation": autocorrelation,
+        "window_energy": window_energy,
+        "reference_energy": float(np.sum(reference ** 2)),
+        "signal_energy": float(np.sum(signal ** 2)),
+        "reference_len": reference_len,
+        "signal_len": len(signal),
+        "bit_len": max(int(round(signal_generator.sampling_rate / signal_generator.bits_per_second)), 1),
+    }
+
+
+def get_competing_lags(profile: dict, min_t: float, max_t: float):
+    """
+    Задержка пика незашумленной ВКФ в допустимом интервале и конкурирующие задержки -
+    локальные максимумы вне интервала (пик равен None, если интервал вне диапазона задержек).
+    """
+    times, correlation = profile["times"], profile["correlation"]
+    inside = (times >= min_t) & (times <= max_t)
+    if not inside.any():
+        return None, None
+
+    peak = int(np.flatnonzero(inside)[np.argmax(correlation[inside])])
+    padded = np.concatenate(([-np.inf], correlation, [-np.inf]))
+    local_max = (correlation >= padded[:-2]) & (correlation >= padded[2:])
+    return peak, np.flatnonzero(~inside & local_max)
+
+
+def _thin_competitors(correlation: np.ndarray, outside: np.ndarray, distance: int):
+    """
+    Прореживание конкурирующих максимумов: из максимумов, отстоящих друг от друга меньше чем на distance
+    отсчетов (их шумы почти совпадают), остается наибольший.
+    """
+    kept = []
+    for lag in outside[np.argsort(correlation[outside])[::-1]].tolist():
+        # Достаточно сравнить с ближайшими сохраненными слева и справа
+        index = bisect.bisect(kept, lag)
+        if (index == 0 or lag - kept[index - 1] >= distance) and \
+                (index == len(kept) or kept[index] - lag >= distance):
+            kept.insert(index, lag)
+    return np.array(kept, dtype=outside.dtype)
+
+
+def _get_detection_probabilities(profile: dict, snr_values: list, min_t: float, max_t: float,
+                                 rng: np.random.Generator):
+    """
+    Вероятности попадания максимума ВКФ в допустимый интервал при заданных ОСШ.
+
+    Значения ВКФ на пике и конкурирующих максимумах вне интервала считаются совместно гауссовскими:
+    среднее - незашумленная ВКФ, ковариации шума исследуемого сигнала - по АКФ опорного сигнала, дисперсии -
+    по дисперсиям шумов, заданных нормировкой энергии в generate_noise. Шумы конкурирующих максимумов
+    сильно коррелированы (особенно при АМ), поэтому вероятность того, что пик превышает их все, оценивается
+    по выборке из этого распределения, общей для всех ОСШ. Ковариации шума опорного сигнала между разными
+    задержками не учитываются: при ОСШ, на которых возможны ошибки, они на порядки меньше остальных.
+    """
+    correlation = profile["correlation"]
+    peak, outside = get_competing_lags(profile, min_t, max_t)
+    if peak is None:
+        return np.zeros(len(snr_values))
+    if not len(outside):
+        return np.ones(len(snr_values))
+    outside = _thin_competitors(correlation, outside,
+                                max(profile["bit_len"] // PREDICTION_COMPETITORS_PER_BIT, 1))
+
+    # Дисперсии шума на отсчет исследуемого (для каждого ОСШ) и опорного сигналов
+    research_variances = (profile["signal_energy"] / (10 ** (np.asarray(snr_values, dtype=float) / 10)) /
+                          profile["signal_len"])
+    reference_variance = profile["reference_energy"] / (10 ** (GENERAL_SNR / 10)) / profile["reference_len"]
+
+    # АКФ опорного сигнала для всех пар задержек [пик, конкурирующие максимумы]
+    reference_len = profile["reference_len"]
+    lags = np.concatenate(([peak], outside))
+    shifts = np.abs(lags[:, None] - lags[None, :])
+    autocorrelation = np.where(shifts < reference_len,
+                               profile["autocorrelation"][np.minimum(shifts, reference_len - 1)], 0.)
+    # Ковариации разностей "пик - конкурирующий максимум" для единичной дисперсии шума исследуемого сигнала
+    differences = autocorrelation[0, 0] - autocorrelation[0, 1:, None] - autocorrelation[None, 0, 1:] + \
+        autocorrelation[1:, 1:]
+    window_energy = profile["window_energy"][lags]
+    differences_diagonal = np.diag(differences)
+    means = correlation[peak] - correlation[outside]
+
+    samples = None
+    probabilities = np.empty(len(snr_values))
+    for i, research_variance in enumerate(research_variances):
+        # Некоррелированные между задержками составляющие: шум опорного сигнала и произведение шумов
+        independent = reference_variance * (window_energy + reference_len * research_variance)
+        variances = research_variance * differences_diagonal + independent[0] + independent[1:]
+
+        # Редкие ошибки - по границе объединения (слагаемые меньше 1e-15 не влияют на результат),
+        # иначе - по выборке из гауссовской модели
+        scores = means / np.sqrt(variances)
+        union_bound = 0.5 * sum(math.erfc(score / math.sqrt(2.)) for score in scores[scores < 8.])
+        if union_bound < PREDICTION_UNION_BOUND:
+            probabilities[i] = 1. - union_bound
+            continue
+        if samples is None:
+            samples = rng.standard_normal((len(outside), PREDICTION_MODEL_SAMPLES))
+        covariance = research_variance * differences + independent[0] + np.diag(independent[1:])
+        root = np.linalg.cholesky(covariance)
+        probabilities[i] = np.mean(np.all(means[:, None] + root @ samples > 0, axis=0))
+    return probabilities
+
+
+def _predict_realizations(signal_generator: SignalGenerator, snr_values: list, realizations_count: int, seed=None):
+    """
+    Прогнозы для каждой реализации бит: {ModulationType: массив (реализации x snr_values)}.
+    """
+    signal_generator.recalc_parameters()
+    min_t, max_t = get_confidence_interval(signal_generator)
+    rng_state = signal_generator.rng
+    seed_sequence = get_seed_sequence(seed)
+    signal_generator.set_seed(seed_sequence)
+    # Выборка гауссовской модели - на отдельном подпотоке, чтобы не менять реализации бит
+    model_rng = np.random.default_rng(get_substream(seed_sequence, 0))
+
+    prediction = {}
+    try:
+        for modulation_type in ModulationType:
+            probabilities = np.zeros((realizations_count, len(snr_values)))
+            for i in range(realizations_count):
+                profile = get_noiseless_profile(signal_generator, modulation_type)
+                if profile is not None:
+                    probabilities[i] = _get_detection_probabilities(profile, snr_values, min_t, max_t, model_rng)
+            prediction[modulation_type] = probabilities
+    finally:
+        signal_generator.rng = rng_state
+    return prediction
+
+
+def predict_detection(signal_generator: SignalGenerator, snr_values: list,
+                      realizations_count: int = PREDICTION_REALIZATIONS, seed=None):
+    """
+    Полуаналитический прогноз вероятности правильной оценки задержки для АМ, ЧМ и ФМ.
+
+    Прогноз построен для обычной ВКФ полосового сигнала и усредняется по нескольким реализациям бит;
+    возвращает словарь {ModulationType: список вероятностей по snr_values}.
+    """
+    prediction = _predict_realizations(signal_generator, snr_values, realizations_count, seed)
+    return {modulation_type: np.mean(probabilities, axis=0).tolist()
+            for modulation_type, probabilities in prediction.items()}
+
+
+def validate_prediction(signal_generator: SignalGenerator, snr_values: list, average_count: int, seed=None):
+    """
+    Сравнение прогноза с методом Монте-Карло.
+
+    Для каждой модуляции и ОСШ: прогноз, оценка Монте-Карло, отклонение в единицах стандартной ошибки разности
+    (биномиальная ошибка Монте-Карло и ошибка усреднения прогноза по реализациям бит) и признак согласия -
+    отклонение не больше PREDICTION_TOLERANCE.
+    """
+    realizations = _predict_realizations(signal_generator, snr_values, PREDICTION_REALIZATIONS, seed)
+    min_t, max_t = get_confidence_interval(signal_generator)
+    seed_sequence = get_seed_sequence(seed)
+
+    rows = []
+    for i, snr in enumerate(snr_values):
+        signal_generator.snr = float(snr)
+        counts = calc_good_counts(average_count, signal_generator, min_t, max_t,
+                                  CorrelationType.CC, BasebandMode.PASSBAND, seed_sequence)
+        for modulation_type, good_count in counts.items():
+            estimate = good_count / average_count
+            predicted = float(np.mean(realizations[modulation_type][:, i]))
+            prediction_variance = np.var(realizations[modulation_type][:, i], ddof=1) / PREDICTION_REALIZATIONS
+            error = math.sqrt(max(predicted * (1 - predicted), 1. / average_count) / average_count +
+                              prediction_variance)
+            deviation = (estimate - predicted) / error
+            rows.append({
+                "snr": snr,
+                "modulation": modulation_type.name,
+                "predicted": predicted,
+                "monte_carlo": estimate,
+                "deviation": deviation,
+                "passed": abs(deviation) <= PREDICTION_TOLERANCE,
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Прогноз вероятности правильной оценки задержки")
+    parser.add_argument("--snr", type=int, nargs=3, default=[10, -11, -1], metavar=("FROM", "TO", "STEP"))
+    parser.add_argument("--validate", type=int, default=0, metavar="AVERAGES",
+                        help="Сравнить с методом Монте-Карло при заданном количестве усреднений")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    signal_generator = SignalGenerator()
+    snr_values = list(range(*args.snr))
+    if args.validate:
+        rows = validate_prediction(signal_generator, snr_values, args.validate, args.seed)
+        for row in rows:
+            print(f"{row['snr']:4d} дБ {row['modulation']}: прогноз {row['predicted']:.3f}, "
+                  f"Монте-Карло {row['monte_carlo']:.3f}, отклонение {row['deviation']:+.1f} СКО"
+                  + ("" if row["passed"] else " - вне допуска"))
+        failed_count = sum(not row["passed"] for row in rows)
+        if failed_count:
+            sys.exit(f"Прогноз вне допуска ±{PREDICTION_TOLERANCE:g} СКО в {failed_count} точках из {len(rows)}")
+        print(f"Прогноз согласуется с методом Монте-Карло (допуск ±{PREDICTION_TOLERANCE:g} СКО)")
+    else:
+        prediction = predict_detection(signal_generator, snr_values, seed=args.seed)
+        for i, snr in enumerate(snr_values):
+            print(f"{snr:4d} дБ: " + ", ".join(f"{modulation_type.name} {prediction[modulation_type][i]:.3f}"
+                                               for modulation_type in ModulationType))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ class GraphType(Enum):
     CORRELATION = 2
     BITS = 3
     BER_OF_SNR = 4
+    ANALYSIS = 5
 
 
 class SignalType(Enum):
@@ -27,3 +28,95 @@ class ModulationType(Enum):
     AM = 0
     FM = 1
     PM = 2
+
+
+class BitsSourceType(Enum):
+    """
+    Источники информационной последовательности опорного сигнала.
+    """
+    RANDOM = 0
+    M_SEQUENCE = 1
+    GOLD = 2
+    BARKER = 3
+
+
+class CorrelationType(Enum):
+    """
+    Типы взаимной корреляционной функции (весовые функции обобщенной корреляции).
+    """
+    CC = 0
+    PHAT = 1
+    SCOT = 2
+    ROTH = 3
+    HT = 4
+
+
+class BasebandMode(Enum):
+    """
+    Режимы расчета корреляции: по полосовому сигналу или по комплексной огибающей.
+    """
+    PASSBAND = 0
+    ANALYTIC = 1
+    IQ = 2
+
+
+class GridType(Enum):
+    """
+    Типы сеток в пространстве параметров исследования.
+    """
+    CARTESIAN = 0
+    LATIN_HYPERCUBE = 1
+
+
+class MainViewType(Enum):
+    """
+    Виды графиков главной страницы.
+    """
+    SIGNALS = 0
+    SPECTRUM = 1
+    AMBIGUITY = 2
+
+
+class ResearchViewType(Enum):
+    """
+    Виды графика страницы исследования.
+    """
+    PROBABILITY = 0
+    RMSE = 1
+    HISTOGRAM = 2
+    DETECTION = 3
+
+
+class NoiseType(Enum):
+    """
+    Виды шума канала распространения.
+    """
+    WHITE = 0
+    COLORED = 1
+    IMPULSIVE = 2
+
+
+class CfarType(Enum):
+    """
+    Виды обнаружителя с постоянным уровнем ложных тревог.
+    """
+    CA = 0
+    OS = 1
+
+
+class KernelBackend(Enum):
+    """
+    Реализации вычислительных ядер с циклами по отсчетам.
+    """
+    NUMPY = 0
+    PYTHON = 1
+    NUMBA = 2
+
+
+class FigureType(Enum):
+    """
+    Виды фигур для пакетной отрисовки.
+    """
+    MODULATED = 0
+    HELPED = 1
+    RESEARCH = 2
@@ -0,0 +1,48 @@
+import numpy as np
+
+
+def next_fast_len(n: int):
+    """
+    Наименьшая длина БПФ не меньше n, раскладывающаяся на множители 2, 3 и 5.
+    """
+    n = int(n)
+    if n <= 6:
+        return max(n, 1)
+
+    best = 1 << (n - 1).bit_length()
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            # Минимальная степень двойки, дополняющая произведение до n
+            quotient = -(-n // p35)
+            candidate = p35 * (1 << (quotient - 1).bit_length())
+            if candidate == n:
+                return n
+            best = min(best, candidate)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+def get_correlation_nfft(research_len: int, reference_len: int):
+    """
+    Длина БПФ для расчета линейной взаимной корреляции без циклического наложения.
+    """
+    return next_fast_len(research_len + reference_len - 1)
+
+
+def correlate_spectra(research_spectrum: np.ndarray, reference_spectra: np.ndarray, nfft: int, lags: int):
+    """
+    Взаимная корреляция по спектрам (режим 'valid'): по последней оси, с поддержкой пакетов.
+    """
+    correlation = np.fft.irfft(research_spectrum * np.conj(reference_spectra), nfft, axis=-1)
+    return correlation[..., :lags]
+
+
+def correlate_complex_spectra(research_spectrum: np.ndarray, reference_spectra: np.ndarray, nfft: int, lags: int):
+    """
+    Взаимная корреляция комплексных сигналов по их полным спектрам (режим 'valid').
+    """
+    correlation = np.fft.ifft(research_spectrum * np.conj(reference_spectra), nfft, axis=-1)
+    return correlation[..., :lags]
@@ -0,0 +1,231 @@
+import argparse
+import csv
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from enums import FigureType, ModulationType
+from mpl_plots import HelpedPlot, ResearchPlot, ModulatedPlot, get_bits_label
+from research_logic import ResearchResult
+from signal_pipeline import SignalPipeline
+from signals_generator import SignalGenerator
+from study_scheduler import STUDY_PARAMETERS, INTEGER_PARAMETERS
+
+
+# Размер (дюймы) и разрешение фигур отчета
+RENDER_FIGSIZE = (8, 6)
+RENDER_DPI = 100
+# Форматы файлов по умолчанию
+RENDER_FORMATS = ("png",)
+# Количество заданий, пересылаемых исполнителю за раз
+RENDER_CHUNK_SIZE = 8
+
+# Классы графиков для видов фигур
+FIGURE_CLASSES = {
+    FigureType.MODULATED: ModulatedPlot,
+    FigureType.HELPED: HelpedPlot,
+    FigureType.RESEARCH: ResearchPlot,
+}
+
+# Задание отрисовки: вид фигуры, вызовы методов графика [(имя, аргументы)], подпись фигуры и пути файлов
+RenderTask = namedtuple("RenderTask", ["figure_type", "calls", "caption", "paths"])
+# Исходное состояние осей шаблона, восстанавливаемое перед каждой отрисовкой
+AxesState = namedtuple("AxesState", ["title", "xlabel", "ylabel", "xscale", "yscale", "margins"])
+
+# Шаблоны фигур текущего процесса: (вид, разрешение, размер) -> (график с холстом Agg, состояния осей)
+_templates = {}
+
+
+def get_axes_state(ax):
+    return AxesState(ax.get_title(), ax.get_xlabel(), ax.get_ylabel(), ax.get_xscale(), ax.get_yscale(),
+                     ax.margins())
+
+
+def reset_axes(ax, state: AxesState):
+    """
+    Удаление данных с осей и восстановление их исходного состояния.
+
+    В отличие от clear, деления, сетка и заголовки не создаются заново, что в несколько раз быстрее.
+    """
+    for artist in [*ax.lines, *ax.collections, *ax.patches, *ax.texts]:
+        artist.remove()
+    ax.containers.clear()
+    if ax.get_legend() is not None:
+        ax.get_legend().remove()
+
+    if ax.get_xscale() != state.xscale:
+        ax.set_xscale(state.xscale)
+    if ax.get_yscale() != state.yscale:
+        ax.set_yscale(state.yscale)
+    ax.title.set_text(state.title)
+    ax.xaxis.label.set_text(state.xlabel)
+    ax.yaxis.label.set_text(state.ylabel)
+    ax.margins(*state.margins)
+    ax.set_prop_cycle(None)
+    ax.relim()
+    ax.set_autoscale_on(True)
+
+
+def get_template(figure_type: FigureType, dpi: int = RENDER_DPI, figsize: tuple = RENDER_FIGSIZE):
+    """
+    Шаблон фигуры (оси, заголовки и сетка создаются один раз на процесс) в исходном состоянии.
+    """
+    key = (figure_type, dpi, tuple(figsize))
+    template = _templates.get(key)
+    if template is None:
+        plot = FIGURE_CLASSES[figure_type](dpi, figsize, facecolor="white")
+        FigureCanvasAgg(plot.fig)
+        template = plot, [get_axes_state(ax) for ax in plot.fig.axes]
+        _templates[key] = template
+    else:
+        for ax, state in zip(template[0].fig.axes, template[1]):
+            reset_axes(ax, state)
+    return template[0]
+
+
+def render_figure(task: RenderTask, dpi: int = RENDER_DPI, figsize: tuple = RENDER_FIGSIZE):
+    """
+    Отрисовка фигуры на шаблоне и сохранение во все заданные файлы (формат - по расширению).
+    """
+    plot = get_template(task.figure_type, dpi, figsize)
+    for method, args in task.calls:
+        getattr(plot, method)(*args)
+    plot.fig.suptitle(task.caption or "")
+    for path in task.paths:
+        plot.fig.savefig(path)
+    return task.paths
+
+
+def _render_chunk(tasks: list):
+    return [render_figure(task) for task in tasks]
+
+
+def _collect_paths(results, tasks_count: int):
+    paths = []
+    for done_count, chunk_paths in enumerate(results, start=1):
+        paths.extend(path for task_paths in chunk_paths for path in task_paths)
+        print(f"Отрисовано фигур: {min(done_count * RENDER_CHUNK_SIZE, tasks_count)} из {tasks_count}")
+    return paths
+
+
+def render_figures(tasks: list, workers_count: int = None):
+    """
+    Отрисовка набора фигур на пуле процессов (каждый исполнитель переиспользует свои шаблоны).
+
+    Возвращает список путей сохраненных файлов.
+    """
+    chunks = [tasks[i:i + RENDER_CHUNK_SIZE] for i in range(0, len(tasks), RENDER_CHUNK_SIZE)]
+    if workers_count == 1:
+        return _collect_paths(map(_render_chunk, chunks), len(tasks))
+    with ProcessPoolExecutor(max_workers=workers_count) as executor:
+        return _collect_paths(executor.map(_render_chunk, chunks), len(tasks))
+
+
+def get_paths(path_prefix: str, formats: tuple = RENDER_FORMATS):
+    """
+    Пути файлов фигуры для каждого формата.
+    """
+    return [f"{path_prefix}.{file_format}" for file_format in formats]
+
+
+def make_scenario_tasks(signal_generator: SignalGenerator, modulation_type: ModulationType, path_prefix: str,
+                        formats: tuple = RENDER_FORMATS, caption: str = None):
+    """
+    Задания отрисовки графиков главной страницы для сценария: сигналы и корреляция, информационные биты.
+    """
+    SignalPipeline(signal_generator).run(modulation_type)
+    sg = signal_generator
+    bits_x, bits_y = sg.get_bits_to_plot()
+    return [
+        RenderTask(FigureType.MODULATED, [("plot_graph_ax1", sg.modulated_signal),
+                                          ("plot_graph_ax2", sg.research_signal),
+                                          ("plot_graph_ax3", sg.correlation_signal)],
+                   caption, get_paths(path_prefix + "_signals", formats)),
+        RenderTask(FigureType.HELPED, [("plot_graph", (bits_x, bits_y, get_bits_label(sg.bits)))],
+                   caption, get_paths(path_prefix + "_bits", formats)),
+    ]
+
+
+def read_study_table(path: str):
+    """
+    Строки итоговой таблицы исследования (CSV, NPZ или Parquet, см. StudyWriter) в виде словарей.
+    """
+    file_format = os.path.splitext(path)[1].lower().lstrip(".")
+    if file_format == "csv":
+        with open(path, newline="", encoding="utf-8") as file:
+            rows = list(csv.DictReader(file))
+    elif file_format == "npz":
+        with np.load(path) as data:
+            columns = {name: data[name].tolist() for name in data.files if name != "delays"}
+        rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    elif file_format == "parquet":
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("Для чтения таблицы в формате Parquet необходим пакет pandas")
+        rows = pd.read_parquet(path).to_dict("records")
+    else:
+        raise ValueError(f"Неподдерживаемый формат таблицы: {file_format}")
+
+    for row in rows:
+        for name in tuple(STUDY_PARAMETERS) + ("snr", "probability"):
+            row[name] = float(row[name])
+    return rows
+
+
+def make_study_tasks(rows: list, output_dir: str, formats: tuple = RENDER_FORMATS):
+    """
+    Задания отрисовки отчета исследования: график доли правильных оценок от ОСШ для каждой точки.
+    """
+    points = {}
+    for row in rows:
+        point = tuple(row[name] for name in STUDY_PARAMETERS)
+        curve = points.setdefault(point, {}).setdefault(ModulationType[row["modulation"]], [])
+        curve.append((row["snr"], row["probability"]))
+
+    tasks = []
+    for index, (point, curves) in enumerate(points.items()):
+        parameters = dict(zip(STUDY_PARAMETERS, point))
+        # Погрешность - как в calc_research: половина длительности бита
+        error = 0.5 / parameters["bits_per_second"]
+        results = {}
+        for modulation_type in ModulationType:
+            if modulation_type in curves:
+                snr_values, probabilities = zip(*sorted(curves[modulation_type], reverse=True))
+                results[modulation_type] = ResearchResult(list(snr_values), list(probabilities),
+                                                          [error] * len(snr_values))
+        caption = ", ".join(f"{name}={int(value) if name in INTEGER_PARAMETERS else value:g}"
+                            for name, value in parameters.items())
+        tasks.append(RenderTask(FigureType.RESEARCH, [("plot_graph", (results,))], caption,
+                                get_paths(os.path.join(output_dir, f"point_{index:04d}"), formats)))
+    return tasks
+
+
+def render_study_report(study_path: str, output_dir: str, formats: tuple = RENDER_FORMATS,
+                        workers_count: int = None):
+    """
+    Отрисовка графиков всех точек исследования из итоговой таблицы в каталог отчета.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = make_study_tasks(read_study_table(study_path), output_dir, formats)
+    return render_figures(tasks, workers_count)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пакетная отрисовка графиков исследования без графического "
+                                                 "интерфейса (Agg)")
+    parser.add_argument("study", help="Итоговая таблица исследования (csv, npz или parquet)")
+    parser.add_argument("--output", default="report")
+    parser.add_argument("--formats", nargs="+", default=list(RENDER_FORMATS), choices=["png", "svg", "pdf"])
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    paths = render_study_report(args.study, args.output, tuple(args.formats), args.workers)
+    print(f"Сохранено файлов: {len(paths)} в {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import numpy as np
+
+from fft_utils import get_correlation_nfft, correlate_spectra
+
+
+# Полная шкала АЦП в СКО оцифровываемого сигнала (запас на пик-фактор после АРУ)
+FIXED_POINT_FULL_SCALE_SIGMAS = 4.
+# Разрядность накопителя корреляции по умолчанию
+FIXED_POINT_ACCUMULATOR_BITS = 32
+# Граница произведения норм операндов, до которой корреляция через БПФ двойной точности
+# остается точной после округления (погрешность БПФ пропорциональна произведению норм)
+FIXED_POINT_EXACT_LIMIT = 2 ** 42
+
+
+def get_integer_dtype(bits: int):
+    """
+    Наименьший целочисленный тип для отсчетов заданной разрядности.
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        if bits <= np.iinfo(dtype).bits:
+            return dtype
+    return np.int64
+
+
+def quantize(values: np.ndarray, bits: int, full_scale=None):
+    """
+    Квантование сигналов (по последней оси) АЦП заданной разрядности с насыщением.
+
+    Полная шкала по умолчанию задается для каждого сигнала по его СКО (FIXED_POINT_FULL_SCALE_SIGMAS).
+    Возвращает коды, масштаб (код / единица сигнала) и количество насыщенных отсчетов каждого сигнала.
+    """
+    values = np.asarray(values, dtype=float)
+    if full_scale is None:
+        full_scale = FIXED_POINT_FULL_SCALE_SIGMAS * np.sqrt(np.mean(values ** 2, axis=-1, keepdims=True))
+    full_scale = np.asarray(full_scale, dtype=float)
+
+    max_code = 2 ** (bits - 1) - 1
+    scale = max_code / np.where(full_scale > 0, full_scale, 1.)
+    codes = np.rint(values * scale)
+    saturated = np.sum((codes > max_code) | (codes < -max_code - 1), axis=-1)
+    return np.clip(codes, -max_code - 1, max_code).astype(get_integer_dtype(bits)), scale, saturated
+
+
+def wrap_integer(values: np.ndarray, bits: int):
+    """
+    Приведение целых значений к разрядности накопителя с переполнением (дополнительный код).
+    """
+    if bits >= 64:
+        return values
+    modulus = 1 << bits
+    return (values + (modulus >> 1)) % modulus - (modulus >> 1)
+
+
+def _split_codes(codes: np.ndarray, max_code: int):
+    """
+    Разбиение целых кодов на старшую и младшую части: codes = (high << shift) + low.
+    """
+    shift = max(max_code.bit_length() // 2, 1)
+    high = codes >> shift
+    return high, codes - (high << shift), shift
+
+
+def _correlate_exact(research_codes: np.ndarray, reference_codes: np.ndarray, lags: int, nfft: int):
+    """
+    Точная целочисленная корреляция через БПФ двойной точности.
+
+    Если произведение норм операндов слишком велико для точного округления, операнд с большими
+    по модулю кодами разбивается на старшую и младшую части, корреляции которых рассчитываются отдельно
+    и складываются в int64. Разбиение прекращается, когда коды обоих операндов не превышают 1 по модулю.
+    """
+    bound = np.sqrt(np.max(np.sum(np.square(research_codes, dtype=float), axis=-1))) * \
+        np.sqrt(np.max(np.sum(np.square(reference_codes, dtype=float), axis=-1)))
+    research_max = int(np.max(np.abs(research_codes.astype(np.int64)), initial=0))
+    reference_max = int(np.max(np.abs(reference_codes.astype(np.int64)), initial=0))
+    if bound < FIXED_POINT_EXACT_LIMIT or max(research_max, reference_max) <= 1:
+        research_spectrum = np.fft.rfft(research_codes.astype(float), nfft, axis=-1)
+        reference_spectrum = np.fft.rfft(reference_codes.astype(float), nfft, axis=-1)
+        return np.rint(correlate_spectra(research_spectrum, reference_spectrum, nfft, lags)).astype(np.int64)
+
+    if research_max >= reference_max:
+        high, low, shift = _split_codes(research_codes, research_max)
+        return (_correlate_exact(high, reference_codes, lags, nfft) << shift) + \
+            _correlate_exact(low, reference_codes, lags, nfft)
+    high, low, shift = _split_codes(reference_codes, reference_max)
+    return (_correlate_exact(research_codes, high, lags, nfft) << shift) + \
+        _correlate_exact(research_codes, low, lags, nfft)
+
+
+def correlate_integer(research_codes: np.ndarray, reference_codes: np.ndarray,
+                      accumulator_bits: int = FIXED_POINT_ACCUMULATOR_BITS):
+    """
+    Целочисленная взаимная корреляция (режим 'valid', по последней оси) с накоплением заданной разрядности.
+
+    Суммы произведений рассчитываются точно; результат переполненного накопителя совпадает
+    с результатом сумматора в дополнительном коде при любом порядке накопления.
+    Возвращает значения накопителя и количество переполненных задержек каждой корреляции.
+    """
+    lags = research_codes.shape[-1] - reference_codes.shape[-1] + 1
+    nfft = get_correlation_nfft(research_codes.shape[-1], reference_codes.shape[-1])
+    exact = _correlate_exact(research_codes, reference_codes, lags, nfft)
+
+    if accumulator_bits >= 64:
+        return exact, np.zeros(exact.shape[:-1], dtype=np.int64)
+    limit = 1 << (accumulator_bits - 1)
+    overflows = np.sum((exact >= limit) | (exact < -limit), axis=-1)
+    return wrap_integer(exact, accumulator_bits), overflows
+
+
+class FixedPointCounters:
+    """
+    Накопление событий целочисленного тракта по испытаниям: насыщение АЦП и переполнение накопителя
+    """
+    def __init__(self):
+        self.samples_count = 0
+        self.saturated_count = 0
+        self.accumulations_count = 0
+        self.overflow_count = 0
+
+    def add(self, samples_count: int, saturated_count: int, accumulations_count: int, overflow_count: int):
+        """
+        Учет оцифрованных отсчетов и рассчитанных значений корреляции.
+        """
+        self.samples_count += int(samples_count)
+        self.saturated_count += int(saturated_count)
+        self.accumulations_count += int(accumulations_count)
+        self.overflow_count += int(overflow_count)
+
+    def get_summary(self):
+        """
+        Доли насыщенных отсчетов и переполненных значений корреляции.
+        """
+        if not self.samples_count:
+            return None
+        return {
+            "saturation": self.saturated_count / self.samples_count,
+            "overflow": self.overflow_count / self.accumulations_count if self.accumulations_count else None,
+        }
+
+    def to_dict(self):
+        """
+        Представление для сохранения в кэше результатов.
+        """
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Восстановление из представления, сохраненного в кэше результатов.
+        """
+        counters = cls()
+        for name, value in data.items():
+            setattr(counters, name, value)
+        return counters
@@ -0,0 +1,85 @@
+import numpy as np
+
+from enums import CorrelationType
+from fft_utils import get_correlation_nfft, correlate_spectra
+
+
+# Ширина окна сглаживания спектральных оценок, отсчетов БПФ
+SPECTRUM_SMOOTHING_BINS = 9
+# Относительный порог регуляризации весовых функций
+WEIGHT_EPSILON = 1e-6
+
+
+def _smooth_spectrum(spectrum: np.ndarray, bins: int):
+    """
+    Сглаживание спектральной оценки скользящим средним по частоте.
+    """
+    if bins <= 1:
+        return spectrum
+    window = np.ones(bins) / bins
+    if np.iscomplexobj(spectrum):
+        return np.convolve(spectrum.real, window, 'same') + 1j * np.convolve(spectrum.imag, window, 'same')
+    return np.convolve(spectrum, window, 'same')
+
+
+def _regularize(values: np.ndarray):
+    """
+    Ограничение знаменателя весовой функции снизу.
+    """
+    return np.maximum(values, WEIGHT_EPSILON * np.max(values) + np.finfo(float).tiny)
+
+
+def get_gcc_weight(correlation_type: CorrelationType, research_spectrum: np.ndarray, reference_spectrum: np.ndarray,
+                   smoothing_bins: int = SPECTRUM_SMOOTHING_BINS):
+    """
+    Расчет частотной весовой функции обобщенной взаимной корреляции.
+    """
+    if correlation_type == CorrelationType.CC:
+        return np.ones(research_spectrum.shape[-1])
+
+    cross = research_spectrum * np.conj(reference_spectrum)
+    if correlation_type == CorrelationType.PHAT:
+        return 1. / _regularize(np.abs(cross))
+
+    reference_psd = _smooth_spectrum(np.abs(reference_spectrum) ** 2, smoothing_bins)
+    if correlation_type == CorrelationType.ROTH:
+        return 1. / _regularize(reference_psd)
+
+    research_psd = _smooth_spectrum(np.abs(research_spectrum) ** 2, smoothing_bins)
+    auto_product = _regularize(reference_psd * research_psd)
+    if correlation_type == CorrelationType.SCOT:
+        return 1. / np.sqrt(auto_product)
+
+    if correlation_type == CorrelationType.HT:
+        # Оценка функции когерентности по сглаженным спектрам
+        coherence = np.abs(_smooth_spectrum(cross, smoothing_bins)) ** 2 / auto_product
+        coherence = np.clip(coherence, 0., 1. - WEIGHT_EPSILON)
+        return coherence / ((1. - coherence) * _regularize(np.abs(cross)))
+
+    raise ValueError(f"Неизвестный тип корреляции: {correlation_type}")
+
+
+def get_generalized_correlation(modulated: list, researched: list,
+                                correlation_type: CorrelationType = CorrelationType.PHAT,
+                                smoothing_bins: int = SPECTRUM_SMOOTHING_BINS):
+    """
+    Расчет обобщенной взаимной корреляционной функции опорного и исследуемого сигналов.
+    """
+    if not modulated or not researched:
+        return
+
+    research = np.asarray(researched[1], dtype=float)
+    modulate = np.asarray(modulated[1], dtype=float)
+    lags = len(research) - len(modulate) + 1
+    if lags <= 0:
+        return
+
+    nfft = get_correlation_nfft(len(research), len(modulate))
+    research_spectrum = np.fft.rfft(research, nfft)
+    reference_spectrum = np.fft.rfft(modulate, nfft)
+
+    # Вещественный вес переносится на спектр опорного сигнала
+    weight = get_gcc_weight(correlation_type, research_spectrum, reference_spectrum, smoothing_bins)
+    y = correlate_spectra(research_spectrum, reference_spectrum * weight, nfft, lags).tolist()
+    x = researched[0][:len(y)]
+    return x, y
@@ -0,0 +1,172 @@
+import numpy as np
+
+from detection_predictor import get_noiseless_profile, get_competing_lags
+from enums import SignalType, ModulationType, CorrelationType, BasebandMode
+from random_utils import get_seed_sequence, get_substream, get_snr_key
+from research_logic import get_confidence_interval
+from signals_generator import SignalGenerator
+
+
+# Количество смещенных компонент смеси (по числу ближайших к пику конкурирующих максимумов)
+IS_COMPETITORS_COUNT = 32
+# Доля несмещенной компоненты смеси (ограничивает веса сверху величиной 1 / IS_DEFENSIVE_WEIGHT)
+IS_DEFENSIVE_WEIGHT = 0.2
+
+
+def _get_biasing_components(profile: dict, peak: int, outside: np.ndarray, noise_variance: float):
+    """
+    Смещения шума исследуемого сигнала к событиям ошибки: для каждого из ближайших конкурирующих максимумов -
+    шум минимальной энергии, при котором значение ВКФ на нем сравнивается с пиком.
+    """
+    reference_len = profile["reference_len"]
+    shifts = np.abs(outside - peak)
+    autocorrelation = np.where(shifts < reference_len,
+                               profile["autocorrelation"][np.minimum(shifts, reference_len - 1)], 0.)
+
+    # Квадрат нормы разности сдвинутых копий опорного сигнала и запас ВКФ пика над максимумом
+    difference_norms = 2 * (profile["reference_energy"] - autocorrelation)
+    margins = profile["correlation"][peak] - profile["correlation"][outside]
+    valid = difference_norms > 0
+    outside, difference_norms, margins = outside[valid], difference_norms[valid], margins[valid]
+
+    # Ближайшие в единицах СКО шума события ошибки; доли компонент пропорциональны их вероятностям
+    distances = margins / np.sqrt(noise_variance * difference_norms)
+    order = np.argsort(distances)[:IS_COMPETITORS_COUNT]
+    shares = np.exp(-(distances[order] ** 2 - distances[order[0]] ** 2) / 2)
+    return (outside[order], margins[order] / difference_norms[order], margins[order] ** 2 / difference_norms[order],
+            shares / np.sum(shares))
+
+
+def _run_trial(signal_generator: SignalGenerator, modulation_type: ModulationType, min_t: float, max_t: float,
+               correlation_type: CorrelationType, baseband_mode: BasebandMode):
+    """
+    Одно испытание с выборкой по значимости: (признак ошибки, вес правдоподобия).
+    """
+    profile = get_noiseless_profile(signal_generator, modulation_type)
+    if profile is None:
+        return None
+    peak, outside = get_competing_lags(profile, min_t, max_t)
+    if peak is None:
+        return None
+
+    # Шум исследуемого сигнала - гауссовский с дисперсией, заданной нормировкой энергии в generate_noise
+    rng = signal_generator.rng
+    noise_variance = profile["signal_energy"] / (10 ** (signal_generator.snr / 10)) / profile["signal_len"]
+    noise = rng.normal(0., np.sqrt(noise_variance), profile["signal_len"])
+
+    reference = np.asarray(profile["modulated"][1])
+    reference_len = profile["reference_len"]
+    lags, amplitudes, energies, shares = _get_biasing_components(profile, peak, outside, noise_variance)
+
+    # Выбор компоненты смеси: несмещенная или смещение к одному из конкурирующих максимумов
+    weights = np.concatenate(([IS_DEFENSIVE_WEIGHT if len(lags) else 1.], (1 - IS_DEFENSIVE_WEIGHT) * shares))
+    component = rng.choice(len(weights), p=weights)
+    if component > 0:
+        lag, amplitude = lags[component - 1], amplitudes[component - 1]
+        noise[lag:lag + reference_len] += amplitude * reference
+        noise[peak:peak + reference_len] -= amplitude * reference
+
+    # Вес правдоподобия: отношение плотности исходного шума к плотности смеси
+    projections = np.array([np.dot(noise[lag:lag + reference_len], reference) for lag in lags])
+    projections = amplitudes * (projections - np.dot(noise[peak:peak + reference_len], reference))
+    exponents = np.concatenate(([0.], (projections - energies / 2) / noise_variance))
+    # Компоненты с нулевой долей (исчезающе малая вероятность события) в смесь не входят
+    log_weights = np.full(len(weights), -np.inf)
+    np.log(weights, out=log_weights, where=weights > 0)
+    log_weights += exponents
+    log_mixture = np.max(log_weights) + np.log(np.sum(np.exp(log_weights - np.max(log_weights))))
+    likelihood_ratio = float(np.exp(-log_mixture))
+
+    # Оценка задержки по зашумленным сигналам
+    researched = profile["researched"]
+    researched = [researched[0], (np.asarray(researched[1]) + noise).tolist()]
+    modulated = signal_generator.generate_noise(SignalType.GENERAL, profile["modulated"])
+    correlation = signal_generator.get_correlation(modulated, researched, correlation_type, baseband_mode)
+    time_delay = signal_generator.find_correlation_max(correlation)
+    return not (min_t <= time_delay <= max_t), likelihood_ratio
+
+
+def calc_failure_probability(trials_count: int, signal_generator: SignalGenerator, modulation_type: ModulationType,
+                             min_t: float, max_t: float, correlation_type: CorrelationType = CorrelationType.CC,
+                             baseband_mode: BasebandMode = BasebandMode.PASSBAND,
+                             seed_sequence: np.random.SeedSequence = None):
+    """
+    Оценка вероятности ошибки оценки задержки выборкой по значимости при текущем ОСШ.
+
+    Возвращает оценку и диагностику дисперсии: стандартную ошибку, относительную ошибку, эффективный
+    объем выборки и выигрыш в дисперсии относительно обычного метода Монте-Карло.
+    Неопределенные показатели (при нулевой оценке или нулевом разбросе) равны None.
+    """
+    snr_key = get_snr_key(signal_generator.snr)
+    values, ratios, failures_count = [], [], 0
+    for trial in range(trials_count):
+        if seed_sequence is not None:
+            signal_generator.set_seed(get_substream(seed_sequence, snr_key, modulation_type.value, trial))
+        result = _run_trial(signal_generator, modulation_type, min_t, max_t, correlation_type, baseband_mode)
+        if result is None:
+            return None
+        failed, likelihood_ratio = result
+        failures_count += failed
+        values.append(likelihood_ratio if failed else 0.)
+        ratios.append(likelihood_ratio)
+
+    values, ratios = np.array(values), np.array(ratios)
+    probability = float(np.mean(values))
+    std_error = float(np.std(values, ddof=1) / np.sqrt(trials_count)) if trials_count > 1 else float("inf")
+    ratios_sum = float(np.sum(ratios))
+    variance_reduction = None
+    if 0 < std_error < float("inf"):
+        variance_reduction = probability * (1 - probability) / (trials_count * std_error ** 2)
+    return {
+        "probability": probability,
+        "std_error": std_error,
+        "relative_error": std_error / probability if probability > 0 else None,
+        # Если все отношения правдоподобия исчезающе малы, выборка не несет информации
+        "effective_sample_size": ratios_sum ** 2 / float(np.sum(ratios ** 2)) if ratios_sum > 0 else 0.,
+        "variance_reduction": variance_reduction,
+        "failures_count": failures_count,
+        "trials_count": trials_count,
+    }
+
+
+def calc_importance_research(trials_count: int, signal_generator: SignalGenerator,
+                             from_noise: int = 10, to_noise: int = -11, step_noise: int = -1,
+                             correlation_type: CorrelationType = None, baseband_mode: BasebandMode = None, seed=None):
+    """
+    Зависимость вероятности ошибки от ОСШ для АМ, ЧМ и ФМ, рассчитанная выборкой по значимости.
+
+    Возвращает список ОСШ и словарь {ModulationType: список результатов calc_failure_probability}.
+    """
+    if correlation_type is None:
+        correlation_type = signal_generator.correlation_type
+    if baseband_mode is None:
+        baseband_mode = signal_generator.baseband_mode
+    signal_generator.recalc_parameters()
+    min_t, max_t = get_confidence_interval(signal_generator)
+    seed_sequence = get_seed_sequence(seed)
+
+    snr_values = list(range(from_noise, to_noise, step_noise))
+    results = {modulation_type: [] for modulation_type in ModulationType}
+    for snr in snr_values:
+        print(f"Запускается расчет вероятности ошибки при {snr} дБ...")
+        signal_generator.snr = float(snr)
+        for modulation_type in ModulationType:
+            result = calc_failure_probability(trials_count, signal_generator, modulation_type, min_t, max_t,
+                                              correlation_type, baseband_mode, seed_sequence)
+            results[modulation_type].append(result)
+    return snr_values, results
+
+
+def _format_optional(value, spec: str):
+    return "-" if value is None else format(value, spec)
+
+
+def format_failure_result(result: dict):
+    """
+    Краткая строка с оценкой вероятности ошибки и диагностикой дисперсии (для вывода вызывающей стороной).
+    """
+    if result is None:
+        return "нет оценки"
+    return (f"{result['probability']:.3e} (отн. ошибка {_format_optional(result['relative_error'], '.2f')}, "
+            f"выигрыш {_format_optional(result['variance_reduction'], '.3g')}, "
+            f"эфф. объем {result['effective_sample_size']:.0f} из {result['trials_count']})")
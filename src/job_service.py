@@ -0,0 +1,307 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+
+from defaults import *
+from enums import BitsSourceType, CorrelationType, BasebandMode, CfarType
+from kernels import warm_up_kernels
+from study_scheduler import STUDY_PARAMETERS, INTEGER_PARAMETERS, run_work_unit
+
+
+class JobRequestError(ValueError):
+    """
+    Ошибка в параметрах запроса на исследование
+    """
+
+
+def normalize_request(request: dict):
+    """
+    Приведение запроса на исследование к каноническому виду.
+    """
+    if not isinstance(request, dict):
+        raise JobRequestError("Запрос должен быть JSON-объектом")
+
+    try:
+        point = {}
+        for name in STUDY_PARAMETERS:
+            if name in request:
+                point[name] = int(request[name]) if name in INTEGER_PARAMETERS else float(request[name])
+        snr_range = request.get("snr", [10, -11, -1])
+        snr_values = list(range(*(int(value) for value in snr_range)))
+        average_count = int(request.get("average_count", DEFAULT_AVERAGE_COUNT))
+        bits_source = BitsSourceType[request.get("bits_source", BitsSourceType.RANDOM.name)]
+        correlation_type = CorrelationType[request.get("correlation_type", CorrelationType.CC.name)]
+        baseband_mode = BasebandMode[request.get("baseband_mode", BasebandMode.PASSBAND.name)]
+        cfar_type = CfarType[request.get("cfar_type", CfarType.CA.name)]
+        seed = request.get("seed")
+        seed = None if seed is None else int(seed)
+    except (TypeError, ValueError, KeyError) as error:
+        raise JobRequestError(f"Некорректные параметры исследования: {error}")
+
+    if not snr_values or average_count <= 0:
+        raise JobRequestError("Пустая сетка ОСШ или неположительное количество усреднений")
+    if seed is not None and seed < 0:
+        raise JobRequestError("Зерно должно быть неотрицательным")
+
+    return {
+        "point": point,
+        "snr_values": snr_values,
+        "average_count": average_count,
+        "bits_source": bits_source.name,
+        "correlation_type": correlation_type.name,
+        "baseband_mode": baseband_mode.name,
+        "cfar_type": cfar_type.name,
+        "seed": seed,
+    }
+
+
+class ResearchJob:
+    """
+    Задание на исследование и его промежуточные результаты
+    """
+    def __init__(self, key: str, parameters: dict):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.parameters = parameters
+        self.status = "queued"
+        self.error = None
+        self.rows = []
+        self.done_count = 0
+        self.total_count = len(parameters["snr_values"])
+        self.changed = asyncio.Condition()
+
+    @property
+    def finished(self):
+        return self.status in ("done", "failed")
+
+    def to_dict(self, rows_from: int = 0):
+        """
+        Состояние задания для передачи клиенту.
+        """
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "error": self.error,
+            "done": self.done_count,
+            "total": self.total_count,
+            "rows": self.rows[rows_from:],
+        }
+
+
+class ResearchJobService:
+    """
+    Асинхронный сервис очереди исследований с локальным HTTP-интерфейсом
+    """
+    def __init__(self, max_workers: int = None, max_running_jobs: int = JOB_SERVICE_MAX_RUNNING_JOBS,
+                 max_finished_jobs: int = JOB_SERVICE_MAX_FINISHED_JOBS):
+        self.executor = ProcessPoolExecutor(max_workers=max_workers, initializer=warm_up_kernels)
+        self.running_limit = asyncio.Semaphore(max_running_jobs)
+        self.max_finished_jobs = max_finished_jobs
+        self.jobs = {}
+        self.in_flight = {}
+        # Номера завершенных заданий в порядке завершения
+        self.finished_jobs = deque()
+
+    async def submit(self, request: dict):
+        """
+        Постановка задания в очередь; одинаковые незавершенные запросы объединяются.
+        """
+        parameters = normalize_request(request)
+        key = hashlib.sha256(json.dumps(parameters, sort_keys=True).encode("utf-8")).hexdigest()
+        job = self.in_flight.get(key)
+        if job is not None:
+            return job
+
+        job = ResearchJob(key, parameters)
+        self.jobs[job.id] = job
+        self.in_flight[key] = job
+        asyncio.get_running_loop().create_task(self._run(job))
+        return job
+
+    async def _run_point(self, job: ResearchJob, snr: int):
+        """
+        Расчет одной точки по ОСШ в пуле процессов.
+        """
+        parameters = job.parameters
+        unit = {"points": [parameters["point"]], "snr_values": [snr], "average_count": parameters["average_count"]}
+        loop = asyncio.get_running_loop()
+        rows = await loop.run_in_executor(self.executor, run_work_unit, unit,
+                                          BitsSourceType[parameters["bits_source"]],
+                                          CorrelationType[parameters["correlation_type"]],
+                                          BasebandMode[parameters["baseband_mode"]],
+                                          parameters["seed"], CfarType[parameters["cfar_type"]])
+        async with job.changed:
+            job.rows.extend(rows)
+            job.done_count += 1
+            job.changed.notify_all()
+
+    async def _run(self, job: ResearchJob):
+        """
+        Выполнение задания с ограничением числа одновременно выполняемых заданий.
+        """
+        try:
+            async with self.running_limit:
+                async with job.changed:
+                    job.status = "running"
+                    job.changed.notify_all()
+                await asyncio.gather(*(self._run_point(job, snr) for snr in job.parameters["snr_values"]))
+            status, error = "done", None
+        except Exception as exception:
+            status, error = "failed", str(exception)
+        finally:
+            self.in_flight.pop(job.key, None)
+
+        async with job.changed:
+            job.status = status
+            job.error = error
+            job.changed.notify_all()
+        self._forget_finished(job)
+
+    def _forget_finished(self, job: ResearchJob):
+        """
+        Учет завершенного задания и удаление самых старых завершенных заданий сверх лимита.
+
+        Уже открытые потоки прогресса удаленного задания дочитываются до конца.
+        """
+        self.finished_jobs.append(job.id)
+        while len(self.finished_jobs) > self.max_finished_jobs:
+            self.jobs.pop(self.finished_jobs.popleft(), None)
+
+    async def stream(self, job: ResearchJob):
+        """
+        Асинхронный генератор изменений задания до его завершения.
+        """
+        sent_rows = 0
+        last_state = None
+        while True:
+            async with job.changed:
+                await job.changed.wait_for(
+                    lambda: len(job.rows) > sent_rows or (job.status, job.done_count) != last_state)
+                event = job.to_dict(sent_rows)
+                sent_rows = len(job.rows)
+                last_state = (job.status, job.done_count)
+                finished = job.finished
+            yield event
+            if finished:
+                return
+
+    @staticmethod
+    async def _send_json(writer: asyncio.StreamWriter, status: HTTPStatus, data: dict):
+        """
+        Отправка JSON-ответа.
+        """
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        writer.write(f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                     f"Content-Type: application/json; charset=utf-8\r\n"
+                     f"Content-Length: {len(body)}\r\n"
+                     f"Connection: close\r\n\r\n".encode("ascii") + body)
+        await writer.drain()
+
+    async def _send_stream(self, writer: asyncio.StreamWriter, job: ResearchJob):
+        """
+        Потоковая передача прогресса задания (NDJSON, chunked).
+        """
+        writer.write(b"HTTP/1.1 200 OK\r\n"
+                     b"Content-Type: application/x-ndjson; charset=utf-8\r\n"
+                     b"Transfer-Encoding: chunked\r\n"
+                     b"Connection: close\r\n\r\n")
+        async for event in self.stream(job):
+            line = (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+            writer.write(f"{len(line):x}\r\n".encode("ascii") + line + b"\r\n")
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Обработка HTTP-запроса клиента.
+
+        POST /jobs - постановка задания, GET /jobs/<id> - состояние, GET /jobs/<id>/stream - поток прогресса.
+        """
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1").strip()
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+            if len(request_line) < 2:
+                await self._send_json(writer, HTTPStatus.BAD_REQUEST, {"error": "Некорректный запрос"})
+                return
+
+            method, path = request_line[0], request_line[1].rstrip("/")
+            parts = path.strip("/").split("/")
+            if method == "POST" and parts == ["jobs"]:
+                try:
+                    job = await self.submit(json.loads(body or b"{}"))
+                except (JobRequestError, ValueError) as error:
+                    await self._send_json(writer, HTTPStatus.BAD_REQUEST, {"error": str(error)})
+                    return
+                await self._send_json(writer, HTTPStatus.ACCEPTED, job.to_dict())
+            elif method == "GET" and parts == ["jobs"]:
+                await self._send_json(writer, HTTPStatus.OK,
+                                      {"jobs": [{"job_id": job.id, "status": job.status} for job in self.jobs.values()]})
+            elif method == "GET" and len(parts) in (2, 3) and parts[0] == "jobs":
+                job = self.jobs.get(parts[1])
+                if job is None:
+                    await self._send_json(writer, HTTPStatus.NOT_FOUND, {"error": "Задание не найдено"})
+                elif len(parts) == 3 and parts[2] == "stream":
+                    await self._send_stream(writer, job)
+                else:
+                    await self._send_json(writer, HTTPStatus.OK, job.to_dict())
+            else:
+                await self._send_json(writer, HTTPStatus.NOT_FOUND, {"error": "Неизвестный адрес"})
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = JOB_SERVICE_HOST, port: int = JOB_SERVICE_PORT, unix_path: str = None):
+        """
+        Запуск сервиса на локальном TCP-порту или UNIX-сокете.
+        """
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_client, path=unix_path)
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.executor.shutdown(cancel_futures=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Локальный сервис очереди исследований")
+    parser.add_argument("--host", default=JOB_SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=JOB_SERVICE_PORT)
+    parser.add_argument("--unix", default=None, help="Путь к UNIX-сокету вместо TCP-порта")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-jobs", type=int, default=JOB_SERVICE_MAX_RUNNING_JOBS)
+    parser.add_argument("--keep-jobs", type=int, default=JOB_SERVICE_MAX_FINISHED_JOBS,
+                        help="Количество хранимых завершенных заданий")
+    args = parser.parse_args()
+    if args.keep_jobs < 0:
+        parser.error("--keep-jobs должно быть неотрицательным")
+
+    async def run():
+        service = ResearchJobService(args.workers, args.max_jobs, args.keep_jobs)
+        await service.serve(args.host, args.port, args.unix)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
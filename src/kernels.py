@@ -0,0 +1,234 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+from enums import KernelBackend
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+# Переменная окружения для выбора реализации ядер (имя KernelBackend), наследуется процессами-исполнителями
+KERNEL_BACKEND_ENV = "SIGNALS_KERNEL_BACKEND"
+# Допустимое абсолютное отклонение ядер от эталонной реализации NumPy
+KERNEL_PARITY_TOLERANCE = 1e-9
+
+
+def _modulate_loop(t, bit_time, bits, amplitudes, frequencies, phases, continuous_phase, initial_phases):
+    """
+    Манипуляция пакета информационных последовательностей (строки bits) с произвольной длительностью бита.
+    """
+    rows_count, samples_count = bits.shape[0], t.shape[0]
+    values = np.empty((rows_count, samples_count))
+    last_phases = np.empty(rows_count)
+    for row in range(rows_count):
+        previous_phase = initial_phases[row]
+        for i in range(samples_count):
+            bit = bits[row, int(t[i] / bit_time)]
+            phase = frequencies[bit] * t[i]
+            offset = phases[bit]
+            if continuous_phase:
+                offset += previous_phase
+            values[row, i] = amplitudes[bit] * np.cos(phase + offset)
+            previous_phase = phase
+        last_phases[row] = previous_phase
+    return values, last_phases
+
+
+def _uniform_mean_loop(uniform):
+    """
+    Шум по Ирвину-Холлу: среднее строк равномерно распределенных на [0, 1) чисел, приведенных к [-1, 1).
+    """
+    rows_count, terms_count = uniform.shape
+    noise = np.empty(rows_count)
+    for row in range(rows_count):
+        total = 0.
+        for i in range(terms_count):
+            total += 2. * uniform[row, i] - 1.
+        noise[row] = total / terms_count
+    return noise
+
+
+def _os_noise_loop(padded, samples_count, guard_cells, training_cells, rank):
+    """
+    Порядковая статистика обучающих ячеек OS-CFAR для каждой ячейки (строки padded - дополненные сигналы).
+    """
+    rows_count = padded.shape[0]
+    window_len = 2 * (guard_cells + training_cells) + 1
+    noise = np.empty((rows_count, samples_count))
+    training = np.empty(2 * training_cells)
+    for row in range(rows_count):
+        for i in range(samples_count):
+            training[:training_cells] = padded[row, i:i + training_cells]
+            training[training_cells:] = padded[row, i + window_len - training_cells:i + window_len]
+            noise[row, i] = np.sort(training)[rank - 1]
+    return noise
+
+
+def _select_peaks_loop(power, guard_cells, peaks_count):
+    """
+    Последовательный выбор максимумов строк power с исключением окрестности уже выбранных пиков.
+    """
+    rows_count, samples_count = power.shape
+    indices = np.empty((rows_count, peaks_count), dtype=np.int64)
+    remaining = np.empty(samples_count)
+    for row in range(rows_count):
+        remaining[:] = power[row]
+        for peak in range(peaks_count):
+            index = np.argmax(remaining)
+            indices[row, peak] = index
+            remaining[max(index - guard_cells, 0):min(index + guard_cells + 1, samples_count)] = -np.inf
+    return indices
+
+
+# Ядра с циклами по отсчетам: имя -> исходная функция Python
+_KERNEL_SOURCES = {
+    "modulate": _modulate_loop,
+    "uniform_mean": _uniform_mean_loop,
+    "os_noise": _os_noise_loop,
+    "select_peaks": _select_peaks_loop,
+}
+# Скомпилированные ядра (компиляция при первом обращении, машинный код кэшируется на диске)
+_compiled_kernels = {}
+
+
+def _get_available_backend(backend: KernelBackend):
+    """
+    Реализация, которая будет использована вместо запрошенной: без Numba - NumPy.
+    """
+    if backend == KernelBackend.NUMBA and numba is None:
+        return KernelBackend.NUMPY
+    return backend
+
+
+def _get_default_backend():
+    """
+    Реализация по умолчанию: из переменной окружения, иначе Numba (если установлена) или NumPy.
+    """
+    name = os.environ.get(KERNEL_BACKEND_ENV)
+    if not name:
+        return _get_available_backend(KernelBackend.NUMBA)
+    try:
+        backend = KernelBackend[name.strip().upper()]
+    except KeyError:
+        raise ValueError(f"Неизвестная реализация ядер в {KERNEL_BACKEND_ENV}: {name} "
+                         f"(допустимы {', '.join(backend.name for backend in KernelBackend)})") from None
+    return _get_available_backend(backend)
+
+
+_backend = _get_default_backend()
+
+
+def get_kernel_backend():
+    return _backend
+
+
+def set_kernel_backend(backend: KernelBackend):
+    """
+    Выбор реализации ядер; при отсутствии Numba выбирается реализация NumPy.
+    """
+    global _backend
+    _backend = _get_available_backend(backend)
+
+
+@contextmanager
+def use_kernel_backend(backend: KernelBackend):
+    """
+    Временный выбор реализации ядер.
+    """
+    previous = _backend
+    set_kernel_backend(backend)
+    try:
+        yield
+    finally:
+        set_kernel_backend(previous)
+
+
+def get_kernel(name: str):
+    """
+    Ядро с циклами для выбранной реализации; None - использовать векторизованный расчет NumPy.
+    """
+    if _backend == KernelBackend.NUMPY:
+        return None
+    if _backend == KernelBackend.PYTHON:
+        return _KERNEL_SOURCES[name]
+
+    kernel = _compiled_kernels.get(name)
+    if kernel is None:
+        kernel = numba.njit(cache=True)(_KERNEL_SOURCES[name])
+        _compiled_kernels[name] = kernel
+    return kernel
+
+
+def warm_up_kernels():
+    """
+    Компиляция (или загрузка из дискового кэша) всех ядер на малых данных, чтобы она не выполнялась
+    при первом расчете. Возвращает затраченное время, с.
+    """
+    start = time.perf_counter()
+    if _backend != KernelBackend.NUMBA:
+        return 0.
+
+    t = np.arange(4) / 4.
+    get_kernel("modulate")(t, 0.5, np.zeros((1, 2), dtype=np.int64), np.ones(2), np.ones(2), np.zeros(2),
+                           True, np.zeros(1))
+    get_kernel("uniform_mean")(np.zeros((1, 2)))
+    get_kernel("os_noise")(np.zeros((1, 9)), 3, 1, 2, 2)
+    get_kernel("select_peaks")(np.zeros((1, 4)), 1, 2)
+    return time.perf_counter() - start
+
+
+def check_kernels_parity(backend: KernelBackend = None):
+    """
+    Сравнение ядер выбранной реализации с эталонным векторизованным расчетом NumPy на случайных данных.
+
+    Возвращает словарь {имя проверки: максимальное абсолютное отклонение}.
+    """
+    from cfar_detector import get_cfar_threshold, find_cfar_peaks
+    from enums import CfarType, ModulationType, SignalType
+    from signals_generator import SignalGenerator
+
+    if backend is None:
+        backend = KernelBackend.NUMBA if numba is not None else KernelBackend.PYTHON
+    rng = np.random.default_rng(0)
+
+    def run(function):
+        with use_kernel_backend(KernelBackend.NUMPY):
+            reference = function()
+        with use_kernel_backend(backend):
+            result = function()
+        return max(float(np.max(np.abs(np.asarray(a, dtype=float) - np.asarray(b, dtype=float))))
+                   for a, b in zip(reference, result))
+
+    signal_generator = SignalGenerator(b_count=7, bps=30)
+    signal_generator.recalc_parameters()
+    bits = rng.integers(0, 2, (3, signal_generator.bits_count))
+    deviations = {}
+    for modulation_type in ModulationType:
+        deviations[f"modulate_{modulation_type.name}"] = run(
+            lambda: signal_generator.modulate_bits(bits, SignalType.GENERAL, modulation_type, 0.3)[1:])
+
+    def noise():
+        signal_generator.set_seed(1)
+        return [signal_generator.get_noise_values(SignalType.GENERAL, (2, 50))]
+    deviations["noise"] = run(noise)
+
+    power = rng.exponential(size=(2, 200))
+    deviations["os_threshold"] = run(lambda: [get_cfar_threshold(power, 2, 6, CfarType.OS)])
+    deviations["peaks"] = run(lambda: find_cfar_peaks(power, 3, 6, CfarType.CA, envelope=False))
+    return deviations
+
+
+if __name__ == "__main__":
+    print(f"Реализация ядер: {_backend.name}, прогрев: {warm_up_kernels():.3f} с")
+    failed = False
+    for check, deviation in check_kernels_parity().items():
+        status = "OK" if deviation <= KERNEL_PARITY_TOLERANCE else "ОТЛИЧИЕ"
+        failed |= status != "OK"
+        print(f"{check}: {deviation:.3g} {status}")
+    sys.exit(1 if failed else 0)
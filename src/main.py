@@ -1,14 +1,47 @@
 import sys
-from PyQt5 import QtWidgets
+import threading
 
-from main_logic import MainApp
+from startup_profile import StartupProfiler
 
 
 def main():
+    # Отчет о времени запуска: python main.py --profile-startup
+    profiler = None
+    if "--profile-startup" in sys.argv:
+        sys.argv.remove("--profile-startup")
+        profiler = StartupProfiler().install()
+
+    # Модули интерфейса собираются явно (python ui2py.py); при запуске только проверяется их актуальность
+    from ui2py import is_ui_build_outdated
+    if is_ui_build_outdated():
+        print("Предупреждение: ui/main.ui или ресурсы изменены после сборки интерфейса, "
+              "выполните python ui2py.py")
+
+    from PyQt5 import QtWidgets, QtCore
+    from main_logic import MainApp
+
     app = QtWidgets.QApplication(sys.argv)
+    if profiler is not None:
+        profiler.mark("Импорт модулей интерфейса")
+
     screen_geometry = app.desktop().screenGeometry()
     window = MainApp(screen_geometry)
     window.show()
+
+    if profiler is not None:
+        profiler.mark("Создание главного окна")
+
+        def report():
+            profiler.mark("Первая отрисовка окна")
+            profiler.uninstall()
+            print(profiler.report())
+
+        QtCore.QTimer.singleShot(0, report)
+
+    # Компиляция ускоренных ядер (если доступны) в фоновом потоке, чтобы не блокировать интерфейс
+    from kernels import warm_up_kernels
+    threading.Thread(target=warm_up_kernels, name="kernels-warm-up", daemon=True).start()
+
     app.exec_()
 
 
@@ -2,7 +2,7 @@
 
 # Form implementation generated from reading ui file '../ui/main.ui'
 #
-# Created by: PyQt5 UI code generator 5.15.7
+# Created by: PyQt5 UI code generator 5.15.11
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic5 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -73,7 +73,7 @@ class Ui_MainWindow(object):
         self.horizontalLayout_3.addWidget(self.application_name_label, 0, QtCore.Qt.AlignTop)
         self.application_icon_label = QtWidgets.QLabel(self.name_frame)
         self.application_icon_label.setText("")
-        self.application_icon_label.setPixmap(QtGui.QPixmap("../ui\\../icons/application_icon.png"))
+        self.application_icon_label.setPixmap(QtGui.QPixmap(":/icons/application_icon.png"))
         self.application_icon_label.setObjectName("application_icon_label")
         self.horizontalLayout_3.addWidget(self.application_icon_label, 0, QtCore.Qt.AlignTop)
         self.verticalLayout_6.addWidget(self.name_frame, 0, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignTop)
@@ -102,7 +102,7 @@ class Ui_MainWindow(object):
         self.open_parameters_page_button.setFont(font)
         self.open_parameters_page_button.setStyleSheet("color: rgb(255, 255, 255);")
         icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("../ui\\../icons/settings.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon.addPixmap(QtGui.QPixmap(":/icons/settings.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.open_parameters_page_button.setIcon(icon)
         self.open_parameters_page_button.setIconSize(QtCore.QSize(30, 30))
         self.open_parameters_page_button.setObjectName("open_parameters_page_button")
@@ -117,7 +117,7 @@ class Ui_MainWindow(object):
         self.open_main_page_button.setFont(font)
         self.open_main_page_button.setStyleSheet("color: rgb(255, 255, 255);")
         icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap("../ui\\../icons/main_graphs.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon1.addPixmap(QtGui.QPixmap(":/icons/main_graphs.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.open_main_page_button.setIcon(icon1)
         self.open_main_page_button.setIconSize(QtCore.QSize(30, 30))
         self.open_main_page_button.setObjectName("open_main_page_button")
@@ -132,7 +132,7 @@ class Ui_MainWindow(object):
         self.open_help_page_button.setFont(font)
         self.open_help_page_button.setStyleSheet("color: rgb(255, 255, 255);")
         icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap("../ui\\../icons/help_graphs.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon2.addPixmap(QtGui.QPixmap(":/icons/help_graphs.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.open_help_page_button.setIcon(icon2)
         self.open_help_page_button.setIconSize(QtCore.QSize(30, 30))
         self.open_help_page_button.setObjectName("open_help_page_button")
@@ -147,7 +147,7 @@ class Ui_MainWindow(object):
         self.open_research_page_button.setFont(font)
         self.open_research_page_button.setStyleSheet("color: rgb(255, 255, 255);")
         icon3 = QtGui.QIcon()
-        icon3.addPixmap(QtGui.QPixmap("../ui\\../icons/research.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon3.addPixmap(QtGui.QPixmap(":/icons/research.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.open_research_page_button.setIcon(icon3)
         self.open_research_page_button.setIconSize(QtCore.QSize(30, 30))
         self.open_research_page_button.setObjectName("open_research_page_button")
@@ -188,7 +188,7 @@ class Ui_MainWindow(object):
         self.side_menu_button = QtWidgets.QPushButton(self.side_menu_button_frame)
         self.side_menu_button.setText("")
         icon4 = QtGui.QIcon()
-        icon4.addPixmap(QtGui.QPixmap("../ui\\../icons/back_menu.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon4.addPixmap(QtGui.QPixmap(":/icons/back_menu.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.side_menu_button.setIcon(icon4)
         self.side_menu_button.setIconSize(QtCore.QSize(30, 30))
         self.side_menu_button.setObjectName("side_menu_button")
@@ -206,7 +206,7 @@ class Ui_MainWindow(object):
         self.minimized_button = QtWidgets.QPushButton(self.window_buttons_frame)
         self.minimized_button.setText("")
         icon5 = QtGui.QIcon()
-        icon5.addPixmap(QtGui.QPixmap("../ui\\../icons/minimize_button.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon5.addPixmap(QtGui.QPixmap(":/icons/minimize_button.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.minimized_button.setIcon(icon5)
         self.minimized_button.setIconSize(QtCore.QSize(30, 30))
         self.minimized_button.setObjectName("minimized_button")
@@ -214,7 +214,7 @@ class Ui_MainWindow(object):
         self.maximized_button = QtWidgets.QPushButton(self.window_buttons_frame)
         self.maximized_button.setText("")
         icon6 = QtGui.QIcon()
-        icon6.addPixmap(QtGui.QPixmap("../ui\\../icons/maximize_button.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon6.addPixmap(QtGui.QPixmap(":/icons/maximize_button.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.maximized_button.setIcon(icon6)
         self.maximized_button.setIconSize(QtCore.QSize(30, 30))
         self.maximized_button.setObjectName("maximized_button")
@@ -222,7 +222,7 @@ class Ui_MainWindow(object):
         self.close_button = QtWidgets.QPushButton(self.window_buttons_frame)
         self.close_button.setText("")
         icon7 = QtGui.QIcon()
-        icon7.addPixmap(QtGui.QPixmap("../ui\\../icons/close_button.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon7.addPixmap(QtGui.QPixmap(":/icons/close_button.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.close_button.setIcon(icon7)
         self.close_button.setIconSize(QtCore.QSize(30, 30))
         self.close_button.setObjectName("close_button")
@@ -329,6 +329,94 @@ class Ui_MainWindow(object):
         self.label_9.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
         self.label_9.setObjectName("label_9")
         self.verticalLayout_8.addWidget(self.label_9)
+        self.label_10 = QtWidgets.QLabel(self.names_container)
+        self.label_10.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_10.setFont(font)
+        self.label_10.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_10.setObjectName("label_10")
+        self.verticalLayout_8.addWidget(self.label_10)
+        self.label_11 = QtWidgets.QLabel(self.names_container)
+        self.label_11.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_11.setFont(font)
+        self.label_11.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_11.setObjectName("label_11")
+        self.verticalLayout_8.addWidget(self.label_11)
+        self.label_12 = QtWidgets.QLabel(self.names_container)
+        self.label_12.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_12.setFont(font)
+        self.label_12.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_12.setObjectName("label_12")
+        self.verticalLayout_8.addWidget(self.label_12)
+        self.label_13 = QtWidgets.QLabel(self.names_container)
+        self.label_13.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_13.setFont(font)
+        self.label_13.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_13.setObjectName("label_13")
+        self.verticalLayout_8.addWidget(self.label_13)
+        self.label_14 = QtWidgets.QLabel(self.names_container)
+        self.label_14.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_14.setFont(font)
+        self.label_14.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_14.setObjectName("label_14")
+        self.verticalLayout_8.addWidget(self.label_14)
+        self.label_15 = QtWidgets.QLabel(self.names_container)
+        self.label_15.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_15.setFont(font)
+        self.label_15.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_15.setObjectName("label_15")
+        self.verticalLayout_8.addWidget(self.label_15)
+        self.label_16 = QtWidgets.QLabel(self.names_container)
+        self.label_16.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_16.setFont(font)
+        self.label_16.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_16.setObjectName("label_16")
+        self.verticalLayout_8.addWidget(self.label_16)
+        self.label_17 = QtWidgets.QLabel(self.names_container)
+        self.label_17.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_17.setFont(font)
+        self.label_17.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_17.setObjectName("label_17")
+        self.verticalLayout_8.addWidget(self.label_17)
         self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.names_container)
         self.edit_container = QtWidgets.QFrame(self.parameters_page)
         self.edit_container.setStyleSheet("")
@@ -420,6 +508,126 @@ class Ui_MainWindow(object):
         self.snr_edit.setAlignment(QtCore.Qt.AlignCenter)
         self.snr_edit.setObjectName("snr_edit")
         self.verticalLayout_12.addWidget(self.snr_edit)
+        self.bits_source_combo = QtWidgets.QComboBox(self.edit_container)
+        self.bits_source_combo.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.bits_source_combo.setFont(font)
+        self.bits_source_combo.setStyleSheet("border: 1px solid black;\n"
+"border-radius: 10px;")
+        self.bits_source_combo.setObjectName("bits_source_combo")
+        self.bits_source_combo.addItem("")
+        self.bits_source_combo.addItem("")
+        self.bits_source_combo.addItem("")
+        self.bits_source_combo.addItem("")
+        self.verticalLayout_12.addWidget(self.bits_source_combo)
+        self.correlation_type_combo = QtWidgets.QComboBox(self.edit_container)
+        self.correlation_type_combo.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.correlation_type_combo.setFont(font)
+        self.correlation_type_combo.setStyleSheet("border: 1px solid black;\n"
+"border-radius: 10px;")
+        self.correlation_type_combo.setObjectName("correlation_type_combo")
+        self.correlation_type_combo.addItem("")
+        self.correlation_type_combo.addItem("")
+        self.correlation_type_combo.addItem("")
+        self.correlation_type_combo.addItem("")
+        self.correlation_type_combo.addItem("")
+        self.verticalLayout_12.addWidget(self.correlation_type_combo)
+        self.baseband_mode_combo = QtWidgets.QComboBox(self.edit_container)
+        self.baseband_mode_combo.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.baseband_mode_combo.setFont(font)
+        self.baseband_mode_combo.setStyleSheet("border: 1px solid black;\n"
+"border-radius: 10px;")
+        self.baseband_mode_combo.setObjectName("baseband_mode_combo")
+        self.baseband_mode_combo.addItem("")
+        self.baseband_mode_combo.addItem("")
+        self.baseband_mode_combo.addItem("")
+        self.verticalLayout_12.addWidget(self.baseband_mode_combo)
+        self.multipath_edit = QtWidgets.QLineEdit(self.edit_container)
+        self.multipath_edit.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.multipath_edit.setFont(font)
+        self.multipath_edit.setStyleSheet("border: 1px solid black;\n"
+"border-radius: 10px;")
+        self.multipath_edit.setAlignment(QtCore.Qt.AlignCenter)
+        self.multipath_edit.setObjectName("multipath_edit")
+        self.verticalLayout_12.addWidget(self.multipath_edit)
+        self.doppler_shift_edit = QtWidgets.QLineEdit(self.edit_container)
+        self.doppler_shift_edit.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.doppler_shift_edit.setFont(font)
+        self.doppler_shift_edit.setStyleSheet("border: 1px solid black;\n"
+"border-radius: 10px;")
+        self.doppler_shift_edit.setAlignment(QtCore.Qt.AlignCenter)
+        self.doppler_shift_edit.setObjectName("doppler_shift_edit")
+        self.verticalLayout_12.addWidget(self.doppler_shift_edit)
+        self.channel_noise_combo = QtWidgets.QComboBox(self.edit_container)
+        self.channel_noise_combo.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.channel_noise_combo.setFont(font)
+        self.channel_noise_combo.setStyleSheet("border: 1px solid black;\n"
+"border-radius: 10px;")
+        self.channel_noise_combo.setObjectName("channel_noise_combo")
+        self.channel_noise_combo.addItem("")
+        self.channel_noise_combo.addItem("")
+        self.channel_noise_combo.addItem("")
+        self.verticalLayout_12.addWidget(self.channel_noise_combo)
+        self.quantization_combo = QtWidgets.QComboBox(self.edit_container)
+        self.quantization_combo.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.quantization_combo.setFont(font)
+        self.quantization_combo.setStyleSheet("border: 1px solid black;\n"
+"border-radius: 10px;")
+        self.quantization_combo.setObjectName("quantization_combo")
+        self.quantization_combo.addItem("")
+        self.quantization_combo.addItem("")
+        self.quantization_combo.addItem("")
+        self.quantization_combo.addItem("")
+        self.quantization_combo.addItem("")
+        self.verticalLayout_12.addWidget(self.quantization_combo)
+        self.cfar_type_combo = QtWidgets.QComboBox(self.edit_container)
+        self.cfar_type_combo.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.cfar_type_combo.setFont(font)
+        self.cfar_type_combo.setStyleSheet("border: 1px solid black;\n"
+"border-radius: 10px;")
+        self.cfar_type_combo.setObjectName("cfar_type_combo")
+        self.cfar_type_combo.addItem("")
+        self.cfar_type_combo.addItem("")
+        self.verticalLayout_12.addWidget(self.cfar_type_combo)
         self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.edit_container)
         self.start_button_container = QtWidgets.QFrame(self.parameters_page)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding)
@@ -446,7 +654,7 @@ class Ui_MainWindow(object):
 "border: 1px solid black;\n"
 "border-radius: 20px;")
         icon8 = QtGui.QIcon()
-        icon8.addPixmap(QtGui.QPixmap("../ui\\../icons/start.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon8.addPixmap(QtGui.QPixmap(":/icons/start.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.start_calc_button.setIcon(icon8)
         self.start_calc_button.setIconSize(QtCore.QSize(30, 30))
         self.start_calc_button.setObjectName("start_calc_button")
@@ -513,6 +721,21 @@ class Ui_MainWindow(object):
         self.mchm_manipulation_radio.setStyleSheet("border: none;")
         self.mchm_manipulation_radio.setObjectName("mchm_manipulation_radio")
         self.verticalLayout_15.addWidget(self.mchm_manipulation_radio)
+        self.main_view_combo = QtWidgets.QComboBox(self.frame_2)
+        self.main_view_combo.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.main_view_combo.setFont(font)
+        self.main_view_combo.setStyleSheet("border: 1px solid black;\n"
+"border-radius: 10px;")
+        self.main_view_combo.setObjectName("main_view_combo")
+        self.main_view_combo.addItem("")
+        self.main_view_combo.addItem("")
+        self.main_view_combo.addItem("")
+        self.verticalLayout_15.addWidget(self.main_view_combo)
         spacerItem2 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
         self.verticalLayout_15.addItem(spacerItem2)
         self.time_delay_assessment_edit = QtWidgets.QLineEdit(self.frame_2)
@@ -597,8 +820,60 @@ class Ui_MainWindow(object):
         self.label_3.setStyleSheet("border: none;")
         self.label_3.setObjectName("label_3")
         self.verticalLayout_13.addWidget(self.label_3)
+        self.importance_sampling_checkbox = QtWidgets.QCheckBox(self.frame_4)
+        self.importance_sampling_checkbox.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.importance_sampling_checkbox.setFont(font)
+        self.importance_sampling_checkbox.setStyleSheet("border: none;")
+        self.importance_sampling_checkbox.setObjectName("importance_sampling_checkbox")
+        self.verticalLayout_13.addWidget(self.importance_sampling_checkbox)
+        self.research_view_combo = QtWidgets.QComboBox(self.frame_4)
+        self.research_view_combo.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.research_view_combo.setFont(font)
+        self.research_view_combo.setStyleSheet("border: 1px solid black;\n"
+"border-radius: 10px;")
+        self.research_view_combo.setObjectName("research_view_combo")
+        self.research_view_combo.addItem("")
+        self.research_view_combo.addItem("")
+        self.research_view_combo.addItem("")
+        self.research_view_combo.addItem("")
+        self.verticalLayout_13.addWidget(self.research_view_combo)
+        self.history_combo = QtWidgets.QComboBox(self.frame_4)
+        self.history_combo.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.history_combo.setFont(font)
+        self.history_combo.setStyleSheet("border: 1px solid black;\n"
+"border-radius: 10px;")
+        self.history_combo.setObjectName("history_combo")
+        self.history_combo.addItem("")
+        self.verticalLayout_13.addWidget(self.history_combo)
         spacerItem4 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         self.verticalLayout_13.addItem(spacerItem4)
+        self.predict_button = QtWidgets.QPushButton(self.frame_4)
+        self.predict_button.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Century Gothic")
+        font.setPointSize(10)
+        self.predict_button.setFont(font)
+        self.predict_button.setStyleSheet("background-color: rgb(21, 28, 77);\n"
+"color: rgb(255, 255, 255);\n"
+"border: 1px solid black;\n"
+"border-radius: 15px;")
+        self.predict_button.setObjectName("predict_button")
+        self.verticalLayout_13.addWidget(self.predict_button)
         self.start_research_button = QtWidgets.QPushButton(self.frame_4)
         self.start_research_button.setMinimumSize(QtCore.QSize(0, 30))
         font = QtGui.QFont()
@@ -665,11 +940,53 @@ class Ui_MainWindow(object):
         self.label_7.setText(_translate("MainWindow", "Несущая частота, Гц"))
         self.label_8.setText(_translate("MainWindow", "Временная задержка в исследуемом канале, мс"))
         self.label_9.setText(_translate("MainWindow", "ОСШ в исследуемом канале, дБ"))
+        self.label_10.setText(_translate("MainWindow", "Опорная последовательность"))
+        self.label_11.setText(_translate("MainWindow", "Взаимная корреляционная функция"))
+        self.label_12.setText(_translate("MainWindow", "Режим расчета корреляции"))
+        self.label_13.setText(_translate("MainWindow", "Лучи канала (задержка, мс: усиление)"))
+        self.label_14.setText(_translate("MainWindow", "Доплеровский сдвиг, Гц"))
+        self.label_15.setText(_translate("MainWindow", "Шум канала"))
+        self.label_16.setText(_translate("MainWindow", "Разрядность АЦП"))
+        self.label_17.setText(_translate("MainWindow", "Обнаружитель CFAR"))
+        self.bits_source_combo.setItemText(0, _translate("MainWindow", "Случайная"))
+        self.bits_source_combo.setItemText(1, _translate("MainWindow", "M-последовательность"))
+        self.bits_source_combo.setItemText(2, _translate("MainWindow", "Код Голда"))
+        self.bits_source_combo.setItemText(3, _translate("MainWindow", "Код Баркера"))
+        self.correlation_type_combo.setItemText(0, _translate("MainWindow", "Обычная"))
+        self.correlation_type_combo.setItemText(1, _translate("MainWindow", "GCC-PHAT"))
+        self.correlation_type_combo.setItemText(2, _translate("MainWindow", "GCC-SCOT"))
+        self.correlation_type_combo.setItemText(3, _translate("MainWindow", "GCC-ROTH"))
+        self.correlation_type_combo.setItemText(4, _translate("MainWindow", "GCC-ML (HT)"))
+        self.baseband_mode_combo.setItemText(0, _translate("MainWindow", "Полосовой сигнал"))
+        self.baseband_mode_combo.setItemText(1, _translate("MainWindow", "Аналитический сигнал"))
+        self.baseband_mode_combo.setItemText(2, _translate("MainWindow", "Квадратурная демодуляция"))
+        self.multipath_edit.setPlaceholderText(_translate("MainWindow", "3:0.5; 7.5:-0.3"))
+        self.channel_noise_combo.setItemText(0, _translate("MainWindow", "Белый"))
+        self.channel_noise_combo.setItemText(1, _translate("MainWindow", "Окрашенный (1/f)"))
+        self.channel_noise_combo.setItemText(2, _translate("MainWindow", "Импульсный"))
+        self.quantization_combo.setItemText(0, _translate("MainWindow", "Без квантования"))
+        self.quantization_combo.setItemText(1, _translate("MainWindow", "8 бит"))
+        self.quantization_combo.setItemText(2, _translate("MainWindow", "10 бит"))
+        self.quantization_combo.setItemText(3, _translate("MainWindow", "12 бит"))
+        self.quantization_combo.setItemText(4, _translate("MainWindow", "16 бит"))
+        self.cfar_type_combo.setItemText(0, _translate("MainWindow", "CA (среднее)"))
+        self.cfar_type_combo.setItemText(1, _translate("MainWindow", "OS (порядковая статистика)"))
         self.start_calc_button.setText(_translate("MainWindow", "Перейти к построению"))
         self.am_manipulation_radio.setText(_translate("MainWindow", "АМ-манипуляция"))
         self.fm2_manipulation_radio.setText(_translate("MainWindow", "ФМ2-манипуляция"))
         self.mchm_manipulation_radio.setText(_translate("MainWindow", "МЧМ-манипуляция"))
+        self.main_view_combo.setItemText(0, _translate("MainWindow", "Сигналы"))
+        self.main_view_combo.setItemText(1, _translate("MainWindow", "Спектр (метод Уэлча)"))
+        self.main_view_combo.setItemText(2, _translate("MainWindow", "Функция неопределенности"))
         self.label.setText(_translate("MainWindow", "Оценка временной задержки"))
         self.draw_button.setText(_translate("MainWindow", "Построить"))
         self.label_3.setText(_translate("MainWindow", "Количество усреднений"))
+        self.importance_sampling_checkbox.setText(_translate("MainWindow", "Редкие события"))
+        self.research_view_combo.setItemText(0, _translate("MainWindow", "Вероятность правильной оценки"))
+        self.research_view_combo.setItemText(1, _translate("MainWindow", "СКО, смещение и граница Крамера-Рао"))
+        self.research_view_combo.setItemText(2, _translate("MainWindow", "Гистограмма ошибок"))
+        self.research_view_combo.setItemText(3, _translate("MainWindow", "Обнаружение и ложные тревоги (CFAR)"))
+        self.history_combo.setItemText(0, _translate("MainWindow", "Без сравнения с историей"))
+        self.predict_button.setText(_translate("MainWindow", "Прогноз"))
         self.start_research_button.setText(_translate("MainWindow", "Запустить"))
+import resources_rc
@@ -1,10 +1,12 @@
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+import time
+
 from PyQt5 import QtWidgets, QtCore, QtGui
 
 from main_interface import Ui_MainWindow
-from mpl_widget import MplGraphicsModulated, MplGraphicsHelped, MplGraphicsResearch
 from signals_generator import SignalGenerator
-from research_logic import calc_research
+from signal_pipeline import SignalPipeline
+from research_cache import ResearchCache
+from channel_model import ChannelModel
 from enums import *
 from defaults import *
 
@@ -50,9 +52,10 @@ class MainApp(QtWidgets.QMainWindow, Ui_MainWindow):
         self.open_research_page_button.clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.research_page))
         self.maximized_button.clicked.connect(self.restore_or_maximized)
         self.side_menu_button.clicked.connect(self.slide_left_menu)
-        self.draw_button.clicked.connect(self.draw_main_page_graphics)
+        self.draw_button.clicked.connect(self.draw_new_realization)
         self.start_calc_button.clicked.connect(lambda: self.open_main_page_button.click())
         self.start_research_button.clicked.connect(self.start_research_logic)
+        self.predict_button.clicked.connect(self.predict_research_logic)
 
         # Инициализация значений по умолчанию
         self.stacked_widget.setCurrentWidget(self.parameters_page)
@@ -65,7 +68,29 @@ class MainApp(QtWidgets.QMainWindow, Ui_MainWindow):
         self.signal_freq_edit.setText(DEFAULT_SIGNAL_FREQ)
         self.time_delay_edit.setText(DEFAULT_TIME_DELAY)
         self.average_count_edit.setText(DEFAULT_AVERAGE_COUNT)
+        self.multipath_edit.setText(DEFAULT_MULTIPATH)
+        self.doppler_shift_edit.setText(DEFAULT_DOPPLER_SHIFT)
         self.signal_generator = SignalGenerator()
+        self.signal_pipeline = SignalPipeline(self.signal_generator)
+        self.research_cache = ResearchCache()
+
+        # Автоматическая перерисовка главной страницы после серии изменений параметров
+        self.redraw_timer = QtCore.QTimer(self)
+        self.redraw_timer.setSingleShot(True)
+        self.redraw_timer.setInterval(REDRAW_DEBOUNCE_INTERVAL)
+        self.redraw_timer.timeout.connect(self.draw_main_page_graphics)
+        # Версии результатов этапов, отображенные на графиках
+        self.drawn_versions = {}
+
+        # Результаты моделирования и прогноз, отображаемые на странице исследования
+        self.research_results = None
+        self.research_statistics = None
+        self.research_detection = None
+        self.prediction = None
+        self.failure_results = None
+        # История исследований (открывается при первом обращении) и выбранные из нее кривые (подпись, результаты)
+        self.results_store = None
+        self.history_results = None
 
         # Обработка событий редактирования параметров
         self.sampling_rate_edit.textChanged.connect(self.sr_change_logic)
@@ -74,29 +99,153 @@ class MainApp(QtWidgets.QMainWindow, Ui_MainWindow):
         self.signal_freq_edit.textChanged.connect(self.signal_freq_change_logic)
         self.time_delay_edit.textChanged.connect(self.time_delay_change_logic)
         self.snr_edit.textChanged.connect(self.snr_change_logic)
+        self.bits_source_combo.currentIndexChanged.connect(self.bits_source_change_logic)
+        self.correlation_type_combo.currentIndexChanged.connect(self.correlation_type_change_logic)
+        self.baseband_mode_combo.currentIndexChanged.connect(self.baseband_mode_change_logic)
+        self.multipath_edit.textChanged.connect(self.multipath_change_logic)
+        self.doppler_shift_edit.textChanged.connect(self.doppler_shift_change_logic)
+        self.channel_noise_combo.currentIndexChanged.connect(self.channel_noise_change_logic)
+        self.quantization_combo.currentIndexChanged.connect(self.quantization_change_logic)
+        self.cfar_type_combo.currentIndexChanged.connect(self.cfar_type_change_logic)
+        self.am_manipulation_radio.toggled.connect(self.schedule_redraw)
+        self.mchm_manipulation_radio.toggled.connect(self.schedule_redraw)
+        self.fm2_manipulation_radio.toggled.connect(self.schedule_redraw)
+        self.main_view_combo.currentIndexChanged.connect(self.main_view_change_logic)
+        self.research_view_combo.currentIndexChanged.connect(self.draw_ber_of_snr)
+        self.history_combo.currentIndexChanged.connect(self.history_change_logic)
+
+        # Графики (и matplotlib) инициализируются при первом показе соответствующей страницы
+        self.graphics, self.toolbar = None, None
+        self.analysis_graphics, self.analysis_toolbar = None, None
+        self.helped_graphics, self.helped_toolbar = None, None
+        # График бит, отложенный до первого показа страницы вспомогательных графиков: (x, y, подпись)
+        self.pending_bits_plot = None
+        self.research_graphics, self.research_toolbar = None, None
+        self.stacked_widget.currentChanged.connect(self.init_page_graphics)
+
+    @staticmethod
+    def _create_graphics(graphics_class, layout: QtWidgets.QLayout):
+        """
+        Создание холста графиков с панелью инструментов.
+        """
+        from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+
+        graphics = graphics_class()
+        toolbar = NavigationToolbar(graphics, graphics, coordinates=True)
+        layout.addWidget(toolbar)
+        layout.addWidget(graphics)
+        return graphics, toolbar
+
+    def init_main_graphics(self):
+        """
+        Инициализация основных графиков.
+        """
+        if self.graphics is None:
+            from mpl_widget import MplGraphicsModulated
+            self.graphics, self.toolbar = self._create_graphics(MplGraphicsModulated, self.verticalLayout_16)
 
-        # Инициализация основных графиков
-        self.graphics = MplGraphicsModulated()
-        self.toolbar = NavigationToolbar(self.graphics, self.graphics, coordinates=True)
-        self.verticalLayout_16.addWidget(self.toolbar)
-        self.verticalLayout_16.addWidget(self.graphics)
+    def init_analysis_graphics(self):
+        """
+        Инициализация графика спектрального анализа (на месте основных графиков).
+        """
+        if self.analysis_graphics is None:
+            from mpl_widget import MplGraphicsAnalysis
+            self.analysis_graphics, self.analysis_toolbar = self._create_graphics(MplGraphicsAnalysis,
+                                                                                  self.verticalLayout_16)
+
+    def init_helped_graphics(self):
+        """
+        Инициализация вспомогательных графиков.
+        """
+        if self.helped_graphics is None:
+            from mpl_widget import MplGraphicsHelped
+            self.helped_graphics, self.helped_toolbar = self._create_graphics(MplGraphicsHelped,
+                                                                              self.verticalLayout_17)
+            if self.pending_bits_plot is not None:
+                self.helped_graphics.plot_graph(*self.pending_bits_plot)
+                self.pending_bits_plot = None
+
+    def init_research_graphics(self):
+        """
+        Инициализация графика исследования.
+        """
+        if self.research_graphics is None:
+            from mpl_widget import MplGraphicsResearch
+            self.research_graphics, self.research_toolbar = self._create_graphics(MplGraphicsResearch,
+                                                                                  self.verticalLayout_10)
+            self.update_history_combo()
 
-        # Инициализация вспомогательных графиков
-        self.helped_graphics = MplGraphicsHelped()
-        self.helped_toolbar = NavigationToolbar(self.helped_graphics, self.helped_graphics, coordinates=True)
-        self.verticalLayout_17.addWidget(self.helped_toolbar)
-        self.verticalLayout_17.addWidget(self.helped_graphics)
+    def get_results_store(self):
+        """
+        История исследований (база открывается при первом обращении).
+        """
+        if self.results_store is None:
+            from results_store import ResultsStore
+            self.results_store = ResultsStore()
+        return self.results_store
 
-        # Инициализация графика исследования
-        self.research_graphics = MplGraphicsResearch()
-        self.research_toolbar = NavigationToolbar(self.research_graphics, self.research_graphics, coordinates=True)
-        self.verticalLayout_10.addWidget(self.research_toolbar)
-        self.verticalLayout_10.addWidget(self.research_graphics)
+    def update_history_combo(self):
+        """
+        Заполнение списка последних исследований из истории с сохранением выбранного.
+        """
+        selected_id = self.history_combo.currentData()
+        self.history_combo.blockSignals(True)
+        while self.history_combo.count() > 1:
+            self.history_combo.removeItem(1)
+        for sweep in self.get_results_store().find_sweeps(limit=RESULTS_HISTORY_SIZE):
+            parameters = sweep.parameters
+            created = time.strftime("%d.%m %H:%M", time.localtime(sweep.created))
+            self.history_combo.addItem(f"{created}: {parameters['bits_count']} бит, "
+                                       f"{parameters['bits_per_second']:g} бит/с, {sweep.average_count} усредн.",
+                                       sweep.id)
+        index = self.history_combo.findData(selected_id) if selected_id is not None else 0
+        self.history_combo.setCurrentIndex(max(index, 0))
+        self.history_combo.blockSignals(False)
+        if index < 0:
+            self.history_change_logic()
+
+    def history_change_logic(self):
+        """
+        Обработка выбора исследования из истории для наложения его кривых.
+        """
+        sweep_id = self.history_combo.currentData()
+        self.history_results = None
+        if sweep_id is not None:
+            # Подпись - дата и время исследования
+            label = self.history_combo.currentText().split(": ", 1)[0]
+            self.history_results = (self.get_results_store().load_results(sweep_id), label)
+        self.draw_ber_of_snr()
+
+    def init_page_graphics(self, index: int):
+        """
+        Обработка события смены страницы: создание графиков страницы при первом показе.
+        """
+        page = self.stacked_widget.widget(index)
+        if page is self.main_page:
+            self.init_main_graphics()
+        elif page is self.help_page:
+            self.init_helped_graphics()
+        elif page is self.research_page:
+            self.init_research_graphics()
 
     def draw(self, graph_type: GraphType, x: list, y: list):
         """
         Нарисовать график.
+
+        График бит до первого показа страницы вспомогательных графиков откладывается.
         """
+        if graph_type == GraphType.BITS:
+            from mpl_plots import get_bits_label
+            bits_plot = (x, y, get_bits_label(self.signal_generator.bits))
+            if self.helped_graphics is None:
+                self.pending_bits_plot = bits_plot
+                return
+            self.helped_graphics.clear_plot()
+            self.helped_graphics.plot_graph(*bits_plot)
+            self.helped_graphics.draw_idle()
+            return
+
+        self.init_main_graphics()
         if graph_type == GraphType.MODULATED:
             self.graphics.clear_plot_ax1()
             self.graphics.plot_graph_ax1(x, y)
@@ -106,108 +255,222 @@ class MainApp(QtWidgets.QMainWindow, Ui_MainWindow):
         elif graph_type == GraphType.CORRELATION:
             self.graphics.clear_plot_ax3()
             self.graphics.plot_graph_ax3(x, y)
-        elif graph_type == GraphType.BITS:
-            if len(self.signal_generator.bits) > 10:
-                bits_str = str(self.signal_generator.bits[:10]).replace("]", ",") + " ...]"
-            else:
-                bits_str = str(self.signal_generator.bits)
+        self.graphics.draw_idle()
 
-            self.helped_graphics.clear_plot()
-            self.helped_graphics.plot_graph(x, y, bits_str)
-
-        self.graphics.draw()
-        self.graphics.flush_events()
-        self.helped_graphics.draw()
-        self.helped_graphics.flush_events()
-
-    def draw_ber_of_snr(self, x_am: list, y_am: list, err_am: list,
-                        x_fm: list, y_fm: list, err_fm: list,
-                        x_pm: list, y_pm: list, err_pm: list):
+    def draw_ber_of_snr(self):
         """
-        Отобразить график исследования.
+        Отобразить график исследования: результаты моделирования и прогноз, статистику ошибок
+        оценки задержки или вероятности ошибки, рассчитанные выборкой по значимости.
         """
+        self.init_research_graphics()
         self.research_graphics.clear_plot()
-        self.research_graphics.plot_graph(x_am, y_am, err_am, x_fm, y_fm, err_fm, x_pm, y_pm, err_pm)
+        view_type = ResearchViewType(self.research_view_combo.currentIndex())
+        if self.failure_results is None and self.research_statistics and \
+                view_type != ResearchViewType.PROBABILITY:
+            self.draw_error_statistics(view_type)
+            self.research_graphics.draw()
+            self.research_graphics.flush_events()
+            return
+        if self.failure_results is not None:
+            self.research_graphics.plot_failure_graph(*self.failure_results)
+        elif self.research_results is not None:
+            self.research_graphics.plot_graph(self.research_results)
+        if self.prediction is not None and self.failure_results is None:
+            self.research_graphics.plot_prediction(*self.prediction)
+        if self.history_results is not None and self.failure_results is None:
+            self.research_graphics.plot_stored_graph(*self.history_results)
         self.research_graphics.draw()
         self.research_graphics.flush_events()
 
-    def draw_main_page_graphics(self):
+    def draw_error_statistics(self, view_type: ResearchViewType):
         """
-        Отрисовка графиков на главной странице.
+        Отобразить статистику ошибок оценки задержки: зависимость СКО или вероятностей обнаружения
+        от ОСШ либо гистограмму при ОСШ исследования, ближайшем к заданному на главной странице.
         """
-        # Пересчет параметров
-        self.signal_generator.recalc_parameters()
-        if self.am_manipulation_radio.isChecked():
-            x, y = self.signal_generator.calc_modulated_signal(SignalType.GENERAL, ModulationType.AM)
-            xr, yr = self.signal_generator.calc_modulated_signal(SignalType.RESEARCH, ModulationType.AM)
-            self.signal_generator.modulated_signal = [x, y]
-            self.signal_generator.research_signal = [xr, yr]
-        elif self.mchm_manipulation_radio.isChecked():
-            x, y = self.signal_generator.calc_modulated_signal(SignalType.GENERAL, ModulationType.FM)
-            xr, yr = self.signal_generator.calc_modulated_signal(SignalType.RESEARCH, ModulationType.FM)
-            self.signal_generator.modulated_signal = [x, y]
-            self.signal_generator.research_signal = [xr, yr]
-        elif self.fm2_manipulation_radio.isChecked():
-            x, y = self.signal_generator.calc_modulated_signal(SignalType.GENERAL, ModulationType.PM)
-            xr, yr = self.signal_generator.calc_modulated_signal(SignalType.RESEARCH, ModulationType.PM)
-            self.signal_generator.modulated_signal = [x, y]
-            self.signal_generator.research_signal = [xr, yr]
+        snr_values = list(self.research_statistics)
+        modulation_types = list(self.research_statistics[snr_values[0]])
+        if view_type == ResearchViewType.DETECTION:
+            self.research_graphics.plot_detection_graph(snr_values, {
+                modulation_type: [self.research_detection[snr][modulation_type].get_summary() for snr in snr_values]
+                for modulation_type in modulation_types})
+        elif view_type == ResearchViewType.RMSE:
+            self.research_graphics.plot_rmse_graph(snr_values, {
+                modulation_type: [self.research_statistics[snr][modulation_type].get_summary() for snr in snr_values]
+                for modulation_type in modulation_types})
+        else:
+            try:
+                target_snr = float(self.snr_edit.text())
+            except ValueError:
+                target_snr = float(DEFAULT_SNR)
+            snr = min(snr_values, key=lambda value: abs(value - target_snr))
+            self.research_graphics.plot_error_histogram(snr, self.research_statistics[snr])
+
+    def get_modulation_type(self):
+        """
+        Выбранный вид манипуляции.
+        """
+        if self.mchm_manipulation_radio.isChecked():
+            return ModulationType.FM
+        if self.fm2_manipulation_radio.isChecked():
+            return ModulationType.PM
+        return ModulationType.AM
 
-        # Получение бит для отрисовки
-        bits = self.signal_generator.get_bits_to_plot()
+    def schedule_redraw(self):
+        """
+        Отложенная перерисовка главной страницы (после того, как графики были построены хотя бы раз).
+        """
+        if self.drawn_versions:
+            self.redraw_timer.start()
 
-        # Вставка маленького сигнала в большой
-        research = self.signal_generator.calc_research_signal(self.signal_generator.modulated_signal,
-                                                              self.signal_generator.research_signal)
-        self.signal_generator.research_signal = research
+    def draw_new_realization(self):
+        """
+        Обработчик кнопки построения: новая реализация бит и шума.
 
-        # Добавление шума
-        modulated = self.signal_generator.generate_noise(SignalType.GENERAL,
-                                                         self.signal_generator.modulated_signal)
-        self.signal_generator.modulated_signal = modulated
-        researched = self.signal_generator.generate_noise(SignalType.RESEARCH,
-                                                          self.signal_generator.research_signal)
-        self.signal_generator.research_signal = researched
+        При отложенной перерисовке после редактирования параметров зерно реализации сохраняется.
+        """
+        self.signal_pipeline.new_realization()
+        self.draw_main_page_graphics()
 
-        # Расчет взаимной корреляционной функции
-        correlation = self.signal_generator.get_correlation(self.signal_generator.modulated_signal,
-                                                            self.signal_generator.research_signal)
-        self.signal_generator.correlation_signal = correlation
+    def draw_main_page_graphics(self):
+        """
+        Отрисовка графиков на главной странице.
+        """
+        self.redraw_timer.stop()
+
+        # Пересчет только тех этапов, параметры которых изменились
+        try:
+            results = self.signal_pipeline.run(self.get_modulation_type())
+        except ValueError as error:
+            print(f"Ошибка расчета сигналов: {error}")
+            self.time_delay_assessment_edit.setText(str(error))
+            return
 
         # Оценка временной задержки
-        time_delay = self.signal_generator.find_correlation_max(self.signal_generator.correlation_signal)
-        self.time_delay_assessment_edit.setText(str(time_delay) + " мс")
+        self.time_delay_assessment_edit.setText(str(results["time_delay"].value) + " мс")
+
+        # Получение бит для отрисовки
+        bits = self.signal_generator.get_bits_to_plot()
 
-        # Отрисовка
+        # Отрисовка только изменившихся графиков
         if self.signal_generator.modulated_signal and \
             self.signal_generator.research_signal and \
                 self.signal_generator.correlation_signal and bits:
-            # Генерация исследуемого сигнала
-            self.draw(GraphType.MODULATED,
-                      self.signal_generator.modulated_signal[0],
-                      self.signal_generator.modulated_signal[1])
-            self.draw(GraphType.RESEARCH,
-                      self.signal_generator.research_signal[0],
-                      self.signal_generator.research_signal[1])
-            self.draw(GraphType.CORRELATION,
-                      self.signal_generator.correlation_signal[0],
-                      self.signal_generator.correlation_signal[1])
-            self.draw(GraphType.BITS,
-                      bits[0],
-                      bits[1])
+            panels = (
+                (GraphType.MODULATED, "modulated", self.signal_generator.modulated_signal),
+                (GraphType.RESEARCH, "research", self.signal_generator.research_signal),
+                (GraphType.CORRELATION, "correlation", self.signal_generator.correlation_signal),
+                (GraphType.BITS, "bits", bits),
+            )
+            for graph_type, stage, signal in panels:
+                if self.drawn_versions.get(graph_type) != results[stage].version:
+                    self.draw(graph_type, signal[0], signal[1])
+                    self.drawn_versions[graph_type] = results[stage].version
+
+            view_type = MainViewType(self.main_view_combo.currentIndex())
+            if view_type != MainViewType.SIGNALS:
+                self.draw_analysis(view_type, results)
+
+    def draw_analysis(self, view_type: MainViewType, results: dict):
+        """
+        Отрисовка спектров сигналов или функции неопределенности опорного сигнала.
+
+        Результаты БПФ кэшируются по версиям сигналов, поэтому при переключении видов они не пересчитываются.
+        """
+        self.init_analysis_graphics()
+        if view_type == MainViewType.SPECTRUM:
+            spectra = self.signal_pipeline.run_spectra(results)
+            versions = (view_type, spectra["modulated"].version, spectra["research"].version)
+        else:
+            ambiguity = self.signal_pipeline.run_ambiguity(results)
+            versions = (view_type, ambiguity.version)
+        if self.drawn_versions.get(GraphType.ANALYSIS) == versions:
+            return
+
+        self.analysis_graphics.clear_plot()
+        if view_type == MainViewType.SPECTRUM:
+            self.analysis_graphics.plot_spectrum({"Манипулированный сигнал": spectra["modulated"].value,
+                                                  "Исследуемый сигнал": spectra["research"].value})
+        else:
+            self.analysis_graphics.plot_ambiguity(ambiguity.value)
+        self.analysis_graphics.draw_idle()
+        self.drawn_versions[GraphType.ANALYSIS] = versions
+
+    def main_view_change_logic(self):
+        """
+        Обработка выбора вида графиков главной страницы: сигналы, их спектры или функция неопределенности.
+        """
+        analysis = MainViewType(self.main_view_combo.currentIndex()) != MainViewType.SIGNALS
+        self.init_main_graphics()
+        if analysis:
+            self.init_analysis_graphics()
+        self.graphics.setVisible(not analysis)
+        self.toolbar.setVisible(not analysis)
+        if self.analysis_graphics is not None:
+            self.analysis_graphics.setVisible(analysis)
+            self.analysis_toolbar.setVisible(analysis)
+
+        # Графики отображаются после первого расчета
+        if self.drawn_versions:
+            self.draw_main_page_graphics()
 
     def start_research_logic(self):
         """
         Обработчик запуска исследования.
         """
+        from research_logic import calc_research
+
         # Запуск исследования
         try:
             average_count = int(self.average_count_edit.text())
         except ValueError:
             return
 
-        x_am, y_am, err_am, x_fm, y_fm, err_fm, x_pm, y_pm, err_pm = calc_research(average_count, self.signal_generator)
-        self.draw_ber_of_snr(x_am, y_am, err_am, x_fm, y_fm, err_fm, x_pm, y_pm, err_pm)
+        # Оценка вероятностей редких ошибок выборкой по значимости
+        if self.importance_sampling_checkbox.isChecked():
+            from importance_sampling import calc_importance_research, format_failure_result
+
+            try:
+                self.failure_results = calc_importance_research(average_count, self.signal_generator)
+            except ValueError as error:
+                print(f"Ошибка исследования: {error}")
+                return
+            snr_values, failures = self.failure_results
+            for index, snr in enumerate(snr_values):
+                print(f"Вероятность ошибки при {snr} дБ:")
+                for modulation_type, results in failures.items():
+                    print(f"  {modulation_type.name}: {format_failure_result(results[index])}")
+            self.draw_ber_of_snr()
+            return
+
+        statistics, detection = {}, {}
+        try:
+            research_results = calc_research(average_count, self.signal_generator, cache=self.research_cache,
+                                             statistics=statistics, detection=detection,
+                                             store=self.get_results_store())
+        except ValueError as error:
+            print(f"Ошибка исследования: {error}")
+            return
+        self.failure_results = None
+        self.research_results = research_results
+        self.research_statistics, self.research_detection = statistics, detection
+        self.update_history_combo()
+        # Отображаемый прогноз пересчитывается для сравнения с моделированием при тех же параметрах
+        if self.prediction is not None:
+            self.predict_research_logic()
+        else:
+            self.draw_ber_of_snr()
+
+    def predict_research_logic(self):
+        """
+        Обработчик расчета полуаналитического прогноза.
+        """
+        from detection_predictor import predict_detection
+
+        snr_values = list(range(10, -11, -1))
+        prediction = predict_detection(self.signal_generator, snr_values)
+        self.failure_results = None
+        self.prediction = (snr_values, prediction)
+        self.draw_ber_of_snr()
 
     def sr_change_logic(self):
         """
@@ -215,6 +478,7 @@ class MainApp(QtWidgets.QMainWindow, Ui_MainWindow):
         """
         if self.sampling_rate_edit.text().isdigit():
             self.signal_generator.sampling_rate = float(self.sampling_rate_edit.text())
+            self.schedule_redraw()
 
     def bits_count_change_logic(self):
         """
@@ -222,6 +486,7 @@ class MainApp(QtWidgets.QMainWindow, Ui_MainWindow):
         """
         if self.bits_count_edit.text().isdigit():
             self.signal_generator.bits_count = int(self.bits_count_edit.text())
+            self.schedule_redraw()
 
     def bits_per_second_change_logic(self):
         """
@@ -229,13 +494,19 @@ class MainApp(QtWidgets.QMainWindow, Ui_MainWindow):
         """
         if self.bits_per_second_edit.text().isdigit():
             self.signal_generator.bits_per_second = float(self.bits_per_second_edit.text())
+            self.schedule_redraw()
 
     def signal_freq_change_logic(self):
         """
         Обработка события изменения значения в поле "Несущая частота".
         """
         if self.signal_freq_edit.text().isdigit():
-            self.signal_generator.signal_freq = float(self.signal_freq_edit.text())
+            signal_freq = float(self.signal_freq_edit.text())
+            # Несущая частота должна оставаться больше заданного доплеровского сдвига
+            if signal_freq <= abs(self.signal_generator.channel.doppler_shift):
+                return
+            self.signal_generator.signal_freq = signal_freq
+            self.schedule_redraw()
 
     def time_delay_change_logic(self):
         """
@@ -243,6 +514,7 @@ class MainApp(QtWidgets.QMainWindow, Ui_MainWindow):
         """
         if self.time_delay_edit.text().isdigit():
             self.signal_generator.time_delay = float(self.time_delay_edit.text())
+            self.schedule_redraw()
 
     def snr_change_logic(self):
         """
@@ -251,7 +523,88 @@ class MainApp(QtWidgets.QMainWindow, Ui_MainWindow):
         try:
             self.signal_generator.snr = float(self.snr_edit.text())
         except ValueError:
-            pass
+            return
+        self.schedule_redraw()
+
+    def bits_source_change_logic(self):
+        """
+        Обработка события выбора источника опорной последовательности.
+        """
+        self.signal_generator.bits_source = BitsSourceType(self.bits_source_combo.currentIndex())
+        self.schedule_redraw()
+
+    def correlation_type_change_logic(self):
+        """
+        Обработка события выбора типа взаимной корреляционной функции.
+        """
+        self.signal_generator.correlation_type = CorrelationType(self.correlation_type_combo.currentIndex())
+        self.schedule_redraw()
+
+    def baseband_mode_change_logic(self):
+        """
+        Обработка события выбора режима расчета корреляции.
+        """
+        self.signal_generator.baseband_mode = BasebandMode(self.baseband_mode_combo.currentIndex())
+        self.schedule_redraw()
+
+    @staticmethod
+    def mark_invalid_input(edit: QtWidgets.QLineEdit, error: str = None):
+        """
+        Выделение поля ввода с некорректным значением (error - пояснение во всплывающей подсказке).
+        """
+        base_style = edit.property("base_style")
+        if base_style is None:
+            base_style = edit.styleSheet()
+            edit.setProperty("base_style", base_style)
+        edit.setStyleSheet(base_style + INVALID_INPUT_STYLE if error else base_style)
+        edit.setToolTip(error or "")
+
+    def multipath_change_logic(self):
+        """
+        Обработка события изменения значения в поле "Лучи канала".
+        """
+        try:
+            paths = ChannelModel.parse_paths(self.multipath_edit.text())
+        except ValueError as error:
+            # Ранее заданные лучи сохраняются до исправления значения
+            self.mark_invalid_input(self.multipath_edit, str(error))
+            return
+        self.mark_invalid_input(self.multipath_edit, None)
+        self.signal_generator.channel.paths = paths
+        self.schedule_redraw()
+
+    def doppler_shift_change_logic(self):
+        """
+        Обработка события изменения значения в поле "Доплеровский сдвиг".
+        """
+        try:
+            doppler_shift = float(self.doppler_shift_edit.text())
+        except ValueError:
+            return
+        # Сдвиг не может превышать несущую частоту (время не может идти в обратную сторону)
+        if abs(doppler_shift) >= self.signal_generator.signal_freq:
+            return
+        self.signal_generator.channel.doppler_shift = doppler_shift
+        self.schedule_redraw()
+
+    def channel_noise_change_logic(self):
+        """
+        Обработка события выбора вида шума канала.
+        """
+        self.signal_generator.channel.noise_type = NoiseType(self.channel_noise_combo.currentIndex())
+        self.schedule_redraw()
+
+    def quantization_change_logic(self):
+        """
+        Обработка события выбора разрядности АЦП целочисленного тракта исследования.
+        """
+        self.signal_generator.quantization_bits = QUANTIZATION_BITS_OPTIONS[self.quantization_combo.currentIndex()]
+
+    def cfar_type_change_logic(self):
+        """
+        Обработка события выбора вида CFAR-обнаружителя исследования.
+        """
+        self.signal_generator.cfar_type = CfarType(self.cfar_type_combo.currentIndex())
 
     def restore_or_maximized(self):
         """
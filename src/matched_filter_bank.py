@@ -0,0 +1,86 @@
+import numpy as np
+
+from fft_utils import get_correlation_nfft, correlate_spectra
+
+
+class MatchedFilterBank:
+    """
+    Банк согласованных фильтров для одновременного поиска нескольких опорных сигналов
+    """
+    def __init__(self, references: list):
+        if not references:
+            raise ValueError("Банк согласованных фильтров требует хотя бы один опорный сигнал")
+
+        # Опорные сигналы дополняются нулями до общей длины
+        values = [np.asarray(reference[1], dtype=float) for reference in references]
+        self.references_count = len(values)
+        self.reference_len = max(len(value) for value in values)
+        self.templates = np.zeros((self.references_count, self.reference_len))
+        for i, value in enumerate(values):
+            self.templates[i, :len(value)] = value
+
+        # Энергии опорных сигналов для нормировки оценок
+        self.energies = np.sqrt(np.sum(self.templates ** 2, axis=1))
+
+        # Спектры опорных сигналов, рассчитанные для каждой длины БПФ
+        self._spectra = {}
+
+    def _get_spectra(self, nfft: int):
+        """
+        Получение (с кэшированием) спектров опорных сигналов для заданной длины БПФ.
+        """
+        spectra = self._spectra.get(nfft)
+        if spectra is None:
+            spectra = np.fft.rfft(self.templates, nfft, axis=1)
+            self._spectra[nfft] = spectra
+        return spectra
+
+    def correlate(self, researched: list):
+        """
+        Расчет взаимных корреляционных функций всех опорных сигналов с исследуемым за один проход БПФ.
+        """
+        if not researched:
+            return
+
+        research = np.asarray(researched[1], dtype=float)
+        lags = len(research) - self.reference_len + 1
+        if lags <= 0:
+            return
+
+        nfft = get_correlation_nfft(len(research), self.reference_len)
+        research_spectrum = np.fft.rfft(research, nfft)
+        correlation = correlate_spectra(research_spectrum, self._get_spectra(nfft), nfft, lags)
+        x = researched[0][:lags]
+        return x, correlation
+
+    def find_delays(self, researched: list, correlation: list):
+        """
+        Нахождение временной задержки (мс) и нормированной оценки пика для каждого опорного сигнала.
+        """
+        if not correlation:
+            return
+
+        x, matrix = correlation
+        peaks_idx = np.argmax(matrix, axis=1)
+        peaks = matrix[np.arange(self.references_count), peaks_idx]
+
+        # Энергия исследуемого сигнала в окне длины опорного на каждой задержке
+        research = np.asarray(researched[1], dtype=float)
+        cumulative = np.concatenate(([0.], np.cumsum(research ** 2)))
+        window_energy = np.sqrt(cumulative[peaks_idx + self.reference_len] - cumulative[peaks_idx])
+
+        denominator = self.energies * window_energy
+        scores = np.divide(peaks, denominator, out=np.zeros_like(peaks), where=denominator > 0)
+        delays = [float(x[idx]) * 1000 for idx in peaks_idx]
+        return delays, scores.tolist()
+
+    def search(self, researched: list):
+        """
+        Поиск всех опорных сигналов в исследуемом: корреляции, задержки и оценки.
+        """
+        correlation = self.correlate(researched)
+        if correlation is None:
+            return
+
+        delays, scores = self.find_delays(researched, correlation)
+        return correlation[0], correlation[1], delays, scores
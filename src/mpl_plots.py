@@ -0,0 +1,367 @@
+import numpy as np
+from matplotlib.figure import Figure
+
+from enums import ModulationType
+
+
+# Подписи и цвета графиков для видов модуляции
+MODULATION_STYLES = {
+    ModulationType.AM: ("АМ", 'r'),
+    ModulationType.FM: ("ЧМ", 'g'),
+    ModulationType.PM: ("ФМ", 'b'),
+}
+
+
+def get_modulation_style(modulation_type: ModulationType):
+    """
+    Подпись и цвет графика для вида модуляции.
+    """
+    return MODULATION_STYLES.get(modulation_type, (modulation_type.name, None))
+
+
+def get_bits_label(bits: list):
+    """
+    Подпись графика информационных бит (первые 10 бит).
+    """
+    if len(bits) > 10:
+        return str(bits[:10]).replace("]", ",") + " ...]"
+    return str(bits)
+
+
+class HelpedPlot:
+    """
+    Построение графика информационных бит на фигуре matplotlib (без привязки к холсту)
+    """
+    def __init__(self, dpi=100, figsize=(4, 3), facecolor=(.94, .94, .94, 0.)):
+        self.fig = Figure(dpi=dpi, facecolor=facecolor, figsize=figsize)
+
+        # Добавление области графа
+        self.ax = self.fig.add_subplot(111)
+        self.add_text()
+
+    def add_text(self):
+        """
+        Инициализация графика.
+
+        :return: None.
+        """
+        # Инициализация области графика модулированного сигнала
+        self.ax.set_title("Последовательность информационных бит")
+        self.ax.grid(linestyle="dotted", alpha=0.65)
+
+    def plot_graph(self, x_list: list, y_list: list, label: str):
+        """
+        Построение графика функции модулированного сигнала.
+
+        :param x_list: Список временный отсчётов.
+        :param y_list: Список значений.
+        :param label: Подпись графика.
+        :return: None.
+        """
+        self.ax.plot(x_list, y_list, linestyle="-", markersize=2, color='r', label=label)
+        self.ax.legend(loc="upper right", framealpha=1.0)
+        self.ax.margins(y=0.8)
+
+    def clear_plot(self):
+        """
+        Очистка области графика.
+
+        :return: None.
+        """
+        self.ax.clear()
+        self.add_text()
+
+
+class ResearchPlot:
+    """
+    Построение графиков исследования на фигуре matplotlib (без привязки к холсту)
+    """
+    def __init__(self, dpi=100, figsize=(4, 3), facecolor=(.94, .94, .94, 0.)):
+        self.fig = Figure(dpi=dpi, facecolor=facecolor, figsize=figsize)
+
+        # Добавление области графа
+        self.ax = self.fig.add_subplot(111)
+        self.add_text()
+
+    def add_text(self):
+        """
+        Инициализация графика.
+        """
+        # Инициализация области графика модулированного сигнала
+        self.ax.set_title("График зависимости BER от SNR")
+        self.ax.grid(linestyle="dotted", alpha=0.65)
+
+    def plot_graph(self, results: dict):
+        """
+        Построение графика функции модулированного сигнала.
+
+        :param results: Результаты исследования {ModulationType: ResearchResult}.
+        """
+        for modulation_type, result in results.items():
+            label, color = get_modulation_style(modulation_type)
+            self.ax.errorbar(result.snr_values, result.probabilities, yerr=result.errors, fmt='o', linestyle='-',
+                             markersize=3, elinewidth=0.5, ecolor='black', color=color, label=label,
+                             capsize=2, capthick=0.5)
+
+        self.ax.legend(loc="lower right", framealpha=1.0)
+
+    def plot_stored_graph(self, results: dict, label: str):
+        """
+        Построение сохраненных в истории кривых для сравнения с текущими результатами.
+
+        :param results: Результаты исследования {ModulationType: ResearchResult}.
+        :param label: Подпись исследования из истории.
+        """
+        for modulation_type, result in results.items():
+            modulation_label, color = get_modulation_style(modulation_type)
+            self.ax.plot(result.snr_values, result.probabilities, marker='x', markersize=3, linestyle=':',
+                         linewidth=1, alpha=0.7, color=color, label=f"{modulation_label} ({label})")
+
+        self.ax.legend(loc="lower right", framealpha=1.0, fontsize="small")
+
+    def plot_failure_graph(self, x: list, failures: dict):
+        """
+        Построение вероятностей ошибки в логарифмическом масштабе.
+
+        :param x: Список значений ОСШ.
+        :param failures: Результаты по ОСШ для каждого вида модуляции {ModulationType: список}.
+        """
+        for modulation_type, results in failures.items():
+            label, color = get_modulation_style(modulation_type)
+            # Точки без оценки (задержка вне исследуемого сигнала) пропускаются
+            points = [(snr, result) for snr, result in zip(x, results) if result is not None]
+            snr_values = [snr for snr, _ in points]
+            results = [result for _, result in points]
+            y = [result["probability"] for result in results]
+            # Нижняя граница интервала не должна выходить в неположительную область
+            lower = [min(result["std_error"], 0.99 * result["probability"]) for result in results]
+            upper = [result["std_error"] for result in results]
+            self.ax.errorbar(snr_values, y, yerr=[lower, upper], fmt='o', linestyle='-', markersize=3, elinewidth=0.5,
+                             ecolor='black', color=color, label=label, capsize=2, capthick=0.5)
+
+        self.ax.set_yscale("log")
+        self.ax.set_title("Вероятность ошибки оценки задержки (выборка по значимости)")
+        self.ax.legend(loc="lower left", framealpha=1.0)
+
+    def plot_rmse_graph(self, x: list, summaries: dict):
+        """
+        Построение СКО, смещения оценки задержки и границы Крамера-Рао (мс) в логарифмическом масштабе.
+
+        :param x: Список значений ОСШ.
+        :param summaries: Итоговые показатели по ОСШ для каждого вида модуляции {ModulationType: список}.
+        """
+        for modulation_type, results in summaries.items():
+            label, color = get_modulation_style(modulation_type)
+            self.ax.plot(x, [result["rmse"] for result in results], marker='o', markersize=3, linestyle='-',
+                         color=color, label=f"{label} (СКО)")
+            self.ax.plot(x, [abs(result["bias"]) for result in results], linestyle=':', linewidth=1,
+                         color=color, label=f"{label} (|смещение|)")
+            self.ax.plot(x, [result["crb"] for result in results], linestyle='--', linewidth=1,
+                         color=color, label=f"{label} (граница Крамера-Рао)")
+
+        self.ax.set_yscale("log")
+        self.ax.set_title("Ошибка оценки задержки, мс")
+        self.ax.legend(loc="upper right", framealpha=1.0, fontsize="small")
+
+    def plot_error_histogram(self, snr: float, statistics: dict):
+        """
+        Построение гистограмм ошибок оценки задержки (мс) при одном значении ОСШ.
+
+        :param snr: Значение ОСШ.
+        :param statistics: Статистика ошибок {ModulationType: DelayErrorStatistics}.
+        """
+        for modulation_type, errors in statistics.items():
+            label, color = get_modulation_style(modulation_type)
+            outside = errors.underflow + errors.overflow
+            self.ax.stairs(errors.histogram, errors.bin_edges, color=color,
+                           label=f"{label} (вне диапазона: {outside})")
+
+        self.ax.set_title(f"Гистограмма ошибок, {snr} дБ")
+        self.ax.set_xlabel("Ошибка, мс")
+        self.ax.legend(loc="upper right", framealpha=1.0)
+
+    def plot_detection_graph(self, x: list, summaries: dict):
+        """
+        Построение вероятностей CFAR-обнаружения и ложной тревоги.
+
+        :param x: Список значений ОСШ.
+        :param summaries: Итоговые показатели обнаружения по ОСШ {ModulationType: список}.
+        """
+        for modulation_type, results in summaries.items():
+            label, color = get_modulation_style(modulation_type)
+            self.ax.plot(x, [result["pd"] for result in results], marker='o', markersize=3, linestyle='-',
+                         color=color, label=f"{label} (обнаружение)")
+            self.ax.plot(x, [result["pfa"] for result in results], marker='x', markersize=3, linestyle='--',
+                         linewidth=1, color=color, label=f"{label} (ложная тревога)")
+
+        self.ax.set_ylim(-0.05, 1.05)
+        self.ax.set_title("Обнаружение CFAR")
+        self.ax.legend(loc="center right", framealpha=1.0, fontsize="small")
+
+    def plot_prediction(self, x: list, prediction: dict):
+        """
+        Построение прогноза вероятности поверх результатов моделирования.
+
+        :param x: Список значений ОСШ.
+        :param prediction: Прогноз по ОСШ для каждого вида модуляции {ModulationType: список}.
+        """
+        for modulation_type, y in prediction.items():
+            label, color = get_modulation_style(modulation_type)
+            self.ax.plot(x, y, linestyle='--', linewidth=1, color=color, label=f"{label} (прогноз)")
+
+        self.ax.legend(loc="lower right", framealpha=1.0)
+
+    def clear_plot(self):
+        """
+        Очистка области графика.
+        """
+        self.ax.clear()
+        self.add_text()
+
+
+class ModulatedPlot:
+    """
+    Построение графиков сигналов и корреляции на фигуре matplotlib (без привязки к холсту)
+    """
+    def __init__(self, dpi=100, figsize=(4, 3), facecolor=(.94, .94, .94, 0.)):
+        self.fig = Figure(dpi=dpi, facecolor=facecolor, figsize=figsize)
+
+        # Добавление области графа
+        self.ax1 = self.fig.add_subplot(311)
+        self.ax2 = self.fig.add_subplot(312)
+        self.ax3 = self.fig.add_subplot(313)
+        self.add_text()
+
+    def add_text(self):
+        """
+        Инициализация графика.
+
+        :return: None.
+        """
+        # Инициализация области графика модулированного сигнала
+        self.ax1.set_title("Смоделированные сигналы / оценка временной задержки")
+
+        self.ax1.grid(linestyle="dotted", alpha=0.65)
+        self.ax2.grid(linestyle="dotted", alpha=0.65)
+        self.ax3.grid(linestyle="dotted", alpha=0.65)
+
+    def plot_graph_ax1(self, x_list: list, y_list: list):
+        """
+        Построение графика функции модулированного сигнала.
+
+        :param x_list: Список временный отсчётов.
+        :param y_list: Список значений.
+        :return: None.
+        """
+        self.ax1.plot(x_list, y_list, linestyle="-", markersize=2, color='r', label="Манипулированный сигнал")
+        self.ax1.legend(loc="upper right", framealpha=1.0)
+        self.ax1.margins(y=0.8)
+
+    def plot_graph_ax2(self, x_list: list, y_list: list):
+        """
+        Построение графика функции исследуемого сигнала.
+
+        :param x_list: Список временный отсчётов.
+        :param y_list: Список значений.
+        :return: None.
+        """
+        self.ax2.plot(x_list, y_list, linestyle="-", markersize=2, color='g', label="Исследуемый сигнал")
+        self.ax2.legend(loc="upper right", framealpha=1.0)
+        self.ax2.margins(y=0.8)
+
+    def plot_graph_ax3(self, x_list: list, y_list: list):
+        """
+        Построение графика взаимной корреляционной функции.
+
+        :param x_list: Список временный отсчётов.
+        :param y_list: Список значений.
+        :return: None.
+        """
+        self.ax3.plot(x_list, y_list, linestyle="-", markersize=2, color='b', label="Взаимная корреляционная функция")
+        self.ax3.legend(loc="upper right", framealpha=1.0)
+        self.ax3.margins(y=0.8)
+
+    def clear_plot_ax1(self):
+        """
+        Очистка области графика.
+
+        :return: None.
+        """
+        self.ax1.clear()
+        self.add_text()
+
+    def clear_plot_ax2(self):
+        """
+        Очистка области графика.
+
+        :return: None.
+        """
+        self.ax2.clear()
+        self.add_text()
+
+    def clear_plot_ax3(self):
+        """
+        Очистка области графика.
+
+        :return: None.
+        """
+        self.ax3.clear()
+        self.add_text()
+
+
+class AnalysisPlot:
+    """
+    Построение спектров сигналов и функции неопределенности на фигуре matplotlib (без привязки к холсту)
+    """
+    def __init__(self, dpi=100, figsize=(4, 3), facecolor=(.94, .94, .94, 0.)):
+        self.fig = Figure(dpi=dpi, facecolor=facecolor, figsize=figsize)
+        self.ax = self.fig.add_subplot(111)
+        self.colorbar = None
+        self.add_text()
+
+    def add_text(self):
+        """
+        Инициализация графика.
+        """
+        self.ax.grid(linestyle="dotted", alpha=0.65)
+
+    def plot_spectrum(self, spectra: dict):
+        """
+        Построение спектральных плотностей мощности сигналов (дБ/Гц).
+
+        :param spectra: Спектры {подпись: PowerSpectrum}.
+        """
+        for (label, spectrum), color in zip(spectra.items(), ('r', 'g')):
+            psd = 10 * np.log10(np.maximum(spectrum.psd, np.finfo(float).tiny))
+            self.ax.plot(spectrum.frequencies, psd, linewidth=1, color=color, label=label)
+
+        self.ax.set_title("Спектральная плотность мощности (метод Уэлча)")
+        self.ax.set_xlabel("Частота, Гц")
+        self.ax.set_ylabel("СПМ, дБ/Гц")
+        self.ax.legend(loc="upper right", framealpha=1.0)
+
+    def plot_ambiguity(self, ambiguity, floor_db: float = -40.):
+        """
+        Построение модуля функции неопределенности (дБ) на плоскости задержка - доплеровский сдвиг.
+
+        :param ambiguity: Функция неопределенности AmbiguityFunction.
+        :param floor_db: Нижняя граница шкалы, дБ.
+        """
+        values = 20 * np.log10(np.maximum(ambiguity.values, 10 ** (floor_db / 20)))
+        image = self.ax.pcolormesh(np.asarray(ambiguity.delays) * 1000, ambiguity.doppler_shifts, values,
+                                   shading="nearest", vmin=floor_db, vmax=0., cmap="viridis", rasterized=True)
+        self.colorbar = self.fig.colorbar(image, ax=self.ax, label="дБ")
+
+        self.ax.set_title("Функция неопределенности опорного сигнала")
+        self.ax.set_xlabel("Задержка, мс")
+        self.ax.set_ylabel("Доплеровский сдвиг, Гц")
+
+    def clear_plot(self):
+        """
+        Очистка области графика.
+        """
+        if self.colorbar is not None:
+            self.colorbar.remove()
+            self.colorbar = None
+        self.ax.clear()
+        self.add_text()
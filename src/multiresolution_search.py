@@ -0,0 +1,160 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from fft_utils import get_correlation_nfft, correlate_spectra
+
+
+# Длина антиэлайзингового фильтра на единицу коэффициента децимации
+ANTIALIAS_TAPS_PER_FACTOR = 8
+# Доля энергии опорного сигнала, определяющая его полосу
+BANDWIDTH_ENERGY_FRACTION = 0.99
+# Минимальный запас частоты дискретизации над верхней частотой сигнала после децимации
+MIN_OVERSAMPLING = 2.5
+# Число операций на отсчет и двоичный логарифм длины БПФ
+FFT_COST_FACTOR = 5.
+# Количество кандидатов грубого уровня для уточнения
+DEFAULT_CANDIDATES_COUNT = 3
+
+
+def estimate_signal_band(values: np.ndarray, sampling_rate: float):
+    """
+    Оценка верхней частоты и частоты спектрального максимума сигнала, Гц.
+    """
+    spectrum = np.abs(np.fft.rfft(values)) ** 2
+    freqs = np.fft.rfftfreq(len(values), 1. / sampling_rate)
+    cumulative = np.cumsum(spectrum)
+    if cumulative[-1] <= 0:
+        return sampling_rate / 2, 0.
+    upper_idx = np.searchsorted(cumulative, BANDWIDTH_ENERGY_FRACTION * cumulative[-1])
+    upper_freq = freqs[min(upper_idx, len(freqs) - 1)]
+    return upper_freq, freqs[np.argmax(spectrum)]
+
+
+def _fft_cost(n: int):
+    """
+    Оценка вычислительной стоимости одного БПФ длины n.
+    """
+    return FFT_COST_FACTOR * n * np.log2(max(n, 2))
+
+
+def get_search_cost(research_len: int, reference_len: int, levels: int,
+                    carrier_period: int = 0, candidates_count: int = DEFAULT_CANDIDATES_COUNT):
+    """
+    Оценка стоимости поиска задержки с заданным числом уровней децимации.
+    """
+    if levels == 0:
+        return 3 * _fft_cost(get_correlation_nfft(research_len, reference_len))
+
+    factor = 2 ** levels
+    # Полифазная децимация обоих сигналов
+    decimation = (research_len + reference_len) * ANTIALIAS_TAPS_PER_FACTOR
+    # Грубая корреляция на пониженной частоте дискретизации
+    coarse = 3 * _fft_cost(get_correlation_nfft(research_len // factor, reference_len // factor))
+    # Уточнение в окрестности каждого кандидата на полной частоте
+    radius = factor + carrier_period
+    refine = candidates_count * 3 * _fft_cost(get_correlation_nfft(reference_len + 2 * radius, reference_len))
+    return decimation + coarse + refine
+
+
+def choose_levels(research_len: int, reference_len: int, max_levels: int,
+                  carrier_period: int = 0, candidates_count: int = DEFAULT_CANDIDATES_COUNT):
+    """
+    Выбор числа уровней децимации с минимальной оценкой стоимости.
+    """
+    costs = [get_search_cost(research_len, reference_len, levels, carrier_period, candidates_count)
+             for levels in range(max(max_levels, 0) + 1)]
+    return int(np.argmin(costs))
+
+
+def _lowpass_taps(factor: int):
+    """
+    Антиэлайзинговый КИХ-фильтр (окно Хэмминга) для децимации в factor раз.
+    """
+    taps_count = ANTIALIAS_TAPS_PER_FACTOR * factor + 1
+    n = np.arange(taps_count) - taps_count // 2
+    taps = np.sinc(n / factor) * np.hamming(taps_count)
+    return taps / np.sum(taps)
+
+
+def decimate(values: np.ndarray, factor: int):
+    """
+    Децимация с антиэлайзинговой фильтрацией (вычисляются только сохраняемые отсчеты).
+    """
+    if factor <= 1:
+        return values
+
+    taps = _lowpass_taps(factor)
+    half = len(taps) // 2
+    padded = np.concatenate((np.zeros(half), values, np.zeros(half)))
+    return sliding_window_view(padded, len(taps))[::factor] @ taps[::-1]
+
+
+def _correlate_valid(research: np.ndarray, reference: np.ndarray):
+    """
+    Взаимная корреляция через БПФ (режим 'valid').
+    """
+    lags = len(research) - len(reference) + 1
+    nfft = get_correlation_nfft(len(research), len(reference))
+    return correlate_spectra(np.fft.rfft(research, nfft), np.fft.rfft(reference, nfft), nfft, lags)
+
+
+def _find_candidates(correlation: np.ndarray, count: int, radius: int):
+    """
+    Поиск нескольких наибольших пиков с подавлением соседних отсчетов.
+    """
+    values = np.array(correlation, dtype=float)
+    candidates = []
+    for _ in range(min(count, len(values))):
+        idx = int(np.argmax(values))
+        if values[idx] == -np.inf:
+            break
+        candidates.append(idx)
+        values[max(0, idx - radius):idx + radius + 1] = -np.inf
+    return candidates
+
+
+def find_delay_multiresolution(modulated: list, researched: list, levels: int = None,
+                               candidates_count: int = DEFAULT_CANDIDATES_COUNT):
+    """
+    Оценка временной задержки (мс) иерархическим поиском от грубого разрешения к полному.
+    """
+    if not modulated or not researched:
+        return
+
+    reference = np.asarray(modulated[1], dtype=float)
+    research = np.asarray(researched[1], dtype=float)
+    lags = len(research) - len(reference) + 1
+    if lags <= 0:
+        return
+
+    # Допустимая децимация определяется полосой опорного сигнала
+    sampling_rate = 1. / (researched[0][1] - researched[0][0])
+    upper_freq, peak_freq = estimate_signal_band(reference, sampling_rate)
+    max_factor = sampling_rate / (MIN_OVERSAMPLING * max(upper_freq, 1e-12))
+    max_levels = int(np.floor(np.log2(max(max_factor, 1.))))
+    carrier_period = int(np.ceil(sampling_rate / peak_freq)) if peak_freq > 0 else 0
+
+    if levels is None:
+        levels = choose_levels(len(research), len(reference), max_levels, carrier_period, candidates_count)
+    factor = 2 ** levels
+    if factor == 1 or len(reference) // factor < 2:
+        correlation = _correlate_valid(research, reference)
+        return researched[0][int(np.argmax(correlation))] * 1000
+
+    # Грубый уровень
+    coarse = _correlate_valid(decimate(research, factor), decimate(reference, factor))
+    suppress_radius = int(np.ceil(carrier_period / factor)) + 1
+    candidates = _find_candidates(coarse, candidates_count, suppress_radius)
+
+    # Уточнение в окрестности кандидатов на полной частоте дискретизации
+    radius = factor + carrier_period
+    best_lag, best_value = 0, -np.inf
+    for candidate in candidates:
+        low = max(0, candidate * factor - radius)
+        high = min(lags - 1, candidate * factor + radius)
+        fine = _correlate_valid(research[low:high + len(reference)], reference)
+        idx = int(np.argmax(fine))
+        if fine[idx] > best_value:
+            best_lag, best_value = low + idx, fine[idx]
+
+    return researched[0][best_lag] * 1000
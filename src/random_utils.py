@@ -0,0 +1,35 @@
+import numpy as np
+
+
+def get_seed_sequence(seed=None):
+    """
+    Корневая последовательность зерен из числа, SeedSequence или генератора numpy.
+
+    При seed=None используется энтропия операционной системы (невоспроизводимый расчет).
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        # Энтропия извлекается из генератора, поэтому результат определяется его состоянием
+        return np.random.SeedSequence(seed.integers(0, 2 ** 32, size=4, dtype=np.uint64).tolist())
+    return np.random.SeedSequence(seed)
+
+
+def get_substream(root: np.random.SeedSequence, *path: int):
+    """
+    Независимый подпоток по пути индексов.
+
+    Совпадает с потомком, который вернул бы root.spawn(...) на той же позиции, но не зависит
+    от порядка и количества ранее порожденных потомков: поэтому последовательный, пакетный
+    и параллельный расчеты получают одни и те же подпотоки.
+    """
+    return np.random.SeedSequence(root.entropy, spawn_key=tuple(root.spawn_key) + tuple(int(index) for index in path),
+                                  pool_size=root.pool_size)
+
+
+def get_snr_key(snr: float):
+    """
+    Индекс подпотока для значения ОСШ (в сотых долях дБ).
+    """
+    return int(round(float(snr) * 100)) % 2 ** 32
+
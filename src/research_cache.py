@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+from functools import lru_cache
+
+from defaults import RESEARCH_CACHE_DIR, RESEARCH_CACHE_MAX_SIZE
+
+
+# Модули, от которых зависит результат исследования
+RESEARCH_MODULES = (
+    "signals_generator.py",
+    "research_logic.py",
+    "code_sequences.py",
+    "fft_utils.py",
+    "generalized_correlation.py",
+    "multiresolution_search.py",
+    "baseband.py",
+    "random_utils.py",
+    "delay_statistics.py",
+    "channel_model.py",
+    "cfar_detector.py",
+    "kernels.py",
+    "fixed_point.py",
+)
+
+
+@lru_cache(maxsize=None)
+def get_code_version():
+    """
+    Версия кода исследования: хэш исходных текстов модулей расчета.
+    """
+    digest = hashlib.sha256()
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    for name in RESEARCH_MODULES:
+        path = os.path.join(src_dir, name)
+        if os.path.exists(path):
+            with open(path, "rb") as file:
+                digest.update(file.read())
+    return digest.hexdigest()
+
+
+def get_research_parameters(signal_generator, **kwargs):
+    """
+    Полный набор параметров, определяющих результат исследования в одной точке.
+    """
+    parameters = {
+        "sampling_rate": signal_generator.sampling_rate,
+        "signal_freq": signal_generator.signal_freq,
+        "bits_count": signal_generator.bits_count,
+        "rsch_bits_count": signal_generator.rsch_bits_count,
+        "bits_per_second": signal_generator.bits_per_second,
+        "time_delay": signal_generator.time_delay,
+        "low_ampl": signal_generator.low_ampl,
+        "high_ampl": signal_generator.high_ampl,
+        "bits_source": signal_generator.bits_source.name,
+        "code_index": signal_generator.code_index,
+        "channel": signal_generator.channel.get_parameters(),
+        "quantization_bits": signal_generator.quantization_bits,
+        "accumulator_bits": signal_generator.accumulator_bits,
+    }
+    for name, value in kwargs.items():
+        parameters[name] = getattr(value, "name", value)
+    return parameters
+
+
+class ResearchCache:
+    """
+    Дисковый кэш результатов исследования с адресацией по содержимому и LRU-вытеснением
+    """
+    def __init__(self, cache_dir: str = RESEARCH_CACHE_DIR, max_size: int = RESEARCH_CACHE_MAX_SIZE):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+    @staticmethod
+    def make_key(parameters: dict):
+        """
+        Ключ записи: хэш параметров и версии кода.
+        """
+        content = json.dumps({"parameters": parameters, "code_version": get_code_version()}, sort_keys=True)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _get_path(self, key: str):
+        """
+        Путь к файлу записи.
+        """
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def load(self, key: str):
+        """
+        Чтение записи (с обновлением времени последнего использования).
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return data
+
+    def store(self, key: str, data: dict):
+        """
+        Атомарная запись результата с последующим вытеснением старых записей.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._get_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def _evict(self):
+        """
+        Удаление давно неиспользованных записей при превышении размера кэша.
+        """
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(".json"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+
+    def clear(self):
+        """
+        Очистка кэша.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(".json"):
+                os.remove(entry.path)
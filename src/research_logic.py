@@ -1,77 +1,278 @@
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from cfar_detector import DetectionCounts, detect_correlation_peaks
+from delay_statistics import DelayErrorStatistics, get_crb_variance
+from fixed_point import FixedPointCounters
+from random_utils import get_seed_sequence, get_substream, get_snr_key
+from research_cache import ResearchCache, get_research_parameters
+from results_store import ResultsStore
 from signals_generator import SignalGenerator
 from defaults import *
 from enums import *
 
 
+# Результат исследования для одного вида модуляции: значения ОСШ, доли правильных оценок и их погрешности
+ResearchResult = namedtuple("ResearchResult", ["snr_values", "probabilities", "errors"])
+
+
+def get_confidence_interval(signal_generator: SignalGenerator):
+    """
+    Допустимый интервал оценки задержки (мс): половина длительности бита в обе стороны.
+    """
+    bit_time = 1. / float(signal_generator.bits_per_second)
+    min_t = float(signal_generator.time_delay) - 0.5 * bit_time * 1000
+    max_t = float(signal_generator.time_delay) + 0.5 * bit_time * 1000
+    return min_t, max_t
+
+
+def _calc_trials_batch(signal_generator: SignalGenerator, modulation_types: list, trials: range,
+                       correlation_type: CorrelationType, baseband_mode: BasebandMode,
+                       seed_sequence: np.random.SeedSequence = None, fixed_point: dict = None):
+    """
+    Расчет пакета испытаний с осями (модуляции x испытания x отсчеты).
+
+    Случайные величины испытания (информационные последовательности и шум) формируются его подпотоком
+    и общие для всех видов модуляции; манипуляция, вставка, канал, нормировка шума и корреляция
+    выполняются для всего пакета сразу. Возвращает отсчеты времени и значения опорных сигналов,
+    незашумленных исследуемых сигналов после канала и корреляционных функций.
+    При заданной разрядности АЦП корреляция рассчитывается целочисленным трактом, а его события
+    накапливаются в словаре fixed_point ({ModulationType: FixedPointCounters}).
+    """
+    snr_key = get_snr_key(signal_generator.snr)
+
+    # Информационные последовательности испытаний и генераторы для их шума
+    bits, research_bits, generators = [], [], []
+    for trial in trials:
+        if seed_sequence is not None:
+            signal_generator.set_seed(get_substream(seed_sequence, snr_key, trial))
+        bits.append(signal_generator.get_bits(SignalType.GENERAL))
+        research_bits.append(signal_generator.get_bits(SignalType.RESEARCH))
+        generators.append(signal_generator.rng)
+
+    # Манипуляция: ось видов модуляции перед осью испытаний
+    modulated, research = [], []
+    for modulation_type in modulation_types:
+        times, values, last_phase = signal_generator.modulate_bits(bits, SignalType.GENERAL, modulation_type)
+        research_times, research_values, _ = signal_generator.modulate_bits(research_bits, SignalType.RESEARCH,
+                                                                            modulation_type, last_phase)
+        modulated.append(values)
+        research.append(research_values)
+    modulated, research = np.stack(modulated), np.stack(research)
+
+    # Вставка модулированного сигнала в исследуемый (общий индекс для всего пакета)
+    index = signal_generator.get_insertion_index(research_times, times)
+    if index is None:
+        raise ValueError("Опорный сигнал с заданной задержкой не помещается в исследуемый")
+    research[..., index:index + modulated.shape[-1]] = modulated
+    # Прохождение через канал распространения
+    if not signal_generator.channel.is_transparent():
+        research = signal_generator.channel.apply(research, signal_generator.sampling_rate,
+                                                  signal_generator.signal_freq)
+
+    # Шум каждого испытания из его подпотока, нормировка - для всего пакета
+    modulated_noise = np.empty(modulated.shape)
+    research_noise = np.empty(research.shape)
+    for i, generator in enumerate(generators):
+        signal_generator.rng = generator
+        modulated_noise[:, i] = signal_generator.get_noise_values(SignalType.GENERAL, modulated[:, i].shape)
+        research_noise[:, i] = signal_generator.get_noise_values(SignalType.RESEARCH, research[:, i].shape)
+    modulated_n = signal_generator.add_noise(SignalType.GENERAL, modulated, modulated_noise)
+    research_n = signal_generator.add_noise(SignalType.RESEARCH, research, research_noise)
+
+    # Расчёт корреляции
+    if signal_generator.quantization_bits:
+        lags, correlation, saturated, overflows = signal_generator.get_fixed_point_correlation_batch(
+            times, modulated_n, research_times, research_n, correlation_type, baseband_mode)
+        if fixed_point is not None:
+            for i, modulation_type in enumerate(modulation_types):
+                fixed_point[modulation_type].add(len(trials) * (modulated.shape[-1] + research.shape[-1]),
+                                                 np.sum(saturated[i]), correlation[i].size, np.sum(overflows[i]))
+    else:
+        lags, correlation = signal_generator.get_correlation_batch(times, modulated_n, research_times, research_n,
+                                                                   correlation_type, baseband_mode)
+    return times, modulated, research_times, research, lags, correlation
+
+
+def calc_good_counts(average_count: int, signal_generator: SignalGenerator, min_t: float, max_t: float,
+                     correlation_type: CorrelationType, baseband_mode: BasebandMode,
+                     seed_sequence: np.random.SeedSequence = None, first_trial: int = 0,
+                     statistics: dict = None, detection: dict = None, delays: np.ndarray = None,
+                     fixed_point: dict = None, cfar_type: CfarType = CfarType.CA):
+    """
+    Подсчет положительных исходов оценки задержки для каждого вида модуляции при текущем ОСШ.
+
+    Испытания рассчитываются пакетами по RESEARCH_BATCH_SIZE, все виды модуляции - в одном пакете.
+    Если задан словарь statistics ({ModulationType: DelayErrorStatistics}), в него добавляются
+    оценки задержки всех испытаний и границы Крамера-Рао. Если задан словарь detection
+    ({ModulationType: DetectionCounts}), в нем накапливаются исходы CFAR-обнаружения (вида cfar_type)
+    приходов сигнала по всем лучам канала. Если задан массив delays (виды модуляции x испытания), в него
+    записываются оценки задержки (мс) каждого испытания. Если задан словарь fixed_point
+    ({ModulationType: FixedPointCounters}), в нем накапливаются насыщения АЦП и переполнения накопителя.
+
+    При заданной seed_sequence каждое испытание использует собственный подпоток (ОСШ, номер испытания),
+    поэтому результат не зависит от разбиения испытаний на части и порядка их расчета.
+    Возвращает словарь {ModulationType: количество положительных исходов}.
+    """
+    modulation_types = list(ModulationType)
+    # Ожидаемые приходы сигнала и допуск на их обнаружение, мс
+    arrival_delays = signal_generator.channel.get_arrival_delays(signal_generator.time_delay,
+                                                                 signal_generator.signal_freq)
+    bit_time = 1. / float(signal_generator.bits_per_second)
+    # Количество положительных исходов
+    good_counts = {modulation_type: 0 for modulation_type in modulation_types}
+    # Цикл для усреднений (пакетами испытаний)
+    last_trial = first_trial + average_count
+    for batch_start in range(first_trial, last_trial, RESEARCH_BATCH_SIZE):
+        trials = range(batch_start, min(batch_start + RESEARCH_BATCH_SIZE, last_trial))
+        times, modulated, research_times, research, lags, correlation = _calc_trials_batch(
+            signal_generator, modulation_types, trials, correlation_type, baseband_mode, seed_sequence, fixed_point)
+
+        # Нахождение временных задержек
+        time_delays = lags[np.argmax(correlation, axis=-1)] * 1000
+        if delays is not None:
+            delays[:, trials.start - first_trial:trials.stop - first_trial] = time_delays
+        if statistics is not None:
+            crb_variances = get_crb_variance([times, modulated], [research_times, research], signal_generator.snr)
+        for i, modulation_type in enumerate(modulation_types):
+            good_counts[modulation_type] += int(np.sum((time_delays[i] >= min_t) & (time_delays[i] <= max_t)))
+            if statistics is not None:
+                for time_delay, crb_variance in zip(time_delays[i], crb_variances[i]):
+                    statistics[modulation_type].add(time_delay, crb_variance)
+            if detection is not None:
+                # Корреляция комплексных огибающих уже является огибающей
+                peaks = detect_correlation_peaks([lags, correlation[i]], bit_time, cfar_type,
+                                                 envelope=baseband_mode == BasebandMode.PASSBAND)
+                detection[modulation_type].add(peaks, arrival_delays, 0.5 * bit_time * 1000)
+
+    return good_counts
+
+
 def calc_research(average_count: int, signal_generator: SignalGenerator,
-                  from_noise: int = 10, to_noise: int = -11, step_noise: int = -1):
+                  from_noise: int = 10, to_noise: int = -11, step_noise: int = -1,
+                  bits_source: BitsSourceType = None, correlation_type: CorrelationType = None,
+                  baseband_mode: BasebandMode = None, cache: ResearchCache = None, seed=None,
+                  statistics: dict = None, detection: dict = None, store: ResultsStore = None,
+                  fixed_point: dict = None, cfar_type: CfarType = None):
+    """
+    Зависимость доли правильных оценок задержки от ОСШ для каждого вида модуляции.
+
+    Возвращает словарь {ModulationType: ResearchResult}. Если задан словарь statistics, в него
+    для каждого ОСШ записывается статистика ошибок оценки задержки {ModulationType: DelayErrorStatistics},
+    если задан словарь detection - исходы CFAR-обнаружения {ModulationType: DetectionCounts}.
+    Если задана история store, исследование записывается в нее вместе со статистикой и временем расчета точек.
+    При заданной разрядности АЦП генератора (quantization_bits) корреляция рассчитывается целочисленным
+    трактом; если задан словарь fixed_point, в него записываются его события {ModulationType: FixedPointCounters}.
+    """
+    # Выбор источника информационной последовательности опорного сигнала
+    if bits_source is not None:
+        signal_generator.bits_source = bits_source
+    # Выбор типа взаимной корреляционной функции
+    if correlation_type is None:
+        correlation_type = signal_generator.correlation_type
+    # Выбор режима расчета корреляции (полосовой сигнал или комплексная огибающая)
+    if baseband_mode is None:
+        baseband_mode = signal_generator.baseband_mode
+    # Выбор вида CFAR-обнаружителя
+    if cfar_type is None:
+        cfar_type = signal_generator.cfar_type
     # Длительность бита
-    bit_time = 1. / float(DEFAULT_BITS_PER_SECOND)
+    bit_time = 1. / float(signal_generator.bits_per_second)
     # Доверительный интервал
-    min_t = float(signal_generator.time_delay) - 0.5 * bit_time
-    max_t = float(signal_generator.time_delay) + 0.5 * bit_time
+    min_t, max_t = get_confidence_interval(signal_generator)
+    # Корневая последовательность зерен (число, SeedSequence или numpy.random.Generator)
+    seed_sequence = get_seed_sequence(seed)
+    seed_value = None if seed is None else np.asarray(seed_sequence.entropy).tolist()
     # Изменение уровня шума
-    x_am, y_am, errors_am = [], [], []
-    x_fm, y_fm, errors_fm = [], [], []
-    x_pm, y_pm, errors_pm = [], [], []
-    for snr in range(from_noise, to_noise, step_noise):
-        print(f"Запускается расчет исследования при {snr} дБ...")
+    snr_values = list(range(from_noise, to_noise, step_noise))
+    probabilities = {modulation_type: [] for modulation_type in ModulationType}
+    # Статистика и время расчета по точкам для истории исследований
+    all_statistics, all_detection, all_fixed_point, timings = {}, {}, {}, {}
+    # Количество испытаний, взятых из кэша, по точкам
+    cached_trials = {}
+    for snr in snr_values:
+        start_time = time.perf_counter()
         # Обновление уровня шума
         signal_generator.snr = float(snr)
-        # Количество положительных исходов
-        good_count_am = 0
-        good_count_fm = 0
-        good_count_pm = 0
-        # Цикл для усреднений
-        for avg in range(average_count):
-            # Модулированные сигналы
-            modulate_am = signal_generator.calc_modulated_signal(SignalType.GENERAL, ModulationType.AM)
-            modulate_fm = signal_generator.calc_modulated_signal(SignalType.GENERAL, ModulationType.FM)
-            modulate_pm = signal_generator.calc_modulated_signal(SignalType.GENERAL, ModulationType.PM)
-            # Исследуемые сигналы
-            research_am = signal_generator.calc_modulated_signal(SignalType.RESEARCH, ModulationType.AM)
-            research_fm = signal_generator.calc_modulated_signal(SignalType.RESEARCH, ModulationType.FM)
-            research_pm = signal_generator.calc_modulated_signal(SignalType.RESEARCH, ModulationType.PM)
-            # Вставка модулированных сигналов в исследуемые
-            researched_am = signal_generator.calc_research_signal(modulate_am, research_am)
-            researched_fm = signal_generator.calc_research_signal(modulate_fm, research_fm)
-            researched_pm = signal_generator.calc_research_signal(modulate_pm, research_pm)
-            # Добавление шума
-            modulate_n_am = signal_generator.generate_noise(SignalType.GENERAL, modulate_am)
-            modulate_n_fm = signal_generator.generate_noise(SignalType.GENERAL, modulate_fm)
-            modulate_n_pm = signal_generator.generate_noise(SignalType.GENERAL, modulate_pm)
-            researche_n_am = signal_generator.generate_noise(SignalType.RESEARCH, researched_am)
-            researche_n_fm = signal_generator.generate_noise(SignalType.RESEARCH, researched_fm)
-            researche_n_pm = signal_generator.generate_noise(SignalType.RESEARCH, researched_pm)
-            # Расчёт корреляции
-            correlation_am = signal_generator.get_correlation(modulate_n_am, researche_n_am)
-            correlation_fm = signal_generator.get_correlation(modulate_n_fm, researche_n_fm)
-            correlation_pm = signal_generator.get_correlation(modulate_n_pm, researche_n_pm)
-
-            # Нахождение временной задержки
-            time_delay_am = signal_generator.find_correlation_max(correlation_am)
-            time_delay_fm = signal_generator.find_correlation_max(correlation_fm)
-            time_delay_pm = signal_generator.find_correlation_max(correlation_pm)
-
-            if min_t <= time_delay_am <= max_t:
-                good_count_am += 1
-
-            if min_t <= time_delay_fm <= max_t:
-                good_count_fm += 1
-
-            if min_t <= time_delay_pm <= max_t:
-                good_count_pm += 1
-
-        x_am.append(snr)
-        y_am.append(good_count_am / average_count)
-        errors_am.append(0.5 * bit_time)
-
-        x_fm.append(snr)
-        y_fm.append(good_count_fm / average_count)
-        errors_fm.append(0.5 * bit_time)
-
-        x_pm.append(snr)
-        y_pm.append(good_count_pm / average_count)
-        errors_pm.append(0.5 * bit_time)
-
-    return x_am, y_am, errors_am, x_fm, y_fm, errors_fm, x_pm, y_pm, errors_pm
+
+        # Поиск ранее рассчитанных исходов для той же конфигурации
+        key, trials_count = None, 0
+        counts = {modulation_type: 0 for modulation_type in ModulationType}
+        snr_statistics = {modulation_type: DelayErrorStatistics(signal_generator.time_delay, bit_time)
+                          for modulation_type in ModulationType}
+        snr_detection = {modulation_type: DetectionCounts() for modulation_type in ModulationType}
+        snr_fixed_point = {modulation_type: FixedPointCounters() for modulation_type in ModulationType}
+        if cache is not None:
+            parameters = get_research_parameters(signal_generator, snr=snr, min_t=min_t, max_t=max_t,
+                                                 correlation_type=correlation_type, baseband_mode=baseband_mode,
+                                                 cfar_type=cfar_type, seed=seed_value)
+            key = cache.make_key(parameters)
+            cached = cache.load(key)
+            if cached is not None:
+                trials_count = cached["trials_count"]
+                for modulation_type in ModulationType:
+                    counts[modulation_type] = cached["counts"][modulation_type.name]
+                    snr_statistics[modulation_type] = DelayErrorStatistics.from_dict(
+                        cached["statistics"][modulation_type.name])
+                    snr_detection[modulation_type] = DetectionCounts.from_dict(
+                        cached["detection"][modulation_type.name])
+                    snr_fixed_point[modulation_type] = FixedPointCounters.from_dict(
+                        cached["fixed_point"][modulation_type.name])
+
+        cached_count = trials_count
+
+        # Досчет недостающих усреднений с объединением частичных результатов
+        if trials_count < average_count:
+            print(f"Запускается расчет исследования при {snr} дБ...")
+            new_counts = calc_good_counts(average_count - trials_count, signal_generator, min_t, max_t,
+                                          correlation_type, baseband_mode, seed_sequence, trials_count,
+                                          snr_statistics, snr_detection, fixed_point=snr_fixed_point,
+                                          cfar_type=cfar_type)
+            counts = {modulation_type: counts[modulation_type] + new_counts[modulation_type]
+                      for modulation_type in ModulationType}
+            trials_count = average_count
+            if cache is not None:
+                cache.store(key, {
+                    "trials_count": trials_count,
+                    "counts": {modulation_type.name: counts[modulation_type] for modulation_type in ModulationType},
+                    "statistics": {modulation_type.name: snr_statistics[modulation_type].to_dict()
+                                   for modulation_type in ModulationType},
+                    "detection": {modulation_type.name: snr_detection[modulation_type].to_dict()
+                                  for modulation_type in ModulationType},
+                    "fixed_point": {modulation_type.name: snr_fixed_point[modulation_type].to_dict()
+                                    for modulation_type in ModulationType},
+                })
+        all_statistics[snr] = snr_statistics
+        all_detection[snr] = snr_detection
+        all_fixed_point[snr] = snr_fixed_point
+        if signal_generator.quantization_bits:
+            for modulation_type, counters in snr_fixed_point.items():
+                summary = counters.get_summary()
+                print(f"  {modulation_type.name}: насыщение АЦП {summary['saturation']:.2e}, "
+                      f"переполнение накопителя {summary['overflow']:.2e}")
+        # Время расчета сравнимо между исследованиями только для точек, рассчитанных полностью
+        cached_trials[snr] = cached_count
+        if not cached_count:
+            timings[snr] = time.perf_counter() - start_time
+
+        for modulation_type in ModulationType:
+            probabilities[modulation_type].append(counts[modulation_type] / trials_count)
+
+    results = {modulation_type: ResearchResult(snr_values, probabilities[modulation_type],
+                                               [0.5 * bit_time] * len(snr_values))
+               for modulation_type in ModulationType}
+    if statistics is not None:
+        statistics.update(all_statistics)
+    if detection is not None:
+        detection.update(all_detection)
+    if fixed_point is not None:
+        fixed_point.update(all_fixed_point)
+    if store is not None:
+        parameters = get_research_parameters(signal_generator, min_t=min_t, max_t=max_t, snr_values=snr_values,
+                                             correlation_type=correlation_type, baseband_mode=baseband_mode,
+                                             cfar_type=cfar_type)
+        store.add_sweep(parameters, average_count, results, seed_value, all_statistics, all_detection, timings,
+                        cached_trials)
+    return results
@@ -0,0 +1,2556 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x04\x8f\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x28\x00\x00\x00\x28\x08\x06\x00\x00\x00\x8c\xfe\xb8\x6d\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x04\x44\x49\x44\x41\x54\x58\x85\xed\x96\x5d\x6c\
+\x93\x65\x14\xc7\xff\xe7\x79\xdf\xb6\xeb\x64\xd9\x26\x24\x12\x62\
+\x8c\x89\x77\xcb\x96\x08\x41\x33\xae\x34\x40\x82\xdb\xda\x5a\x62\
+\x66\xa2\xa6\xfb\x04\xbc\x20\x0b\x98\xb0\x26\x9b\x23\x69\x02\x74\
+\x63\x1a\x34\x7e\x70\x23\xed\x58\x37\x2f\x64\x4c\xa4\xdb\x4a\xe6\
+\xc5\x82\x17\x46\x02\x1b\xc3\xec\x9d\x09\x1a\x6f\x9c\x89\x57\xc3\
+\x01\xfb\x70\x6d\xdf\xe7\x78\xd1\xb5\xb4\xb3\x6d\xde\x7d\x32\x93\
+\xfe\x6f\xdf\xe7\xbc\xcf\xef\x39\xe7\x9f\x73\x0e\x90\x53\x4e\x39\
+\x65\x15\x6d\xc6\x25\xf5\xfe\x16\x1b\x11\x02\x00\x58\x02\xae\xcb\
+\xf5\xed\x21\xa3\xb1\xea\x06\x72\x25\x44\x84\xee\x03\xbb\xf7\x16\
+\x33\x80\x91\xf1\xd1\x5e\x00\xcf\x1a\x8d\xdd\x14\x40\x00\x0a\x03\
+\x00\x33\x18\x28\xaa\xf1\xb9\x7f\x84\xa4\x01\x26\x7d\xb0\xe7\xc8\
+\xc7\x5a\xb6\xc0\x0d\x2f\x71\x5d\x57\xf3\x4e\xd6\xc5\x3d\x45\xa1\
+\x6d\x80\xf8\x27\x1a\x89\xd4\x41\x11\x33\x60\xb6\x01\x70\x02\xc8\
+\x63\xc2\x30\x98\x06\x4d\x44\x2a\x04\xf9\x90\x64\x05\xc3\x80\xab\
+\xf1\x51\xf5\x97\x9e\x6d\x56\xcb\xfc\x4d\x02\xfa\xbb\x8f\x74\xb6\
+\xa7\x3b\xe3\xba\x74\xaa\x54\x40\xd8\x99\x60\x53\x85\xd8\x77\x60\
+\xf7\x2b\x14\xb3\xc2\xd8\xb4\xbf\xde\xbb\xc3\x70\x89\x53\x7d\x34\
+\x16\x00\xb0\x23\xdb\xf9\xd7\x3d\x1e\xd5\x6a\x99\xff\x86\x09\x63\
+\x81\xc6\xf4\x70\x00\xb0\x54\x62\x0d\x40\x7b\x43\x57\xcb\xdf\x0c\
+\x14\x81\x39\xf1\x5d\xac\x00\xd0\x1c\xf7\x11\x18\x85\xb5\x3e\xb7\
+\x03\x9c\xd9\x22\x2f\x3c\x3f\xf7\x05\x00\x4c\x4d\xe5\x1f\x37\x7a\
+\x87\x04\xde\x1b\x19\x1f\x7d\x30\x72\xef\xee\x34\xa4\xee\x02\x0c\
+\x7a\xb0\xe6\x52\xf3\x09\x82\x38\xad\x2a\x42\x65\x50\x54\xca\xc8\
+\x05\x1d\x70\x92\xa4\x3c\x26\x3e\xd3\xd3\xf8\xd1\x55\x10\x12\xcf\
+\xae\xf1\x35\xb7\x92\xa4\xb7\xe6\xc3\xf9\xaf\xf5\x1d\xf7\xcc\x1a\
+\x05\x4c\xa7\xec\x80\x0c\x72\xf9\x9a\x3b\x04\x84\x8d\x75\x54\x04\
+\xde\x3f\xff\x47\x0a\xb8\xff\xd4\x41\x66\xf2\x92\xa4\x3c\xa1\x20\
+\x24\x48\x39\x46\x04\x53\x34\xca\x0b\x51\x96\x7b\xbe\x3e\xda\xf9\
+\xe7\x5a\xe0\xb2\x02\x36\x7d\xd6\x64\x79\x68\xb5\x06\x00\x3c\x27\
+\xd4\xb0\xf3\x72\xfd\xa7\x33\x99\x1e\x51\xeb\x77\xdb\x55\x45\xe9\
+\xdf\xff\xf2\x5e\x75\xc9\xa3\x33\xfe\x7a\x6f\xf1\x5a\xe1\x80\x0c\
+\x1e\xac\xeb\x3a\x59\xf4\xd0\x6a\x1d\x06\x80\xc2\x85\x85\x43\x19\
+\xe1\x00\x80\xc0\xdd\x8d\x9d\x41\x66\x3c\x4a\x78\x14\xd0\xd7\x03\
+\x0e\x48\xd3\xa8\x1b\x7c\xee\x5d\x51\x1d\x21\x16\xf8\xe1\xa5\xa9\
+\xfc\x0f\x3c\x9e\x4e\x69\xe4\x47\x12\x70\x8d\x8c\x8f\xf6\x00\xc4\
+\x71\x83\xaf\x87\x08\x48\xe9\x71\x42\xd7\x65\x98\x99\x2f\x06\x8e\
+\x76\x7a\xd6\xeb\x92\xb5\x48\x05\x96\xf5\xb8\xbb\x63\xb3\xfe\x06\
+\xef\x96\x80\x03\x92\x4a\x9c\xf0\x0f\x61\xf1\x69\xc1\x1c\x6e\x1b\
+\xb2\x31\x44\x00\x44\xcc\xcc\xae\xeb\x67\x2b\x42\x2a\xb0\x71\xfe\
+\x59\x89\xaa\xab\xaf\x28\x11\x52\x7a\xcb\x4a\x4b\x0a\x19\x84\xc9\
+\x89\xc9\x00\x80\xd8\xa8\x5b\x9a\xab\xdb\x37\x12\x60\x79\x76\xcc\
+\x2a\xdd\x0a\x2f\x72\x39\x93\x5e\x0e\xa6\x7d\x8b\x84\x57\x05\xf3\
+\x33\x0c\x02\x25\x8d\xba\xcd\x5a\xb7\xc0\xa4\x74\x97\x95\x96\x14\
+\x33\x08\xda\x84\x16\x5c\x0c\xeb\x73\x00\x6e\x03\xf8\x89\x20\x3e\
+\x31\x9b\xe9\x56\x38\xca\xe5\x9a\xa6\xf5\x10\x13\xb3\x94\xae\x15\
+\x01\xa6\xf3\x87\xd1\xd8\xea\xea\x2b\x4a\x04\x6c\x8d\x67\x87\x80\
+\x59\xcb\x6f\x73\xdb\xfb\xfa\xde\x5e\xde\x2f\xff\x53\x49\xc3\x80\
+\xc9\x19\x88\xfb\xc3\x48\x5c\x65\xf3\xd0\xce\xb0\x89\x7b\x21\xe5\
+\x7d\x4d\x9b\x7c\x91\x18\x3a\x4b\x76\xa5\x81\x4b\xab\x95\x94\xd8\
+\x1c\xcf\x00\x13\x17\x3a\x5a\x06\x1d\xc1\xf6\xaa\x01\x80\x38\x53\
+\x80\xbd\x2d\xb4\x9f\x24\x07\x18\xf4\x95\xe5\xd7\xb9\xb3\x46\xa1\
+\x92\x65\x68\x9b\x71\xb4\x0e\x9d\x20\xa2\xd3\x42\x08\x15\x8c\xa8\
+\xd4\xa3\x17\x98\xc8\x09\x46\x1e\x04\x9f\x09\x9e\xab\xba\x9a\x0a\
+\xca\x64\x6f\x1d\x72\x13\xd1\x49\xd6\xa9\x76\xa0\xa3\xf2\xfb\x95\
+\x82\x19\x04\x64\x72\x7c\x18\xea\x00\xc3\xc6\xba\xac\x18\x38\x6f\
+\x4f\xd9\x66\xde\x6c\x1b\x3c\xc8\x92\xbc\x60\xe4\x91\x42\x21\x02\
+\x1d\x03\x11\x31\xeb\xbf\x4b\x9d\x1e\x9b\x48\xbc\xfb\xad\xf7\x8d\
+\xbf\x56\x0b\x97\x15\xb0\xa2\x29\x64\x31\x15\x70\x6c\x9b\x31\x87\
+\x9d\xdf\x79\x0e\x67\x58\x18\x98\x1c\x2d\x43\x76\xa1\xaa\xfd\x65\
+\xa5\x25\x6a\xcc\xa3\x13\x0b\xea\xfd\xd9\x82\xd5\x94\x74\xb9\xd2\
+\x6e\x33\x4e\xcf\xb5\x22\x53\x01\x0f\x03\x40\xe4\x31\x1d\xca\x0c\
+\x07\x00\xc4\xc1\x76\x5b\x10\xc0\xa3\x27\x3d\x4c\xcc\xaf\x07\x5c\
+\x5a\x40\x87\xfb\xfa\x2e\x19\x31\xdf\x64\xc6\xcf\x7b\xcc\x77\xde\
+\xb9\xf1\x79\xa5\xa1\xd1\xc7\xcc\x2e\x4d\xd3\x1e\x68\xda\x2f\xd3\
+\xf1\x1e\xb6\x1e\x22\x20\xa5\xc7\x09\x29\xf5\x30\x18\x17\x83\xde\
+\xaa\x2d\xb1\x30\xa8\xc0\xf2\x1e\xa7\xcd\x5e\x3b\x57\xb1\x25\xe0\
+\x80\xa4\x12\x3f\xf1\x0f\x3d\xb5\x6d\x26\x9d\x62\x19\x8c\xf9\x27\
+\x65\x06\xe6\x94\x53\x4e\xff\x13\xfd\x0b\xfe\x57\x0e\x98\xae\xdd\
+\xb3\xdc\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x08\x66\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x08\x1b\x49\x44\x41\x54\x68\x81\xed\x58\x7b\x6c\
+\x53\xd7\x19\xff\x7d\xf7\xda\x8e\x5f\x21\x4e\xc8\xa3\x40\xc6\xa3\
+\x65\x80\x9d\x47\x53\x60\xeb\x24\x60\xa5\x88\x76\x65\x7f\xac\x0f\
+\xc6\xe8\xd6\xb0\x89\x49\x1d\xa8\x41\xdd\x58\x17\x16\x92\xb0\x5d\
+\xad\xa1\xd9\xa3\x0b\x1b\x6a\x90\x22\xb6\xb6\xea\x58\x19\x63\xd2\
+\xda\xfe\x81\xd0\x3a\x95\x4a\x43\x5d\x1f\xd0\x04\x93\x07\x09\xa5\
+\x03\x42\x9a\x90\xc4\x76\x1c\x27\x8e\xed\x7b\xef\xf9\xf6\x87\x63\
+\xf2\xc0\x34\x8e\x1d\xb2\x3f\xc6\x4f\xba\xf2\xa7\xe3\x7b\xce\xf9\
+\xfd\xce\xf7\x9d\xf3\x9d\xef\x02\x77\x70\x07\xff\xdf\xa0\x99\x18\
+\xa4\xa4\xb2\xf5\x21\x30\xdf\xfb\xc5\x4f\x5c\x07\x8e\x1f\x27\x7d\
+\x26\xc6\x4c\x14\x29\x0b\xb8\xaf\xa2\x6d\xb3\x64\x96\xff\x22\x9b\
+\x8d\x86\xb0\x3f\x78\x2c\x33\xad\xb7\xf4\x5d\xe5\x41\x6d\x26\xc8\
+\x25\x02\x29\x95\xce\x31\xf2\xe9\x8b\xb2\x0d\xf6\xf9\x0e\xa4\x65\
+\x59\xb7\x7a\xc3\xb9\x47\xd6\x2b\xa7\x0c\x33\x45\x70\x2a\x24\x2d\
+\xe0\xbe\x8a\xb6\xcd\x90\x70\x14\xb2\x6c\x20\x19\x80\x24\x20\x9b\
+\x24\x40\xa2\x59\x15\x21\x27\xd3\x29\xb6\xf2\x19\x77\xe7\x1a\x99\
+\x75\x8c\x78\x87\x20\x54\x0d\xa1\x40\x04\x99\x4b\xf2\xc0\xd0\x0b\
+\xfd\x41\xd3\xdd\x0f\xe4\xad\x7f\xab\xb5\xf5\x38\xcf\x34\xe9\xf1\
+\x48\xca\x03\x4c\x7c\xd0\xb6\x20\xcb\x40\x06\x82\x25\xdb\x06\x16\
+\x02\x43\x7d\xc3\xc8\xc8\xcf\x86\x24\x03\xf6\xbc\x39\x30\x98\xe4\
+\xd2\x96\xe5\xce\x57\xb7\x6c\xf9\x6b\x52\x8b\x94\x28\x92\x13\xc0\
+\xfc\xfc\xf0\x75\x1f\x33\xeb\x08\xf9\x82\x60\x41\xb0\x38\x6c\x08\
+\x74\x7b\xc0\x10\x08\x7a\x03\x20\x83\x01\xd6\x39\xb6\xd2\x96\xe5\
+\xce\x57\x11\x47\x44\xed\xa1\x43\x99\xa9\xd3\x4f\xe1\x14\x2a\xae\
+\x6a\x7d\x86\x64\x7a\x49\x32\xc8\xe4\x58\x98\x03\x92\x81\xe1\x3e\
+\x3f\x42\xfe\x20\xa4\x34\x23\x1c\xf9\x39\x20\x30\xfc\xbd\x5e\x84\
+\x06\x82\xbf\x69\xa9\x29\xda\x03\x00\x4a\xdd\x1f\xb2\x4c\x88\xbc\
+\x05\x60\x0d\xc0\x27\x8c\x7a\xf0\x5b\xe5\xe5\xe5\xc3\xc9\xf2\x48\
+\x7a\x13\xbb\xf7\xbb\x0e\xb1\xce\xbb\x40\x60\x10\x03\x24\x00\x62\
+\x88\x1b\x11\x2f\x00\x49\x80\x08\x60\x62\x19\x00\x94\x03\x07\x1c\
+\x46\x0e\x9f\x64\xe6\x35\xcc\x0c\x00\x5f\x8f\x18\xac\x27\x95\xfa\
+\x7a\x7b\xb2\x3c\x52\xce\x03\x45\x7b\x9b\x9f\x36\xd8\x4d\x0d\x46\
+\xb3\x81\xd4\xb0\x0e\x47\x7e\x0e\x82\x5e\x3f\x22\x23\x61\x48\x46\
+\x09\x23\xbe\xc1\x37\x73\x8d\xfe\x6f\xae\xcf\x68\xb2\x1b\x85\xf1\
+\x1f\x00\x7d\x29\xce\x30\xa7\x55\x33\x36\x29\x65\x65\x43\xb3\x2e\
+\x00\x00\x0a\xaa\x9b\x9f\x06\xb8\x21\x67\xe9\x02\x92\x64\x02\x48\
+\xa0\xff\x3f\xbd\x90\x7d\x97\xae\x3c\x60\x3e\x17\xb6\xd8\xd3\x1e\
+\xb5\x9b\xcc\xaf\x31\x30\x81\x3c\xd1\x04\x0a\x49\x89\x98\x11\x01\
+\x40\x54\x84\xc1\x62\x6c\xc8\xfa\xc2\x5c\x1a\xf2\x0c\x22\xe0\x09\
+\xfc\xed\x6b\x7c\x82\x0c\x32\x36\xa7\x5b\xad\xdd\x92\x24\xcd\x03\
+\x8d\x4d\x48\x74\xf3\xd4\x44\x38\xad\x9a\x69\x5a\x22\x52\xca\xc4\
+\xe3\xd1\x52\x53\x78\x38\x12\x52\x77\xf5\x7e\xd2\x2d\x86\x3c\x43\
+\x47\x2f\xb4\xb7\x3f\x69\xb3\x5a\xca\x6c\x66\x4b\x27\x08\xf3\x04\
+\x0b\xb0\x60\x08\x66\x30\x33\x84\x88\xfe\x46\x9f\xe8\x18\xcc\x58\
+\x6b\x08\xf2\xb1\xe9\xcc\x3b\x63\x1e\x88\x61\x99\x72\x26\xbb\x43\
+\x59\xdd\xaf\x28\x75\x59\xc2\x4c\x6f\x83\x69\xe5\x58\xa4\x50\xec\
+\x67\x74\x62\x1a\xb3\x89\x6e\x90\x31\xea\x26\x47\x45\xc5\x0e\xff\
+\xff\x44\x00\x00\x28\x4a\x5d\x96\x66\xc4\xdb\x00\x56\x8e\x8f\xf3\
+\x98\x3d\x16\x3d\x63\x36\xc5\x94\x10\x4e\xff\xbc\xfc\xd9\x75\x89\
+\xce\x35\xe3\xf7\x15\x45\x39\xe0\x88\xc8\xfa\xc9\xd8\xca\xc7\x4e\
+\xd5\x98\x4d\x60\x30\xc7\x56\x3e\x6a\x13\x01\x0c\x06\x31\x35\x99\
+\x84\xfc\xd8\x74\xe6\x9b\xd1\x34\xaf\x28\x8a\x7d\x44\x36\x9c\x02\
+\x63\x75\x94\x12\x46\xe3\x3b\x6a\x83\xc7\x04\x8d\xb7\x39\xaa\xec\
+\x63\x32\x89\x8d\xfb\xf6\xfc\xd0\x3b\x9d\x39\x67\xd4\x03\xc3\xc2\
+\xfc\x3d\xb0\x88\x86\x0d\x51\x34\xc7\x11\x81\x19\xa3\xab\x0c\x10\
+\x03\x4c\x51\xc6\x31\x9b\x40\x1f\xcb\x21\x3c\xa4\x54\xfc\x78\x5a\
+\xe4\x67\x5c\x80\x06\x5c\x23\x11\xcd\xbe\xb1\x98\xa6\xd1\xcd\x19\
+\x3b\x36\x69\x54\x49\x4c\x10\x04\xfb\x21\xe8\xa9\xf6\x96\xe7\xfc\
+\x25\x15\x8f\xd4\x09\x40\x5b\x7e\xc9\xb9\x37\xd1\xca\x2e\xa5\x4d\
+\xac\x28\x8a\x94\xb3\x68\xc5\x2a\x09\x5c\x20\x49\x12\xeb\x4c\xcd\
+\xed\x1d\x17\x9f\x22\x09\xbb\x69\x74\x83\x4e\x16\x12\xf5\xcc\xe8\
+\xe6\x25\xea\x55\x55\x2d\x77\x28\x30\xd8\xf2\x61\x5a\xe9\xb9\xb4\
+\xb9\xe9\xdf\x61\x08\x84\x7d\xc3\x09\x57\x76\x49\x0b\x38\xf8\xc7\
+\x23\x0f\x4b\x8c\x06\x10\x16\x47\x09\x45\x1f\x10\x5d\xba\x7c\xe5\
+\xaa\x7b\x24\x1c\x79\x3c\x26\x60\xfc\xe9\x13\x15\x44\x20\x42\x13\
+\x05\xa5\x4d\x83\xea\xc0\xef\xcf\xe2\xe1\xf9\xd2\xfc\x25\x6b\xed\
+\xf3\x32\x00\x08\x0c\x75\x0f\x20\xe4\x1b\x39\x96\x95\x80\x88\xa4\
+\x13\x99\x1c\x52\xdd\x2c\xf4\x11\x21\x04\x26\x3e\xfa\x3d\x8b\x16\
+\xe6\x3f\x6e\xb3\x59\xff\x25\x74\x01\x5d\x08\xe8\x7a\xf4\x3f\x7d\
+\xf4\x11\x42\x34\x8d\x44\xc4\xc6\xcb\x97\xcb\xfb\x3e\x30\x97\x46\
+\x84\x63\xc1\x5a\x56\x35\x30\xeb\x60\x08\xe8\xaa\x0e\xd9\x6c\x48\
+\xa8\xb2\x4b\x5a\x40\x59\xd9\xf6\x1e\x49\x15\x1b\x58\x88\xb6\x71\
+\xe4\xc1\xa3\x76\xfe\x5d\x79\xeb\xd2\x4c\xa6\xbf\x4f\x20\xae\x33\
+\x34\x21\x9a\x22\x3a\x36\xd6\xd7\x56\x7a\x2e\x2e\x6d\xfb\x53\x5a\
+\xb6\xbd\xd4\x71\x4f\x0e\x0c\x36\x23\x02\x9d\x5e\x0c\x5e\xf1\xc1\
+\x68\x35\x23\x73\x49\x1e\xd2\xe6\x5a\xb7\xf6\xab\xb9\x2f\x7f\x5e\
+\x51\x94\xd2\x55\xa2\xac\x6c\x7b\xcf\x67\xd7\x3d\xdf\x0e\x04\x06\
+\x3f\x15\x42\xc7\x64\x6f\x2c\x5e\x98\x5f\xa4\x6b\xe2\x97\xe3\x44\
+\x34\x31\xe4\x8d\xf5\xb5\x95\x9e\x55\xcf\xb5\x67\x43\xa2\xad\xd6\
+\x9c\x74\x80\x04\xcc\x73\xad\xd0\x42\x1a\x34\x55\x83\x65\xae\x1d\
+\x90\x04\xec\x39\x36\x10\x89\x6d\xad\xcb\x9c\xaf\xdc\x4a\x44\xca\
+\x77\x21\x5d\x0b\xe5\x5f\xeb\xfa\x6c\x80\x99\x6f\x78\x82\xc7\x3c\
+\xb2\xb4\x68\xf9\xe2\x63\x82\xf9\x31\x5d\x13\xcf\x04\x44\x60\x6d\
+\x7d\x6d\xa5\x07\x00\xce\xfe\x76\x79\x3f\x84\xbe\x73\xb0\xb3\x5f\
+\x08\x4d\xc3\x60\xa7\x0f\xe6\x2c\x3b\xcc\x19\x36\xf8\xbb\x3c\x10\
+\xba\x06\x5f\xa7\x0f\xb6\xdc\x2c\x58\x1c\xf6\x6d\xad\xcb\x9c\x7f\
+\x8e\x17\x4e\x29\x1f\xa3\xcc\x54\x60\xb5\xa7\x5f\x52\x05\x3d\x6b\
+\x94\xf8\x1d\x66\x76\x8e\x16\x2b\xd1\x1c\x40\x70\x35\xbc\xf8\x8b\
+\xd7\xe3\xf5\x6d\xaa\x2d\x3c\x5c\x5c\xd5\x6a\xf4\x76\xf4\xbd\x64\
+\xc9\xb2\x93\x35\x3b\xea\x8d\x40\xcf\x00\xfa\x3b\xae\xc3\x96\xe3\
+\x80\x35\xd3\x06\xc0\x02\x66\x6d\x6b\xaf\x3f\xfb\x0c\x80\x17\xc7\
+\x8f\x91\xfa\x6d\x94\xb1\x8e\x81\x9c\x9e\x9e\xee\x83\xed\x1d\x17\
+\x47\x86\x87\x87\x3f\x1d\x13\xc7\x10\x31\x35\xb7\x80\x7b\xbf\xeb\
+\x10\x88\x77\xa9\xa1\x08\x33\xeb\x60\x5d\x83\x16\x8a\xc0\x60\x35\
+\x43\x0d\x86\xc1\xac\x43\xe8\x1a\xd4\x90\xaa\x31\x71\xd3\xe4\xfe\
+\x37\x09\x70\x56\xbb\x9b\x5d\x55\xee\x47\x27\xb5\xbd\xef\xaa\x3c\
+\x5f\x1a\x97\x3f\xb3\x4a\x8c\x21\x66\xfe\xc8\x6a\x4b\xdf\x17\x1c\
+\x1a\xdc\x0c\xa0\xed\xc6\x0b\x84\xf6\xa9\xd6\xc0\xbd\xbf\xf0\x50\
+\x38\x14\xde\xe1\xbb\xda\xcf\x03\x57\x3d\x30\xcf\x49\x47\xd6\xc2\
+\x1c\x18\xad\x46\xf8\xae\xf5\xc1\xdb\xe9\xd1\x23\x61\xf5\xbb\x6d\
+\x35\xc5\xff\x9c\xdc\x37\x4e\x08\x51\x1e\x24\x7c\x19\xc0\x9b\xe3\
+\x1a\x73\x41\x74\x3f\x80\x23\x93\xdf\xae\xdb\x5f\xf5\xc4\xe4\xb6\
+\x5f\xd7\xbf\xb2\xc1\x28\xf1\x3b\x00\x4c\x3f\xfa\xc1\xf6\xc6\xdd\
+\x3b\xbe\x3f\x95\x06\xb4\xd4\x14\x1e\x2e\xa8\x6e\x86\x64\x90\x1a\
+\xcc\x19\x56\x02\x09\x58\x1c\x16\x0c\x79\xfc\xba\x2e\x78\xdb\x85\
+\xfd\xf7\x1e\x8d\xd7\x2f\x4e\x08\x71\x37\x04\xcf\x9f\x20\x89\xa8\
+\x19\x10\x6b\xa6\x64\x31\x8a\x3d\x65\xdb\x7b\x54\x41\x1b\xc0\xd8\
+\x49\x44\x09\x7f\xd8\x6a\xa9\x29\x3c\x2c\x34\xb1\xc3\xdb\xd5\xcb\
+\x6a\x38\x0c\xef\x35\xef\xe7\x92\x8f\x0b\x67\xb5\xfb\xf5\x82\x6a\
+\xf7\x85\x09\x6d\x55\xe7\xb7\xb9\xaa\xce\xb3\xb3\xca\xfd\xd5\x84\
+\x07\x4a\x01\xae\x7d\xe7\x77\x3a\xab\xdd\x5d\x2b\xaa\xce\x6d\x9e\
+\xea\xdd\x9b\xae\x12\xce\x7d\xe7\x9e\x24\xa6\xa3\x12\xc8\xd5\x5c\
+\x53\xd4\x06\x00\xeb\x95\x53\x86\x5e\x35\xbb\x91\x00\xab\x49\xa8\
+\x5f\x69\xac\x5d\xd9\x77\x3b\x88\x27\x83\x9b\x42\x48\x95\xad\x27\
+\x00\x0c\xea\xcc\xbb\x63\x6d\xef\x2a\x0f\x6a\xb2\xe0\x2d\x00\x32\
+\x55\xc9\xf4\x7e\x51\x55\xeb\xac\x78\x22\x11\xc4\xbd\xcc\x15\x54\
+\xbb\xf7\x31\xd3\xcf\x20\x49\x25\xad\xcf\x17\xb4\xc4\xda\x8b\xf6\
+\xba\x57\xb0\x44\xc7\x89\xa9\x90\x88\x1a\x89\xe9\x3d\x09\xf8\xb0\
+\xf1\x05\xd7\x6b\xb3\x47\x79\x22\xe2\xe6\x01\x39\xc4\x75\x00\xba\
+\x48\x88\xe3\xab\x7e\x7a\x26\x23\xd6\x7e\xbe\xb6\xf8\x82\xb3\xa3\
+\xad\x84\xc1\xdb\xc0\xe8\x04\x78\x13\x33\x76\xce\x1a\xdb\x38\xb8\
+\xe5\x75\xba\xa0\xb2\xa5\x04\x24\x4e\x03\xfc\x81\x59\x8b\x3c\x71\
+\xf6\x57\xab\x13\xfa\x4a\x30\xdb\xb8\x65\x26\x6e\x79\xa1\xa0\x89\
+\x18\x5b\x01\xba\x3f\x6c\x30\xff\xbb\xb8\xb2\xb5\x70\x36\x89\x25\
+\x8a\x29\x0b\x9a\x82\xca\x96\x12\x22\x7e\x83\x40\xf9\x00\xbf\x6c\
+\x10\xf4\xbb\xc6\xda\x82\xd6\xd9\x20\x97\x08\x12\xaa\xc8\x8a\x7f\
+\x72\xce\xc6\x69\xf2\x6e\x30\xca\x09\x34\x07\xc0\x45\x10\xbd\x27\
+\x09\xea\x02\xf8\xa3\xa6\x5a\xd7\x1b\xb7\x99\xe7\x2d\x31\xad\x92\
+\x72\xa9\x72\x71\x8e\x2d\x12\x79\x04\x8c\x6f\x00\x28\x06\xe8\x2e\
+\x02\xae\x37\xd5\xba\x8a\x6e\x13\xbf\x3b\xb8\x83\x3b\x98\x02\xff\
+\x05\x23\xcd\xe3\xc5\x9d\x41\xc3\x27\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x08\xdb\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x08\x90\x49\x44\x41\x54\x68\x81\xed\x99\x4b\x8f\
+\x1d\x47\x15\xc7\x7f\xa7\xfa\x71\x9f\xe3\xf1\xcc\xd8\xd9\x05\x21\
+\xa4\x20\xc7\x26\x28\x26\x11\x58\x91\x1c\x1c\x85\x0d\x12\xf9\x00\
+\x11\xac\xfd\x01\x22\x04\x42\x40\x04\x62\xc1\x86\xc0\x36\x59\x82\
+\x94\x0d\x6c\xd8\x20\x01\x12\x04\xf2\x62\x48\x0c\x8a\x14\x39\x8a\
+\xb2\x48\x50\x16\x01\xc5\xaf\x19\xcf\x7d\xf4\xed\xae\x3a\x87\x45\
+\x55\xdf\x7b\xc7\x64\xc6\x1e\x67\x48\x36\x73\xae\xee\xa3\xab\xbb\
+\xab\xcf\xff\x3c\xff\x55\x17\x8e\xe4\x48\x8e\xe4\x48\x3e\x4d\x91\
+\xc3\x9a\xe8\x1b\xaf\x9d\x7f\x7c\x1c\x6e\x5e\xac\x75\xf6\x70\x30\
+\x3d\x19\xbc\xef\xab\x98\x03\x70\x88\x66\x59\x3e\xc9\xc4\x5d\x29\
+\x5d\xe7\xf5\x7e\x6f\xf8\xdc\xef\x1e\x7c\xe5\x85\xc3\x78\xee\xc7\
+\x02\x70\xe1\xbd\x0b\x5d\xf7\xe1\xd6\xcf\x47\xf5\xe8\x49\x81\xe3\
+\xfd\x62\x40\xb7\xe8\x52\x66\x1d\x72\x97\xe3\x5c\x9c\x5e\xd5\xf0\
+\xea\xa9\xc3\x8c\xaa\xa9\x98\x34\x63\x30\xb6\x86\xdd\x63\xcf\xaf\
+\x0f\x66\x4f\xfd\xe6\xcc\xe5\xfa\x13\x07\xf0\xb5\xd7\xce\xfe\x60\
+\xbb\xda\xfa\x7e\x37\xef\x75\x57\xba\xab\x0c\x8a\x3e\x9d\xbc\x4b\
+\xee\x72\x72\x97\x93\xb9\x0c\x91\x38\xbd\x99\x11\x34\xe0\xd5\xe3\
+\xd5\x33\xf3\x15\xe3\x66\xc2\x4e\xb5\x4d\xe5\xab\xe9\xb1\xf2\xd8\
+\x4f\xfe\x74\xee\x8d\x9f\x7e\x22\x00\x9e\xb8\xf4\xd0\x89\xab\xd5\
+\xce\x4b\x06\xa7\xd6\xfb\xeb\xac\x94\xc7\xe8\x16\x5d\xba\x79\x87\
+\x4c\x72\x32\x97\xe3\x9c\xc3\x21\x48\x9a\xde\x30\x14\x43\x55\x09\
+\xea\x09\xe6\xa9\x7c\xf4\xc6\x4e\x7d\x93\xeb\x93\xeb\x00\x6f\xad\
+\xba\x8d\xf3\x7f\x78\xe4\x6f\xd7\xff\x6f\x00\xbe\xbe\x79\xf6\xf4\
+\x95\x7a\x7b\x73\x50\x0e\x56\x36\x06\x1b\x0c\xca\x21\xdd\xbc\x47\
+\xe9\x0a\xf2\x2c\xc7\x49\x86\x73\x82\x98\x20\xce\xed\xba\xd7\x54\
+\x31\x31\x54\x0d\xb5\x80\x0f\x9e\x5a\x1b\x2a\x3f\x65\x5c\x8f\xb8\
+\x36\xbe\xc6\x78\x36\xde\x59\x1f\xac\x7d\xf9\x8f\x0f\xff\xe3\xed\
+\x43\x07\xf0\xf8\xe6\xd9\xd3\x5b\xf5\x8d\x4b\xab\x9d\xe3\xbd\x8d\
+\xc1\x09\x06\xe5\x80\x6e\xde\xa5\xc8\x8a\x64\x79\x87\x13\x97\x26\
+\x14\x10\x41\xb0\xa8\x3c\x02\x66\x44\x5f\x80\x9a\x12\x54\x09\xe6\
+\x69\x42\x43\xe5\x2b\xc6\xf5\x98\x6b\xe3\xab\x6c\xcf\xb6\xa6\x1b\
+\xfd\x8d\x2f\xdd\x29\x88\x3b\x02\xf0\xc4\xa5\x87\x4e\x7c\x30\xbe\
+\xfe\xee\x6a\x77\x75\x65\x63\x78\x82\x95\x72\x48\x99\x77\x29\x5c\
+\x41\xee\x32\x9c\xb8\xa8\xb0\x24\xeb\x8b\x24\x65\x5b\x38\x16\x3f\
+\xcd\x30\x31\xcc\x0c\xcc\x50\x53\xbc\x06\x1a\x6d\xa8\x7d\xc5\x4e\
+\x3d\xe2\xda\xe8\x2a\xdb\xd3\xed\x9d\x7b\x57\x57\x3f\xf3\xdb\xb3\
+\x6f\x6c\xdd\x4e\xb7\xfc\x4e\x00\xfc\xa7\xda\x7e\xa9\xdf\x19\xac\
+\xac\xf5\xd7\x19\x94\x03\x8a\xa2\x93\x42\x26\x2a\x6e\x62\x44\x7b\
+\xdb\x5c\x6d\xfb\x08\x4b\xd9\xd2\x81\x89\x81\x09\x4e\x1c\xb9\xcb\
+\x31\xe9\x30\xc0\xd0\xbe\xd2\x98\x5f\xf9\x60\x34\x7a\x19\xf8\xc2\
+\xed\x74\x73\xb7\xbb\xe0\xfc\xe6\xe9\xef\x09\x76\x6a\xad\xbf\x46\
+\xaf\xec\x51\x64\x25\x99\xcb\x70\xad\x4a\xa2\x98\xc5\xb8\x36\x0b\
+\xa8\x04\x82\x06\xd4\x02\x6a\x9a\xde\x69\x4c\xd2\x35\x16\xa2\x17\
+\x44\x01\xc3\x21\x64\x2e\xa3\xc8\x4a\x7a\x65\x8f\xb5\xfe\x1a\x88\
+\x9d\x39\xbf\x79\xff\x0f\x6f\xa7\xdf\xbe\x21\x74\xe1\xbd\xcf\x76\
+\x6f\xbe\xaf\x37\x36\x06\x27\xbb\xeb\x83\x0d\x06\x65\x9f\x32\xeb\
+\x90\x65\x19\x0e\x17\x43\x46\xda\x00\x89\x61\x2e\xc9\x07\x82\x2d\
+\x66\x37\x58\xf8\x48\x10\x61\xe9\x9e\x18\x52\x8a\x12\x42\xa0\x0e\
+\x33\xc6\xf5\x84\xeb\xe3\x6b\x5c\x1b\x5f\x99\xce\x4e\xac\x1c\xbf\
+\xbc\x4f\x9f\xd8\xd7\x03\xb3\x7f\x17\xbf\xe8\xe4\x9d\xee\xa0\x1c\
+\x50\x26\xcb\x4b\x52\x08\x51\x0c\x45\x35\xa0\xea\x51\xf5\x18\x9e\
+\x60\x8a\xa6\xef\x10\xd2\x7b\x69\xcc\xf0\xf3\xeb\x55\x03\x86\x46\
+\x4f\x24\xbc\x99\xcb\x28\xb3\x92\x41\x39\xa0\x93\x77\x7a\xab\x5b\
+\xcd\xcf\xf6\xd3\x71\x5f\x00\x55\x33\x7b\x72\xd0\x59\xa1\xcc\xa3\
+\xf2\x20\x98\x33\x4c\x02\xde\x94\x90\x5e\x8a\x12\x44\xf1\x84\xa4\
+\x68\x20\xe0\x09\x92\xde\x69\x4c\xf1\x78\x02\x41\x34\xde\x93\x5e\
+\xde\x14\x93\x80\xb9\xe8\x97\xcc\x65\x94\x79\xc9\xa0\xb3\xc2\x34\
+\x54\xdf\xba\x2b\x00\xe7\x5f\x3d\xfd\xb8\x20\xab\x9d\xa2\x43\x9e\
+\xe7\x88\x13\x70\xa0\x66\x44\xbb\x45\xcb\x06\xd3\xa8\xb6\x06\x42\
+\xd0\x08\x6c\x8f\xb7\x4f\x5e\xf1\x1a\x61\xb7\xe3\x11\x8c\xa1\x66\
+\xe0\x40\x9c\x90\xe7\x39\x9d\xa2\x83\x98\x5b\x7b\xe4\x95\x07\x1e\
+\xdd\x4b\xcf\x3d\xab\xd0\x44\xa7\x17\xbb\x45\x8f\x22\x2b\x76\xf7\
+\x54\x31\x4c\xa3\xbb\x15\x10\xb1\x58\xe2\x15\xfe\xa7\xfc\xb4\xbf\
+\x6f\xcd\x34\x8d\xa6\x13\xc0\x54\x70\xed\xa5\x6d\x5d\x00\x04\xa1\
+\xc8\x0a\xba\x45\x97\x46\xc7\x17\x81\x17\x0f\x04\x20\xa8\x7f\xb8\
+\xec\x0c\x63\xa9\x74\x82\x3a\x45\xe6\x4f\x69\xcb\xe0\x52\xe2\x2e\
+\x2b\x69\xc4\x5e\xb0\x34\x16\xab\xce\x02\x90\xcc\x13\x1b\x54\x40\
+\x2c\x65\xb6\x19\xea\x14\x5c\x2c\xb1\x65\x51\x30\x9d\x8e\xcf\xed\
+\xa5\xe7\x9e\x00\x4c\xed\x9e\xcc\x15\x91\x1a\x08\xa0\x46\x70\x9a\
+\x1e\x69\x98\xa6\x2e\xdb\x96\x9f\x5b\x94\x57\xdb\xdd\x09\x04\x89\
+\xf7\x2c\x03\x15\x89\x46\x69\x01\xa7\x3a\x85\x1a\x22\xe0\x9c\x90\
+\xb9\x02\x8c\x93\x07\x07\x60\xda\xcb\xda\x46\x65\x8a\xba\xe8\xe8\
+\x68\xb9\x48\x09\x5a\xc5\x6d\x49\x59\x49\x1d\xf7\xa3\xe4\xd6\x73\
+\x42\x5b\x4f\x23\x90\x39\xf9\x90\xc8\x9d\x10\x21\x13\x47\x30\xed\
+\x1f\x1c\x00\x38\x24\xaa\xaa\x66\x60\x61\x11\xe2\x66\xe9\xb9\x31\
+\x1f\xac\x0d\xf6\x64\x49\xe3\x36\x00\x92\x17\x22\xed\x88\x79\x20\
+\x24\x20\xc9\x2e\x6a\xc9\x4c\x51\x87\xec\xc0\x00\x92\x3e\x89\x08\
+\xb7\x84\xb8\x6d\x5a\x9a\x72\xd6\x58\x50\xb4\x25\x25\xf7\x03\x70\
+\xcb\xb5\xd1\x28\x6d\x22\xb7\x64\xd0\x96\x9e\xb9\xbf\xec\x03\xc0\
+\x54\x4d\x33\x4d\xf5\x1e\xb2\x64\xf9\xc5\x8b\x14\xd3\xbb\xc2\xc2\
+\xee\x00\x40\x3a\x2d\x22\x6d\x29\x43\x11\xc4\xda\xb4\x26\xf6\x97\
+\x44\x45\xcc\x2c\x1c\x18\x80\xc1\xd4\xab\x1f\x06\x0d\x64\xa6\x10\
+\x0c\x44\x5a\x97\x46\x0a\x00\xbb\x14\x6a\x6f\x8c\x54\xe1\x23\x92\
+\xb8\xe5\x0f\xcb\xe3\x96\xe2\x5f\x92\x3f\x4c\x12\x53\x5d\xac\xe2\
+\xc4\x31\x39\x38\x00\xd1\x0f\x7d\x68\x86\x41\x23\x11\x23\x73\x29\
+\x81\x01\x53\x34\x05\xab\xcd\x79\xfe\x92\x66\x31\xff\x76\x89\xce\
+\xc9\x4f\x0b\xc8\x52\x09\x13\x4c\x04\xa7\x60\xb2\x78\x46\x50\x8d\
+\x00\x42\x83\xaa\x5d\x39\x30\x00\x11\x5e\xaf\x7d\xfd\x39\xaf\x9e\
+\xdc\xf2\x68\x25\x17\xeb\xff\x3c\x42\xc5\x16\x79\xa0\xb6\xd0\x7a\
+\x89\xc4\xcd\x8f\x77\xf5\x09\x43\xdc\x72\xfc\x47\x10\xd2\xd2\x72\
+\x25\xae\xda\xd4\x53\xfb\x1a\x71\xb2\xb9\x97\x9e\x7b\x52\x89\xac\
+\x93\x3f\x37\x6b\x66\x34\xa1\x49\xd4\x38\xc5\xa4\x26\x12\x67\x1a\
+\x3d\xa1\x8a\x59\x4b\xec\xfc\xd2\xb5\x81\x48\x32\xc2\xee\x31\xf5\
+\x31\x39\xd3\xbd\xb4\x71\x4e\x3c\x6e\xe9\xb7\x5a\xa0\x09\x0d\xb3\
+\x66\x46\x96\x15\xcf\xee\x69\xe8\xbd\x4e\x00\xdc\xff\xc2\xc9\x1b\
+\x6b\xfd\xf5\xe3\xc3\xde\x90\x32\x2f\x71\xce\x81\x8b\x74\x42\xe7\
+\xab\x2b\x9d\x73\x63\x4b\xad\xd9\xf6\x98\x56\x52\x82\x2c\xea\x3f\
+\x88\x38\xc4\x04\x97\x56\x73\xa8\xa0\xaa\xd4\xbe\x66\x34\x1d\xb1\
+\x35\xb9\x7e\xe3\xad\xc7\xae\xac\x1f\xd8\x03\x00\x2e\x97\xe7\xa7\
+\xf5\x84\x26\x34\x78\xf3\x4b\x95\xc1\xb0\x44\xa7\x63\x28\x69\x62\
+\x9b\x21\x92\x32\x89\x8b\x97\xb9\x07\xd2\x71\x24\x81\x21\x5e\x2b\
+\x4b\xe5\x59\xe2\x9c\x6d\xc5\xf3\x69\xad\x3c\xad\x27\x98\x73\xbf\
+\xdc\x57\xc7\xfd\x4e\xb2\x7e\xf2\xa9\xa9\xaf\xa6\x55\x5d\xa5\x64\
+\x0a\x51\x79\x53\x4c\x23\x9d\x48\x1b\x26\x29\xac\x0c\x23\xc4\x1d\
+\x08\x5d\x8c\x2f\x8e\xd3\xfd\x2c\x9f\x4b\xf3\x24\xc3\x68\x4a\xdc\
+\xaa\xae\xa8\xea\x6a\xe2\x4e\x9c\xf8\xee\x5d\x03\xb8\x7c\xe6\x72\
+\x2d\x4e\x7f\x3c\xae\x46\xcc\x9a\x9a\xc6\xfb\xb4\x5c\x4c\x96\x6f\
+\xbf\x35\xf9\xc2\x96\x2d\xb9\x9b\x6e\xcf\x3d\x67\x9a\xf6\x88\x6c\
+\xf7\x1c\x16\xab\x4e\xe3\x3d\xb3\xa6\x66\x5c\x8d\xb0\xd2\x9e\xde\
+\x6f\x35\x06\x77\xb8\x2b\x71\xdf\x9f\xd7\x2f\x0f\xcb\x95\xd3\x2b\
+\xbd\x21\x65\x59\xe0\x32\x37\x87\xbe\xe8\x98\x36\x6f\x74\x71\x7c\
+\xf1\xc9\xbc\x3d\xa5\x5f\x29\x0f\x24\x6d\x7f\x01\xa0\xa0\x41\xa9\
+\xeb\x86\x9d\xe9\x88\xb1\xdf\x79\xf3\x9d\x0b\xd7\xbf\x78\x3b\xdd\
+\xee\x68\x57\xa2\xec\xfa\xf3\xe3\xe9\xe8\x5f\x4e\x64\x05\xd7\xa7\
+\x20\x47\x2c\x03\xb1\xc8\x87\x64\x99\xb7\x2c\x80\x2d\x64\xb9\x83\
+\x2d\x77\x6d\x45\x2d\x36\x2f\x4b\xd6\x1f\x57\x13\xc6\xb3\x9d\xed\
+\xfe\xba\xee\xb9\x88\x59\x96\x3b\xde\xd8\x7a\xe0\xd2\xc6\xa9\xd9\
+\x4d\xfe\x39\xec\x0c\x7b\xfd\x6e\x9f\x3c\xcf\x71\x99\x20\xae\x65\
+\x90\xa9\xa1\xd9\xf2\xda\x60\xf7\x8a\xa6\xed\xb8\x69\x5f\x25\x2d\
+\x68\x0c\x0d\x86\xf7\x9e\x49\x35\x61\x54\x8f\xa6\xae\x2f\x0f\xbe\
+\xfd\x95\xab\xef\x1c\x2a\x00\x80\xcf\xbf\xba\x71\xca\xa6\xf6\xf7\
+\x41\x67\x70\xac\xd7\xed\x51\xe4\x71\x1f\x54\xdc\xd2\xe2\xa5\x6d\
+\xa5\x6e\xc1\x91\x16\x9c\x07\xe6\xe8\x2c\x29\xaf\x4a\xe3\x3d\xd3\
+\x6a\xca\x78\xb6\xb3\x2d\xbd\xec\xdc\x3b\x8f\x5c\x3b\xfc\xad\xc5\
+\x56\xce\xfc\xfe\xd8\x7a\x55\xf2\x62\x37\xeb\x9f\xe9\x75\x7a\x94\
+\x45\x19\xb7\x15\xf3\x94\x14\xf3\x95\x98\xdd\x12\x34\x8b\x15\x17\
+\x80\xfa\xb8\xbd\x58\x37\x35\xd3\xd9\x94\xa9\x4e\xdf\x3c\x76\x5c\
+\x1e\x7d\xe3\xec\xd6\x6d\x77\xe3\x3e\x16\x80\x56\xee\xfb\xcb\xca\
+\x77\x4c\xf3\x1f\xf5\xf2\x6e\xaf\x53\xc6\x9d\xba\x2c\x5b\xec\x15\
+\xed\x5a\x52\xda\x62\xff\xc7\xcc\xe2\xc2\x3e\x78\x66\xf5\x8c\x69\
+\x5d\x4d\x42\x51\x3f\xfd\xde\x57\xc7\xcf\xdc\x8d\x1e\x1f\xeb\x0f\
+\x8e\x33\xbf\xa6\x9c\x9c\x1c\x3e\xe3\x2c\xfb\x66\x29\x9d\xb5\x22\
+\x2f\xc8\xf3\x0c\xe7\xb2\xd8\x59\x97\xfe\x1f\x98\xd7\x78\x1f\x68\
+\x7c\x43\x6d\xb3\x1b\x26\xe1\x57\xef\x32\xfa\x36\x8f\xe1\xef\x56\
+\x87\x43\xfb\x8b\xe9\xde\xbf\x0e\x1f\x75\xc1\x2e\x8a\xb9\x73\xb9\
+\xb8\x7b\xc4\x5c\x5f\x88\x7b\xec\x26\x1a\xcc\x74\xe2\xd1\x2b\x26\
+\xba\x69\xe2\x9e\x7d\xff\xb1\x9d\x97\x0f\xeb\xd9\x47\x72\x24\x47\
+\x72\x24\x9f\x9e\xfc\x17\x07\x5d\xfd\x3a\x04\x59\xde\x3f\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\x73\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x05\x28\x49\x44\x41\x54\x68\x81\xed\x98\x6b\x6c\
+\x54\x45\x14\xc7\x7f\x67\x6e\x97\x52\x41\x11\x4b\xa1\xdb\x36\x80\
+\x34\x44\xa5\x10\x68\x2b\x26\x2a\x51\xab\x91\x87\x04\x63\x88\x12\
+\x63\x78\x88\xda\xd5\x84\x8a\x31\x46\x5b\x34\x26\x9b\x18\xb5\x88\
+\xc1\x28\x6a\xec\xe2\x23\x1a\xfd\x02\xbe\x48\x8c\xa8\x80\x28\x18\
+\x0d\xc1\x6e\x29\xb8\x36\x82\x82\x0a\x65\xa1\x54\xc2\x6a\xb5\xfb\
+\xba\x73\xfc\x50\x30\xb4\xb4\x74\x5b\xdb\x52\xe3\xfe\xbe\xdd\xcc\
+\x99\x7b\xfe\xff\x3b\x73\x26\x73\x2e\xa4\x49\x93\xe6\x3f\x8d\x9c\
+\x6b\x01\xdd\x31\x3f\xac\x73\x55\xa9\x51\x50\x04\xdf\x87\x5e\xd9\
+\x78\xfa\xb8\x39\x57\xc2\x52\xc5\xb5\x1a\x50\xc8\x07\x0a\x50\x6a\
+\x3a\x8e\x0f\x6e\x03\xb7\xad\x73\xe2\x51\xf7\xa2\xb3\x85\x0c\x6e\
+\x03\x85\x93\x56\x05\x37\x35\x0e\x8d\xfe\x99\xb4\x6a\x35\x2c\xe0\
+\xeb\x18\x32\x78\x6b\xa0\x2a\x74\x27\xe8\x1b\x40\x02\xc3\x2c\x9e\
+\x9a\xbc\xb5\xb3\xb0\x8c\x01\x96\x95\x1a\x95\xa1\x19\xa0\xaf\xb4\
+\x3d\x48\x05\x4f\x15\x75\x2a\x1e\x06\xe3\x16\xaa\x6a\x18\x8f\xf0\
+\x3e\x90\x89\xb2\x9a\xea\xa2\xc0\xd9\xc2\xfb\x6d\x05\xe6\x87\x75\
+\xae\x85\x80\x5a\x54\x0c\xe5\x1d\x8f\xbf\x4e\xf1\xef\xbb\x80\x68\
+\xec\x23\x20\x07\xf4\x63\xf6\x37\x3c\xd2\xdd\x94\x7e\x5b\x01\xd7\
+\xd5\xb5\x28\x79\x22\xe4\xbb\x49\xfb\x66\xb7\x13\xfc\x6a\x88\xc6\
+\xde\x06\x8a\x80\x06\x34\x76\x07\xeb\x17\xb8\xdd\x4d\xeb\x1f\x03\
+\x95\xbb\xa7\xc4\xa2\xee\xe8\x53\x8f\xf1\x56\x37\x87\xaa\xd0\x5b\
+\xac\x08\xe6\x74\x39\x27\x1a\x7a\x16\x98\x07\xfc\x06\x72\x33\x2b\
+\x2f\x8f\xa4\x92\xaa\xef\x0d\x54\x85\x66\x23\xe6\xeb\xba\xcd\x8d\
+\x4e\xac\x35\x19\x4b\xc4\x6d\xa4\xfe\xf3\xc3\x71\xd0\x45\x68\x66\
+\x88\xca\xef\x16\x83\xb6\x3f\xfd\x56\xec\xb9\x1b\x78\x10\x88\xa3\
+\x66\x3e\xd5\x45\x3f\xa6\x9a\xae\x6f\x8f\xd1\x15\xa1\xa5\xa8\xd6\
+\x00\x1e\x60\x3d\x43\x87\x2d\xc6\x7f\x71\x94\x87\xf7\x14\xe2\xc8\
+\xcb\xc0\xcc\xb6\x40\xdd\x86\xe5\x3e\x9e\x99\xd2\x40\x65\x68\x06\
+\xa2\x9b\x81\x4c\x90\x7b\xbb\x2b\xda\x94\x0c\x74\x77\xff\x38\x13\
+\x15\xaa\xbe\x7f\x02\xf4\xb1\x93\xaf\x7d\x92\xea\x49\x8f\x83\x68\
+\xbb\x98\xca\xd0\x22\x44\x9e\x05\xcd\xf1\x4e\x38\x3f\x5e\x3a\xb3\
+\x20\x96\x4c\xb8\xc3\xea\xb6\x1c\x36\x47\x0f\xb4\xac\x66\xe5\xe4\
+\x87\x7a\x22\xbe\x4b\x03\xb7\x1c\xd6\x83\x40\x01\x40\xac\xd5\x8d\
+\x6e\x5c\xdb\xb0\x12\x95\x5a\xb2\x12\xdb\xf1\x17\x9f\x68\x17\xec\
+\x0f\x0d\x21\xca\x6b\xa0\x0b\x41\x5c\xb0\x15\x54\x4f\x79\xa5\xcb\
+\x8c\x55\xbb\x47\x82\xe3\x9f\x75\xd7\xc4\xe5\x59\xc3\x3d\xb4\xe5\
+\x48\x46\x37\x56\x7d\x30\x3c\x95\xa2\xed\xb1\x81\xd6\x96\x04\x9f\
+\xbe\xbe\xf7\xd4\x50\x12\xd5\xdd\x18\xf9\x66\xf2\x55\x63\xa2\x85\
+\xc5\xd9\x8b\xe2\x31\x77\x44\x70\x53\x63\xe6\xd1\x9f\x5b\xfe\x00\
+\x59\x40\x75\xd1\x27\xa9\x24\x9e\x77\xd0\x36\x39\x8e\xe4\x00\xa8\
+\x6a\xe3\x86\x7c\x53\xd0\x53\xf1\xd0\x55\x11\x0b\x3e\xe0\x90\x5a\
+\x0d\x1f\x6a\x88\xac\x42\x78\x09\xd5\x60\xdb\x98\x94\xa0\x2c\xcb\
+\xbf\x64\xc4\x43\x62\x64\x74\x66\x56\x46\x66\xf1\x0d\xf9\x2e\xc8\
+\xb5\xa9\x8a\x07\x70\x32\x64\x89\x2a\x8d\x6a\xf5\xb0\x11\xb9\xa7\
+\x37\xe2\xdb\xa4\xf6\x04\xff\xb7\xe7\xd1\x9a\x55\x02\xb6\xf4\xa6\
+\x7b\x2f\x7d\x7a\xc8\xd0\x8c\x2c\x00\xb5\x1a\xde\x50\x60\xf2\x7a\
+\x2b\xe2\xdf\xd0\xeb\x53\xe8\x96\xb0\xce\x41\x09\xa0\x8a\x88\x94\
+\x7f\x90\x27\x29\x7f\xfd\x34\x69\xd2\xa4\x49\x33\x68\x18\xbc\x4d\
+\xfd\x49\x76\xf8\x8e\xcd\x55\x6c\x0d\x58\x55\xc5\x77\xe5\x5a\x6f\
+\xbb\x8b\xe5\xe0\x6c\xea\x4f\xf2\x5c\xe9\x36\xaf\x75\xdd\x77\xc4\
+\x91\x11\x00\x18\xad\x01\xc6\x9e\x1e\xd3\x6f\x06\x76\xf8\x8e\xcd\
+\xb5\xea\x06\x44\xd4\x76\xf6\xe5\xba\xc2\x8f\xdf\x64\x97\x5c\x73\
+\x23\x18\x1f\xea\xce\x4b\x26\x5d\x8f\xc7\xe9\x5a\x66\xff\xad\x80\
+\xda\xb5\x22\xe2\x05\x25\x69\x93\xef\xae\x99\xb6\xf5\x51\x6b\xf4\
+\xab\xe5\xc1\xb2\xa0\xb4\xeb\x13\xda\x78\x69\xfa\xd6\x5c\x4d\xb2\
+\x44\x45\x7c\xa0\x13\x40\x01\xdc\x43\x8d\x4d\x75\xe3\xc6\xe7\x8e\
+\x35\x86\xbf\x74\xa0\x7e\x6c\xbd\x30\xf5\xcb\xe2\xe2\xe2\x89\x3b\
+\x3d\x43\x1c\x07\x2c\xb1\x44\x82\xfa\x5d\xff\x74\x89\x61\x41\xbf\
+\xcc\xcf\x1f\xf3\x9b\xd7\x3b\xea\x56\xab\xd6\xf9\xf5\x97\x23\x3f\
+\x34\x37\x47\xae\x00\x3c\x08\x20\x1c\x50\xd5\x57\x1d\x47\x5e\x5f\
+\xb6\xb3\xec\xc8\xd9\x72\xf5\xf9\x0a\x3c\x5f\xb2\x75\x36\xd6\x5d\
+\x77\xe0\x40\xa3\x73\x71\x61\x5e\xcc\x31\x72\xe2\x58\xd3\xf1\xf5\
+\x82\x8e\x52\xe4\x3a\xc0\xab\xc8\xed\x39\xd9\x23\x11\x11\x1c\x11\
+\xf2\x0a\x46\x8d\x6a\x6e\x8e\x24\x80\xf7\x54\x6c\xe0\x78\xed\xf6\
+\xcd\x7e\xfc\x36\x95\x7c\x7d\x6a\x60\xcd\xd4\x2d\x4b\xd5\xb6\xf5\
+\xc4\x27\x22\x2d\xeb\x7f\xdc\xbf\x77\xf1\xd2\x2f\xca\xa2\xa7\xc7\
+\x3c\x37\x7d\xf3\x04\x27\x69\x66\x38\xc6\xbc\x0c\x0c\x03\x70\x8c\
+\xf3\xbb\xc9\x30\x93\x97\xed\xbc\xf6\x60\x4f\x73\x9e\xb1\x85\xba\
+\x3b\xb6\x3a\x43\x51\x79\x71\xda\xe7\x4f\x28\xf2\x58\xdb\x4b\xf5\
+\xc9\x8a\x5d\xd7\x3f\xde\xd9\x5e\x3f\xc5\xce\xf2\xa6\x39\xae\x68\
+\x00\xac\x5a\x51\xdf\x55\x35\x79\xbd\xba\x8e\x9f\x69\xa0\xbc\xe9\
+\xa0\x8a\x16\x80\x25\x9e\x4c\xc4\x82\xb5\x7b\x6b\x50\x53\x6b\x85\
+\xda\x07\xeb\xcb\xbe\xef\x28\xca\x5f\xb4\x6e\xc8\x48\x4f\xf6\x6b\
+\x82\x2c\x04\x5c\x11\xad\xb8\xbf\xee\x86\xae\x7b\xe2\x3e\xe6\xac\
+\x06\xa2\xf1\x38\xf5\x75\xed\x7e\xd1\x34\x8b\xd1\x5a\xd4\xd4\x8e\
+\x1d\xe7\x25\x77\xf4\xc8\xbb\x13\x6e\xe2\xc2\xfd\x3f\x85\x33\x23\
+\x91\x96\x3f\xd4\xc8\x82\x07\x82\x65\x03\xda\xd8\x9c\x51\x03\x06\
+\x7c\x2e\x04\x54\x31\x91\xe3\x2d\x01\x04\x41\x29\x05\xa6\x03\x63\
+\x54\x65\x16\xe8\xac\xec\x0b\x2f\x00\x11\x3c\x19\x19\x8c\x9f\x90\
+\xeb\xee\xa9\xdd\x77\x5d\xc5\xae\xeb\x83\x03\x29\x1e\x7a\x78\x8c\
+\xae\x29\xfe\x2c\x4f\x5d\xa7\x54\x0d\xa5\xa5\xc5\x97\x55\x66\x78\
+\x9c\xa1\x60\x71\xd1\xf0\xd5\x81\xbc\xff\x56\x4f\x7c\xaa\x08\x55\
+\x5d\xd4\x50\xde\xdb\x22\x4c\x93\x26\xcd\xff\x9c\xbf\x01\xff\xd2\
+\x39\x0a\x1a\x32\xe0\xbd\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x01\xb8\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x01\x6d\x49\x44\x41\x54\x68\x81\xed\xd9\x31\x4b\
+\xc3\x40\x18\x06\xe0\xf7\xbb\xd8\x9a\x1a\x91\x3a\xba\x08\x4e\x52\
+\x44\x07\xc5\xc1\xcd\x2e\xae\x8a\x43\xd5\x5d\xfa\x13\x74\x15\x7f\
+\x80\x7f\xc0\x9f\xe0\xea\xe2\x62\x9d\x74\x15\xc1\xdd\xa9\x76\x4a\
+\x5b\xac\x52\x69\x72\xe7\x2a\xed\xc5\x70\xa6\xb9\x23\xf0\x3d\x90\
+\xe5\x3b\xb8\x7b\xdf\x1c\x64\x09\xc0\x18\x2b\x34\xd2\x0d\x6f\x6e\
+\x5b\xc7\x44\xea\x40\x7e\xd2\x69\xa3\x51\x1f\xd8\x0e\x65\x42\xe8\
+\x86\x0a\x68\x2a\x85\x23\x2f\x90\x9b\xb6\x03\x99\x9a\xd1\x0d\x09\
+\x8a\x00\x40\x4a\xa1\x2d\xf8\x97\xa5\xeb\xb7\x1a\x20\x1e\x01\x54\
+\x35\xcb\x31\x14\xce\xde\x9b\xcb\x57\xa6\xfb\x26\x31\x0e\x98\x46\
+\x81\xd6\xa0\x0f\x0f\x00\x1e\x88\x76\xa6\x79\xde\xd4\x0b\xd8\xc6\
+\x05\x5c\x2b\x7c\x01\xed\x57\x28\xd5\xc5\x6b\x19\xc3\x38\x98\x98\
+\xfb\xde\x28\x6b\x20\x53\xe6\x37\x70\xfe\xb2\x8e\x21\x7a\x80\x08\
+\x27\x9e\xa1\xfa\x08\xdb\x5f\x87\x39\xe4\x4c\x64\x5e\x40\x78\xab\
+\x80\xaa\x24\x2d\xcb\x91\x5c\xc9\x94\xc8\x34\x8e\xcd\xc3\xf2\xc0\
+\x05\x5c\x2b\x7c\x81\xff\x7d\x46\x33\xda\xb8\xeb\x04\x0b\x73\x7e\
+\x79\x7c\x3e\x88\x94\x7a\xae\x2f\xf6\x4c\xf6\xb2\x7e\x03\xc2\xa3\
+\xea\xac\x5f\xe9\x7e\x4b\x0a\xc7\x9f\x92\x10\xdd\xed\x87\xfe\xa5\
+\xd1\x7e\x79\x05\x4d\x3c\x50\x60\x1e\x40\x29\x69\x9d\x40\x35\xa3\
+\xfd\x32\x27\x72\x8c\x0b\xb8\xc6\x05\x5c\xe3\x02\xae\x71\x01\xd7\
+\xb8\x80\x6b\x5c\xc0\x35\x2e\xe0\x1a\x17\x70\xad\xf0\x05\x12\xfe\
+\x91\xdd\xb7\x00\xec\x5a\xce\x92\xa6\x13\xc5\xd1\xd6\xc9\xfe\x5e\
+\xfb\xf7\x50\x7f\x03\x84\x27\x00\xd2\x46\x2a\x03\xda\x97\xcd\x18\
+\x2b\xb8\x1f\xd9\x18\x55\x86\xd7\x19\x6b\x84\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x07\xf9\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x07\xae\x49\x44\x41\x54\x68\x81\xed\x59\xcb\x6e\
+\x1c\xc7\x15\x3d\xf5\xe8\x9e\xee\x69\x72\x66\x48\x88\x92\x88\x78\
+\x93\x45\xbc\x30\x82\x38\x01\x2c\x51\x8c\xa8\x18\x4e\x00\xcb\xfa\
+\x08\x23\x04\xb2\x0d\x10\xc0\x4b\xc3\x81\x90\xd8\x3f\x90\x55\x96\
+\x0a\x92\x8f\x70\x1c\x20\xb1\x22\x44\x50\x24\x87\x89\xb2\x8d\x76\
+\xb6\x41\x81\x91\x44\x0e\xc9\xe9\x77\xd5\xad\x2c\xba\xaa\x59\x1c\
+\x71\x86\x43\x9a\xb1\x37\xbc\x40\x63\xba\xab\xab\xab\xce\xb9\x75\
+\xeb\x3e\x6a\x80\x73\x39\x97\x73\x39\x97\x6f\x52\xd8\x59\x0d\xf4\
+\xef\x9b\x37\x6f\xe8\x3c\x5f\xa7\xba\xbe\x42\x44\xcb\xd0\xba\x07\
+\xc6\x24\x00\x18\x63\x14\x13\x62\x8f\x73\xfe\x94\x0b\xf1\x28\x9c\
+\x9f\xbf\xf3\xdd\x8f\x3f\xbe\x7f\x16\xf3\x7e\x25\x02\x4f\x6e\xdd\
+\xea\xec\x65\xd9\x87\x2a\xcb\xde\xe5\x9c\x5f\x8e\xba\x5d\x04\x51\
+\x04\x19\x04\x10\x9c\x03\x9c\x37\x1d\x89\xa0\x89\xa0\xea\x1a\x75\
+\x51\xa0\xc8\x32\x18\xa2\xa7\x41\xb7\xfb\x87\xef\x8f\x46\x1f\xb0\
+\x8d\x8d\xfa\x6b\x27\xf0\x78\x6d\xed\xbd\x32\xcf\x6f\x87\x71\xdc\
+\xeb\xf6\x7a\xe8\x44\x11\x64\xa7\x83\x20\x08\xc0\x85\x00\xe3\x1c\
+\x8c\x35\xc3\x1b\x63\x60\x88\x40\x5a\xa3\xae\x6b\xa8\xb2\x44\x59\
+\x14\xc8\xf6\xf6\x50\xe5\xf9\x6e\x94\x24\xb7\x5f\xbf\x77\xef\x37\
+\x5f\x0b\x81\x2f\x6e\xde\x5c\xdc\xdc\xde\xfe\x44\x0a\xf1\x46\xb2\
+\xb0\x80\x38\x49\x10\xc5\x31\x64\x10\x80\x09\x01\x2e\x44\xa3\x7d\
+\xc6\x0e\x11\x80\x31\xd0\x96\x84\xd1\x1a\xaa\xae\x51\xe4\x39\xf2\
+\x34\x45\xba\xb3\x03\xa5\xf5\x67\x17\x93\xe4\xed\x6f\xdf\xbd\x3b\
+\xfc\xbf\x11\x78\xbc\xb6\xf6\x6a\x9e\xa6\xf7\x93\xf9\xf9\x0b\x73\
+\x83\x01\xa2\xb9\x39\x84\x61\x08\x19\x04\xe0\x52\x82\x73\x0e\xee\
+\xcc\x86\xf3\x76\x70\x03\x00\x44\x68\x7e\xa8\xb9\x94\x82\xaa\x6b\
+\x54\x55\x85\x62\x34\xc2\x68\x38\x44\x3a\x1a\x3d\xeb\xcf\xcd\x5d\
+\x7f\xed\xde\xbd\x27\x67\x4e\xe0\xf1\xda\xda\xab\x45\x9a\x3e\x9a\
+\x1f\x0c\xfa\xc9\x60\x80\x38\x49\x10\x58\xf0\x4c\x88\x06\x3c\x63\
+\x80\xd5\xba\x7f\x0f\x63\x40\xc6\x1c\xba\x27\xa2\x76\x25\xea\xaa\
+\x6a\x56\x62\x38\xc4\xfe\x70\xb8\xdb\x0b\xc3\x2b\xaf\x3d\x7c\x38\
+\x13\x09\x3e\x4b\xa7\x2f\x56\x57\x17\xf3\xfd\xfd\xfb\x73\xfd\x7e\
+\x3f\xe9\xf7\xd1\xf5\xc0\x73\xce\x21\x18\x3b\xd0\x84\x31\x60\xc6\
+\xb4\x66\x03\x7b\xcf\xdc\xb3\xd5\x9a\x60\x0c\x9c\x73\xc8\x20\x40\
+\x10\x86\xe8\x26\x09\x92\x7e\x1f\x73\xfd\x7e\x7f\x58\x96\xf7\x9f\
+\xac\xac\xf4\x66\xc1\x26\x67\x22\x90\xe7\x9f\x24\x49\x72\xa1\xdb\
+\xeb\x21\xee\x76\x9b\x8d\x2a\x65\xa3\x65\x78\x26\xc2\x0e\x16\xd4\
+\x18\x73\x68\x05\x18\x63\x30\x47\xbc\xe3\x8c\x41\x48\x09\x66\x0c\
+\xe2\x6e\x17\x44\x04\x5d\x55\x4b\x2f\xb2\xec\x4f\x00\xae\x1d\x87\
+\xed\xd8\x15\xf8\xc7\xca\xca\x2f\x02\x21\xde\xe8\xf6\x7a\x88\xe3\
+\xb8\x99\x8c\x73\x70\xa7\x65\x22\x30\xa2\x46\xeb\x76\x83\x12\x51\
+\xeb\x75\x48\xeb\xe6\xde\x9a\x8c\xd1\x1a\xcc\x18\x30\x22\x80\x08\
+\xc6\x18\x70\x63\xc0\x38\x87\x90\x12\x71\x1c\xa3\xdb\xeb\x41\x08\
+\xb1\xf2\xcf\xab\x57\xdf\x3b\x0e\xdf\xd4\x3d\xf0\xe4\xd6\xad\xce\
+\xf3\xcf\x3f\xff\x6f\xef\xe2\xc5\x5e\x6f\x30\x40\xd4\xed\x36\x3e\
+\x5e\x88\xc6\xc3\x58\xd3\x61\x8c\x35\xa6\x02\x34\x9a\x75\x1a\x76\
+\x76\x3f\xd6\xc6\x6c\x9b\x71\xdf\x58\x65\x68\xe7\x9d\xb2\x0c\x7b\
+\xc3\x21\x76\x9f\x3f\xdf\x5d\x0d\xc3\xa5\x69\x71\x62\xea\x0a\xec\
+\x6c\x6d\x7d\x14\xc4\x71\x2f\x8a\x22\x04\xd6\x64\xb8\xb3\x6b\xa7\
+\x41\xab\x65\xa7\x75\xa3\x54\xab\x69\xe3\xda\xdc\xb3\x52\xed\x6a\
+\x38\x77\x0a\xdb\x07\x76\x25\x38\x63\x08\xa4\x44\x14\x45\x08\x3b\
+\x9d\xfe\x06\xf0\xab\x69\x18\xa7\x12\xa8\x8b\xe2\xdd\x28\x49\xd0\
+\x09\x43\x70\xcf\x2d\xc2\x9a\x0c\x1c\x00\x07\xce\x01\x75\xcf\xfe\
+\x35\xfe\xce\x7e\x0b\x6b\x52\xce\xcd\x32\x00\x9c\x73\x74\xc2\x10\
+\x51\x92\xa0\xcc\xf3\xf5\x53\x11\x78\x78\xf5\xea\x0d\xce\xf9\xa5\
+\xd0\xf9\x77\x00\xcc\x6a\x98\x3c\x60\xa4\x14\x4c\x5d\x37\xc0\xea\
+\xfa\x65\xe0\xe3\x97\xd7\xf7\xa5\x71\x94\x02\x23\x02\xb7\x24\x42\
+\x29\xc1\x85\x58\xde\x58\x59\x99\xb8\x99\x27\x7a\x21\x93\x65\xeb\
+\x9d\x4e\x07\x52\xca\xc6\xce\x2d\x01\x70\x0e\x10\x81\x6c\x9b\x69\
+\x3f\x30\x93\x86\x3a\x5a\x7c\x8f\xe5\xb5\x31\xa2\x76\x3e\x29\x25\
+\x3a\x61\x88\x3a\x4d\xd7\x01\xfc\xfd\x44\x04\x48\xa9\x2b\x72\x7e\
+\xbe\x49\x0b\x80\x06\xb4\xb7\x31\x99\xdd\x80\x66\x12\x70\x36\xe6\
+\x1f\x26\xf4\x6b\xd3\x0d\xcf\xe5\xba\xbe\x82\x73\xc8\x30\x44\x96\
+\xa6\xab\x93\x70\x4e\x26\x60\xcc\xb2\xb0\x09\x19\x77\x9b\xd6\x0b\
+\x58\x87\xc0\x8f\x83\xf3\xc1\x1c\xf5\xec\xf5\x33\x1e\x09\x7f\x5c\
+\x6e\x63\x87\xe0\x1c\x8c\x68\xf9\xc4\x04\x0c\x51\x8f\xdb\x49\x5d\
+\x36\xc9\xed\x84\xc6\x2e\xf3\x91\xe6\x33\x05\xec\xc4\xbe\x76\x2c\
+\x66\x1d\x05\x79\x91\x9c\x37\x84\x26\x46\xe5\x89\x04\x98\x2d\x46\
+\x7c\x0f\x61\x9c\xbf\xf7\x53\x05\xdf\xdf\x3b\x50\xd3\xcc\xea\x88\
+\xbe\xc6\xc5\x14\x77\xef\x02\xe4\xc1\x0a\x06\x27\x26\x60\x3c\xcd\
+\x83\xa8\xd1\xbc\x7b\x67\xfd\xf6\x59\x11\x80\x25\x60\xec\x7e\x73\
+\xa9\x89\xb1\x91\x7a\xe2\x3e\x9b\x46\x00\x5a\x2b\x68\x1d\xba\x94\
+\xc0\x45\xd0\xd6\x84\xec\xa0\x2e\x92\x1e\x02\x35\xde\x36\xa9\xdd\
+\xdf\x53\x8c\x81\xec\x1c\x04\xb4\x81\x11\x5a\x03\x5a\x4f\x8c\xc4\
+\xd3\x92\xb9\x3d\xad\xf5\x05\xd2\xba\xd5\x94\x46\x63\x52\x0c\x07\
+\x45\xca\x4b\x04\x8e\x02\x7b\x1c\x29\x5b\xfc\x18\xe7\xe9\x80\xc6\
+\xeb\x69\x0d\xdd\x28\x6f\xef\xc4\x04\x0c\xd1\xa6\x52\xea\x02\x29\
+\x05\x6d\xed\x93\xb9\xfc\xc5\x73\x75\xce\xbc\x5e\x92\x19\xdc\x28\
+\x03\x0e\xcc\xc6\xd5\x0f\x76\x0e\xed\x8a\x1e\xa5\x60\x8c\xd9\x3c\
+\x39\x01\x63\x3e\xab\xcb\xf2\x7b\x75\x14\x41\x08\xd1\x44\x47\x78\
+\x26\x63\x37\xb6\xed\x3b\x69\x98\xa9\xc2\x18\x6b\x4c\x04\x68\x02\
+\xa4\x35\x29\x02\xa0\x89\x50\xd7\x35\xea\xb2\x04\x9b\x10\xc4\xa6\
+\x12\x08\xa5\xbc\x53\x96\xe5\xcf\x54\x5d\x83\x82\x00\x2d\x5c\xab\
+\x7d\x06\xbb\x99\x6d\xdb\x49\x29\x30\x1c\x04\x2f\xc6\x79\x93\x1b\
+\x31\xd6\xec\x05\x00\x64\x33\xd3\xb2\x2c\x21\x81\x3b\xd3\xc6\x99\
+\x28\x77\x5f\x79\xe5\x69\x6f\x61\xe1\xf2\x7c\x92\x20\xb0\xc5\xba\
+\x8b\x0d\x7e\xb5\x05\x7f\x3f\xcc\x08\xde\x99\x0b\xf3\x4c\x07\x16\
+\xbc\x26\x42\xad\x35\xf6\xd3\x14\xfb\x3b\x3b\x9b\x6f\x7e\xf9\xe5\
+\xb7\x26\x8d\x35\x35\x1b\xe5\xc0\xef\x8b\x2c\x43\x59\x55\xd0\x36\
+\x65\x6e\x0b\x14\x97\x2e\x7b\x69\xb3\xcb\x2e\xcd\x84\xab\xcd\x5e\
+\xfd\x34\x7b\x6c\x4c\x22\x82\xd6\x1a\x65\x55\xa1\xc8\x32\xc0\x98\
+\x89\xda\x3f\x96\xc0\x8d\x4b\x97\x3e\xa8\x8a\x62\xb7\x2c\x4b\xd4\
+\x4a\x35\x24\xbc\x40\x46\x2e\x1e\x8c\x01\x82\x47\xc6\x81\x3e\xb2\
+\x8f\x2b\xee\xdd\x78\xb6\xa8\xa9\x95\x42\xd9\x9c\x1d\x0d\x7f\x74\
+\xf9\xf2\xe9\xeb\x01\xb6\xb1\x51\x07\x4a\xfd\x32\x1f\x8d\x50\x16\
+\x05\xb4\x23\x31\x06\xbc\x35\xa1\x31\xed\xba\x23\x94\x43\xc5\xcd\
+\x58\x7f\x9f\x88\xd6\x1a\x5a\x29\x94\x45\x81\x7c\x34\x82\x00\xde\
+\x3f\xee\xd4\x6e\xa6\x63\x95\x3f\x2f\x2d\x3d\x4a\xe6\xe7\xaf\x24\
+\x49\x82\x28\x0c\x21\xad\xed\x1e\x4a\x33\x5c\x5d\x0c\x1c\x9c\x4a\
+\x8c\x17\xf5\xd6\xcb\x18\xc6\xc0\xbc\xf3\x23\x63\x5d\xa7\x32\x06\
+\x45\x55\x21\x4d\x53\xe4\x69\xfa\xe0\xad\xad\xad\x1f\x1e\x87\x6d\
+\xa6\x53\x89\xc5\xba\x7e\x7b\x27\x4d\xff\xc3\x19\x5b\x82\x31\x08\
+\x83\x00\x02\xcd\x89\x02\xf3\x8e\x51\xfc\xfa\xd6\xd7\x8e\x9f\xb9\
+\xfa\xb9\x8e\x71\xc1\xcb\x06\xc9\xaa\xae\x91\xe7\x39\xd2\xd1\x68\
+\x2b\x51\xea\x9d\x59\xb0\xcd\x74\x2e\xf4\x83\xe1\x70\x28\x88\xae\
+\x8f\xf6\xf6\x76\xb3\x2c\x43\x51\x96\x50\x5a\x37\xc1\xc6\xda\x6e\
+\x1b\x1f\xdc\x2a\x78\xcf\x6d\xe6\xea\xbd\x77\xdf\x69\x22\x28\xad\
+\x51\x94\x25\xb2\x2c\xc3\xfe\xfe\xfe\x2e\x80\xeb\xd7\xb6\xb7\x27\
+\x46\x5f\x5f\x4e\x74\xb4\xf8\xd7\xa5\xa5\xef\x28\xe0\x6f\x71\x1c\
+\x5f\x8c\xe3\x18\xa1\x94\x90\x8c\x35\x2b\xe1\x4e\x28\x9c\x49\xc1\
+\x2b\x56\xdc\x49\x04\x9a\xc8\xeb\x56\x84\xac\xd9\x54\x4a\x21\xcf\
+\x73\x64\x59\xb6\x15\x30\x76\xe3\xcd\x67\xcf\xce\xfe\x68\xd1\xc9\
+\xbf\x06\x83\xc1\x36\xe7\x7f\x0c\xa2\x68\x25\xb2\x24\x42\x21\x0e\
+\x48\xb8\x1c\x7e\xac\xf8\x61\xc6\x80\x6c\xbb\x03\x5f\x69\x8d\x4a\
+\x29\x14\x79\x8e\xaa\x28\x1e\xcc\x01\xef\xcc\xaa\xf9\x53\x13\x70\
+\xf2\xe9\xc2\xc2\xcf\x35\xe7\x1f\x75\xa2\xa8\xdf\xe9\x74\x10\x70\
+\x0e\x61\xaf\x76\x35\xfc\xe3\x75\xfb\xab\xed\x7f\x05\x35\x51\xeb\
+\x2a\x19\xd1\xfb\x3f\xd9\xd9\xf9\xed\x69\x70\x7c\xa5\x3f\x38\x0c\
+\x10\xfc\xa5\xdf\xff\x35\x71\xfe\x53\x19\x86\xcb\xa1\x94\x90\x52\
+\xb6\x11\xbb\x4d\x15\xac\xf6\x35\x11\x94\x52\xa8\x94\x82\xae\xaa\
+\x4d\x49\xf4\x3b\xb3\xbb\x7b\xfb\x2d\x40\x9d\x16\xc3\x99\xfd\xc5\
+\xf4\xe9\xe2\xe2\x35\x53\x55\xeb\x24\xc4\x2a\x63\x6c\xd9\x30\xd6\
+\x67\x52\x36\x5e\x8e\xa8\x86\xd6\x7b\xc6\x98\xa7\x5c\xeb\x07\xe8\
+\x74\xee\xfc\xf8\xc5\x8b\x87\x67\x35\xf7\xb9\x9c\xcb\xb9\x9c\xcb\
+\x37\x27\xff\x03\x79\x3f\x0c\x74\xc8\xa1\x2a\x86\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x07\x0c\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x06\xc1\x49\x44\x41\x54\x78\x9c\xed\x9c\x6d\x8c\
+\x1d\x55\x19\xc7\x7f\xcf\x99\x7b\x77\xb7\xd0\x2e\x4b\x37\xd8\x62\
+\x57\x30\x36\x41\xb4\xa4\x06\x53\x48\xf9\x00\x98\x60\x84\x52\x62\
+\x22\xf5\x35\x40\xb1\xf6\x03\x29\xf1\x03\x7c\xc0\x88\x46\x20\x28\
+\x69\x48\x28\x15\x5d\x90\xbe\x18\xca\x8b\x08\x62\x05\x69\x31\x84\
+\xb6\x4a\x14\xc1\x1a\xa4\xa5\x84\x46\x5b\x10\x4b\xb6\xd4\x92\x6c\
+\x4b\xbb\x05\xee\xcb\xcc\x39\x7c\x98\xbb\xbd\x77\xdb\xdd\xed\x9e\
+\x61\x66\xe7\xdc\x7b\xcf\x6f\x33\x1f\x76\xf6\x9e\x99\x67\xce\x73\
+\x9e\xe7\x7f\x9e\x33\xe7\x2e\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\xda\x05\x49\xd2\x68\xee\x9a\x2b\xfb\x28\
+\x86\x2b\x31\x5c\x0a\x4c\x4b\xd9\xa6\x66\x63\x08\xd8\xa4\xd0\x3f\
+\xdc\xbe\x64\xe3\x6e\xdb\xc6\xd6\x0e\x98\xbb\x66\x41\x1f\x41\xe1\
+\x55\x60\xba\x6d\xdb\x16\xe7\x80\x04\x66\xee\xab\xd7\x6e\xdc\x6b\
+\xd3\x48\xd9\xde\xc5\x04\xc5\x95\x06\xa6\x1b\xc0\x1f\x23\x8e\xe9\
+\x3a\x92\xbb\x6d\xfb\xb3\x60\xdb\x00\x63\x2e\xb5\x6e\xd3\x3e\x58\
+\xf7\x4d\x12\x07\xb4\x7b\xce\x1f\x8f\x53\x6c\x1b\x58\xa7\x20\x4f\
+\xba\x58\x47\x80\x31\x26\x0b\x3b\xda\x96\x04\x29\x28\x03\x2b\xda\
+\x18\x9f\x82\x72\x26\x89\x08\x67\x60\x46\xfb\x92\x40\x03\xb2\x30\
+\xa3\x7d\xb1\x8f\x00\x2f\x02\xa9\xe2\x45\x38\x67\x7c\x04\xe4\x8c\
+\xd7\x80\x9c\x71\x33\x05\xe9\xda\x4d\x44\x12\x2e\x98\x37\x0f\x6e\
+\xa5\x20\x6d\xd0\xa1\x86\xc8\x60\x00\x09\x04\x51\x82\x14\x5a\xb7\
+\x5c\x71\x27\x02\x8c\x41\x97\x35\xba\x12\x31\x6b\xda\x0c\x7a\xa6\
+\x74\xb3\x73\xff\x6e\x4c\x51\x90\xc8\xa0\x0a\x0a\x54\xeb\x85\x83\
+\x33\x6b\x41\xa6\xaa\x89\xaa\x21\x8b\xe6\x2c\xe0\xc7\x5f\xfe\x3e\
+\x4a\x14\xdb\xf6\xee\xe4\xf6\x4d\xf7\xf0\xd6\xc1\xb7\x31\x1d\x0a\
+\x29\x28\x24\x50\x2d\x95\x96\x9c\x89\x6d\x63\x0c\x44\x86\xc5\xf3\
+\x16\xa1\x24\x36\xeb\xdc\x59\x9f\xe7\x77\xd7\xf4\xb3\x6c\xfe\xd5\
+\x14\xaa\x0a\x5d\x8e\xd0\xd5\x08\xa3\x5b\x67\x26\x60\xef\x80\x2c\
+\x5f\x2b\x69\xe8\xee\x9a\x3a\xe2\x76\xc5\xa0\xc8\x75\x17\x5c\xc5\
+\xef\xaf\x5d\xc5\x79\xa7\xcf\x45\x7f\x10\x62\x4a\x11\xa6\xa2\x41\
+\x67\x6c\x4f\x92\xc3\x92\x04\x0e\x30\xd9\x1e\x63\x70\xc6\xa9\x9f\
+\x64\xd5\x37\x96\xf3\xb3\xcb\x6e\x62\x2a\x53\x88\x4a\x55\x74\x29\
+\xc4\x84\x51\xf6\x36\xa5\x60\x7f\x6a\x0e\xc8\x73\x00\x09\xc2\x15\
+\x73\x2e\xe1\xc9\xa5\x6b\x59\xf8\xd9\x4b\x88\xca\x21\x51\x59\x13\
+\x55\x22\x8c\x31\xb9\x0f\xfe\x04\x01\xd0\x3c\x11\xd0\x48\xef\x49\
+\x3d\xdc\x71\xf9\x4d\xf4\x5f\xf9\x53\x66\x76\xf6\xa2\x4b\x21\xba\
+\x14\x61\xaa\x51\x5c\x43\xb4\x72\x04\xb8\x34\x8c\x2e\xfc\xcc\xf9\
+\x3c\xb9\x74\x0d\x4b\xe6\x7d\x13\x29\x6b\x74\x29\x42\x57\x22\x88\
+\x4c\xd3\x84\x40\x82\x59\x90\x5b\x4f\x30\xa5\xd8\xc5\x0d\x17\x2f\
+\xe5\xd1\xc5\xf7\xf2\xb9\xde\xd9\xe8\x72\x88\xae\x34\x68\x83\xe3\
+\x1e\xb0\xd7\x80\x14\xa3\xf5\xb8\xc3\xda\xfc\x3a\x67\xcf\x98\xcd\
+\x23\xd7\xfc\x82\x1f\x7c\x69\x19\x1d\xba\x48\x54\x8a\x88\x2a\x11\
+\x3a\x34\x2e\x67\x20\x77\xea\x80\x34\x08\x54\xc0\x55\xf3\xbe\xc6\
+\xfa\x25\xab\x99\xdf\xf7\xc5\x58\x1b\x2a\x11\xa6\xaa\x93\xf5\xce\
+\x24\xd0\x94\x22\x7c\x22\xfa\x7a\x4e\x67\xd5\xb7\x96\x73\xd7\x57\
+\x7f\x42\x8f\x3a\xb9\x2e\xd2\x93\x31\x65\xb5\xc4\x3d\x11\x4e\x91\
+\xaf\x9c\x7d\x11\x1b\xae\x7b\x90\x45\x73\x16\x60\xca\x11\xba\xa4\
+\xb3\x17\x69\x4b\x12\xd4\x01\xd9\xfe\xa4\x4d\x77\xd7\x54\x6e\xb9\
+\xfc\x46\x7e\xfd\x9d\xbb\x38\x63\xda\x4c\xa2\x52\x58\xd3\x86\xe1\
+\xda\x21\x5f\xfb\x5b\x3a\x02\x1a\x99\x77\xe6\x17\x78\xe2\x7b\xab\
+\xb9\xfe\x82\xc5\x04\x55\x39\x3a\x65\x35\x69\x47\x83\x25\x6e\x39\
+\x20\x63\xba\x8a\x9d\x2c\xbb\x68\x31\x8f\x2d\xb9\x97\x73\x4e\x3b\
+\x2b\xd6\x85\x72\x4d\xa4\xd3\x5a\x57\xb2\xa4\xe9\xeb\x80\x24\x9c\
+\xf5\x89\xd9\x3c\xf2\xdd\x5f\x72\xeb\x65\x37\xd0\x25\x1d\xb5\xba\
+\x21\x24\x9d\xba\xc1\x0e\xb7\xea\x80\xc9\xe9\x7f\x00\x94\x28\xbe\
+\x7e\xee\x15\xfc\x61\xe9\x5a\x66\x9f\xf2\x69\xa2\x8a\x46\x87\xba\
+\x09\xea\x80\x56\xf1\x40\x8d\x59\x3d\x33\xb9\x75\xe1\x8d\x98\x50\
+\xa7\xb3\x8e\x64\x49\x82\x77\xc2\xd9\x32\x74\xf8\x10\xaa\xa2\xe3\
+\x19\xca\x31\x87\xd6\xc7\x9f\x1f\xed\xdc\x78\x9f\x1d\x8d\x3d\x07\
+\xde\x9a\xe4\xa7\xac\xe3\xce\xde\xd0\xda\x08\x52\x4a\x11\x04\xc1\
+\xa8\x9d\x29\x22\xc7\x9d\x1f\xed\xdc\x44\x3f\x0b\xf0\xee\xfb\x83\
+\xdc\xff\xf2\xa3\xc4\x2f\xe1\x26\x3f\x0a\xed\xdf\x09\x67\x61\x05\
+\x75\x09\x0b\x82\x60\x84\x03\x3e\x6e\x27\x8f\x75\x3e\x8c\x42\x36\
+\xff\xf7\xef\xac\xdb\xb1\x9e\x32\x55\x54\x31\x80\x40\x4d\xd2\x34\
+\xa0\x8e\x43\xbb\x22\xe2\x63\x38\x02\xd2\xe8\xe4\xb1\xae\xf1\xe6\
+\xe0\x1e\xfa\xb7\x3e\xc4\xee\x83\x7b\x50\x45\x85\x2a\x04\xf1\xcb\
+\xfe\x2c\x9f\x6f\x0c\x9c\x4c\x41\x4a\xa9\x8f\xdd\xc9\xa3\x7d\xf6\
+\xc3\x4a\x89\x27\x5e\x7b\x86\xc7\x5e\xdb\x80\x0e\x0c\x6a\x78\xa7\
+\x85\x12\xe2\xf4\x93\xcd\xa3\x8d\x87\x73\x22\x2c\x22\x28\xa5\x8e\
+\xe6\xe8\xb4\x34\x60\xdb\xde\xd7\x59\xf9\xb7\xb5\xbc\xf3\xfe\x7e\
+\xa4\x23\x88\x9d\xec\xc0\x16\x17\x77\xf6\x05\xd5\x3a\x4a\x44\x10\
+\xa9\xf7\xca\xf0\xef\x49\x47\xfd\xe1\xd2\x11\xee\x7f\xf1\x61\x36\
+\xfe\xfb\xcf\x50\x10\x54\x31\x40\x02\x01\x25\x98\x9c\x46\x7d\x23\
+\xce\x69\xc0\xb1\x0e\x18\xa6\xb1\x63\x27\x9a\x9e\x36\xff\xe7\x05\
+\x56\xfc\x65\x35\x87\x2a\x43\x48\x31\x1e\xf1\x12\x48\xb6\xcf\x61\
+\x89\x93\x29\x68\x34\x07\x34\xfe\xfd\x44\xe9\x69\xe0\xbd\x7d\x2c\
+\x7f\xae\x9f\xad\x7b\xb6\x23\x45\x85\xea\x08\xe2\xfd\xa5\x0e\xee\
+\xa8\x73\x4e\x84\x45\x46\xa6\x9d\xf1\x38\x36\x3d\x55\xa3\x90\xc7\
+\xff\xf5\x34\xfd\xcf\x3f\x40\xc9\x54\x62\x91\x3d\x3a\xea\xf3\x4f\
+\x37\xa3\xe1\xce\xf7\x03\x6a\x35\xd0\x89\x22\x60\x34\x44\x84\x9d\
+\xef\xec\xe2\xb6\x8d\x2b\x78\xfd\xff\xbb\xe3\x3c\x3f\x3c\xb5\x94\
+\x5c\x56\x38\x26\x8c\x43\xdb\xd3\xe3\xeb\xda\x3a\xe0\xc3\x6a\x89\
+\x5f\x3d\xff\x20\x0f\xbc\xf4\x38\x5a\x41\xd0\x59\x17\x59\x27\x87\
+\xfc\x31\x34\x8d\x08\x37\x32\x9c\x76\xfe\xba\xeb\x1f\xdc\xf6\xf4\
+\x0a\xf6\x0d\xbd\x1b\xe7\x7a\x25\xf5\xa9\xa5\xfb\x7d\x0f\xb8\xa4\
+\x01\xb5\x6b\x4f\xc4\x01\x83\x47\x0e\x72\xe7\x9f\xfa\x79\x6a\xfb\
+\xb3\x71\xc7\x17\x55\x83\xc8\xba\x99\xeb\xc7\xc2\xb9\xb5\xa0\xf1\
+\x1c\x60\x8c\xe1\x8f\xdb\x9e\xe5\x8e\x67\xee\xe1\xbd\xd2\x10\xd2\
+\x59\xcb\xf3\x81\x34\x53\x9f\x8f\xa0\x69\x52\xd0\xdb\x83\x7b\xf9\
+\xd1\xfa\xe5\xbc\xf8\xc6\xcb\xa8\x8e\x86\xa9\x65\x96\x36\x4d\x02\
+\x6e\x89\xb0\xc4\x95\x6b\xef\xd4\xfa\x7f\x43\xab\x46\x55\xee\xdb\
+\xb2\x8e\xfb\xb6\xac\xa3\x22\x21\x41\x57\x00\xb5\xef\x8e\x35\x75\
+\xcf\xd7\x70\xe7\xa5\x3c\xf1\xe8\x5f\xb5\xe5\x21\x0c\xb1\x16\xbc\
+\xf2\xbf\x1d\x2c\x5c\x71\x35\x3f\x7f\x6e\x0d\x55\x15\x1d\xcd\xf5\
+\x22\x92\x9d\x1d\x29\x3c\x87\x0d\xce\xac\x05\xa1\x04\x0a\xc2\x6f\
+\xb7\x3e\xc5\x0b\xbb\xfe\xc9\xa9\x27\xf7\xb0\x63\x60\x27\x04\x52\
+\x5b\xb5\x14\x98\x40\x71\xd6\x6c\xb8\xb3\x14\x21\xa0\x8a\x0a\x23\
+\xc2\xc0\x91\x7d\x0c\x0c\xed\x43\x75\x06\xa0\xa4\xbe\x7e\xd3\x82\
+\xb8\x23\xc2\x00\x08\x52\x10\xc4\x28\x6a\x8a\x3c\x09\xf7\xcc\x17\
+\xb7\xea\x80\x3c\xef\x95\x13\xce\xd4\x01\xed\x8a\xdb\x11\xd0\x06\
+\x38\xa6\x01\xed\x87\x43\x85\x58\x7b\xe2\xce\xfb\x80\x36\xc5\xa7\
+\xa0\x9c\xf1\x29\x28\x67\x7c\x04\xe4\x4c\x82\x3a\xc0\x7b\x20\x4d\
+\x7c\x04\xe4\x4c\x92\x42\xec\x30\xd0\x9d\xbe\x29\x2d\xc1\x21\xdb\
+\x06\x49\xbe\x29\xbf\x39\x41\x9b\xb6\xc0\xc0\x26\xdb\x36\xd6\x11\
+\xa0\x8d\xbe\x59\x44\x5d\x8c\xa1\xd7\xb6\x6d\x8b\x73\x00\x23\x37\
+\xdb\x36\x0a\x6c\x1b\x0c\xbd\xb4\x7f\xb0\x7b\xfe\x8c\xdf\x08\xf4\
+\x01\x9f\x02\x3a\x6d\xaf\xd1\x62\x1c\x06\x36\x80\xfa\xf6\xc0\xca\
+\x57\xde\xc8\xdb\x18\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\
+\x78\x3c\x1e\x8f\xbb\x7c\x04\x6e\xe9\xb5\xaf\x89\x11\xd3\x1a\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x08\x6a\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x08\x1f\x49\x44\x41\x54\x68\x81\xed\x59\xcd\x8f\
+\x1c\x47\x15\xff\xd5\xab\xfe\x98\xee\x99\xd9\xd9\xb5\x77\x2d\x21\
+\x04\xc2\xe4\x62\x79\x63\x13\x20\x20\x5f\x6c\x59\xca\xdf\xc0\x21\
+\x82\x5b\xa4\x95\xb8\x46\x08\x84\x1d\xc2\xa2\x28\xe1\xe2\x00\x17\
+\x24\x1b\x21\x24\x90\xf2\x67\x20\xa4\x24\x52\x1c\x05\x10\xc2\x38\
+\x42\x10\x62\x2c\x45\x0e\xce\xda\xde\x9d\x1d\x4f\x4f\x7f\x54\xbd\
+\xc7\xa1\xaa\x7b\x7a\x87\xfd\xf4\x2e\xc9\x65\x9f\x54\x9a\xea\xea\
+\xea\x57\xef\x57\xf5\x3e\x6b\x80\x63\x3a\xa6\x63\x3a\xa6\xcf\x92\
+\xd4\x51\x31\xba\xfb\xea\xc5\xe7\xaa\x3c\x5b\xb1\x55\xfe\x2c\x1b\
+\xbb\x24\xd6\xa4\xcc\x42\x00\x40\xa4\x58\xe9\x20\xa3\x40\xaf\x69\
+\x1d\xbf\x17\xa4\x0b\x37\xbe\x74\xf5\xf7\x7f\x38\x8a\x75\x0f\x05\
+\xe0\xce\xea\xe5\x0e\xf3\xf8\x67\xc5\x78\xf8\xbc\x02\xe6\xe3\xee\
+\x1c\x74\xdc\x81\x0e\x62\x10\x05\x80\xf2\xec\x45\xc0\x6c\x60\x4d\
+\x01\x5b\xe4\x28\xc6\x9b\x10\x60\x23\xee\xce\xbd\x91\xd3\xe4\xc5\
+\xe5\xd5\xdb\xe5\xa7\x0e\xe0\x83\xd5\x6f\xbc\x54\x0e\x1f\x5e\x0d\
+\x3a\xbd\x4e\xdc\x9b\x47\x94\xf6\xa0\xc3\x0e\x82\x20\x04\x05\x01\
+\x94\x22\x28\x45\x5e\x7e\x86\x08\x83\x8d\x81\x31\x15\x6c\x95\xa3\
+\xcc\x1e\xa3\x78\xbc\x01\x93\x8f\x27\xf1\xfc\xe2\x2b\x4f\xfd\xf8\
+\xdd\x9f\x7e\x2a\x00\xee\x5d\xbb\xbc\xb8\x79\xff\x3f\x6f\x09\x70\
+\x26\x9d\x5f\x42\xa7\x3b\x40\x18\xa7\xd0\x51\x0c\x15\x84\x20\xad\
+\x5b\xc2\x4b\xb3\x4c\x03\xc2\x5a\x88\xa9\x60\xcb\x02\x55\x91\x21\
+\x1f\x0f\x91\x6d\xac\x81\x40\xef\xa7\xdd\xc1\xc5\x2f\xac\xbe\xf3\
+\xe8\xff\x06\xe0\xee\x6b\x17\xcf\x8e\xd7\xee\xdd\x8c\x7b\x83\x7e\
+\xa7\x7f\x12\x9d\xee\x1c\x82\x4e\x02\x1d\x44\xa0\x20\x84\x22\x0d\
+\x22\x05\x40\x41\x29\xd5\x12\x1f\x10\x11\x00\x02\x66\x81\xb0\x05\
+\x9b\x0a\xd6\x94\x30\xf9\x04\xf9\x78\x13\xf9\xe8\x21\xf2\xc7\x9b\
+\xa3\x74\xb0\xf4\xcd\xd3\xab\xef\xfc\xfd\xc8\x01\xdc\x7d\xed\xe2\
+\xd9\xf1\x27\x1f\xfd\x31\x19\x2c\x26\xc9\x60\x11\x71\xb7\x8f\x30\
+\x4a\xa7\xbb\x4e\x7e\xe7\x3d\x00\x47\x6d\x08\xee\x59\x58\xdc\x69\
+\xb0\x6d\x4e\xa3\x2a\x33\x14\xe3\x11\x26\xc3\x07\x98\x0c\x1f\x4c\
+\x92\xf9\x13\x5f\x3b\xbd\xfa\xa7\x7d\x81\xd8\x17\x80\x7b\xd7\xbe\
+\xbe\xb8\xfe\xd1\xfa\x87\xe9\xe0\x64\x3f\x99\x5f\x42\x9c\xf6\x11\
+\xc4\x1d\xe8\x20\x72\x82\x13\x79\xb5\x51\x5b\x39\x8a\x7f\x50\xd2\
+\x1a\x73\xa7\xe1\x40\x38\x20\xd6\x94\x30\x45\x8e\x22\x1b\x61\xb2\
+\xb1\x86\x6c\xf8\x68\x94\xce\xf7\xbf\x78\x7a\xf5\x2f\x1b\x7b\xc9\
+\x16\xec\x07\xc0\xe6\xc7\x9b\x6f\x75\xba\x73\xfd\x64\xee\x04\xe2\
+\xa4\x87\x30\x8a\x41\xda\x19\x2a\x91\x97\x59\x18\x4e\xd7\xbd\xca\
+\xb4\x76\x67\x76\x4c\x89\xb8\x67\x02\x58\x08\x5a\x07\x50\x51\xec\
+\x26\x3a\xf5\xea\x97\xa3\xec\x6d\x00\x4f\xef\x25\x1b\xed\x35\xe1\
+\x9f\x57\x9e\xf9\xa1\x40\x9d\x89\xfb\x0b\x88\x92\x2e\x74\x14\x41\
+\x35\x86\xea\xd6\x74\x3b\x2a\x10\xb1\xae\x31\x03\xcd\x0e\xb7\xfa\
+\xf5\xfb\x66\xbe\xf3\xb4\x4a\x11\x94\xd6\xd0\x51\x84\x28\xe9\x22\
+\xee\x2f\x80\x81\xe5\x0f\xae\x7c\xe5\x47\x7b\xc9\xb7\xab\x0a\xdd\
+\x59\xbd\xdc\xc9\x1e\xde\x59\xef\x2e\x7e\xae\xd3\x9d\x5f\x44\x9c\
+\xf6\x41\x61\x04\xa2\x5a\xe7\x1d\x0b\xa5\x00\x6e\x98\xc9\x54\xf5\
+\xb7\x5d\xcd\x19\x37\xc1\x81\x07\x1c\x10\x61\x0b\x66\x0b\xae\x4a\
+\x14\xd9\x08\xe3\x8d\x07\xc8\x1e\x7d\x3c\x91\x85\xde\xfc\x6e\x71\
+\x62\xd7\x13\xa8\xb2\xfb\x3f\xd7\x49\xda\x89\xd3\x1e\x82\x30\xf6\
+\xba\x0e\x28\xd5\xd6\x61\x03\xb6\x16\x60\x03\x61\xeb\x9a\xd8\x69\
+\x7f\x9b\x31\xf8\x6f\x84\x8d\x3f\x19\x86\x52\xe2\x78\x13\x21\x08\
+\x63\xc4\x69\x0f\x14\xa7\x49\x38\x91\x6b\xbb\xc9\xb8\x2b\x80\x62\
+\x92\x3d\xdf\x49\xfb\x08\xc2\xd8\xfb\x77\xe5\xf6\x4f\x04\x8a\x19\
+\x4a\x18\x60\x06\xc4\x00\x5e\x30\x58\xf6\xfd\x6d\x9a\x65\x37\x87\
+\xad\xff\xc6\xf1\x50\xcc\x8e\x27\x04\x4a\x29\x90\xd6\x08\xc2\x18\
+\x9d\xb4\x8f\x6a\x92\x7d\xe7\x89\x00\xfc\xeb\xca\xf9\xe7\x34\xd1\
+\x20\x8c\x13\xe8\x20\x70\x1e\x06\x02\xb0\x40\xac\xdb\x51\x66\x03\
+\x11\xbf\xf3\xb6\xde\x61\xd3\xea\xb7\x5a\xb3\xe3\xad\xb9\x62\x3c\
+\x0f\x37\x06\x76\xb1\x42\x29\x05\x1d\x04\x08\xe3\x04\x20\xb5\xf0\
+\xe1\xd5\x73\x97\x76\x92\x73\x47\x2f\x64\x8a\x6c\x25\x4a\xbb\xa0\
+\x20\x04\x14\xd5\xd1\x08\x00\x3b\x6f\x22\xd2\x52\x75\xdf\xe3\x59\
+\x2e\xb3\xf1\xa0\x35\x2c\xd3\xf7\xee\x51\x79\x6f\xe6\x5d\x96\x22\
+\x50\x10\x22\x4e\xba\x28\xf3\xc9\x0a\x80\x37\x0f\x04\x80\x6d\xf5\
+\x6c\x18\xce\x41\x93\x73\x95\x24\x02\x05\x86\x0f\xa8\x5e\x24\x69\
+\xc9\xd7\x16\x72\x27\xdf\x30\x33\xa7\xce\xf5\x6a\xf3\xf7\x43\x24\
+\x02\x22\xb8\xb5\xc3\x08\x9c\x8d\x2e\xec\x24\xe7\x8e\x00\xac\xe5\
+\x53\x9a\x02\x10\x11\xe0\x03\x0f\xac\x5f\x57\x6a\xf1\x65\x06\x44\
+\x5b\xf8\x59\x57\x34\x33\xde\x3a\x05\xd5\x00\x50\x3e\xd0\x39\x9b\
+\x20\x22\x68\x0a\x00\x91\xa5\x03\x03\x10\x91\xa4\xce\x26\xbd\x9f\
+\x73\x02\x7b\xbf\xef\x34\x8a\xd1\x04\x83\x2d\x82\x6e\xe3\x4a\xd5\
+\x16\xa9\xfd\x98\xff\x56\x91\xc7\x32\x4d\xbf\x6b\x9e\x4a\x11\x18\
+\x9c\x1e\x18\x00\xa4\x36\x70\x27\x3c\xb3\x9a\xfa\x7d\xaf\x4a\x35\
+\xa0\x29\x80\xd6\x2e\xcb\xd6\xc7\x29\x80\x7a\x60\x46\x60\x05\x88\
+\xb8\x0c\xd6\xa9\x29\x37\xf3\x84\xa1\x0f\x0e\xc0\x0b\x0e\xf6\xed\
+\x7f\xde\xb5\xd5\xe7\x90\x00\xa0\x7c\xbf\xb5\x4e\xbd\xae\xf0\xce\
+\x81\x71\x37\x00\x22\xc2\x22\xac\xeb\x40\x43\x22\xde\x53\x08\xd8\
+\xfb\x6c\xe1\x3a\xc9\x39\x8c\x0a\x01\x20\x05\x91\x3a\x05\x9f\xae\
+\xd1\x0a\x72\xf6\xc0\x00\x08\x98\x30\xdb\x5e\x1d\x41\x19\xe4\x59\
+\xd7\xf6\x00\x6f\xdc\x5b\xdc\x12\x76\x34\x62\xd9\xce\x88\x9d\x01\
+\x0b\xd7\x46\x4c\x80\x53\xd0\x26\x77\x62\xb6\x50\xc2\xd9\x81\x01\
+\x00\xfc\x09\x9b\xaa\xc7\xc6\x80\x83\x00\xc4\x2e\x7b\xac\x0d\x4c\
+\x66\xdc\xea\x13\xbb\x51\xaf\xfb\x4d\xa0\xf4\x89\x15\xfb\x12\x94\
+\x4d\x05\x81\x5a\x3b\x30\x00\x02\xbd\x67\xab\xf2\xcb\xc6\x1a\x68\
+\x63\xc1\x01\x40\xd6\xa5\x62\xb5\xf0\x68\xbc\xd1\xac\x2b\xdd\x83\
+\xea\x32\x01\xca\xcb\x2c\x80\x07\xe1\x39\x43\x8c\x85\xb1\x06\xb6\
+\x2a\xa1\x81\x9b\x3b\xcb\xb9\xd3\x8b\x20\xbc\x51\xe6\x99\xdb\x01\
+\x9f\x1e\xb0\x70\x53\x12\x0a\x0b\xd8\x17\x24\x4d\x7a\xb0\x5d\x12\
+\xb7\x5d\x52\xd7\x4a\x35\x1c\x0f\x5f\x66\xb2\x80\x85\x9b\xb4\x83\
+\x4d\x85\x32\xcf\x40\x41\x70\x7d\x8f\xbd\xd8\x9e\x6e\x7d\xf7\xd4\
+\x7a\x3a\x58\x9a\x4f\xbb\x7d\x04\x51\x04\x22\x72\x59\xa3\x78\x03\
+\xae\x3d\x15\x64\xeb\x29\xcc\xd8\x6a\xb3\x52\xcb\x33\x39\x95\x51\
+\x2e\x4d\x81\x82\x22\x05\x51\xce\x98\x99\x19\xa6\x2c\x91\x8d\x47\
+\xc8\x36\x1e\xac\x9f\xbb\x7e\xff\xc4\x81\x4f\x00\x00\x34\xd1\x1b\
+\x45\x3e\x86\x31\xa5\x4f\x7f\x2d\xe0\x3d\x03\xe0\x0b\x15\xef\x6a\
+\x95\xf8\xec\x54\x7c\x36\x2a\x33\x8d\x2d\x20\xad\x79\x35\x1f\xcf\
+\xab\xe6\x53\xd7\xca\xc6\x94\x28\xf2\x31\xb4\xa6\xdf\xee\x26\xe3\
+\xae\x00\x64\xe9\xe4\x8b\x26\x1f\x4f\xca\x7c\x02\x5b\x95\x4e\x8d\
+\xea\x23\xf7\xd1\x19\x22\x90\x96\xdb\x73\xc2\xd6\x29\x35\x6f\xed\
+\xfb\x6a\x8d\xfd\x37\x4d\x84\xf7\x27\xca\xec\xd4\xc7\x56\x25\xca\
+\x7c\x02\x93\x67\x99\x2c\x9d\xf8\xc1\x13\x03\x58\x5e\xbd\x5d\x46\
+\x5a\xff\x24\xcf\x46\x28\x8a\x1c\xc6\x1a\x30\x33\x58\xd8\xa5\xd5\
+\x75\x39\xc9\x3e\xcd\x16\x0f\xa4\x6e\x5c\x97\x92\x5b\xdf\x81\xa5\
+\xd9\x04\x97\xe0\x8a\xb7\x2f\x86\xb1\x06\x45\x91\x23\xcf\x46\x08\
+\x41\x2f\xef\x75\x6b\xb7\xaf\x5b\x89\x5b\x2b\x27\x6f\x47\xbd\xc1\
+\xd9\x24\xed\x23\x8c\x22\x68\x4d\xfe\x63\x69\x0a\x9c\x76\xae\xa4\
+\x30\xad\x77\x01\x34\x7d\xf1\xae\x53\xd5\xba\xaf\x6a\x0e\x6e\xa2\
+\xb5\x8c\xaa\x2c\x31\xc9\x46\x28\xc7\xc3\x5b\xe7\x6e\x3c\x3c\xbf\
+\x97\x6c\xfb\xba\x95\x20\x5b\x5d\xcc\x1f\x0f\xff\x4d\x4a\xf5\x81\
+\x2e\x10\x86\x20\x4d\xd3\x1a\xd8\x5b\xe7\xd6\x9a\x58\x9a\x00\x05\
+\x25\x2e\x68\x35\xd1\x78\x6b\xb4\x16\x08\xd8\x32\xaa\xaa\x42\x31\
+\x19\x23\x7f\xbc\x31\xe4\x94\x77\x2c\x62\xda\xb4\xef\x8b\xad\xbf\
+\xae\x9c\x3c\x23\xc0\x9f\x93\xfe\x20\xe9\x74\x52\x04\x61\x08\x4d\
+\x2e\x3a\x3b\x3f\x5e\xbb\x9d\x56\xbf\xfe\x55\xaa\xf5\x3b\xed\x8b\
+\xb8\xc8\x6e\x99\x61\xaa\x0a\x79\x9e\x21\x1f\x0d\x27\xdd\x50\x3d\
+\xf3\xd4\x2f\x1f\xfc\xe3\x48\x01\xd4\x20\x00\x79\x37\x4e\xe7\xe6\
+\xc2\x38\x41\x14\x85\xd0\xda\xdd\x4e\xa8\xa6\xae\xf2\x69\x30\x04\
+\xe2\xd3\x07\xa5\x64\x5a\xb4\xf8\x13\x10\xaf\x66\xd6\x5a\x94\x65\
+\x85\xaa\x98\x20\x1f\x0f\x87\x4a\xd1\x85\xf3\xbf\x7a\x78\xf4\x57\
+\x8b\x35\xdd\x7e\x61\xee\x84\x55\xf4\x26\xc5\xc9\x72\x9c\x74\x11\
+\x85\x11\xb4\xd6\xde\x2e\x94\x07\x33\x1b\x0c\x5c\x5f\xfc\xc5\x17\
+\x20\xb0\x96\x9d\xf0\x55\x89\x62\x32\x06\x17\x93\x5b\xb6\x87\x4b\
+\x5f\xfd\xc5\xc6\x9e\xb7\x71\x87\x02\x50\xd3\xdf\x56\x06\xdf\xb7\
+\x42\xab\x41\x27\x4d\xa2\xa8\x83\x20\x0c\x41\xa4\xa1\x95\x0b\x4a\
+\x4e\xdd\xa7\x56\xec\x52\x7c\x81\x15\x01\xb3\x85\xa9\x2a\x94\x65\
+\x0e\x93\x67\x59\x20\xf2\xf2\xf2\xaf\x37\x5e\x7f\x12\x39\x0e\xf5\
+\x07\xc7\xed\x6f\x21\xb2\x73\x73\xaf\x8b\x52\xdf\xa6\xb0\xb3\xe0\
+\xae\x1c\x35\x88\x34\x48\x4d\xbd\x4b\x9d\x1e\xb3\x0f\x52\x55\x59\
+\x80\xab\x7c\x9d\x94\xfc\xee\xe9\xcf\x6f\x7e\x4f\xad\xc2\x3c\xa9\
+\x0c\x87\x02\xd0\xa6\xf7\x5f\x98\xbf\x64\xa4\x5a\x81\xa2\x0b\x42\
+\xfa\x94\x40\xa7\x54\xd7\xa4\x4a\xac\x62\x9b\x09\xdb\x35\x08\xdf\
+\xd4\x88\xae\x2f\xff\x66\xfd\xed\xa3\x5a\xfb\x98\x8e\xe9\x98\x8e\
+\xe9\xb3\xa3\xff\x02\xcc\x8c\xd6\xe7\xca\x44\x15\x73\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\xfb\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\xb0\x49\x44\x41\x54\x68\x81\xed\xd6\x41\x0a\
+\xc2\x30\x14\x84\xe1\x79\x39\x47\x5d\x7b\x08\x6f\xe0\x41\xb2\xeb\
+\x81\x7a\x12\xaf\xe0\x3d\xec\xce\xb5\xdb\xbc\x6e\x5a\x68\xc4\x28\
+\x05\xb1\x4f\xf8\x3f\x28\x4d\x43\x02\x13\x28\x64\x24\x00\x00\xfe\
+\x98\xad\x3f\x4e\xd7\xc7\xd9\xac\x0c\x2e\x75\x9f\x36\x7a\x71\x95\
+\xe2\xf2\xf9\x29\x4f\xef\xf7\xe3\xf6\xfe\xd6\x78\x36\x2a\x59\xbe\
+\xf7\xc7\xcb\x32\x91\xaa\xd3\xc4\x0e\x2f\x49\x9d\xdc\x87\xf5\x44\
+\x75\x80\xe0\xe1\x97\x90\x87\xe6\x01\xc2\x87\x7f\xa1\xfe\x85\xa4\
+\x31\x7c\x78\xd3\xad\x79\x00\x4f\x29\x4b\xf5\x82\x70\xe1\x5d\xb9\
+\xbd\x00\x00\x7e\x8d\x2e\x44\x17\xda\x7a\xa9\xd1\x85\xf6\x0e\x4f\
+\x17\x02\x80\x6f\xa2\x0b\xd1\x85\xb6\x5e\x6a\x74\xa1\xbd\xc3\xd3\
+\x85\x00\x00\x08\x64\x02\x74\x38\x11\x59\x0e\x61\x7d\x8b\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x07\x82\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x07\x37\x49\x44\x41\x54\x68\x81\xed\xd9\x6b\x6c\
+\x14\xd7\x15\xc0\xf1\xff\x9d\x5d\xdb\xc0\xee\xd6\xd8\x6b\x30\x01\
+\x9b\x18\xd3\x84\x52\x5e\x31\x51\x5b\xc2\x87\x14\x95\x40\x9a\x2a\
+\x2a\x22\x71\x91\xaa\x12\x29\x51\xac\xa6\xa5\xa9\xda\xd2\x52\x42\
+\x80\x64\x9a\xe0\x05\xc2\xc3\xae\x62\xa0\x49\xa0\x49\xd5\x50\x90\
+\x11\x8f\x54\x6d\x50\x1f\xa8\x81\x36\x55\x1a\x04\xc1\x2a\x89\x08\
+\x81\xc6\x38\x80\x5f\x60\xaf\x8d\xdf\xde\xb9\xa7\x1f\xbc\xbb\xde\
+\x97\x77\x67\x01\xf7\x43\xe5\xab\x95\x66\x67\x76\xee\xce\xef\xcc\
+\xdc\xc7\x99\x19\x18\x29\x23\x65\xa4\xdc\x72\x31\x4d\xd3\x30\xcd\
+\xea\xcc\x34\xf6\xcf\x34\x4d\xd3\xb8\x1d\xc7\x56\xb7\x52\x79\xc3\
+\xf6\x5d\x93\x0c\x64\x05\xe8\xe5\x0a\x55\x33\xb5\x60\xdc\xd2\x65\
+\xcb\x96\x59\xc9\xea\x54\x57\x57\x3b\x3e\xae\x6b\x3c\x22\x9a\xd9\
+\x22\xfc\x56\x60\xa7\xb9\xfa\x87\x57\x6f\xd6\x70\x53\x01\x98\xdb\
+\x77\xe7\x66\xd2\xfb\x0b\xa0\x0c\x18\x05\x20\x02\xc0\xe1\x7e\x95\
+\x55\x66\xae\x2c\x6b\x49\x54\xcf\xe7\xab\xf2\x06\x32\xf4\x1e\x44\
+\x2d\x11\x84\x81\x8f\xf4\x20\xbc\xd6\x23\x19\xcf\x6f\x5a\xb3\xa2\
+\x75\xd8\x03\xf0\x55\xec\x28\x45\xa8\x02\xf2\x43\xdb\x82\xf8\x50\
+\x69\x04\x76\x63\xc9\xa1\xfe\x8c\xfe\xff\x00\x18\x56\xd6\x54\xb4\
+\x7e\x44\x21\x4f\x0a\xe4\x47\xe0\x83\xf5\x05\x05\x8d\x5a\xf8\xc1\
+\x0b\x6b\x7e\x7c\x70\x58\x02\xa8\xae\xae\x76\x7c\x72\xe5\x5a\xb9\
+\x12\x56\xc3\xa0\x38\x06\x0f\x48\xdc\x36\x11\x09\xef\x9b\x08\x3f\
+\xf8\x3f\x82\x68\x5e\x6d\xcc\x1b\xf3\xf4\xab\x4f\x3d\xd5\x6f\xc7\
+\x65\xbb\x23\x9d\xbf\x7c\x7d\x82\x12\x56\x0d\x2b\x5e\x00\x25\x4f\
+\x8e\x6b\xee\x1c\x6f\xd7\x65\x3b\x80\x75\x2b\xbf\x7f\x05\x38\x31\
+\xac\xf8\x81\x5f\x8f\x97\xaf\x5b\x79\xe5\xb6\x07\x10\xfc\xfb\x8f\
+\x86\x15\x2f\x80\xc8\x87\xe9\x98\xd2\x0a\x40\x41\xfb\xb0\xe2\x01\
+\x11\x75\x23\x1d\x93\x33\x9d\x9d\x45\xab\x22\x54\xa4\x36\x31\xde\
+\xe3\x76\x91\xed\x71\x93\x95\x95\x89\x52\x8a\x9e\xde\x5e\xfc\xed\
+\x1d\xf8\xdb\xda\x53\xe0\x05\x11\x8a\xd2\x31\xd9\x1e\x85\x4c\xd3\
+\x74\x66\x78\xc6\xd5\x02\x93\x12\xe1\x0d\x43\x51\x54\x30\x91\xa2\
+\xc2\x3b\xf0\xb8\x5d\x28\xa5\x30\x0c\x23\x6a\xd9\xd9\xdd\xc3\xf9\
+\x8b\x97\x38\x77\xe1\x53\x02\x01\x2b\x1e\x0f\xa0\xe4\x72\x66\x7f\
+\xc7\x14\xd3\x34\x03\x76\x5c\xb6\x9b\x90\xd3\x33\x7e\xe9\x50\xf8\
+\x9c\x6c\x0f\x0b\xee\xbb\x97\x19\xd3\x8a\x87\xc4\x1b\x86\xc1\xe7\
+\xdc\x2e\xbe\x5c\x32\x93\xd2\x87\x17\x91\x3f\x2e\x37\x1e\x3f\x30\
+\x8c\x16\xf4\x38\x3d\x4b\xed\xba\x6c\x5d\x81\xf2\x8a\x57\xee\x10\
+\x1d\x38\xad\x60\x42\x2c\x7e\xc2\x78\x2f\x25\x33\xee\xc6\xe9\x74\
+\x26\x44\xc7\x2e\x43\xdf\x45\x84\x63\x7f\xff\x17\x17\x6b\x3f\x1b\
+\xc4\x0f\x06\xd4\x60\x38\x9c\x73\x7d\x6b\x7f\x52\x7f\xcb\x01\xbc\
+\xb8\xe5\xe5\x29\x86\x32\x0e\xa1\xb8\x27\xd1\x99\x9f\x37\x77\x66\
+\x14\xbe\xad\x47\x53\x7d\xfa\x1a\xef\x5e\x6c\xa7\xae\xa5\x1b\x04\
+\xee\xf4\x66\x71\xff\x5d\xb9\x2c\x9f\x5f\x80\xd7\x9d\x19\x15\xc4\
+\xa1\xb7\x8f\xd1\xd0\xd4\x1c\x75\x35\x06\x96\xfa\x03\xcb\x30\x1e\
+\xdd\xba\x7e\xd5\xa7\x37\x15\x40\x79\x65\x65\x3e\x56\x46\x19\xf0\
+\x33\x60\x6c\xa2\x36\xbf\xe0\xbe\x7b\x71\x8d\x19\x1d\x06\xfd\xed\
+\x93\x1b\x6c\x38\x5a\x47\x77\xdf\x40\xfb\x26\xd8\x49\x11\x41\xa1\
+\x71\x65\x3a\xd8\xf0\xe8\x74\x1e\x9c\x3d\x21\x5c\xa7\xa3\xab\x9b\
+\x37\xf6\x1d\xc6\xd2\x3a\x02\x2f\xa1\x66\xd5\xaa\x2d\xd9\x1a\xb0\
+\xac\x3d\xbf\xf4\xad\x6d\xb4\x15\x40\xf9\xb6\x1d\x8f\x03\x2f\x00\
+\x05\x83\xbf\xc7\x8f\x36\xc5\x93\x27\x31\x63\x5a\x71\x14\x7e\xed\
+\xef\x6b\x83\x43\x4c\x3c\x1e\x11\x54\xf0\x7b\xe5\x63\x25\x3c\x38\
+\x67\x62\xb8\xee\x89\xf7\x4e\x71\xf2\x83\x7f\x47\xe3\x25\xd4\x37\
+\x84\x81\x4d\x72\x59\xb4\x3c\x57\xe9\x5b\xfb\x46\xa4\x23\xae\x13\
+\x2b\x78\x00\x28\x4c\x86\x17\x11\x8a\x26\x4f\x8c\x6a\x36\x1b\x8e\
+\xd6\xa5\xc4\x23\x1a\xb4\xb0\x7e\x7f\x0d\xfe\xae\x40\xb8\x5f\x94\
+\xcc\x9c\x9e\x0c\x8f\x88\x28\x11\x29\x14\x43\x2f\x8c\xf5\xc6\x05\
+\x20\x8a\x59\x11\x6b\x43\x8e\xf3\x1e\xd7\x98\x30\xa0\xfa\xf4\xb5\
+\x21\x9b\x4d\x24\x5e\x89\xa0\x44\xd3\xd1\xd3\xc7\xde\x13\x17\xc2\
+\x9d\x3a\x37\x27\x1b\x6f\xee\xd8\xa1\xf0\x83\xeb\x5a\xcd\x4e\x19\
+\x00\x12\x4a\x93\x87\x9e\x61\xb3\x3d\xee\xa8\xd1\xe5\x1f\x17\xda\
+\x6c\xe3\x61\x60\xf9\xce\xd9\xfa\xa8\xd1\x29\x3f\xcf\x9b\x1c\x3f\
+\xb0\x1e\x97\xe4\x25\x9a\x07\xe2\x3a\x6c\x24\x5e\x04\xb2\xb2\x32\
+\xa3\x0e\x7e\xb9\xb5\x27\x2d\x3c\x22\xd4\x35\xb5\x45\x9d\x04\xb7\
+\xdb\x95\x0a\x8f\x88\xe4\xd8\x08\x40\x54\xaa\xdc\xc6\x50\x2a\xea\
+\xe0\x0a\x95\x16\x5e\x05\xb7\x47\x9e\x84\xe0\x35\x4f\x86\x87\x18\
+\x57\xc2\x00\x44\xb8\x11\xbd\x1e\x9f\x98\x75\xf7\xf6\x46\x1d\xbc\
+\x30\x37\x2b\x2d\x3c\xa2\x29\x1a\xef\x8e\x9a\xdc\x3a\x3a\xbb\x52\
+\xe2\x05\x89\x4b\xf4\x12\x35\xa1\x70\x2e\x3e\x54\x56\xe9\x6f\xef\
+\x88\xba\x02\xf7\xdf\x95\x93\x16\x5e\x89\x66\xe1\x9c\xc2\xa8\x99\
+\xf9\x6a\x43\x53\x2a\x3c\x5a\x24\xee\x3e\x21\xfe\x0a\xc0\x9f\x80\
+\x4b\x22\x12\x48\x84\x07\xf0\xb7\xb5\xd3\xd9\xd5\x1d\x0e\x62\xf9\
+\xfc\x02\x5c\x99\x0e\xdb\x78\xcf\x28\x27\x4f\x2c\x9e\x15\xc6\xb7\
+\xf8\xdb\x68\x6c\xbe\x9e\x0c\x1f\x10\x91\x4b\x68\xfe\x1c\xeb\x4d\
+\x3a\x13\xeb\x5e\xe7\xe3\x5a\xe9\x67\x10\xc6\xc6\xe6\xf3\x33\xa6\
+\x4d\xe5\x4b\xf7\xcc\x0c\x23\xfe\xfa\x61\x33\x3f\xdd\x7b\x06\x74\
+\x72\xbc\x42\xb3\xeb\xe9\x45\x7c\xe3\x2b\x9f\x0f\x9f\x80\x3f\xfe\
+\xe5\x38\xc7\xff\xf9\x7e\x22\xbc\x1f\xd8\xe8\x70\x38\x7e\x63\x7b\
+\x26\x8e\x2d\x2f\x6e\x79\x79\x8a\xa5\xf5\x41\xa0\x24\xb2\x49\x39\
+\x1c\x06\xa5\x0f\x2f\xc2\xe3\x76\x0d\x06\x71\xb6\x91\xf5\xfb\x6b\
+\xe8\xe8\xe9\x1b\xf2\xcc\x6f\x29\xfb\x6a\x14\xde\xdf\xd6\xce\x4b\
+\x55\xbb\xe9\x0f\x04\x62\xf1\xa7\x02\x4a\x97\xfe\x6a\x93\x59\x9b\
+\xcc\x67\x2f\x1b\x2d\xaf\xcc\xef\x73\x70\x1a\x98\x28\x11\x37\x21\
+\x79\xb9\x63\x59\xf2\xd0\xd7\xc8\x88\x48\xe6\xfc\x5d\x01\xf6\x9e\
+\xb8\xc0\x3b\x67\xeb\xb9\xd4\xd8\x06\xa2\x29\xce\xf7\xb0\x70\x4e\
+\x21\x4f\x2c\x9e\x85\x37\x7b\x70\x02\xd4\x5a\xb3\xeb\xf5\x7d\xd4\
+\x5e\xbe\x12\x8b\x6f\x44\xf4\xdc\xaa\x97\xcc\x94\x0f\xbc\x6c\xdf\
+\xd0\x3c\xb7\xb1\xf2\x5b\x40\xf5\xe0\x1c\x31\xb0\x2c\xbe\xb3\x80\
+\xc5\x0b\xe6\xc7\xa5\xd3\xc9\x52\xe9\x10\xfe\x77\x07\xff\x40\xcd\
+\x47\xe7\xe2\x87\x4a\x25\xcb\xaa\x36\x3d\x7f\xc0\x8e\xcb\xf6\x0d\
+\x4d\x43\xee\xe8\x23\x20\xf5\x91\x78\x80\x8b\xb5\x9f\x71\xe8\xed\
+\x63\x74\x44\x74\xea\x54\x78\x7f\x5b\x3b\x3b\x5f\xdf\x97\x18\x8f\
+\xd4\xe7\x8d\x92\xc3\x76\x5d\x69\x3d\x99\x5b\xe7\xab\x78\x53\x21\
+\xdf\x09\xe1\x23\xef\xa4\x0c\x65\x50\x32\x6b\x3a\x25\xb3\xbe\x48\
+\x6e\x4e\x76\x42\x7c\xab\xbf\x9d\xf7\x4e\xd5\xf0\xee\xfb\xa7\x12\
+\xb5\xf9\x60\xbe\x23\x6f\xee\xdc\x62\x3e\x66\xd7\x94\xd6\x4d\xbd\
+\xa1\xe4\xaa\xd6\xf1\x78\x11\xb0\x44\x73\xf2\xcc\x59\x4e\x9e\x39\
+\x8b\x37\x67\x2c\xf9\xe3\xf3\x70\xbb\xc6\x80\x40\x47\x77\x17\x57\
+\xeb\x9b\x52\x0d\x95\x88\x08\x1a\xd2\x7a\xd0\x9b\x56\x00\x96\xc6\
+\xa5\x12\xe0\x43\x01\x85\x96\xcd\xd7\x5b\x68\xba\xd6\x62\x27\xb7\
+\x89\xc2\x8b\x80\xd2\x8c\x1e\xb6\x00\x14\x6a\xb6\x88\x4e\x8a\x4f\
+\x99\x12\x27\xc1\x8b\x08\x28\x89\x4b\x99\x93\x9b\x6c\x16\x73\x63\
+\x45\x71\xbf\xa5\x3f\x16\x70\x0e\x17\x3e\x78\x65\x2d\x4b\x1b\x5f\
+\xd8\x53\x61\x5e\xb0\xe3\xb2\x3d\x0a\xf5\x5b\x56\xe9\xff\x00\x8f\
+\x88\x38\x90\xfe\x47\xec\xba\xec\x3f\x9d\xbe\x7b\xf2\x36\x41\x6f\
+\xb7\x81\x6f\x15\x28\xb7\x90\x79\x38\xfb\xbc\x2a\xa3\xdf\x8b\xd6\
+\xf3\x44\xb4\x4f\x44\x5a\x53\xe0\xd1\x9a\xed\xed\x57\xce\x6f\xb3\
+\xeb\x4a\xfb\x05\xc7\xea\x0d\x5b\x96\x28\x2d\xaf\x80\xca\x4f\x80\
+\x3f\xea\xec\x55\xdf\xde\xbc\xf9\x99\xb6\x44\x75\xbf\xbb\x7a\x53\
+\x76\x86\xf4\xed\x17\xf4\xd7\x63\xf1\x5a\xa4\x01\xd1\xdf\xdb\x5d\
+\x51\xfe\x56\x3a\x9e\x9b\x7a\xc5\xb4\xc6\xe7\xf3\xea\x3e\xc7\xb3\
+\x02\x2b\x44\x18\x15\x0c\xe2\x48\xdd\xb9\xe2\xd2\x03\x07\x92\xbf\
+\x23\x33\x4d\xd3\xd9\xd8\xc9\x41\x11\xf9\x66\x10\xdf\xa3\x61\x87\
+\x68\xc3\xb7\xa7\xc2\x4c\xf8\x6a\xea\xb6\x07\x10\x2a\x3f\x37\x37\
+\x4f\xb4\x2c\x29\x13\xc5\x12\xc3\x70\x3c\xb4\xd5\x5c\xd5\x64\xa7\
+\x5e\xd9\x8f\x9e\xcd\x77\x38\x9d\x47\x45\x78\x2b\xe0\x34\x5e\xfb\
+\xb5\x8d\x9c\x67\xa4\x8c\x94\x91\xf2\x7f\x5a\xfe\x0b\x56\xd5\x8a\
+\x94\xc2\x6d\x5f\xe2\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x04\x81\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x04\x36\x49\x44\x41\x54\x68\x81\xed\x99\x5f\x6b\
+\x1c\x55\x18\xc6\x7f\xcf\xcc\x69\x73\x23\xb4\x16\x12\xd3\xd4\x26\
+\x4d\x29\xe4\x22\xe0\x17\x11\xa9\xc8\x18\x6d\x42\xd9\x82\x34\x78\
+\x61\xaf\x22\x42\xbf\x80\xa2\xb6\x0a\x55\x51\x1b\x6f\x42\x5d\x87\
+\xc6\x08\x95\x8a\xb7\x7e\x00\x2f\xb5\x29\x12\x13\x13\x2a\xdd\x75\
+\x4d\x05\xb5\x60\x53\x76\xf6\xf5\x62\x76\x92\x4d\xf3\x67\x67\x77\
+\x66\xd2\x5e\xe4\x61\x2e\x86\xdd\xe5\xbc\xcf\xef\x3d\xef\xbc\xe7\
+\xcc\x59\xd8\xd7\xbe\x32\x49\x7b\x1d\xf0\xc4\xb5\xbb\x2f\x1a\xf6\
+\x31\x18\x0d\xbc\x37\xee\x9c\x1d\xb8\x91\x65\xbc\x3d\x05\x18\xfe\
+\xf2\xf7\xa0\x21\x85\x32\x9c\x19\x80\x45\x60\xa5\x95\xb3\xc7\xcb\
+\xdd\x8e\xb9\x67\x00\xc3\x61\x25\xc0\x2c\x34\x33\x07\x80\x41\x1e\
+\x10\x5e\x8e\x1e\x77\xd4\x70\x58\x09\x84\x85\x08\x27\x35\x73\x26\
+\x88\x6f\xe5\x83\x66\x86\xae\xdd\x99\xe8\x66\xec\xc2\x67\xe0\xd4\
+\xf5\xca\x98\x19\x65\xc3\x1c\x06\x71\xd2\xc1\xe2\xf4\xb7\xce\x44\
+\xbd\xd1\x50\x70\xa7\x74\xec\xdb\x4e\xc6\x2f\x74\x06\x4e\x5d\xaf\
+\x8c\x21\xca\x08\x27\x44\xf3\x6a\x66\x7f\xcb\x4c\x38\xc9\x3e\xea\
+\x34\x46\x61\x00\xa7\xe6\x2a\x63\xf2\x54\x06\x9c\x44\xd3\x7c\x5b\
+\x88\x8e\xe3\x14\x02\x30\x32\x57\x19\x13\x89\xf9\xd8\x54\x3b\x08\
+\x13\x75\xcf\xe7\x42\xa7\xb1\x72\x07\x18\xf9\xa6\x16\x98\xbc\xb2\
+\x84\x4b\x12\x9a\x02\x22\x02\x9d\x5b\x9e\xe8\xac\xfe\x01\xfc\xfc\
+\xac\xc3\xc8\x8d\x5a\x80\x2c\x14\x38\x10\x6a\xa9\x88\x4d\x10\x6c\
+\x82\x88\xe4\x51\x5a\x1e\x1f\xe8\xaa\x8d\xe6\x06\x30\x7a\xa3\x16\
+\x18\xc4\xe6\x93\xec\xb6\x87\x88\x10\xa5\xa5\x57\xbb\x33\x0f\x39\
+\x01\x8c\xde\xac\x05\x8d\x75\xf3\xda\x28\x8d\xc4\xe6\xf6\x10\x91\
+\x99\x65\x32\x0f\x39\x00\x8c\xde\xac\x05\x66\x0a\x25\x1c\x24\x75\
+\xdd\x16\x22\x42\x56\x5a\x7c\x25\x9b\x79\xc8\x08\x30\x7a\xb3\x16\
+\x80\x42\xb4\xb9\xe6\xdb\x40\x44\x86\x4a\xbf\xbe\x7c\x34\xb3\x79\
+\xc8\x00\x30\xfa\xfd\xbd\x40\x52\x08\xb8\x8d\x16\xde\x16\x22\xf2\
+\x3c\x95\x16\x82\x67\x72\x31\x0f\x5d\xb6\xd1\xc1\xcf\xe7\xdf\x93\
+\x35\xbe\x26\xe9\xf3\x2d\x2d\x71\x1d\x42\x5b\x20\x22\x89\xd2\x2f\
+\x2f\xe5\x67\x7e\x3d\x64\x27\x3a\x3e\x7d\xfb\xd2\xe1\x63\xbd\x53\
+\x88\x96\x7d\x4c\x73\x6f\xd3\xb2\xd7\x01\x8b\xbf\x8b\x3f\x8b\xac\
+\x61\xb9\x9b\x87\x0e\x01\x8e\x4f\xdf\xbe\xf4\xf4\xb3\xbd\x53\x48\
+\x4d\x63\x96\x06\x22\x12\x2a\xcd\x9f\xee\xcd\xdd\x3c\x74\x00\x30\
+\x34\x7d\xfb\xd2\xa1\xc1\xbe\x29\x35\xcd\xad\xef\x2a\x77\x81\x90\
+\x11\x99\x28\xcd\xbf\x50\x8c\x79\x48\xf9\x0c\x0c\x4e\xdf\x7a\xe7\
+\xf0\x50\xdf\x94\xa7\xe6\xae\xab\x75\x1b\x90\xac\xa8\xad\xdb\x86\
+\xf8\xaa\x1b\x36\x5e\xa4\xf9\xa6\x85\xf6\x7a\xee\xbb\x5a\xdd\xef\
+\x71\xfe\x46\xd6\x89\x53\xbe\xf3\x4c\x44\xd0\x18\xff\xf9\xf9\xbe\
+\xd9\x82\x7c\xaf\xcb\xa5\xf9\x91\x64\x71\x37\x31\xc3\x04\x32\x30\
+\xc5\x4f\x71\x7c\x0f\x32\x61\x8a\x09\x56\x17\xab\x3c\xfc\xf7\x61\
+\xc1\xd6\x63\xa5\x2a\xa1\xbf\xef\xae\xbe\x0f\xb6\xb5\xaf\x3f\xda\
+\x42\x0d\x56\x17\xab\xac\xdd\x5f\xf3\x75\xc0\x2f\xf7\x7e\xf0\xd3\
+\x58\x61\xce\x9b\x4a\x05\xb0\x7c\x7e\xf4\xe2\x5f\x2b\x7f\x5e\xde\
+\x0d\x02\x33\x56\x97\xaa\xac\xdd\x5f\xc3\x73\x0e\x39\xe7\xe4\x1f\
+\xf8\xaa\xef\xca\x42\x57\xef\xba\x69\x95\x7a\x21\x5b\x79\x6d\xe4\
+\xcd\x9d\x20\x8c\x38\xf3\x0f\xfe\x79\x90\x98\xc7\xf3\x1d\xf2\x3c\
+\x5f\x3e\x33\x7d\x9f\x2e\x16\x06\xd1\xd1\x4a\xbc\x1d\x84\x61\xac\
+\x2e\x54\xf8\x6f\xab\x79\xf0\x04\x92\xef\x49\x33\x47\x0b\x82\xe8\
+\xea\x54\x62\xf0\x8b\xf9\x77\x0f\xf5\x1f\x79\xcb\x10\xf7\x96\xfe\
+\xe0\xc1\xfd\x87\x3b\x99\x8f\xef\x63\x45\xf2\xbc\x52\x65\xf2\xc4\
+\xe3\xdd\x4a\x24\x7a\xea\xe2\x0f\x81\x77\xf0\x60\xe8\xf7\xf4\xb8\
+\x14\xe6\x93\x85\x22\x92\x94\x2b\x44\xa6\x73\xa1\x23\x6f\xff\x18\
+\xc8\x1d\x08\xe5\x9c\x4b\x61\x3e\x09\x18\x91\x23\x44\xe6\x83\xad\
+\xde\x0f\x6f\x05\xf2\xfc\x50\x9e\xe7\x52\x98\x4f\x94\x1b\x44\x66\
+\x00\x80\xfe\x2b\x0b\x81\xf9\x84\x48\x2e\x85\xf9\xf5\x72\x02\x32\
+\x43\xe4\x02\x00\xd0\xff\xc9\x42\x80\xef\x87\x24\xab\xfb\xee\xe6\
+\x13\x65\x86\xc8\x0d\x00\xa0\xff\xb3\xa5\x00\xe2\x99\xd8\x36\x80\
+\xb6\x0d\x97\x09\x22\xd7\x83\xad\xea\xeb\x27\xe7\x80\x33\xa0\x3a\
+\xa4\x32\x0f\xf1\x6b\xed\xcc\xd1\xab\xcb\x4f\xce\xe9\x74\xff\xd5\
+\xa5\x31\x99\x57\x06\xdb\x52\x4e\xbb\xa8\x2e\x59\x70\xf7\xfc\xf0\
+\xe3\x3f\x9d\xae\x4e\x9e\x9c\x35\x35\x26\x40\xf5\x94\xe6\x01\x9c\
+\x35\xbc\x27\xe7\x74\x3a\x86\xd0\x04\x50\x2f\x2a\x06\x14\xfc\xff\
+\x40\x75\x72\x68\xd6\x48\x0d\x51\x97\xd7\x78\xfc\xa7\xd3\x8f\xaa\
+\x3a\x39\x34\x6b\xd2\x19\x76\x87\x88\x80\x73\x9d\xd6\x3f\x14\xf4\
+\x10\x6f\xa7\xfe\xe9\x95\x40\x66\x1b\xeb\xc4\x86\x32\xb5\xd1\x3d\
+\x03\x80\x6d\x21\x9e\xac\x85\x2c\x8d\x06\xa6\x7f\x3b\x9d\x74\x1b\
+\x79\x8d\x0b\xdd\x94\xcd\xbe\xf6\x95\xa3\xfe\x07\x78\x75\xae\xc6\
+\x7c\xeb\x7c\x22\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x54\x1b\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x05\x2f\x00\x00\x01\x77\x08\x06\x00\x00\x00\x44\xda\xbe\xc0\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x03\x26\x69\x54\x58\x74\x58\x4d\x4c\
+\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
+\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
+\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\
+\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
+\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\
+\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\
+\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\
+\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\
+\x43\x6f\x72\x65\x20\x35\x2e\x36\x2d\x63\x30\x31\x34\x20\x37\x39\
+\x2e\x31\x35\x36\x37\x39\x37\x2c\x20\x32\x30\x31\x34\x2f\x30\x38\
+\x2f\x32\x30\x2d\x30\x39\x3a\x35\x33\x3a\x30\x32\x20\x20\x20\x20\
+\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\
+\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\
+\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\
+\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\
+\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
+\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
+\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
+\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\x20\
+\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\
+\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
+\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x20\x78\x6d\
+\x6c\x6e\x73\x3a\x73\x74\x52\x65\x66\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\
+\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\x73\
+\x6f\x75\x72\x63\x65\x52\x65\x66\x23\x22\x20\x78\x6d\x70\x3a\x43\
+\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\x64\x6f\x62\
+\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x43\x20\x32\
+\x30\x31\x34\x20\x28\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x78\
+\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\
+\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\x38\x46\x37\x45\x32\x46\x33\
+\x44\x35\x36\x43\x36\x31\x31\x45\x35\x38\x31\x39\x46\x44\x46\x31\
+\x36\x31\x46\x37\x42\x35\x37\x37\x31\x22\x20\x78\x6d\x70\x4d\x4d\
+\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\
+\x2e\x64\x69\x64\x3a\x38\x46\x37\x45\x32\x46\x33\x45\x35\x36\x43\
+\x36\x31\x31\x45\x35\x38\x31\x39\x46\x44\x46\x31\x36\x31\x46\x37\
+\x42\x35\x37\x37\x31\x22\x3e\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x44\
+\x65\x72\x69\x76\x65\x64\x46\x72\x6f\x6d\x20\x73\x74\x52\x65\x66\
+\x3a\x69\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\
+\x2e\x69\x69\x64\x3a\x38\x46\x37\x45\x32\x46\x33\x42\x35\x36\x43\
+\x36\x31\x31\x45\x35\x38\x31\x39\x46\x44\x46\x31\x36\x31\x46\x37\
+\x42\x35\x37\x37\x31\x22\x20\x73\x74\x52\x65\x66\x3a\x64\x6f\x63\
+\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\
+\x3a\x38\x46\x37\x45\x32\x46\x33\x43\x35\x36\x43\x36\x31\x31\x45\
+\x35\x38\x31\x39\x46\x44\x46\x31\x36\x31\x46\x37\x42\x35\x37\x37\
+\x31\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
+\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\
+\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\
+\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\
+\x22\x3f\x3e\x61\xd1\xa0\xd1\x00\x00\x50\x8b\x49\x44\x41\x54\x78\
+\xda\xec\xdd\x41\x52\xdc\x48\xda\x30\xe0\xc4\xe1\xfd\xc7\x1f\xc1\
+\xbe\xab\x4f\xd0\xf8\x04\x2e\x4e\x60\xbc\xf1\xd6\xc5\x82\xb5\xcd\
+\x09\x30\x27\xc0\x5e\x7b\x41\x79\xcb\xc6\xf8\x04\x2e\x9f\xc0\xf4\
+\x09\xba\x7a\xef\x88\x8f\x39\xc1\xf7\x2b\xa9\xac\x71\xb5\x1b\x63\
+\x40\x29\x29\x25\x3d\x4f\x84\x86\x9e\x99\xa6\x50\xa5\x52\xa9\xcc\
+\x57\x6f\x66\x6e\x05\xe8\xc0\xce\xe1\xf9\x76\xf5\x63\xf7\x17\xff\
+\xda\x24\x1d\x77\x75\x55\x1d\x97\xbf\xf8\x77\x2e\xbf\xbd\x7f\x71\
+\xe5\x0a\x00\x00\x00\x00\x94\x6f\x4b\x11\xf0\x10\x37\x04\x1f\xa7\
+\x1b\xff\xfc\x5b\xf8\x67\xd0\x71\x12\xee\x17\x84\x6c\xdb\x32\x1d\
+\x6b\xef\xbe\xbd\x7f\x71\xe1\x2a\x03\x00\x00\x00\x74\x4b\xf0\x92\
+\x7f\xd8\x39\x3c\x9f\x84\xef\x81\xc6\x69\xfa\xf9\x47\x75\x6c\xff\
+\xf0\xbf\x0d\xdd\xde\xb7\xf7\x2f\x16\x6a\x04\x00\x00\x00\x40\x77\
+\x1e\x2b\x82\x71\xd9\x08\x4e\xc6\xac\xc9\x18\x90\x5c\x07\x26\xd7\
+\xff\x3b\x2b\xd3\xea\x58\x28\x06\x00\x00\x00\x80\xee\x08\x5e\x0e\
+\xd0\x0d\x01\xca\xa7\xe9\xe7\xae\xd2\x01\x00\x00\x00\xa0\x2f\x04\
+\x2f\x7b\x6c\xe7\xf0\x3c\x06\x23\x27\x61\x15\x94\x5c\x67\x50\x4e\
+\x95\x0c\x00\x00\x00\x00\x43\x20\x78\xd9\x43\x29\x68\xf9\x39\x7c\
+\x5f\x87\x12\x00\x00\x00\x00\x06\xe7\x91\x22\xe8\xa5\xb3\x20\x70\
+\x09\x00\x00\x00\xc0\xc0\x09\x5e\xf6\x93\xb5\x2b\x01\x00\x00\x00\
+\x18\x3c\xd3\xc6\x61\x24\xd2\x72\x03\xc7\x61\x95\xb5\xfb\xa5\x3a\
+\x2e\xab\x63\xf1\xed\xfd\x8b\x2b\xa5\x03\x00\x00\x00\x94\x48\xf0\
+\x12\xc6\x63\x73\x9d\xd4\xe9\xfa\x7f\xdc\x39\x3c\x5f\x56\x3f\x16\
+\x61\x15\xd0\x8c\xc1\xcc\xa5\xa2\x02\x00\x00\x00\x4a\x20\x78\x99\
+\xd9\xce\xe1\xf9\x34\xac\x02\x43\x4f\xc3\x6a\x7a\x77\x0c\x16\x2d\
+\xaa\xe3\xb9\x0c\x37\x3a\xae\x97\x3f\x5b\x27\x75\x52\x1d\xb3\x74\
+\x08\x66\x02\x00\x00\x00\xc5\x10\xbc\xac\x61\xe7\xf0\x3c\x06\x83\
+\xa6\x61\x15\xa8\x8c\x3f\x7f\xb6\x16\x65\xfc\xff\x66\xd5\xf1\x56\
+\xa9\xd1\x03\x93\x20\x98\x09\x00\x00\x00\x14\x40\xf0\xf2\x1e\xee\
+\x11\xac\xbc\x89\xdd\xc1\xe9\xab\x49\xf8\x67\x30\xf3\x7a\xad\xcc\
+\xea\xf8\xf2\xed\xfd\x8b\x0b\xc5\x03\x00\x00\x00\x34\x45\xf0\xf2\
+\x17\xd2\x74\xdb\x67\xe1\xfe\xc1\x4a\x18\xaa\xdd\x74\xbc\xae\xee\
+\x8f\xf8\xdf\x17\xd5\xf1\x29\xac\xb2\x32\x2f\x15\x0f\x00\x00\x00\
+\x90\x8b\xe0\xe5\x0f\xd2\x8e\xcc\xd3\xb0\xca\xae\xdc\x57\x22\xf0\
+\x4b\xd3\x74\xac\xa7\x98\xc7\x6c\x4c\x59\x99\x00\x00\x00\x40\x6d\
+\xa3\x0f\x5e\x6e\x4c\x05\x5f\x67\x57\x4e\x54\x0b\x78\xb0\x78\xff\
+\xbc\x0e\xab\xac\xcc\xb8\x41\xd5\x22\xac\xb2\x32\x2f\x6c\x58\x05\
+\x00\x00\x00\xdc\xd7\x28\x83\x97\x3b\x87\xe7\x93\xb0\xca\xaa\x5c\
+\x07\x2c\x81\xfc\xb6\xd3\x7d\x16\x8f\xb3\xb4\x56\xe6\x87\xb0\x0a\
+\x64\x2e\x15\x0f\x00\x00\x00\xf0\x2b\xa3\x09\x5e\xa6\xe9\xe0\x2f\
+\xc3\x2a\x90\x32\x71\xe9\xa1\x75\xeb\xb5\x32\x4f\x05\x32\x01\x00\
+\x00\x80\xbb\x18\x74\xf0\x72\xe7\xf0\x7c\x9d\x5d\x19\x7f\xda\xed\
+\x1b\xca\x21\x90\x09\x00\x00\x00\xfc\xd2\xe0\x82\x97\x02\x96\xd0\
+\x3b\x02\x99\x00\x00\x00\xc0\x8d\x06\x11\xbc\x14\xb0\x84\xc1\xf8\
+\x31\x90\xf9\x2e\xd8\xec\x07\x00\x00\x00\x46\xab\xb7\xc1\x4b\x01\
+\x4b\x18\xbc\x18\xc4\x3c\x0b\xab\xcd\x7e\x2e\xaa\x9f\x9f\xbe\xbd\
+\x7f\x31\x57\x2c\x00\x00\x00\x30\x1e\xbd\x0a\x5e\xee\x1c\x9e\x4f\
+\xc3\xf7\x4d\x77\x04\x2c\x61\x3c\xae\x77\x2d\xaf\xda\x80\xd3\xea\
+\x67\x0c\x64\xbe\xfb\xf6\xfe\xc5\xa5\x62\x01\x00\x00\x80\x61\x2b\
+\x3e\x78\xb9\x73\x78\x3e\xa9\x7e\xbc\x0a\x76\x09\x07\x56\x2f\x2d\
+\x66\xf1\xa8\xda\x86\x65\xf8\x3e\xad\x7c\xa9\x68\x00\x00\x00\x60\
+\x78\x8a\x0c\x5e\xee\x1c\x9e\xaf\x03\x14\x31\xcb\x72\xd7\x65\x02\
+\x6e\x30\xa9\x8e\x98\x89\x79\x9a\xa6\x95\x7f\xf8\xf6\xfe\xc5\x85\
+\x62\x01\x00\x00\x80\xe1\x28\x2a\x78\x99\xd6\xb1\x5c\x4f\x0b\x07\
+\xb8\xab\xf5\xb4\xf2\x65\x58\xed\x56\x3e\x97\x8d\x09\x00\x00\x00\
+\xfd\xd7\x79\xf0\xd2\xb4\x70\x20\xa3\xd8\x86\x1c\xc7\x43\x36\x26\
+\x00\x00\x00\xf4\x5f\x67\xc1\xcb\x9d\xc3\xf3\x59\x58\x65\x59\x4e\
+\x5d\x06\xa0\x01\x3f\x66\x63\xbe\xfd\xf6\xfe\xc5\x95\x62\x01\x00\
+\x00\x80\xfe\x68\x35\x78\xb9\x91\x65\x39\x0b\x76\x0b\x07\xda\x11\
+\xdb\x9d\x75\x36\xe6\x3c\xd8\xa9\x1c\x00\x00\x00\x7a\xa3\x95\xe0\
+\x65\x5a\xcb\x32\x06\x2d\xa7\x8a\x1c\xe8\xd0\x2c\xac\x76\x2a\x5f\
+\x84\xd5\x94\xf2\xb9\x22\x01\x00\x00\x80\x72\x35\x16\xbc\x4c\x3b\
+\x86\xbf\x0e\xab\xa9\xe1\x13\x45\x0d\x14\x64\x1a\x8f\xaa\x9d\x8a\
+\x19\x99\xa6\x94\x03\x00\x00\x40\xa1\xb2\x07\x2f\x77\x0e\xcf\x77\
+\xc3\xf7\xa9\xe1\x00\x25\x9b\x84\xd5\x94\xf2\x57\x69\x83\x9f\x13\
+\xbb\x94\x03\x00\x00\x40\x39\xb2\x05\x2f\x6d\xc0\x03\xf4\x58\xcc\
+\x14\x8f\x6d\xd8\x2c\x05\x31\xe3\xba\x98\x0b\xc5\x02\x00\x00\x00\
+\xdd\xaa\x15\xbc\x34\x35\x1c\x18\xa0\xf5\x2e\xe5\x8b\xb0\xca\xc4\
+\x5c\x28\x12\x00\x00\x00\xe8\xc6\x83\x82\x97\x76\x0d\x07\x46\x60\
+\x1a\x56\xeb\x62\x2e\xc3\x2a\x88\x39\x57\x24\x00\x00\x00\xd0\xae\
+\x7b\x05\x2f\xad\x67\x09\x8c\xd0\xa4\x3a\xce\xd2\xe6\x3e\x82\x98\
+\x00\x00\x00\xd0\xa2\x3b\x05\x2f\xab\x41\xfb\x34\xac\x36\xb5\x98\
+\x2a\x32\x60\xa4\x26\x61\x23\x88\x59\x1d\x17\x76\x28\x07\x00\x00\
+\x80\x66\xdd\x1a\xbc\xac\x06\xe9\x71\xed\xb7\x98\x69\x39\x55\x54\
+\x00\xd7\x26\xd5\x71\x56\x1d\xa7\x55\x1b\xf9\xae\xfa\xf9\x56\x10\
+\x13\x00\x00\x00\x9a\x71\x63\xf0\x32\xed\x1c\x7e\x1c\x6c\xc2\x03\
+\xf0\x33\xdb\xa9\x9d\x7c\x25\x88\x09\x00\x00\x00\xcd\xf8\x47\xf0\
+\x52\xd0\x12\xe0\xde\xd6\x41\xcc\x67\xd5\xf1\x44\x71\x00\x00\x00\
+\x40\x3e\x8f\xe2\x7f\xc4\xa0\x65\x75\xfc\x15\x56\x53\x21\x27\x8a\
+\x05\xe0\xde\x76\xd3\xfa\xc0\x00\x00\x00\x40\x26\x8f\xab\xc1\x76\
+\x0c\x58\xce\x14\x05\x00\x00\x00\x00\x50\x92\x98\x79\x39\x53\x0c\
+\x00\x00\x00\x00\x40\x69\x1e\x29\x02\x00\x00\x00\x00\xa0\x44\x82\
+\x97\x00\x00\x00\x00\x40\x91\x04\x2f\x01\x00\x00\x00\x80\x22\x09\
+\x5e\x02\x00\x00\x00\x00\x45\x12\xbc\x04\x00\x00\x00\x00\x8a\x24\
+\x78\x09\x00\x00\x00\x00\x14\x49\xf0\x12\x00\x00\x00\x00\x28\x92\
+\xe0\x25\x00\x00\x00\x00\x50\x24\xc1\x4b\x00\x00\x00\x00\xa0\x48\
+\x82\x97\x00\x00\x00\x00\x40\x91\x04\x2f\x01\x00\x00\x00\x80\x22\
+\x09\x5e\x02\x00\x00\x00\x00\x45\x12\xbc\x04\x00\x00\x00\x00\x8a\
+\x24\x78\x09\x00\x00\x00\x00\x14\x49\xf0\x12\x00\x00\x00\x00\x28\
+\x92\xe0\x25\x00\x00\x00\x00\x50\x24\xc1\x4b\x00\x00\x00\x00\xa0\
+\x48\x82\x97\x00\x00\x00\x00\x40\x91\x04\x2f\x01\x00\x00\x00\x80\
+\x22\x09\x5e\x02\x00\x00\x00\x00\x45\x12\xbc\x04\x00\x00\x00\x00\
+\x8a\x24\x78\x09\x00\x00\x00\x00\x14\x49\xf0\x12\x00\x00\x00\x00\
+\x28\x92\xe0\x25\x00\x00\x00\x00\x50\x24\xc1\x4b\x00\x00\x00\x00\
+\xa0\x48\x82\x97\x00\x00\x00\x00\x40\x91\x04\x2f\x01\x00\x00\x00\
+\x80\x22\x09\x5e\x02\x00\x00\x00\x00\x45\x12\xbc\x04\x00\x00\x00\
+\x00\x8a\x24\x78\x09\x00\x00\x00\x00\x14\x49\xf0\x12\x00\x00\x00\
+\x00\x28\x92\xe0\x25\x00\x00\x00\x00\x50\x24\xc1\x4b\x00\x00\x00\
+\x00\xa0\x48\x82\x97\x00\x00\x00\x00\x40\x91\x04\x2f\x01\x00\x00\
+\x00\x80\x22\x09\x5e\x02\x00\x00\x00\x00\x45\x12\xbc\x04\x00\x00\
+\x00\x00\x8a\x24\x78\x09\x00\x00\x00\x00\x14\x49\xf0\x12\x00\x00\
+\x00\x00\x28\x92\xe0\x25\x00\x00\x00\x00\x50\x24\xc1\x4b\x00\x00\
+\x00\x00\xa0\x48\x82\x97\x00\x00\x00\x00\x40\x91\x04\x2f\x01\x00\
+\x00\x00\x80\x22\x09\x5e\x02\x00\x00\x00\x00\x45\x12\xbc\x04\x00\
+\x00\x00\x00\x8a\x24\x78\x09\x00\x00\x00\x00\x14\x49\xf0\x12\x00\
+\x00\x00\x00\x28\xd2\x63\x45\x00\x00\x00\xc0\xd0\xec\x1c\x9e\x4f\
+\xaa\x1f\x93\x5f\xfd\x7b\xdf\xde\xbf\x58\x28\x2d\x80\x72\x09\x5e\
+\x02\x00\x00\xd0\x5b\x3b\x87\xe7\xbb\xd5\x8f\x78\xfc\x91\x7e\xc6\
+\x63\xfb\x1e\xbf\xbf\xfe\xc7\xcb\xea\x58\x56\xc7\x9f\xd5\xb1\x88\
+\xff\xfd\xdb\xfb\x17\x57\x4a\x18\xa0\x5b\x82\x97\x00\xf4\x71\x90\
+\xf2\x57\xb8\x43\x26\xc5\x1d\xed\x75\x99\x71\x51\x7d\x97\xaf\x69\
+\x90\x55\xc7\xb2\xfa\x0e\xbf\x67\x3c\xa7\xff\xab\xf3\xfb\xd5\xb9\
+\x6c\x75\x54\x96\xc5\x9e\x77\x75\x6e\x6f\xaa\x1f\xc7\x3d\xae\xa7\
+\x31\x08\xf0\xf9\x81\x75\xb5\xd1\x73\xaf\x7b\xdd\x33\x58\xa6\x63\
+\xed\x4b\x75\xc4\x60\x47\x0c\x82\x14\x1d\xf8\xa8\xca\x6e\x9a\xae\
+\xeb\x50\x2c\xaa\xf2\xde\x1b\x70\x59\x5d\xa6\xba\xb5\xae\x77\x7f\
+\x6f\xd4\xb3\xe5\x08\xfb\x02\xfb\xd5\x8f\x67\xd5\x11\x7f\x6e\x67\
+\xfa\xd8\x75\xe0\x73\x7f\xdd\x66\x57\x7f\x27\x96\xf1\xa7\xea\xb8\
+\xa8\xca\xf9\x72\x00\xf7\xed\x5e\xd7\x99\xa6\xd5\x77\x38\xab\x7e\
+\xcc\x1e\xf0\xab\x27\xd5\xb9\xbf\xd1\x06\x96\xd7\x5e\x0e\xb1\x2c\
+\x73\xf6\x0b\xab\xf2\x89\x65\x33\x1d\x69\x5d\xcb\xd2\xe6\x08\x5e\
+\x02\xd0\x47\x27\xd5\x71\x96\xe9\xb3\xe2\xe0\xa4\x93\x4e\xfc\x46\
+\xa6\x48\x8e\xf2\x80\x26\x1d\x67\xaa\xab\x43\x34\x09\xff\x7c\x99\
+\x32\xfd\xe1\x3e\xbf\x4c\x6d\xcc\x87\x12\x02\x1f\xf4\xda\xee\x2d\
+\xcf\x93\x65\xaa\x67\x9f\xaa\x7a\x76\x31\xd4\x02\x48\xcf\xcd\x57\
+\x21\x6f\xc0\xf2\x2e\xe5\x1e\x8f\xe3\x74\x3f\x7f\xa8\x8e\xb9\x8c\
+\xcc\x07\x5f\xc3\x59\x78\x58\xe0\x12\x18\x31\x1b\xf6\x00\xd0\x3b\
+\xd5\x80\x61\x1e\xf2\x05\x1c\xa7\xe9\x6d\x71\x17\x5e\x65\xf8\x8c\
+\x65\x2a\x0f\x68\x6a\xa0\x19\x83\x04\xaf\x95\xc4\x83\xed\xa6\xf2\
+\xfb\x1a\xb3\xc6\xab\xe3\x75\xca\x64\x85\x9c\x26\x61\x15\x10\xfa\
+\x58\xd5\xaf\xff\x8d\x99\x6d\x69\xbd\xc7\xa1\xb4\x43\xd3\x94\xb9\
+\xf4\x35\x7d\xcf\xed\x0e\xef\xe7\xd3\xea\xf8\x6b\x68\x65\xdc\xd2\
+\x75\x9c\xa4\xf2\x03\xb8\x17\xc1\x4b\x00\xfa\x2a\x67\xb6\xe1\x71\
+\xdb\x27\x9f\x82\x17\xb3\xc2\xca\x01\x6e\x1a\x68\x9e\x29\x89\x6c\
+\xd6\x03\xf7\xeb\x20\xa6\xe2\xa0\x21\xeb\xe7\x4b\xef\x03\x6c\x31\
+\xd3\x32\x05\x2d\x4b\x9b\x72\xb9\x59\xc6\xa7\x5e\x48\xdc\xd9\xc7\
+\xd0\x5d\xe0\x19\xe8\x31\xc1\x4b\x00\x7a\x29\xad\x9d\x32\xcf\xf4\
+\x71\x5d\x64\x5f\xce\x32\x7c\xc6\x95\xac\x4b\x1a\x76\x66\xa0\xd9\
+\x88\x58\xa6\x31\xe0\xf1\x59\xe6\x16\x2d\x3c\x6b\x62\x80\xed\x4d\
+\x9f\x02\x6c\xf1\x5c\x63\x50\x30\xac\x32\x2d\xa7\x85\x9f\xee\xeb\
+\x54\xc6\x33\xd5\xed\xd6\x6b\xfa\x26\x58\x7e\x04\x78\x20\xc1\x4b\
+\x00\xfa\xac\xcf\xd9\x97\x39\xa6\x8c\xbf\x53\x05\x68\x78\xa0\x39\
+\x55\x12\x8d\x8a\xe5\xfb\x35\xad\xe3\x07\x4d\x8a\xcf\xb8\xcf\x7d\
+\xa8\x6b\xe9\x65\x62\xdc\x98\xaf\x4f\xd9\xc9\x31\x30\x7c\xe6\x85\
+\xc4\xad\xd7\xf4\x58\x49\x00\x0f\x25\x78\x09\x40\x6f\xa5\xdd\x55\
+\x73\x05\x30\x5b\xcb\xbe\x4c\x6b\x08\xd6\x1d\xdc\xc4\x8d\x02\xde\
+\xaa\x05\x34\x54\x47\x77\x0d\x34\x5b\x13\x83\x1e\x5f\x65\x6d\xd1\
+\x82\x78\x5f\x7f\x2e\xb9\xae\xa5\x6c\xcb\xcf\xa1\xbf\x19\xdf\xd3\
+\x74\x3f\xef\xab\x6e\xff\xbd\xa6\xf1\x5a\x7e\x54\x12\x40\x1d\x82\
+\x97\x00\xf4\x5d\x0c\xe0\xe5\xda\xf1\xb3\xad\x60\xcd\xcb\x0c\x9f\
+\xf1\xce\x4e\xa7\x18\x68\x0e\xca\xa9\x0c\x4c\x5a\xb0\xce\x10\x9c\
+\x95\xd6\xee\x54\x47\x6c\x77\x5e\x0f\xa4\x8c\x3f\xa6\xec\x75\x2c\
+\x3f\x02\x64\x20\x78\x09\x40\xaf\xa5\x00\x5e\x6f\xb2\x2f\xd3\x74\
+\xb2\xba\x19\x19\xb2\x2e\x69\x7a\xa0\x39\x51\x0c\xad\x5b\x07\x3c\
+\x0c\xf2\x69\xe5\x3e\x2f\x25\x80\x99\xea\xfc\xe7\x0c\xcf\xc6\xd2\
+\x1c\x8f\x7d\x0a\x79\xda\x98\x4c\x16\x2a\x50\x9b\xe0\x25\x00\xbd\
+\xf7\xed\xfd\x8b\x18\xc8\x5b\xe6\x1a\x6c\x34\x7c\xba\x39\xd6\xba\
+\x9c\xcb\xba\xa4\xa1\x81\xe6\xcc\x40\xb3\x53\x93\xb0\xda\x8d\x1c\
+\xda\xd0\x79\x00\x73\x23\x70\x39\xc4\xac\xe3\xa3\xb4\xbc\xcd\x58\
+\x9f\x27\xbb\xda\x33\x20\x17\xc1\x4b\x00\x86\xe2\x20\xd3\xe7\x34\
+\x9d\x7d\x99\x63\xa0\x68\xa3\x1e\x0c\x34\x87\x6b\x66\xc3\x0f\x5a\
+\x74\xda\x55\x7d\x1b\x78\xe0\xf2\x22\xbd\x58\x1d\xeb\xf3\xe4\x7a\
+\x79\x02\xb7\x17\x90\x8b\xe0\x25\x00\x83\x50\x0d\x12\x16\xd5\x8f\
+\x45\xa6\x8f\x6b\x24\xfb\x32\x65\xb8\xd4\x9d\x12\x3a\x1f\x73\x26\
+\x07\x8d\xb2\x2e\x59\x39\x6c\x96\x44\x5b\xba\x0c\x32\xc5\x35\x2e\
+\x87\x18\xb8\x8c\xcf\xe8\x83\x91\xd7\xab\xd3\x81\x5e\x5b\xa0\x23\
+\x82\x97\x00\x0c\xc9\x51\xa6\xcf\x69\x2a\xfb\x32\xc7\x46\x3d\x27\
+\x2e\x33\xb9\xa5\x1d\x7e\x0d\x34\xcb\x31\xb3\xf6\x25\x2d\x9a\xb6\
+\x3d\x7d\x3c\xb5\x39\xd3\x01\x96\x65\x5c\xd2\xe5\xf9\x98\x97\x76\
+\x49\x3b\xad\xcf\xdc\x56\x40\x4e\x8f\x15\x01\x00\x43\x51\x0d\x16\
+\x2e\xab\x4e\xf3\x3c\x53\xa7\x39\x66\x3e\x2d\x32\x76\xe6\x77\x33\
+\x0c\xd4\x64\x5d\xd2\xd4\x40\xf3\xf5\x48\xbf\x7e\xbc\x9f\x3e\xd4\
+\xfc\x8c\xa7\xe9\xe7\x34\xf3\xb9\xc5\xcf\xbb\x50\x43\x69\x49\x7c\
+\xe6\xcd\x07\xd4\xe6\x5c\xa6\x67\xf8\xdf\xe9\x9f\x37\xff\xf7\xf8\
+\x62\x60\xf2\xc3\xbd\xf6\x3f\xe9\x67\xdd\x97\x38\x71\x9d\xcb\xcb\
+\x11\x3f\x4f\x62\xb9\x9a\x2e\x0e\x64\x27\x78\x09\xc0\xd0\xc4\xcc\
+\xc4\xfd\x50\x7f\xfa\xeb\x75\xf6\x65\x9a\x8e\x9e\xc3\xab\x4c\xdf\
+\x0d\x72\x0e\x34\xc7\xbe\x2e\xd9\xb2\xba\xc7\xdf\x64\x2c\xcf\xfd\
+\x74\xaf\x4f\x33\x7c\x5c\x0c\x8a\x96\x1e\xbc\x8c\xd9\xee\x25\x05\
+\x6a\x4a\xce\x76\x9b\x87\xfa\x81\xf2\x49\x3a\xfe\x48\x75\x2c\x67\
+\x76\xee\x24\x66\x5f\x56\xf7\xc3\xbc\xc7\x6d\xce\x22\x95\xf1\xc5\
+\x2f\x32\x1f\xe3\xff\xb7\xfc\xe1\xf7\x7e\xbc\x8f\x9f\x3d\xa0\x2f\
+\x31\x6f\xba\xfc\x7a\xe0\x63\xe8\xd7\xf2\x23\xcb\x86\xfb\x56\x2f\
+\xc3\x3f\x03\xe5\x25\xf5\xfb\x96\x03\x6c\x23\x4b\x16\xbf\xdb\x97\
+\x06\x3f\xff\xb8\x66\x5d\xf8\x50\x7a\x5d\x13\xbc\x04\x60\x50\x62\
+\x66\x62\x35\xf0\x78\x17\xf2\xac\x19\x97\x25\xfb\x32\x0d\xd6\xea\
+\xee\xe0\xbc\x90\x75\x89\x81\x66\xf1\xed\x4f\x0c\x36\x5e\xa4\x29\
+\xb8\x75\x03\x34\x7d\x98\xc6\x7f\x99\xf1\x05\xcf\xd0\xfd\x9d\xbb\
+\xac\x52\x3d\x8b\xcf\xa9\x49\xa6\x8f\x7c\x15\x9a\xcf\xbe\x3c\x6d\
+\xa0\xcd\x89\xf7\xdd\x49\xae\x8c\xc7\xf5\x7d\x5c\x1d\x07\xa9\x8c\
+\x63\x00\x6a\xfa\xab\x7b\x21\xe4\x5b\xba\xa6\x97\xaa\xb2\x7a\x13\
+\x7a\xb6\xfc\x48\xea\x57\xbd\x69\xb0\x4c\x9e\xd6\xb9\x3f\x73\xbe\
+\x5c\x1b\x63\x1b\x59\x58\x5d\x9b\x37\x7c\xff\xd5\x0a\x5e\xf6\xa1\
+\xae\x59\xf3\x12\x80\x21\x8a\x3b\x7c\x2e\x33\x7c\xce\x34\xd3\x2e\
+\xac\xb3\x0c\x83\x35\x59\x97\x34\x31\xd0\x9c\x2a\x89\xc6\x06\x29\
+\x75\x03\x19\xd6\x20\xe5\x97\xf5\xac\x3a\x7e\x0f\xf9\x82\x66\xbb\
+\x69\x89\x93\xa6\xda\x9c\x69\xc8\xbb\x16\x62\x7c\xce\xef\x55\x65\
+\xf0\xbc\xa9\xa9\xda\xa9\x8c\xf7\xe2\xdf\xb9\xa5\x5f\x11\x33\x39\
+\x0f\x46\xbe\xce\x65\xbc\xb6\x36\x1a\x03\x1a\x23\x78\x09\xc0\x10\
+\x07\x74\x71\x00\x91\x2b\xd8\x97\xa3\x33\x5e\x77\xca\xf8\x42\x76\
+\x13\x99\x07\x9a\xbb\x06\x9a\x8d\xb7\x43\x75\x5f\xa2\xc8\x88\xe5\
+\x3e\x75\x2d\xd7\xee\xd6\xfb\x0d\x9e\x6a\xce\x36\x67\x5e\x1d\x4f\
+\xda\x7a\x36\xc6\xbf\x93\x02\xc5\x37\xf5\x2d\xc6\xbe\xce\x65\x6c\
+\xab\x3e\xba\x13\x81\x26\x09\x5e\x02\x30\xd4\xc1\x5c\x1c\xd8\xe4\
+\x18\x4c\xcc\xea\x64\x5f\xa6\x6c\x84\x49\xcd\x73\x90\x75\x89\x81\
+\x66\x3f\xd9\x70\x87\x36\x9f\x79\x39\x32\x30\x9f\x36\xd4\xee\xc4\
+\x67\xe1\x34\xd3\xc7\xc5\x60\x61\x27\x99\x8e\x69\x6a\xe5\x93\xf0\
+\xfd\xc5\x84\x75\x2e\x57\x4b\x64\x78\xd9\x02\x34\x4a\xf0\x12\x80\
+\x21\xcb\x35\x95\xae\x4e\xb6\x48\xdd\xac\x4b\x6b\xca\xd1\xc4\x40\
+\x73\xa2\x18\x5a\xf1\x45\x11\xd0\x96\x94\x81\x59\xf7\x79\x31\x6d\
+\xe8\xf4\x72\x65\x5d\x1e\xa4\xef\xd9\x65\x39\xc7\x17\xa3\x31\x80\
+\x19\x03\x97\x07\x63\xae\x73\x3b\x87\xe7\x71\xd7\xf8\x7d\x77\x1f\
+\xd0\x34\xc1\x4b\x00\x86\x3c\x90\x5b\x64\x18\xc8\x45\x0f\xca\xbe\
+\x4c\xbf\x53\xb7\x53\xff\xce\x95\x24\xe3\x40\x73\x66\xa0\xd9\xaa\
+\x2b\x45\x40\xcb\x6a\x3f\x33\x72\xaf\x7b\x99\x9e\x85\xd3\x0c\x1f\
+\x55\x4c\x96\x63\xcc\xfa\x14\xb8\xbc\xae\x27\xa7\x6e\x39\xa0\x0d\
+\x82\x97\x00\x0c\x5d\xae\xc1\xc5\x43\xb2\x46\x66\x35\xff\xe6\xd2\
+\x74\x34\x0c\x34\x7b\x6d\xa2\x08\x68\x53\xda\x29\xfb\xaa\xb0\x7a\
+\xfb\x2a\xc3\x67\x5c\x8e\x3d\x58\x58\xd8\xf3\x24\x4e\x13\x3f\x53\
+\x12\x40\x5b\x04\x2f\x01\x18\xfa\x40\x6e\x19\x56\xbb\x8f\xd7\xf5\
+\x90\xec\xcb\xba\x03\x36\x6b\x5d\x92\x93\x75\xc9\xda\xf7\x47\x8d\
+\xdf\x5d\x28\x3e\x1e\xa8\xee\x5a\xab\xb9\x77\x1c\xcf\x91\xed\xfd\
+\xdc\x65\x2d\xca\x69\x03\xf5\x04\xe0\xa7\x04\x2f\x01\x18\x83\x18\
+\x04\xcc\x31\x7d\xf3\xce\xd9\x97\x69\x7a\x6e\x9d\x40\x91\xac\x4b\
+\xb2\xa9\xea\xa3\x81\x66\xfb\x65\x1e\xef\xff\x59\x8d\x8f\xb8\x54\
+\x8a\x3c\xd0\xdf\x05\xdd\x07\xd3\x90\x61\xd3\xba\xf4\x22\x92\x32\
+\xae\xe9\x7e\xa8\x3f\xb3\x04\xe0\x5e\x04\x2f\x01\x18\xbc\xb4\x23\
+\x69\x8e\xb5\x23\xef\x93\x7d\xf9\xb2\xee\x60\xcd\x95\x23\xe3\x40\
+\xf3\xb5\x92\x68\x5d\x0c\x18\xd7\x79\x81\x61\xb3\x1f\x1e\x6a\x59\
+\xd0\xb9\x3c\xab\xf9\xfb\xf1\xf9\xfd\xd6\x25\x2d\xe6\x79\x12\xfb\
+\x40\xa6\x8b\x03\xad\x13\xbc\x04\x60\x14\xbe\xbd\x7f\xf1\x26\xd3\
+\x80\xee\x97\xd9\x97\x69\x6d\xc1\x69\xcd\xc1\xda\x85\xab\x46\x86\
+\x81\xa6\x75\xc9\xba\x29\xf7\x18\xb8\x9c\xd5\x69\x03\xd2\xda\x85\
+\xf0\x10\xcb\x82\xce\x65\x5a\xf3\xf7\xdf\xa5\x17\x90\x94\xe1\x63\
+\xb0\xfc\x08\xd0\x01\xc1\x4b\x00\xc6\x24\x47\x36\xe3\x5d\xb2\x2f\
+\xeb\xae\x75\x69\xb0\x46\x49\x03\xcd\xa5\x62\xbc\x9b\x98\xe5\x5a\
+\x1d\x9f\x43\xfd\x4c\xd7\x77\x4a\x93\x1a\x76\x0b\xb9\x1f\xb6\x33\
+\x9c\xcb\xdc\xe5\x2c\xa6\x7d\x7b\x93\xe1\x7a\x7a\x9e\x00\x0f\xf2\
+\x58\x11\x00\x30\x16\x71\x0d\xc9\xaa\xf3\x1d\xa7\x73\x4f\x6b\x7e\
+\x54\xcc\xbe\x3c\xb8\x65\xb0\x56\x67\x73\x82\xde\x4f\x91\x4b\xc1\
+\x1b\xca\x18\x68\xd6\xad\xeb\x71\xa0\x79\x14\x56\x41\xd0\x21\x9a\
+\xa4\x72\xaa\xe3\xb7\xb0\x5a\xd3\x2f\x0e\xea\x73\x64\x24\xf5\xa9\
+\x0d\xf8\x5c\x95\x5f\x97\x7f\x7f\x51\xb5\xeb\x7b\xee\xf6\x7f\x29\
+\x25\x33\xae\x6e\xa0\xeb\xd2\x5a\x97\xc5\x3c\x4f\xa6\xe1\x1e\xeb\
+\x7e\xdf\x22\x6e\xbc\xf4\x55\x89\x72\x53\xdf\xba\xaa\x67\xc7\x5d\
+\x9e\x40\xd5\xde\x6c\xb9\x0c\xe5\x12\xbc\x04\x60\x6c\x62\xf6\xe5\
+\xb4\xe6\x67\xc4\xec\xcb\x9f\x6d\x20\x30\xab\x39\x70\x1c\x42\xd6\
+\xe5\x54\x35\xeb\x7c\xa0\xb9\x9b\x71\xa0\x39\xe4\x29\x82\x93\x4c\
+\xe5\x94\xd3\x91\xcc\x6b\x6a\x7a\x5a\xf3\xf7\x73\xd5\xbf\xba\xcf\
+\x82\x4f\x2e\x65\x11\xcf\x93\x5c\xcb\x8f\xc4\xb6\xed\xb2\xe3\x17\
+\x1e\x40\x4f\x99\x36\x0e\xc0\xa8\x54\x1d\xe7\x45\xc8\x33\x0d\xed\
+\x67\x01\x8f\xba\x53\xc6\x6d\x4c\x40\x8e\x81\x66\x8e\x4c\xc9\x18\
+\xa0\xb7\xe3\x75\xbb\xe6\x31\x43\x5c\x31\x50\xf3\xfe\x9f\xd6\xfc\
+\x98\x5c\xf7\xfd\x6f\x35\x7f\x7f\xe1\x8a\x16\x21\x06\x2e\x27\x35\
+\x3f\xe3\xa2\x6a\xdb\xf4\x6f\x80\x07\x13\xbc\x04\x60\x8c\x1a\x59\
+\xfb\x32\x4d\xab\xaa\xd3\xc1\x9f\xcb\xb8\x22\x83\xd3\x0c\x03\xcd\
+\x45\xda\xe4\x8a\xf6\xc4\xfb\xff\x40\x31\x50\xd3\xeb\x0c\x9f\xb1\
+\xcc\x74\x2e\xb5\xda\xa1\xf4\xb2\x91\x0e\x55\xfd\x9a\x58\x9f\xf6\
+\x6b\x7e\x4c\xec\xd7\x68\xdb\x80\x5a\x04\x2f\x01\x18\x9d\x34\xdd\
+\x3b\x47\x00\xf3\xc7\xec\xcb\xba\x59\x97\x27\xae\x0e\x35\x07\x9a\
+\xb3\x50\x6f\x97\xeb\xf5\x40\xf3\xb9\xd2\x6c\x4d\x2c\xef\x23\x81\
+\x4b\x32\xdc\xff\xdb\x19\x9e\x43\xcb\x42\xd6\x99\xf4\x22\xaf\xfb\
+\xfa\x94\x6d\xf9\x11\x2f\x66\x81\xba\x04\x2f\x01\x18\xab\xb7\x19\
+\x06\x47\xff\xcd\xbe\x4c\x3f\xeb\x64\x27\xcc\x6d\x4c\x40\xcd\x81\
+\x66\xac\x83\xa7\x06\x9a\xbd\x73\x60\x3a\x25\x99\xc4\xcd\xd2\xea\
+\xae\x51\xbb\xc8\x78\x3e\xd3\x1a\xbf\x6b\xc9\x8a\x6e\x9f\x27\xeb\
+\x75\x2e\xeb\xd6\xa7\x13\x19\xb4\x40\x0e\x82\x97\x00\x8c\x52\x0a\
+\xce\xe4\xcc\xbe\x9c\xd5\xed\xe0\xbb\x2a\xd4\xf4\x31\xc3\x40\xf3\
+\xad\x81\x66\xfb\xd7\x6d\xe7\xf0\xfc\x73\xca\x9a\x85\x7b\x8b\x81\
+\xa6\xea\x88\x81\xa6\xdd\x0c\x1f\xf7\x45\x89\x92\xfa\x36\x75\xeb\
+\x93\xe5\x47\x80\x6c\x04\x2f\x01\x18\xad\x94\xed\xb4\xac\xf9\x31\
+\xb3\xb4\xd6\xe5\xcb\x1a\x9f\x21\xeb\x92\x5a\xaa\x3a\x78\x9a\x61\
+\xa0\x79\x59\xd5\xc3\x23\xa5\xd9\x89\xd8\x86\x9c\xa5\x20\xe6\xae\
+\xe2\xe0\x1e\xf7\x7e\xac\x2f\x31\xe3\x72\x96\xe1\xe3\xe2\x4b\xbd\
+\x0b\xa5\x3a\xfa\x3a\x15\x67\x91\xbc\xce\x50\x97\x2c\x85\x01\x64\
+\x23\x78\x09\xc0\xd8\xe5\xe8\x5c\xc7\x81\xe3\xa4\xc6\xef\x7f\x70\
+\x19\xa8\x31\xd0\x9c\x66\x1a\x68\x5a\xe7\xb2\x7b\xf1\x5a\x7e\x95\
+\x85\xc9\x5d\xee\xfb\x94\x6d\xf9\x35\xe4\xc9\xb8\x8c\x2e\x2c\x19\
+\x31\xfa\x7a\x15\xfb\x32\x67\x39\xfa\x56\x5e\xca\x02\x39\x3d\x56\
+\x04\x00\x8c\x59\x9c\x22\x5b\x75\xd6\x17\xa1\xde\xda\x5c\x75\x2c\
+\x4c\xd3\xa5\xc6\x40\x33\x4e\x13\xff\x68\xa0\x39\x38\x31\x0b\xf3\
+\xa9\x4d\x7c\x06\xe5\xb7\xf4\xa2\xe1\xa1\x26\xe9\xf8\x23\x3d\xaf\
+\xb6\x1b\x38\x47\xcb\x97\x90\x63\x9d\xcb\xb8\xfc\x88\x0c\x5e\x20\
+\x2b\xc1\x4b\x00\x08\x21\x4e\x95\xfd\xda\xd1\xdf\x36\x58\xa4\x8e\
+\x1c\xeb\x5c\xce\x0d\x34\x8b\x14\x97\xa4\xf8\xdb\x9a\x71\xc3\xb9\
+\x9e\x21\xcf\xd4\xee\xa6\x58\xbe\x64\xe4\xaa\xf6\x26\xb6\x35\xd3\
+\x9a\x1f\x63\xf9\x11\xa0\x11\xa6\x8d\x03\x30\x7a\x55\x47\x3b\xee\
+\x6a\x3a\xef\xe0\x4f\xcb\xba\xa4\xce\x40\xf3\x75\x8e\x81\x66\x58\
+\x05\xef\x29\xd3\x71\x5a\x7f\x0e\x9a\x74\xd5\x50\x3b\xb0\xac\xf1\
+\xbb\xd6\x7e\x6d\xf7\x79\x12\x9f\x25\xc7\x19\xea\x91\x6c\x71\xa0\
+\x11\x82\x97\x00\xb0\x72\x92\x3a\xde\x6d\x7a\xa7\xd8\x79\xe0\x40\
+\x33\x0e\xec\x4f\x33\x7c\xd4\x81\x35\xee\x8a\x77\x96\x96\x07\x80\
+\xa6\x34\xd5\x0e\x2c\x6b\xfc\xee\xb6\x7a\xdf\xda\xf3\x24\x96\x73\
+\x8e\x75\x2e\x8f\xd2\xcb\x60\x80\xec\x4c\x1b\x07\x80\x70\x9d\x7d\
+\xb9\xac\x3a\xf0\x31\x98\x78\xdc\xd2\x9f\x5c\x9a\xaa\x4b\x8d\x81\
+\x66\x8e\x75\x2e\x0d\x34\xf3\x67\x9e\xc6\xa0\x72\xbc\x3e\x39\xd7\
+\x25\xdc\x4e\xed\x92\x0c\x59\x9a\x50\xf2\xb2\x11\xf1\x7e\x5a\xb8\
+\x44\x8d\x8b\x81\xcb\x49\xcd\xcf\x88\x9b\x3d\xcd\x15\x25\xd0\x14\
+\xc1\x4b\x00\xf8\xee\x6d\x75\xbc\xcc\xd0\x89\xbf\x8b\x21\xaf\x75\
+\xd9\xd5\x60\x73\x3a\x92\x7a\x7a\x9a\x69\xa0\xf9\xd6\x2d\x1f\xae\
+\x32\x2f\xdd\xf0\x8f\xcf\x4a\x53\xbe\x5f\x65\xa8\x9b\xaf\xab\xcf\
+\x3a\x29\x30\x4b\x76\xcf\xd2\x17\xbd\xd6\xf4\xb2\x11\x5f\x6a\xd6\
+\xfd\x67\x41\xf0\xb2\x51\x69\xf9\x91\xba\x4b\x53\x2c\x83\xe9\xe2\
+\x64\xe8\x17\x5b\xe3\x99\xdb\x08\x5e\x02\x40\x12\x03\x03\x31\x40\
+\x10\xf2\x4c\x9f\xba\xb5\xa3\x3f\xe4\x0c\x85\xea\xbb\xed\x75\x34\
+\x08\xfb\xbf\x11\x0c\x34\x67\xa1\xfe\xa6\x1f\x06\x9a\xed\xdd\x0b\
+\x31\xa3\xed\x22\x05\x08\xea\x4e\xf3\x8f\xd7\x5d\xc0\x99\x5c\x62\
+\xe0\x72\xaf\xe1\x80\x78\xdd\xcf\x9e\xba\x4c\x8d\x3e\x4f\x62\x66\
+\x6b\x8e\xd9\x26\xcf\x2d\x3f\x02\x34\xcd\x9a\x97\x00\xb0\x21\x05\
+\x15\x9b\x9e\x4a\x6b\x87\x71\x1e\x32\xd0\x9c\x04\xeb\x5c\xf6\xb5\
+\x5d\x89\x41\xc7\xba\x19\x6e\x2f\x95\x24\x99\xb4\x11\xb8\x0c\x19\
+\x9e\xa5\xbb\x29\xc0\x46\xfe\xe7\xc9\x7a\x9d\xcb\xba\x4b\x5b\x58\
+\x7e\x04\x68\x85\xe0\x25\x00\xdc\xd0\x19\x6f\xf0\xb3\x97\xd6\x85\
+\xe2\x81\x3e\x66\x18\x68\x9e\x98\xe6\xdb\x8d\x14\xc0\xac\x53\xf6\
+\xbb\x36\x30\x21\x83\xf8\xfc\x69\x23\x70\x19\x32\xb5\x35\xaf\x5c\
+\xb2\x46\xc4\x8c\xcb\xba\x81\xe1\x85\xe5\x47\x80\xb6\x08\x5e\x02\
+\xc0\xcd\x03\xae\x45\x43\x1f\xff\x41\x09\xf3\x00\xa7\x99\x06\x9a\
+\x6f\x14\x65\xa7\xea\xde\xff\xb2\xd0\x78\xa8\x18\xac\x8c\x59\xd7\
+\x6d\x67\x5e\xd7\x7d\x96\xce\x52\xd6\x39\xf9\xc4\xb5\x44\x5f\x67\
+\xa8\x4f\xcf\x15\x25\xd0\x16\xc1\x4b\x00\xb8\x59\x13\x6b\x02\xc6\
+\xce\xbe\x2c\x05\x1e\x62\x37\x43\xdd\x33\xd0\xec\xde\x45\xc7\xf5\
+\x80\x71\x9a\x57\xc7\x93\x8e\xb2\xfe\xbf\x64\xf8\x8c\x63\x97\x30\
+\xab\xd7\x19\x3e\xc3\x3a\x97\x40\xab\x04\x2f\x01\xe0\x06\x55\xa7\
+\x7c\x19\xf2\x07\x1a\xdf\xe9\xec\xd3\x11\xeb\x5c\x96\xd1\xae\xd4\
+\xbd\x06\xa6\x8d\x73\x1f\x31\x58\xbe\x97\xb2\x2d\x97\x1d\x9e\x43\
+\x5d\x31\xfb\x72\xea\x72\x16\xc3\xf2\x23\x40\xeb\x04\x2f\x01\xe0\
+\x96\x0e\x7a\xa8\xbf\x5b\xea\x9a\xac\x4b\xba\xf2\x36\xed\x7a\x0d\
+\x0c\xdf\x32\x3d\x6b\x7e\xaf\xee\xfb\xe7\x5d\x07\x99\xd2\x66\x2e\
+\xcb\x0c\x1f\x75\x56\xe2\x9a\xaf\x23\x5c\x87\xf6\xd2\xf2\x23\x40\
+\x17\x04\x2f\x01\xe0\xe7\x83\xae\x18\x70\x7c\x97\xe9\xe3\xe6\x32\
+\xdf\xe8\x68\xa0\x79\xa4\x18\x60\xd0\x16\x61\xf5\xb2\x2d\x4e\x0d\
+\x8f\x41\xcb\xa3\x0e\x33\x2d\x6f\x92\x63\xad\xe7\x49\x58\xed\x8e\
+\x5d\x8c\xb4\x13\xfa\x5f\xd5\xcf\xd9\x48\xea\x99\xe5\x47\x80\xce\
+\x3c\x56\x04\x00\xf0\x73\x31\xc3\xa0\x1a\x98\xbc\x4c\x03\xa7\x3a\
+\xde\x29\x4d\x0c\x34\xc7\xcd\xd4\xd7\x51\x5b\x86\x3c\x19\x88\xeb\
+\x35\x24\xaf\x33\x1a\x53\x66\x63\xe9\xe6\x21\xcf\xba\x95\xfb\xd5\
+\x3d\x74\x16\xa7\xc1\x17\x70\x2f\xcf\xc2\xf7\x60\xea\x69\xf5\xdf\
+\x2f\x7b\x72\x2d\xea\x38\x28\x2c\x28\x0e\x8c\x88\xe0\x25\x00\xfc\
+\x5a\xdd\x69\x61\x73\x1d\x7e\x3a\x70\xa4\xde\x15\xe7\x59\xcd\xdf\
+\x97\xbd\xdd\x5f\x1f\xc6\x3a\xdd\x36\xb6\x43\x3b\x87\xe7\xf3\xea\
+\x1f\x67\x19\x3e\x2e\xae\x7f\xb9\x6e\xdf\x5a\xbf\x1f\xd2\x34\xf1\
+\xd3\x1f\xbe\x4b\xfc\xdf\x3e\x56\xff\xdf\x93\x01\xcf\xb0\xb0\xfc\
+\x08\xd0\x29\xd3\xc6\x01\xe0\xf6\x81\xca\x2c\xd4\x0f\x5e\x9e\x28\
+\x49\x5a\x36\xef\x68\x67\x61\x7e\xde\x96\xc4\x76\x64\x56\xf3\x63\
+\x2e\x95\x24\x3d\x95\xf3\x39\x18\xef\xa3\xcf\x69\xda\x76\x9b\xf7\
+\xf0\x7e\xf5\xe3\xeb\x4f\xee\xe3\x49\x75\x7c\x1c\xe8\xb5\xbb\xd4\
+\x8f\x01\xba\x26\x78\x09\x00\xb7\x7b\x59\xf3\xf7\x65\x5d\xd2\xb6\
+\x58\xdf\xac\x73\x59\x90\x14\xb8\xfc\x1c\xea\xbf\x08\x11\xbc\xa4\
+\x97\xd2\x73\x70\x9e\xf1\x23\x63\xe0\x32\x06\x30\xdf\xb4\x70\xff\
+\x4e\xab\x23\xde\xbf\x31\x38\x39\xb9\xe5\x5f\x8d\xff\xde\xd9\xc0\
+\x2e\x5d\xcc\x24\x3d\xb0\x66\x37\xd0\x35\xc1\x4b\x00\xf8\xf9\x80\
+\xe5\x75\x1c\x8c\xd4\xfc\x18\xd9\x0a\xb4\xed\xb9\x81\x66\x51\xed\
+\xc8\x75\x90\x25\xac\x82\x2d\x75\x2c\x5d\x57\x7a\x2e\xf7\xf3\x30\
+\xbe\x0c\x38\xae\xee\xb1\xeb\x4d\x73\x72\xef\xfc\x1d\x33\x2d\x53\
+\xd0\xf2\xf3\x3d\xfa\x02\xb3\x81\x6d\xe0\x73\x32\x82\xb5\x3c\x81\
+\x1e\xb0\xe6\x25\x00\x63\x0b\x22\xc4\x01\xc8\xc5\x6d\xd9\x90\x69\
+\x00\x14\x37\x17\x78\x5d\xf3\x4f\x2e\x64\x5d\xd2\xb2\x23\x03\xcd\
+\x22\xda\x9a\x49\x6a\x6b\x5e\x86\xfa\x2f\x40\xd6\x4a\x5c\x6f\xee\
+\x65\xa1\x9b\x10\xc5\xb6\x77\xa1\x26\x96\x25\xad\x7d\x79\x12\xf2\
+\x6c\xde\xb3\x29\xde\x6f\x31\xe3\x31\x6e\x9c\x13\xef\x93\x4f\x0f\
+\x59\x9f\x31\x3d\xfb\x63\x7d\x8e\x6b\xd3\xc6\x29\xe2\x0f\x0d\x86\
+\x9e\x0d\x64\x03\x9f\xd8\x57\x7a\xab\xe6\xd2\x92\xa7\x6d\x64\x52\
+\x3f\xc0\xd2\x32\x3c\x65\x10\xbc\x04\x60\x4c\xf6\xd3\xa0\xe9\x7a\
+\x67\xd0\xb0\x9a\x82\xf9\x77\xf8\xbe\x09\x46\x1c\xa8\xfc\x91\x06\
+\x2f\x39\x32\x38\x64\x5d\x62\xa0\x59\xb6\xdd\x94\x59\x95\xcb\x24\
+\xdc\x3e\xad\xb4\x8e\x0f\x05\x96\xdf\xac\xe0\x6b\xbb\x50\xbd\xcb\
+\x13\x37\x2d\xaa\xee\xb9\x18\x1c\x6c\x62\xbd\xca\xf5\xba\xb2\xeb\
+\x4d\x7d\x16\xe9\x39\xff\x9f\xf4\xf3\xc7\xcc\xe5\x69\xfa\xf9\xb4\
+\x81\x7b\x37\x4e\x69\xff\xbd\xc7\xd9\xd2\xcb\xea\x38\x50\x63\x69\
+\xd1\x34\xe4\x7b\xd9\x97\xfb\x59\x32\x77\x79\xba\x27\x78\x09\xc0\
+\x98\x3c\xdd\xf8\xe7\xdd\x86\x06\x4f\xff\xed\xec\xc8\xfc\xa1\x45\
+\x57\x06\x9a\x0f\xb2\x5d\xe8\x60\xe9\x47\x4b\x19\xb5\x0c\x48\x6c\
+\xab\x72\xac\x01\xfb\x2b\xd3\x0e\xef\xef\xeb\x75\x6e\x77\x0e\xcf\
+\xf7\x7a\x1a\xc0\xb4\xfc\x08\x50\x14\x6b\x5e\x02\x30\x0a\x1b\xd3\
+\xc1\xda\x22\xeb\x12\x03\x4d\xb4\x27\xf0\x83\x14\x88\x1f\xc3\xa6\
+\x62\xf1\x05\xe9\x69\x1f\xdb\x1b\x2f\x4b\x80\xd2\x08\x5e\x02\x30\
+\x16\xd3\x16\xff\x96\xac\x4b\xda\x1e\x68\xaa\x6f\xc3\x75\x69\xbd\
+\x2d\x86\x26\xd5\xe9\x31\x2c\x73\xd1\xb7\x0d\x7c\x62\xff\xe5\x8d\
+\x1a\x0a\x94\x46\xf0\x12\x80\xb1\x78\xda\xe2\xdf\x3a\x52\xdc\x18\
+\x68\x92\x89\xe5\x00\x18\xa4\xaa\xed\x8a\xcf\xca\xf9\xc0\xbf\xe6\
+\x32\xac\xd6\xdb\xec\x83\x98\xbd\xff\x5c\xcd\x04\x4a\x24\x78\x09\
+\xc0\x58\x4c\x5b\xfa\x3b\x6f\x4d\xb7\xa2\xc5\x81\xa6\xc0\xd6\xb0\
+\x1d\x68\x4f\x18\xb2\xaa\x7e\xc7\x36\x6c\x3e\xd0\xaf\x17\xef\xdd\
+\x27\x3d\xba\x87\x2d\x3f\x02\x14\x4b\xf0\x12\x80\xc1\x4b\xeb\x5d\
+\xee\xb6\xf0\xa7\x96\xc1\xda\x74\xb4\x27\x06\xb6\x96\x8a\x61\xb0\
+\xde\x9a\x2e\xce\x18\x0c\x34\x80\x19\xbf\x4f\x9f\x36\xeb\x79\x6b\
+\xf9\x11\xa0\x64\x82\x97\x00\x8c\xc1\x7e\x4b\x7f\xe7\x40\xd6\x02\
+\x2d\x0e\x34\x2f\x14\xc3\x60\x9d\xa4\x29\xb5\x30\x0a\x29\x80\x39\
+\x84\x4c\xf2\xab\xd4\x17\xe8\x53\x7f\xe0\x52\x7b\x03\x94\x4e\xf0\
+\x12\x80\x31\x68\x63\xbd\xcb\x23\x59\x0b\x18\x68\x52\xd3\x3a\xf0\
+\xf1\x46\x51\x30\x36\x29\xd3\xf8\x49\xe8\xcf\x1a\x91\x3f\x8a\x7d\
+\x80\x27\x3d\xcb\x98\xb6\xce\x25\xd0\x0b\x82\x97\x00\x8c\xc1\xb4\
+\xe1\xcf\x9f\x57\x83\x95\xb7\x8a\x99\x96\x06\x9a\xd6\xb9\x1c\xa6\
+\x45\xe8\x5f\xe0\x03\xb2\x4a\xeb\x43\xee\x85\x7e\x2d\xc1\xb2\x0c\
+\xab\xf5\x22\xf7\x7a\xb8\x94\x87\xe5\x47\x80\x5e\x78\xac\x08\x00\
+\x18\xb2\x9d\xc3\xf3\x49\xf5\x63\xd2\xe0\x9f\x98\xa7\xe9\x6e\xd0\
+\x86\x23\x1b\xb8\x0c\xce\x22\xac\xa6\x89\x2f\x14\x05\x5c\x07\x30\
+\xe3\x4b\x9a\x37\xd5\xf3\x7b\x5e\xfd\x3c\x0d\xed\x2d\xfd\x72\x5f\
+\xf1\x3c\xdf\x85\xd5\x32\x1e\x7d\x5c\x32\x66\x6e\xf9\x11\xa0\x2f\
+\x04\x2f\x01\x18\xba\x26\x07\x3d\x02\x97\xb4\xe9\x42\x56\xde\x60\
+\xc4\x40\x47\x0c\x1a\x7c\x10\xb4\x84\x9b\xa5\x8c\xc0\xe7\x3b\x87\
+\xe7\x71\xc3\xbd\x57\xd5\x31\x2b\xe4\xd4\xe2\x79\x9d\xa4\x36\xb9\
+\xaf\xeb\x5c\xc7\x97\x60\x96\x1f\x01\x7a\x43\xf0\x12\x80\xa1\xfb\
+\xa3\x81\xcf\x5c\xaf\x4b\x27\x63\x81\x36\x07\xcb\x02\xe5\xfd\x16\
+\x83\x05\x8b\xea\xf8\xa2\xed\x80\xbb\x4b\xd9\xe6\x07\x3b\x87\xe7\
+\x31\x60\x38\xab\x8e\x97\xa1\xd9\x19\x15\x3f\x7b\xee\x0f\xe9\x85\
+\x83\x0d\x06\x81\x5e\x11\xbc\x04\x60\xe8\x83\x9e\x38\xe0\xf9\x90\
+\x06\x3b\x31\x0b\x73\xbb\xe6\xe0\xa5\xcf\x53\xc4\xee\x6a\xe1\xbc\
+\xb3\x5b\xd6\x3c\xbf\xa3\x0e\xeb\xdc\x55\xcd\x73\xbf\x1a\xd9\x75\
+\x8f\xd7\xfa\xef\xf4\xcf\x31\xe8\x72\x55\x70\xb0\xe3\xaa\xc7\xf7\
+\xfb\xaf\xae\x41\x69\x65\xb5\x0c\xd4\x7d\x9e\xc7\x32\x7c\x13\x56\
+\x53\xca\x77\xd3\x33\xfd\x59\x75\xec\x36\xf4\x27\x4b\x7d\xe1\x50\
+\xb7\x2e\x7e\xe8\x78\xf9\x91\x31\xdd\x47\x63\x5a\xe6\x65\xa8\xcf\
+\x93\xbe\x5c\xc3\xc5\xd0\xbf\xe3\x56\xd5\xf0\xff\x9f\x47\x61\x2b\
+\x4e\x72\xed\x1c\xe9\x9a\xf5\xeb\x7a\x95\xa0\xaa\x33\xd3\xea\xc7\
+\x67\x97\xb5\x71\x7b\xa6\xff\xf5\xe2\x7e\x88\x83\x9c\x78\x4f\xc4\
+\x8c\xcc\x49\x1a\xf4\x6c\xff\xa2\xa3\x7c\x3d\x78\x09\xfd\x9e\x22\
+\x06\x00\x43\x7c\xae\x6f\xa7\x67\x79\x7c\xb6\xff\x76\xc7\x67\xfb\
+\x8f\x03\xf7\xab\xf4\xf3\xef\xf4\xf3\xd2\xf3\x1e\xa0\x1c\x32\x2f\
+\x01\x18\x95\x94\x6d\x70\xf9\x93\x01\xd0\xe6\x60\xc7\xc0\x05\x00\
+\xca\x7f\xae\xaf\x33\xbe\x16\x3f\x79\xb6\xaf\x83\x9b\x6b\x57\x36\
+\x3e\x03\xe8\x17\xc1\x4b\x00\xf8\x3e\x00\x32\x98\x01\x80\x61\x3d\
+\xdb\x87\x3a\x9d\x15\x60\x34\x1e\x29\x02\x00\x00\x00\x00\xa0\x44\
+\x82\x97\x00\x00\x00\x00\x40\x91\x04\x2f\x01\x00\x00\x00\x80\x22\
+\x09\x5e\x02\x00\x00\x00\x00\x45\x12\xbc\x04\x00\x00\x00\x00\x8a\
+\x24\x78\x09\x00\x00\x00\x00\x14\x49\xf0\x12\x00\x00\x00\x00\x28\
+\x92\xe0\x25\x00\x00\x00\x00\x50\x24\xc1\x4b\x00\x00\x00\x00\xa0\
+\x48\x82\x97\x00\x00\x00\x00\x40\x91\x04\x2f\x01\x00\x00\x00\x80\
+\x22\x09\x5e\x02\x00\x00\x00\x00\x45\x12\xbc\x04\x00\x00\x00\x00\
+\x8a\x24\x78\x09\x00\x00\x00\x00\x14\x49\xf0\x12\x00\x00\x00\x00\
+\x28\x92\xe0\x25\x00\x00\x00\x00\x50\x24\xc1\x4b\x00\x00\x00\x00\
+\xa0\x48\x82\x97\x00\x00\x00\x00\x40\x91\x04\x2f\x01\x00\x00\x00\
+\x80\x22\x09\x5e\x02\x00\x00\x00\x00\x45\x12\xbc\x04\x00\x00\x00\
+\x00\x8a\x24\x78\x09\x00\x00\x00\x00\x14\x49\xf0\x12\x00\x00\x00\
+\x00\x28\x92\xe0\x25\x00\x00\x00\x00\x50\x24\xc1\x4b\x00\x00\x00\
+\x00\xa0\x48\x82\x97\x00\x00\x00\x00\x40\x91\x04\x2f\xfb\xe9\x52\
+\x11\x00\x00\x00\x00\x30\x74\x82\x97\xfd\x74\xa5\x08\x00\x00\x00\
+\x00\x18\x3a\xc1\xcb\xf6\x3c\x55\x04\x30\x78\x5e\x2c\x00\x00\x00\
+\x40\x46\x82\x97\x00\x99\x7c\x7b\xff\xc2\x92\x0e\x00\x00\x00\x90\
+\x91\xe0\x25\x00\x00\x00\x00\x50\x24\xc1\x4b\x00\x00\x00\x00\xa0\
+\x48\x82\x97\xed\x99\x64\xfc\x2c\x53\x53\x01\x00\x00\x00\x18\xbc\
+\x18\xbc\x5c\x2a\x86\x56\x4c\x32\x7e\xd6\x7f\x14\x27\x14\x67\xa1\
+\x08\x00\x00\x00\x20\x2f\xc1\x4b\x00\x00\x00\x00\xa0\x48\xa6\x8d\
+\xb7\x68\xe7\xf0\x7c\x3b\xd3\x47\x99\x36\xde\xbc\xff\x51\x04\x00\
+\x00\x00\x00\xdd\x8a\xc1\xcb\x2b\xc5\xd0\x9a\xdd\x4c\x9f\xe3\x9a\
+\xf5\xe7\x5a\x95\x62\xea\x92\x36\xee\x8b\x22\x00\x00\x00\x80\xbc\
+\x62\xf0\xf2\x4f\xc5\xd0\x3b\x4b\x45\xd0\xb8\xc9\xc0\xbe\xcf\x6f\
+\x2e\x29\x00\x00\x00\xd0\x37\xa6\x8d\xb7\x2b\x4b\x36\xdf\xb7\xf7\
+\x2f\x96\x8a\xb2\x71\x93\x8c\xd3\xfc\x07\x53\xf7\xb8\xd5\x42\x11\
+\x00\x00\x00\x40\x5e\x31\x78\x69\xfd\xc4\xf6\xe4\x0c\x86\x2d\x15\
+\x67\xe3\xa6\x43\xf8\x12\x29\x08\x2b\x78\x09\x00\x00\x00\xf4\x8e\
+\x35\x2f\xdb\x95\x73\x13\x98\xa5\xe2\x6c\xdc\xb3\x81\x7c\x8f\xa9\
+\x4b\xd9\xbc\x6f\xef\x5f\x2c\x94\x02\x00\x00\x00\xe4\x25\x78\xd9\
+\xae\x9c\xd9\x6f\x32\x66\x9b\xb7\x3f\x90\xef\xf1\xcc\xa5\x6c\x9c\
+\x76\x14\x00\x00\x00\x1a\xf0\xf8\xdb\xfb\x17\x97\x3b\x87\xe7\x4a\
+\xa2\x1d\x39\xa7\x8d\xff\xad\x38\x9b\xbf\x5e\xd5\xbd\xb1\x5f\xdd\
+\x23\x17\x7d\xfd\x02\x69\xca\xf8\xcc\xa5\x6c\x9c\x97\x09\x70\xbf\
+\x76\x69\x37\x3d\x13\xef\xf2\x52\x6f\xb9\x3e\xac\xf9\x0c\xc0\x08\
+\x9e\x93\x9b\xcf\xc8\xbb\x8c\x1f\xaf\x52\x5f\xf4\x2a\x8e\xed\x95\
+\xa0\xba\x73\x8f\xba\xb3\x88\xff\x61\x06\xd9\x68\xeb\xcb\xf4\x1e\
+\xfd\xf1\xce\xdb\x99\xc7\x1b\x27\xb2\xed\xf2\x35\x4e\xe6\x65\xff\
+\xbc\xaa\x8e\x8b\x1e\x9f\xff\xcc\x25\x6c\x85\xfb\xb1\xdf\x0f\xed\
+\x41\xd5\xc5\xaa\x43\x71\x55\x58\x19\xc7\x67\x5f\x2c\xe7\xa7\xe9\
+\x39\x38\xa9\xf1\x59\xeb\x8e\x76\xbc\xe7\xbe\x94\xfa\x72\x69\x88\
+\x6b\x0d\xf7\x65\x60\x93\xab\xec\x4b\xf8\xbe\x19\xbe\x4b\xab\x01\
+\xff\x0c\xe7\xdb\xc8\x80\x68\x80\xf7\x63\xf6\x72\x2a\xe5\x59\x38\
+\xc6\x00\x4a\x55\xf6\xf1\x99\x18\x67\x7b\xfd\x91\xea\xe9\x6e\xcd\
+\xcf\xbb\xbe\xf7\xd7\xcf\xc9\xf8\xcc\x6c\x23\xd0\x90\xe1\x3e\x6b\
+\xad\xff\x92\xb9\xbe\x77\xf6\x62\x35\x95\xf9\xba\x7f\x35\x7d\x60\
+\xf9\x1f\xff\x50\x6f\xe2\x3d\xf8\x67\x1c\xff\x96\xf8\xc2\x78\x23\
+\x38\xab\x7f\xf5\xb0\xb6\x66\xb3\xbe\x64\xeb\x8f\xa7\x76\xa6\xf1\
+\xfb\xf7\xf1\xc6\xc0\x7b\x68\x03\xb8\x62\x1f\x50\x99\x1a\x02\xc1\
+\x92\x76\x4c\x33\x5e\xb3\x2e\xbc\x72\x09\x5b\x21\x13\xba\xbf\x3e\
+\x0f\xec\xfb\xec\xa5\xce\x44\x09\x9d\xcb\x97\x69\x40\x36\xc9\xfc\
+\xf1\xd3\x74\xbc\x4e\x9d\xa7\x18\xc0\xfc\x94\x3a\xda\xa5\x04\x6e\
+\x77\x07\x58\xb7\xb6\x7a\x72\x9e\xa7\x21\xc3\x8b\xbb\xaa\x6e\x1d\
+\x54\xf5\x69\xde\xf3\x7a\x74\x52\x1d\x6f\x7a\x74\xbe\x8b\xd4\x86\
+\xb9\x1f\xdb\x2f\xa7\x22\xca\x67\x63\x36\xe0\x32\x7c\x0f\xc0\xfd\
+\x99\x06\xc6\xcb\xa1\x5c\xc0\x86\x9f\x91\x21\x7d\xe6\x24\x7d\x7e\
+\xfc\x7b\xcb\x54\x6f\x3e\x34\x18\x28\xa9\x7b\x9f\xb5\xd2\x7f\xa9\
+\xca\xe2\x75\x7a\x4e\xe4\x70\xd5\x50\x9b\x75\xdb\xf9\x6f\xa7\xeb\
+\xfa\x2c\xe4\x5f\xe2\x6c\xb2\xf1\xfc\x3c\x4d\xf5\x26\xf6\xb1\xde\
+\x15\x74\xff\x9d\x86\xe1\xc5\xad\xb6\x1a\xac\x2f\xeb\x76\xe0\x65\
+\xc8\xff\x12\xef\xbf\xfd\xf1\xf4\xb7\xae\xdb\x98\x26\xfb\xe3\x9b\
+\x99\x97\xb4\x63\x12\x32\x6c\xb6\x13\x2b\x44\x55\x41\x64\xcc\xb6\
+\xd7\x48\x3e\xef\x61\xc7\x68\xd6\x50\x87\x88\x7f\xf3\x32\x01\xbe\
+\xb7\x3b\x2f\x5b\xee\x58\xee\xa7\x23\x76\xb4\xe7\x85\x75\xb2\x69\
+\x7f\x50\x37\xcb\xf4\x71\xb1\x1e\xcf\x95\x2a\x74\x36\x5e\x9a\x6c\
+\x3e\x4b\x0a\x0d\xa4\x3c\xe4\x19\xf9\x2a\xb4\x9f\x09\x3c\x49\x6d\
+\xe3\x2c\x95\xe3\xbb\xd8\xbe\x95\x36\x53\xa3\x85\xf2\xdf\x0d\xf9\
+\x02\x97\xd1\x51\x5b\xd3\x67\x53\x10\xea\x38\xf5\x77\xb6\x5b\xac\
+\x37\x31\x30\xf5\x7a\x1d\x98\x2a\xe0\xa5\x1e\x77\xab\x2f\xd3\xd4\
+\xd6\xb4\xb9\x87\xc7\x34\x1d\x67\x1b\xfd\xf1\xac\xf7\xc7\xa3\xf4\
+\xf3\x4f\x97\xb8\x35\xa6\x8e\xf7\xcf\x7e\xdf\xa6\x96\xa6\x01\xdc\
+\xa9\x4b\xd7\x0e\xeb\xc4\xa0\x93\x74\x1e\x07\x44\x7f\xc5\x0e\x4b\
+\xe8\xee\x8d\xf8\x76\xea\x64\xff\x55\x9d\xcb\x59\xea\xe8\x33\x2e\
+\xb3\x9c\x9d\xf0\x34\xd0\x05\xca\x30\xd9\x68\xe3\x3f\xf7\xa5\x6f\
+\x1e\xfb\xe4\xd5\xf1\xa6\x3a\xfe\x37\x3d\x23\x77\x0b\x28\xc7\xd3\
+\x54\x8e\x6f\xd2\x98\x61\x0c\xfd\x94\xf8\x3d\x3f\x66\xfc\xc8\xb7\
+\x6d\x04\xf2\x62\x5f\x26\xf6\x69\xe2\xf5\x4a\xcf\xb8\xae\xae\x57\
+\xbc\xdf\x62\xdf\xea\xaf\x14\x84\xa7\xcc\x7a\x1e\xfb\x2e\x31\x03\
+\x3a\x1e\x5d\x6e\x3e\x1c\xeb\xc8\xd7\xdc\x6d\xf5\x3a\x78\xb9\x74\
+\xa9\x5b\xf3\x5b\xc6\xcf\xfa\xa2\x38\x5b\x73\xd6\xb3\x87\xfb\x71\
+\x90\x95\xdb\x16\x2f\x11\xd0\x49\x5a\x0d\xc8\x26\x05\x9d\xda\x6c\
+\x6c\x03\x33\xae\xbd\x2a\xfc\xf3\x80\x3c\xe2\x60\x38\x0e\x8a\x3f\
+\x96\xfc\xa2\x2a\x05\x79\xbe\x16\xda\x2f\xdf\x4e\xe7\x75\xfd\xac\
+\x1c\x41\x9d\xf9\x98\xb1\x9f\x12\x97\x31\x38\x6a\xb8\xee\x6c\xa7\
+\xeb\xb2\x0e\x5a\x96\x62\x92\xc6\xc5\x5f\x07\xb8\x6e\x7c\x9f\xfb\
+\xe3\x31\xc8\x1d\xeb\xf8\xe7\x50\xd6\xb4\xfa\x75\x5b\x9d\x25\xa9\
+\x40\xf0\xb2\x7d\x39\xdf\xb6\x2d\x14\x67\xab\x0d\xf5\x71\x4f\x1a\
+\xaf\xf8\x96\xe5\xb5\x4b\xd6\x1a\xf7\x21\x63\xec\x24\xc5\x4e\xf5\
+\x69\x81\x9d\xa4\x1f\xc5\x76\x5b\x07\x7b\x1c\x75\x72\x1a\xf2\x07\
+\xd0\xf7\x05\xbf\xa1\x68\xfb\xa9\x8d\xdf\x2f\xe9\xa4\x62\xd6\x76\
+\xa1\x2f\xf6\x6e\x72\x1d\xc4\x1c\x72\x30\x2a\x05\x01\x73\x7d\xb7\
+\x65\x68\x78\x39\xb1\x74\x1d\xbe\x16\x3e\xf6\xbc\x5e\xe3\x34\xf6\
+\x05\x3d\x27\x8b\xa8\xdf\x5f\x43\xb7\x99\x96\xbf\x32\x4b\x6d\x75\
+\xad\x18\xc5\x3a\x78\x29\x73\xa8\xdd\x1b\x3d\x17\xd7\xad\x5d\xaf\
+\x4b\x4f\x93\x4f\x53\xdc\xce\x5c\xaa\x56\x59\x76\x83\xb1\x75\x92\
+\x76\x53\x27\xa9\x2f\x2f\x49\x26\xeb\x0e\xb6\xab\x37\x68\x4d\x64\
+\x49\x6e\x17\x3e\x18\x00\x56\xf7\xe9\xc7\xba\x83\xe2\x8c\xcf\xc8\
+\xd7\xe9\x19\x39\xed\xe1\x18\xf5\xf3\xd0\xb2\x30\x53\x20\x30\x67\
+\x10\xf0\x79\x93\x6b\x85\x6e\xbc\x18\x9e\xf4\x65\x7c\x1c\x56\x41\
+\x29\xcb\xac\xb4\x5f\xb7\x27\xe9\x25\x49\x5f\x66\x5c\x5e\x2f\x6b\
+\x97\x32\xe6\x1f\x74\xbe\xd7\xc1\xcb\xb1\x2d\xd6\xdb\xf5\x45\xcb\
+\xf5\x76\x22\x5d\x37\x01\xcc\x76\x9d\x95\xda\x38\xa7\x7a\x75\x16\
+\x4c\x17\x6f\xdb\x42\x11\x30\xa2\x8e\xd2\x2c\x0d\xca\x26\x3d\x3c\
+\xfd\xd7\x29\xb3\x44\x1b\x39\xc0\x0e\x7c\x68\x2e\xc8\x78\xac\x84\
+\xa1\x17\x4e\xbb\x0c\xbc\xa5\x19\x09\x71\xda\x66\xdf\x5f\x94\x1d\
+\xa7\x75\xea\x7a\xff\xac\x6c\x60\x9d\xcb\x83\xa6\x36\xe8\x49\xf5\
+\xa7\x4f\x2f\x86\x37\xc5\x67\xf0\x57\x6b\x61\xb6\x5a\xb7\xa7\xa1\
+\x9f\x2f\x49\x42\xf8\x9e\x31\x7f\xef\x98\xca\x23\x03\xf0\x4e\x98\
+\x3a\xde\x6f\x9f\x4b\x0b\x60\xa6\x87\xf3\xe7\xd0\xfd\x22\xe0\x63\
+\xb3\xb4\xab\x31\x23\xea\x28\xc5\x97\x23\x7d\xcf\xec\xde\x0d\x32\
+\x04\x86\xa8\xc9\x01\xd3\xc4\xb2\x03\xd0\x1b\xc7\x5d\x04\x50\x36\
+\xfa\xe1\x43\xc9\xd4\x9e\x0e\xe4\x59\x19\xaf\x49\xae\x20\xec\xbc\
+\xa9\x0d\x7a\x52\x39\xff\x35\x80\x71\xdc\xd9\x48\xd6\x4f\xed\xba\
+\x3f\x3e\xcb\x5c\xb7\xbb\x30\x09\x0f\x88\xa9\x6c\x06\x2f\x0d\xc0\
+\xdb\x1d\x3c\xe5\x62\xd3\x9e\xf6\x6d\xa7\x9b\xad\x88\xc1\x8c\xc0\
+\x65\xa7\x16\x8a\x80\x91\x74\x94\x62\xd0\x72\x36\x90\xaf\xf3\xa0\
+\x0e\x13\x45\x7b\xd9\xf3\xcf\x07\xf2\x39\x6d\x73\x13\x9f\x01\x05\
+\x9e\x6e\x1a\xef\xf4\xb9\xdf\x72\x9a\xf1\x9a\x5c\x7e\x7b\xff\xe2\
+\xa0\xc1\xfa\xd3\xf7\x40\xd4\xa6\xe3\xd4\x67\xa4\x99\xfa\x12\xfb\
+\xe2\x43\x29\xdf\x58\xe7\xef\x95\xb1\xbb\x19\xbc\xb4\x6e\x5b\x7b\
+\xfe\xc8\xf8\x59\x0b\xc5\xd9\xd9\xcd\xf6\xb9\xeb\xf5\x75\x06\xdc\
+\x61\xea\x0b\x2f\x0f\x18\x43\x47\x69\x48\x81\xcb\x1f\xdb\x70\x6d\
+\xe7\x30\x3a\xf2\x93\x86\xff\xcc\xcc\x72\x03\xd0\xab\xf6\xbd\x95\
+\xc1\xfd\x00\x03\x4f\x9b\x8e\x9a\x9a\x22\xdd\xc2\x75\xc9\xb9\x79\
+\x69\x5c\xa6\x6d\x4f\xfd\xb9\xf7\x33\xd3\x3a\xe3\xf9\xeb\xcb\x9b\
+\x30\xcc\xbd\x2d\x4e\xef\xda\x1f\xdf\x0c\x5e\x5a\x3b\xb1\x3d\xd9\
+\x06\x4b\xd6\xbd\x2c\xe2\x66\xfb\xd8\xc5\xa0\x66\x63\x67\x31\x03\
+\xaa\xee\x2c\x14\x01\x03\xef\x28\x0d\x31\x70\xf9\x8f\x01\xae\xa0\
+\x54\xef\xb5\x95\x15\xf9\x5a\x51\x43\x6f\x4c\x9b\x9e\x21\x35\xf0\
+\xb5\xe6\x1b\x9b\x22\xdd\x42\xbf\x25\xf7\xe6\xa5\x7b\x4d\xec\x0f\
+\x32\xf0\xc0\xf7\xf5\x33\xd3\x1a\x98\x59\xeb\x4b\x2c\xcb\xa1\xae\
+\xc1\x7d\xe7\x84\x02\xc1\xcb\x6e\xec\x66\x1e\x2c\x7d\x52\xa4\x9d\
+\x8a\x6f\xf7\xfe\x6a\xab\x81\x8e\x9d\xb1\xb4\xa0\xb3\x4d\x04\xba\
+\x75\x69\xbd\x4b\x06\xde\x51\x8a\xc1\x9a\xa1\x77\x3c\x63\x47\xe9\
+\xa3\xab\xdd\xdb\x3a\x3a\x09\xed\x2d\x56\x6f\xea\x38\xf4\xcb\xab\
+\x86\x3f\x7f\xa8\x4b\x36\xc5\x98\xc0\x51\x4f\x9f\x09\xb9\x03\xca\
+\x8d\x6c\xd0\xb3\xb1\xe4\xd7\xd0\x5f\x9e\x9e\x59\x33\x3a\x4b\x7d\
+\xd9\x0f\xc3\xcc\xb8\xdc\x74\xbd\xb9\xd6\xaf\x62\x64\x8f\xd7\xff\
+\x10\xdf\x28\x54\xff\x72\x1c\x88\x4f\x54\x91\xd6\x06\x4c\x8b\x4c\
+\x9f\x75\x11\x04\xb2\x4a\xb8\xe1\x62\x03\x1d\xaf\xc3\x49\x13\x6f\
+\x2b\x53\xe3\x7f\x1c\xfa\xb9\xab\xd8\x10\x2d\x14\x01\x03\xee\x28\
+\xc5\x76\xe6\xb4\xa5\xfb\x28\xf6\x3d\xfe\xbe\xe1\xff\xfb\x2d\xf5\
+\x49\x76\x1b\xee\xe0\xc7\x17\x42\xa7\x55\xbb\x7d\xe4\xca\x0b\x4e\
+\xdc\x22\x6e\xdc\xb3\x5f\xd5\x93\x0b\xc5\x0e\xbd\xb0\x1f\x07\xc2\
+\x0d\x65\xcd\xe5\x5c\x4f\xf1\x2e\x96\xe1\xdf\xfb\x53\x6c\x37\x70\
+\x0e\xb1\xac\x0e\x9a\x28\xb3\x96\xe4\xbc\x2e\x4d\x66\x9f\x7e\x0c\
+\xcd\x07\x2e\xd7\x75\xe6\x67\x4b\x5c\x3d\x6d\xa8\x0e\xfd\xeb\xbb\
+\x56\xf7\xcb\xef\x3d\xae\x53\x5d\xf7\xc7\x63\x3f\xb8\x8d\xc0\xe5\
+\x22\xdd\xff\x37\x2d\x25\xf9\x3f\xa9\x9e\x34\xdd\x1f\x5f\x7f\xd7\
+\xe7\x3f\xfb\x17\x1e\xff\xf0\xdf\x2f\x83\xe0\x65\x5b\xa6\x21\x53\
+\xf0\x23\xbe\x11\x12\x78\x2e\xc6\xf5\x4d\x97\x82\x98\x1f\xd2\x83\
+\x6f\x59\xa3\xc1\x8a\x0d\xc4\x7e\x1a\xa0\x59\x9b\xad\x2c\x1f\x14\
+\x01\x03\xed\x28\x35\xb9\x5e\xd8\x32\xdd\x3b\x17\xf7\xc9\x66\x48\
+\x53\x49\xe2\x73\xf3\x65\x43\x6d\x61\x9c\xde\xf4\xa9\x3a\xa7\x85\
+\x1a\xd0\x2b\xb3\x96\xff\x5e\x7c\x16\x0b\x5e\xc2\xbf\xc7\x8f\x75\
+\x5f\xfe\x4c\xd2\xf1\x47\xc8\xbb\x63\xf7\x34\xf7\x3d\x9b\x79\x3d\
+\xc5\x9f\x95\xe7\xa7\xf4\xf3\x4e\xb3\x7c\xd2\x0b\xc7\x58\x7e\x4f\
+\xd3\x77\x7e\xe8\x98\xb0\xcf\xeb\x5c\xce\x32\x3e\x13\x9a\xdc\xa0\
+\xe7\x4d\x68\x2e\x11\x65\x9e\xea\xce\xe2\xae\xc1\xc2\xd4\xe7\x8b\
+\xe7\xf3\x2c\xdd\x7b\xb9\x83\x53\xd7\x19\x75\xa1\xa1\x75\x43\x47\
+\xa0\xa9\x40\xf7\xd5\xba\xbe\xdc\xa7\xef\xbb\x31\xe3\xe5\x59\xe6\
+\xb6\x7a\x2d\xbe\x74\x7a\x5d\x9d\xd3\xdb\x9b\xfe\xcf\x1f\x83\x97\
+\x7f\x36\x74\x12\xfc\xdb\xd3\xcc\x9f\xb7\x08\xc3\x9f\xde\xd7\x27\
+\xf1\xc6\x8e\x01\xcc\xe3\x14\x58\x8e\xd7\x27\xbe\xf9\x5a\xde\xd6\
+\x40\xa4\x01\xfa\x24\x0d\xce\x9f\x05\x01\xcb\x52\x2d\xfb\xda\xb9\
+\x23\x6f\xbb\x5b\xd5\x83\xac\x9d\xb1\xd4\xa9\xed\x3a\x93\xfe\x34\
+\xe4\x7f\x19\x16\xdb\xbd\x93\x87\x06\x07\xd3\xfd\x16\x8f\xb7\xa9\
+\x9d\x7c\xd5\xc0\x33\x2f\xbe\x78\x7a\x52\x48\x76\x40\x2c\xab\x37\
+\x6e\xb1\x5f\x0e\x54\xdb\x9e\x72\x17\xb3\x74\x27\x96\x0c\x19\x9d\
+\x3d\x2f\x36\x6e\x1f\x04\xe7\x2c\x9f\x14\x4c\x79\x9d\xda\xf9\xba\
+\xf7\x78\x1c\x6f\x5d\x64\x3e\xb7\x26\x5e\xee\xc5\xe7\xce\xbb\xf0\
+\xc0\xa4\x87\x8d\xf2\x9f\x6f\x8c\x27\x5e\xa6\x71\xfd\x5d\x9f\xe7\
+\x6f\x7b\xbe\xce\xe5\x69\xc6\x6b\xd1\xe4\x06\x3d\xc7\x0d\xd5\x9d\
+\xb7\x0f\xe9\xbf\xa4\xdf\x89\xf7\xc8\x45\x75\x7e\x47\xa9\xce\x1c\
+\x67\xee\x07\xc6\x67\xe7\xac\x84\xfa\x55\x9d\xc3\x56\x8f\xea\xf5\
+\x9b\x06\x62\x01\xcb\x50\x63\x96\x68\x6a\x9f\xe2\xef\xce\x53\x20\
+\x73\xdd\x1f\xcf\xd9\x1f\x8b\xf1\x93\x8b\x9b\xda\xc2\xc7\x37\x0c\
+\x2e\x4c\x3f\x6e\x47\xee\x8a\xf8\x29\x08\x5e\x96\x6a\x92\xae\xcd\
+\x2c\x35\x44\x9b\xff\xdf\x65\x10\xa0\xec\x23\x83\x18\x06\x29\x65\
+\x6f\xe4\x7c\x96\xc4\x8e\xc7\x51\xce\xa9\xb6\x29\x90\x79\x50\x9d\
+\xeb\x49\x1a\x44\x4e\x33\xb6\xd5\x71\xc0\xfc\x46\x4d\xe8\x85\x87\
+\x4e\x19\x5f\x0f\xd4\x66\x35\xfe\xae\x25\x06\xa0\xb9\xe0\x42\xbc\
+\x47\xdf\xc4\xc1\x6b\xa8\xbf\x2e\x60\xee\x3e\xf6\x71\xe6\x41\x7a\
+\xad\xc0\xd3\x2f\x9e\x93\xd7\x19\xb1\x1b\x1b\x7d\x4c\x6e\xf9\x95\
+\xcb\xbe\x2e\x9d\x92\x02\xca\x39\xb3\xd3\xf6\x1a\x7c\x89\x99\x7b\
+\x39\x9e\x79\xea\x63\x5d\x65\xbc\xf7\xe2\x67\xce\x53\xe0\xec\x55\
+\xc6\x72\x3d\x4d\x01\x29\xd3\xc7\xef\x56\xaf\x27\x21\xef\xd2\x38\
+\xb1\xdc\x4f\x7e\x96\xd1\xf8\xc0\xfa\xb2\x4c\x6d\xcc\xbb\x54\xb7\
+\x73\x25\x41\x6e\xa7\xcf\xfb\xd7\xf4\xf1\x47\x3f\x36\x5c\xaa\x4a\
+\x6b\xb6\xef\xba\x25\xfc\x1d\x2b\xcf\x45\xaa\x94\xf4\x8b\xc0\x65\
+\x3f\x99\x32\xce\x50\xe5\xec\x58\xc7\xe7\xd2\x93\xa6\xd6\x08\x8c\
+\x9d\xa6\x94\xf9\x9a\x73\xc0\xf5\x2a\x75\x18\x29\xbb\x53\xbf\x5b\
+\xe3\xf9\x79\x91\xa6\x03\x3e\xb4\xcf\x34\x73\x05\xa0\x79\x29\x00\
+\xf7\xbc\xe6\xc7\x64\x6b\xcf\x53\xbb\x93\x73\xba\xf8\x22\x3d\x23\
+\xdf\x34\x19\xd0\x89\x19\x56\xd5\xf1\x7b\xf5\x8f\x3f\x6b\xf7\xae\
+\x32\x94\x73\x97\xce\x32\x5e\xe7\x83\xa6\x66\x56\xa5\x20\xf2\x34\
+\xd3\xc7\x5d\x67\x87\xc6\x67\x59\x53\x75\x27\xcd\xfe\x88\x7d\xac\
+\x5c\xe5\xb1\x1d\x9a\x5d\x6e\x61\x68\x72\xbe\x28\xb9\x4c\x6d\xcd\
+\xdb\x86\xea\x4a\xec\x8f\x3f\x4f\xed\x48\xae\xfa\xb8\x7f\xd3\x66\
+\x4f\x8f\x7e\xf8\xc3\xf1\x8f\x2d\xd5\x95\xd6\x4c\x33\x7f\x9e\x75\
+\x98\xa0\x79\x4b\xd3\xc7\x18\xa2\xd4\xb1\xce\xf5\x42\x25\x66\x02\
+\x3c\x6f\xe3\x0d\x7b\xea\x8c\xed\x65\xea\x30\x6d\x07\x33\x50\xfa\
+\xa0\x4e\x36\xc2\xbb\x9a\x7d\xa6\xed\x74\xaf\x00\xcd\xb7\xef\x8b\
+\x50\x2f\x78\x32\xc9\x78\x3a\x39\x5f\xee\xc5\x0c\xa8\xbd\x36\x97\
+\xa0\x48\xd3\x44\x7f\xbf\xa1\xed\x3b\xe8\xeb\x52\x18\x71\x6d\xbc\
+\x90\x2f\xdb\x6b\xde\xf0\xb4\xe6\x5c\x7d\x8b\x78\x3f\xfc\xde\xc6\
+\x58\x24\x05\x72\xf7\x32\xc6\x18\x8e\xbd\x20\xbe\x53\xbd\x9e\x86\
+\x7c\x2f\x4a\x63\xbd\x7e\xd2\xc6\x3d\x9e\x92\x15\x72\xf5\xc7\x6f\
+\xbc\x67\x1e\xdd\xf0\x2f\x19\x94\xb7\x27\xf7\xba\x97\xef\x14\x29\
+\x34\xce\x4b\x02\x86\x2a\x57\xc7\xfa\xa0\xa9\xb7\xbb\xbf\x18\xe0\
+\xe6\xea\x30\xcd\xd2\x34\x34\xca\xec\xd4\x6f\xd7\x18\xac\x6e\xae\
+\x57\xfc\xa9\xc6\x69\xbc\x72\x25\xa0\x35\x9f\xba\x3e\x81\x8d\x4d\
+\xe3\x72\x3d\x23\xdf\x74\xf1\x3d\xe2\x0b\xc5\x94\x21\xb5\x9e\xb1\
+\xf0\xb6\xa9\xd9\x11\x2d\x5d\x93\x5c\x01\xe5\xc6\x36\xe8\x49\xe7\
+\x3a\x0b\x79\x02\xe9\xd7\xc1\xc4\x36\xa7\x5e\x6f\xd4\x99\x45\xa6\
+\x8f\xf4\xfc\x6c\xaf\x8c\xe6\x4d\xd6\xeb\x9f\xd4\x97\xcb\x8c\xfd\
+\xf1\xe9\x8f\xd9\x97\x37\x05\x2f\xff\x54\x5f\x5a\xb3\xdf\x40\x65\
+\x59\x2a\x56\x68\x94\x29\xe3\x0c\x4e\xda\x3d\x35\x47\xc7\xfa\xa8\
+\xab\x05\xd9\xd3\x33\x30\xd7\x14\x72\x53\x9b\xca\x15\x07\x81\x0f\
+\x0d\x2e\x5f\x6c\xd4\x97\x3a\xcb\xed\xec\xe6\x5c\xfa\x07\x18\x4d\
+\x30\xe1\xa0\x90\x4d\x4b\xe2\x0b\xc6\x27\x3d\x5f\xe7\xf2\x73\xa6\
+\x8f\x6b\x6c\x83\x9e\x0d\x39\x5e\x0e\xb7\x1e\xb8\xfc\xc1\xf3\x90\
+\x67\x0a\xb9\x17\xc4\xb7\xd7\xed\xd8\x17\xcf\x11\x23\x6a\x3d\x70\
+\xf9\x43\x7f\x3c\x57\x00\xf3\x1f\x6d\xaf\xcc\xcb\xee\x2b\xe8\x34\
+\xf3\x47\x0a\xac\x40\x73\x2e\xed\x32\xce\x40\xbd\xcc\xf0\x19\x17\
+\x6d\x67\x5c\xde\xd0\x61\x8a\x83\xc2\xb7\x85\x94\x07\xe5\x05\x11\
+\x7e\xec\x23\x5d\x74\x74\x1e\x40\x7f\xc6\x6a\x31\xd0\x32\xcb\xf0\
+\x51\x27\x25\xed\xe6\xdd\xf3\xfe\x6c\x5f\x36\xe8\x59\x8f\xf5\x27\
+\x35\x3f\x26\x9e\xdf\x41\x97\x9b\xdd\xa4\xbf\x9d\x63\x4d\xc3\x3a\
+\xb3\x27\xf4\x71\xee\x3e\x5e\x3d\xe8\xf2\x4b\x64\x4c\x28\xd8\xdf\
+\x5c\x6a\xe0\xd1\x4f\xfe\x90\x8d\x5f\xda\xf3\x2c\xf3\xe7\xcd\x15\
+\x29\x34\xc6\xd2\x0c\x0c\x71\x60\x36\xc9\xd0\x91\xbc\xee\x58\x17\
+\xf2\x95\xe2\x2e\xe4\xcb\x9a\x9f\x31\x49\xd9\xa8\x94\x55\x57\xeb\
+\x0c\x02\x6f\x7a\xf9\x54\xa7\x4d\xdf\x97\x3d\x02\xc5\x5b\x64\xf8\
+\x8c\x59\x8e\xf3\xe8\x6a\xaa\xf8\x00\x9f\x03\xb1\x1c\xa7\x99\x3e\
+\xee\xa8\x85\x20\x6e\x8e\x97\xa1\x27\x25\x04\x9b\xd3\xba\x89\x27\
+\x19\x3e\xca\xcb\xbf\x66\xdb\x9b\x22\xfa\xe3\xe9\x65\xcd\x45\xce\
+\x32\x79\xd4\x60\x43\xcf\xdd\x4c\x33\x57\x92\x65\xb0\x26\x1f\x34\
+\xe1\xca\xbd\xc5\x40\xe5\x08\xd2\x1d\x75\x99\x11\xf0\xc3\x73\x30\
+\x57\x20\xf5\x99\xaa\x51\x9c\x3a\x83\xc0\x0f\x37\xd4\x95\x3a\xcb\
+\xed\xe4\xca\xc6\x02\x9a\x6b\x8b\x97\x19\xfe\x7e\x8e\xe0\xd3\x81\
+\xcb\x58\x5f\x7a\x81\x95\x6b\x7d\xee\x79\x4b\xb3\x45\xea\xf6\xb1\
+\x2e\xbb\x9e\xd5\xf2\xc3\x73\x33\x9e\xcb\xa2\xe6\xc7\xec\xda\xb8\
+\xe7\xc6\xfa\xbd\x1f\xea\x67\x14\x9f\x14\x96\x55\x9d\x23\xfb\xf2\
+\xbf\x6d\xf0\xcf\x82\x97\x5f\x54\x9f\xd6\x34\x71\xf3\x9a\x3a\x0e\
+\xf9\x5d\x94\x12\x9c\x81\xcc\xea\x0e\xcc\x96\x25\x4d\x85\x4b\x9d\
+\xeb\x45\x86\xce\xb5\xcc\xcb\xb2\x3a\xf5\x75\x83\x85\x17\xf7\xfc\
+\xdf\xef\x42\xf6\x08\x34\x7b\xdf\x4f\xe3\x58\xa9\xc6\x47\xfc\x59\
+\xf3\xef\x4f\x6a\xfe\xfd\x75\x30\x61\xe9\x6a\xd6\xae\x0b\xf1\x5a\
+\x7c\xcc\xf4\x71\x39\xd7\xc8\xbe\xed\x9c\x73\x04\xa3\x4a\x5c\x97\
+\x34\x47\xf6\xa5\x3e\xd6\xbf\xd5\x7d\x69\x1e\xc7\xa9\x6f\x4b\xfa\
+\x42\xa9\xed\xab\x7b\x4e\x93\x75\xbc\xec\xf1\x4f\xfe\x85\x85\xba\
+\xd3\xaa\xfd\x9c\x15\x2d\x2e\x42\x5f\x5d\xe0\x58\x51\x26\x8a\x16\
+\xb2\x31\x65\x7c\x78\x1d\xe1\x5d\x65\x70\x1d\x10\xaa\x3d\x30\x2b\
+\xf8\x9e\x9d\xd6\xf8\xfd\xed\x38\x70\x4e\x81\xd0\xb6\x3d\x4d\x53\
+\xe3\x72\x0d\xd2\xd6\x2f\x5e\x2e\x7b\xfc\x12\xa6\xce\x26\x4a\x8b\
+\x5b\x82\x07\x1f\x6a\x7c\xf6\xa4\xc3\x3a\x02\x63\x78\x3e\x9d\xd5\
+\xfc\x98\xba\x33\x66\x72\x04\x58\xde\xba\x9a\x59\xe4\x5a\xe7\xf2\
+\x7a\xed\xc6\x96\x9e\x85\x75\x83\x51\x97\x25\x3e\x5f\xe2\x39\x55\
+\xf7\xe7\x65\xcd\xfe\xe3\x53\xf7\xc6\xbf\x4c\x6b\xfe\xfe\xbb\x42\
+\xfb\x78\xef\x42\xfd\x8d\x30\xaf\xe3\x65\x8f\x7f\x52\x21\x2f\x05\
+\xbf\x5a\xf5\xac\x81\x9b\x37\x56\x92\x53\x45\x0b\x59\x2c\x6c\xd4\
+\x33\x48\xd6\xab\xab\xdf\x51\xba\x2a\x2d\xeb\x72\xa3\x2f\x93\xe3\
+\x45\x5e\x2c\x9f\x45\x47\xd7\x65\xda\xc4\x07\x57\x65\x12\xd2\x77\
+\x8a\x6d\xda\x9f\xe1\xf6\xc0\x5e\x49\xb2\x4e\x19\xcf\xd8\xe7\x7d\
+\x19\xca\x7d\xe9\xff\x3f\x9a\x38\xfa\x28\xbd\x5c\xfc\x58\xb3\xfd\
+\xce\xd1\xb6\x3d\xad\xf9\xfb\x73\xb3\x76\xee\x7d\xed\x37\x5f\xaa\
+\x4e\x37\xae\x43\xae\x17\xce\xcf\x5b\x7c\xe6\xd5\x7d\x8e\x97\x9c\
+\x38\x11\xcf\xed\xac\xc3\xb2\x19\x62\x9b\x37\xa9\xf9\x31\xa5\xf6\
+\xc7\x97\xd5\xf7\x8b\x2f\x92\xea\xbc\x0c\xba\x0e\x76\x3f\xbe\xad\
+\xc1\x0f\xd6\xf2\x69\x6d\x90\x12\x1b\xea\xcc\x0f\xb7\x58\x79\x8f\
+\x0d\xce\x21\xdb\x03\x1a\x7e\x34\x84\x80\x76\xdd\x81\x59\xe9\xeb\
+\xc0\xc6\xf3\xab\xf3\xb6\xf7\x8f\xa1\xf6\x3b\x36\x07\x0e\x29\x83\
+\x22\x06\xf8\x2e\x4a\x0c\x64\xa6\xa9\x77\x93\x06\xeb\x69\x9d\x17\
+\xbe\xb3\xea\xfc\x4a\x9d\x16\x3a\xfa\xec\xf2\x5c\xe5\x98\x82\xfe\
+\x5d\xb9\x1a\xc3\x0b\xd4\x14\xb4\x8a\xed\xd2\xb3\x4c\x63\xd0\x1c\
+\xb3\x02\xa6\x35\x7f\xdf\x52\x5e\x77\xf7\xb1\x85\x4d\xd0\x8e\xda\
+\xca\x64\x4c\xdf\x65\x52\xf3\x63\x4a\xee\x63\xc5\x73\xab\x13\xbc\
+\x8c\xb3\x5b\x76\x25\x87\x64\x7b\x5e\x5f\x16\xfe\x22\xfa\x53\xa8\
+\x17\xbc\xbc\x2e\x9f\xdb\x82\x97\x5f\x82\xe0\x65\x9b\xe2\xc5\x9c\
+\xe7\xfa\xb0\x18\x08\xad\x1a\x84\xd8\x19\x3f\x56\xb4\x50\x4b\x5c\
+\xcf\xcf\x46\x3d\xdc\xe4\x3f\x3a\x4b\xd7\x9d\x91\x92\xc5\xf3\x7b\
+\xdd\x61\xf9\xf4\xa9\x1e\xc4\xe3\xb4\xea\x3b\xc4\xbe\xc8\x87\xc2\
+\xa6\xaa\xd5\xc9\xba\xbc\xcb\x7a\xc5\xb1\x8d\xaf\x33\x5b\x25\xf6\
+\x97\xdf\x34\xf0\xbd\x2f\x3b\xbe\xbf\x59\xe9\x7a\x26\x53\xbc\x17\
+\xf7\x0a\x2e\x9f\x98\x84\xf1\x7f\x85\x9d\xd3\x45\xdd\x36\x2c\xad\
+\xb1\x56\x27\x98\x76\x65\x49\x89\x7b\x69\x3a\x70\x39\x6f\x79\xe3\
+\x9b\xba\xed\xef\xa2\xe4\xac\xdd\x14\x6b\xa8\x3b\x75\x7c\x37\x0c\
+\x23\x11\x20\x87\xba\x2f\xcb\x4b\x7f\x51\x52\x37\xd8\x1d\x97\xe9\
+\xd9\x7e\xf4\x8b\x3f\x40\x7b\x9a\xd8\xd5\x74\xae\x58\xa1\xb6\x13\
+\x45\xc0\x80\xd5\xea\x5c\x97\x1e\xd8\xcf\x30\x70\x9c\x8c\xb0\x4e\
+\xcc\xaa\xe3\x73\xd5\x49\x3c\x2b\x61\x37\xd0\x74\x0e\x75\xde\xd6\
+\x7f\xba\x43\x3d\x59\xd6\x1c\x40\xbd\x6c\xa8\xfe\xd6\x1d\xb8\x6e\
+\x5b\xdb\x97\x11\x8a\xf7\x4d\x8e\xdd\xbd\xeb\xb6\x7f\xc6\xd2\xe5\
+\x68\x65\x83\x9e\x1f\x4c\x6b\xfe\x7e\x1f\x36\x50\xfe\xd4\xf1\x3d\
+\xa6\x3f\xfe\xdd\xa2\xe4\x2f\x97\xfa\x33\xb5\x5f\xc8\x3e\x6a\xf8\
+\x0f\x70\x77\xfb\xb9\x07\x09\xa9\x33\x3e\x57\xb4\xf0\x60\xcb\x52\
+\xd7\xf3\x83\x4c\xea\x64\x3a\xf4\xa5\x8f\x50\xab\x43\x97\x76\xbb\
+\x1d\xa3\x59\x75\x7c\xad\xbe\xff\xac\xe3\xf3\xa8\xb3\xa3\xf7\x7d\
+\xd6\x64\xad\x93\xb5\x30\x29\xa0\x9c\x9a\x1a\x40\x43\x9f\xc4\xf1\
+\xeb\x5e\xa6\x8c\xb5\xba\xf7\xce\x9f\x2e\x47\x31\x75\xe2\x79\x0f\
+\xd7\x1e\x5d\xf4\xe0\x1c\xeb\xf6\x03\xff\x50\x3d\xbf\xf7\x23\xea\
+\xfc\x72\x4f\xa6\xdf\xd7\x3d\xc7\xc9\xa3\x06\x3b\x72\xdc\xdf\x7e\
+\x03\x9f\x29\x6b\x0c\xdc\x3f\xf0\x2f\x19\x82\x72\x7d\x09\x5e\x2e\
+\x5d\xed\x07\xbb\xde\xed\x37\x66\x61\x76\x78\x0e\xb3\x1a\xbf\x7b\
+\xd1\xd0\xbf\x7b\x93\x97\x0d\x7d\xff\xba\x03\xd8\x57\xaa\x31\x23\
+\xb1\x0e\x5c\x96\xf2\x6c\x92\x04\x54\x86\xe7\x1d\xad\x05\xf8\x74\
+\x04\xf5\xa7\xee\x39\xda\x9b\xe3\xbb\x49\x87\xfd\x84\xb6\xfc\x5d\
+\xb7\x8c\x1e\x0d\xa4\x20\x86\x22\x7b\xc7\x57\xf6\x25\x3c\x98\xac\
+\x4b\x68\xb6\x13\xd2\x97\xf3\xd4\xb9\x5e\x6d\x4a\xd3\x7a\x00\x33\
+\x65\x33\xd6\x29\xff\x3b\x4f\x69\x4b\xfd\xa5\x3a\xfd\xde\x69\x43\
+\xd3\xec\xeb\x0e\xba\x4b\xce\x0a\x85\x5c\xe2\xcb\x87\xdf\x33\x07\
+\x2e\xff\xe8\xf8\xde\xa5\xbe\xa3\xbe\xae\x3b\xda\x87\x4c\xd1\xc2\
+\x37\x88\x19\x93\xbe\x64\x15\xd7\xbe\x17\x1f\xfd\xa2\x42\x5e\x6a\
+\x78\x5b\xb5\xdb\xd0\xda\x44\xb2\xc7\xc0\x7d\x03\x63\xed\x2c\xd5\
+\x7e\x36\xbb\xd4\xd7\xba\x08\x60\xd6\x79\xa9\x7b\xf5\x80\x35\x59\
+\xeb\xce\x38\x6a\x22\xcb\x31\xc7\xd4\xd3\xd3\xa6\xd7\x2f\x4d\x3b\
+\xeb\xbe\x74\x9b\xd0\x91\x26\xc6\xab\xb5\x5e\x5c\x09\xec\x14\x61\
+\xde\xd3\xf3\x1e\x4b\xd6\xae\xfe\xd5\xea\xf9\x59\xb7\x1c\xc6\xb2\
+\x44\xc5\x6f\x8f\xee\xf0\x2f\x59\x6c\xb8\x3f\x1d\xf5\xdb\x1e\x9e\
+\x02\x31\x70\x8f\x4e\xb0\xac\xcb\x51\x90\x51\x37\x8e\xce\xf5\xc2\
+\xa5\xca\x26\x06\x30\x5f\xb7\xf1\x87\x52\xb0\x6d\xda\xf2\xa0\xf5\
+\x22\x43\xf9\x6c\x17\x58\x7f\xe3\x39\x7d\x6c\xe0\xdc\xd6\xd7\x6a\
+\x56\xfd\xf8\x2b\xd4\x9b\xe2\x0f\x75\xc4\x76\xe9\x7f\x4b\xd9\x68\
+\x8c\x62\x7c\xec\x69\x1f\xb3\x4f\x2f\x87\x17\x1d\x95\x91\xf1\xc8\
+\xf8\x4c\xee\x12\xbc\xb4\xee\x65\xcb\x03\x83\x86\x3e\xf7\x6d\x18\
+\x4f\x96\x0c\xd4\x75\xa4\x08\x46\xc1\x1b\x5f\xb8\xbf\xd3\x96\x76\
+\xb0\x3e\xae\xf9\xfb\xf7\xee\xbf\xa6\x69\x7a\x75\x02\x98\x71\x00\
+\x92\x75\xfd\xf2\x34\x0b\x2a\x47\xff\x2d\x5e\xb3\xaf\xb9\xae\x5d\
+\x0c\x84\xc6\x40\x76\x75\xc4\xa0\xe5\x99\xc1\x17\x05\x8d\xa3\xbe\
+\xb6\xf5\x92\x85\xe2\xc5\xe5\x3c\xde\xe8\x63\xc2\x30\xfc\x32\x78\
+\x69\xea\x78\xeb\xb6\x9b\x58\x9b\x28\x75\xc8\x65\x5f\xc2\xaf\x2d\
+\x1e\x30\xd5\x90\x71\xf2\x6c\x64\xac\x1a\x9d\x3e\x9e\x32\x04\xeb\
+\x04\x01\x97\x35\xd6\xbe\xfb\x54\xf3\xf4\x9b\x98\x3a\x9e\xeb\x99\
+\x34\x09\xab\xc0\xce\xd9\x43\x82\x98\x31\xa3\x2d\xf6\x51\xab\x23\
+\x66\x33\xfd\x6f\x75\x9c\x86\x9a\x3b\xa4\x42\x13\x63\xa9\xb0\x7a\
+\xc9\x72\xa6\x28\xa8\x1c\x67\xd8\xa0\x50\x1f\x11\x0a\xf0\xf8\x1e\
+\x9d\x26\x6f\xb0\xda\x13\xa7\x8e\xcf\x73\x7f\x68\xd5\x91\x7f\x5b\
+\x35\xde\xaf\x74\x34\xe1\x56\xb2\x2e\xd1\x31\xbd\x9b\x18\xfc\x58\
+\xf4\xe0\x3c\xa7\xaa\x6a\xfe\x6b\x1f\x83\x58\x0d\x2e\xaf\x11\x03\
+\x97\x75\x32\xf9\x2e\x6a\xfe\xee\x59\xcd\xb2\xd9\xcd\xbc\x71\x48\
+\xcc\x22\x9d\x65\xfc\xbc\xf8\x59\x31\x08\x19\xdb\xb0\x78\x9e\x7f\
+\xa6\xf6\x6c\xf9\x93\x7b\xe7\x69\xea\x3b\xea\x3f\xd2\x27\xb1\x8e\
+\xc7\xf1\xcf\x81\xa2\x18\xbd\xb8\x6c\xc6\x93\x96\xd7\x21\x5d\x8e\
+\xa4\xcd\x94\x61\x4a\x6b\xf7\xd4\xa3\x3b\xfe\x8b\xa6\x8e\xb7\x3c\
+\xd0\x6a\x70\x4a\x96\x07\x38\xfc\xdc\x3c\xf3\x80\x93\xb2\xfd\xa6\
+\x08\x6a\x19\xcb\x34\xd1\xa5\x4b\x7d\xa3\xe3\x06\x3f\xbb\x6e\xf6\
+\xe2\xbb\x87\xfe\x62\x9a\xa9\x32\xef\xf8\xfc\x7f\x3c\xa7\x45\x43\
+\xf5\x30\x0e\xac\xf7\xd3\xb5\x8c\x01\xdb\xcf\x3f\x1c\xc7\xe9\x98\
+\x06\x81\x4b\xfa\x69\x26\x03\x93\xd4\x5f\xf9\xd8\xa3\xf3\x9d\x8e\
+\xa4\x2f\xb8\x50\x35\xff\xfb\x8c\xaf\xe3\x8f\x91\x14\xd5\xdf\x8f\
+\xee\x58\xa0\xa6\x8e\xb7\xef\x55\x83\x37\x87\x29\xb1\xf0\x6f\x71\
+\xc0\x2a\xeb\x72\x5c\x0c\xc6\xeb\xf9\x9f\x9e\x9c\x67\xdd\x20\x75\
+\x17\xfd\x9f\x79\x75\xec\x65\x38\x4e\xd2\xb1\x08\xf9\xd7\xbd\x9e\
+\x34\xf1\xa2\x35\x4d\xef\xab\xf3\xb9\x97\x19\xb2\x6b\xea\x4e\x1d\
+\x6f\x62\xe3\x1e\x4b\xff\xc0\xc3\xef\xc7\x87\xcc\x20\xac\xd5\x66\
+\x76\x34\x55\x99\x9f\x8b\x59\xf1\xa7\x8a\x21\xeb\xf3\x5a\x3f\xba\
+\x0c\x7d\x49\x26\xa8\xdd\x67\x7c\x7c\x8f\x7f\x37\x66\x5f\x1e\xab\
+\x1b\xad\x3e\x68\x8f\x52\x06\x40\x6e\x31\x40\x33\x0d\x16\x57\x87\
+\x7f\x0c\x0c\x1b\xba\xdf\x18\xae\xcb\x91\x9f\x7f\x5f\xa6\x0a\xf5\
+\xb1\x73\xfd\x77\x86\x37\xf1\xd1\xe2\x87\x81\x46\xcc\xb2\x7b\x15\
+\xf2\x65\x75\xbc\x6c\xe0\x3e\x78\x59\xf3\xf7\x6b\xcf\x16\x8a\xeb\
+\x1e\x57\x65\x75\x55\xb3\x9f\x34\x0b\xab\xcd\x12\xb3\x88\x53\xf4\
+\xab\x73\x3a\x0e\x5e\xba\xc0\x43\xc4\x75\x0f\xe7\xf7\xec\xe7\xc5\
+\xe5\x14\xea\xac\xbd\xeb\x5e\xbd\x7f\x9f\xe4\x67\xd7\x67\x3b\x53\
+\x9f\x23\x6e\x32\xf6\xa5\xa5\xb5\xed\x2f\xeb\x3c\x6b\x63\xf0\x3b\
+\x53\x3f\xa0\xe4\xfe\x95\x71\xd7\x3f\xcb\xe2\xa1\x7d\x8e\xbe\xf4\
+\xc7\x6b\x27\x13\xdc\x27\x78\x39\x0f\x82\x97\x6d\x8b\x6f\x09\xdf\
+\xe4\xfe\xd0\x98\x91\x50\x35\x88\xef\x5c\x4f\xf8\x3e\xc0\x8f\x6b\
+\xc2\x2a\x86\xd1\x99\xd6\xf9\xe5\xbe\x07\xbb\xe3\xf9\xc7\xf5\xc0\
+\xba\x2a\xbf\x1e\x5d\xe7\xc5\x50\x2a\x7c\x1a\xb0\x5d\xa4\x8d\x01\
+\x4f\x43\xfd\x97\x98\x59\xeb\x40\xca\x56\x9c\xd5\xfc\x98\x5c\x83\
+\xd2\x8b\x9a\xe7\x12\x83\xc4\xb9\x9f\x2b\x71\xe9\x9f\xcf\x9a\xee\
+\xd6\xc5\x31\xd0\xdf\x1d\xfe\xfd\x65\x0f\xfa\x50\x7b\x99\xdb\x82\
+\xd8\xb6\x4c\xc2\x6a\xbd\xd5\xba\x6b\xe0\x86\xf4\xfb\xa7\xa1\xdd\
+\xe5\xb3\xfe\x70\xeb\xdc\xcb\xd1\x6d\xcf\xdb\xaa\x4e\x7c\x0d\x79\
+\x82\x34\x71\xc3\xb2\x65\x0b\xcb\x44\xfd\xa7\xe6\xef\xf7\x61\x5d\
+\xf1\xba\x7d\x80\x3f\x55\xfb\xff\xaa\x13\xec\x8e\x1b\x3e\x4f\x5a\
+\x5e\xd3\xf5\xa1\x75\xba\xd6\xb3\xf0\xce\xc1\xcb\x14\xf0\x5a\x04\
+\x0b\xdf\xb7\xe9\x55\x55\xe6\x6f\x9b\x18\x20\x57\x9f\xf9\xa6\xfa\
+\xec\x67\xc1\x22\xbb\x10\x82\xb5\x60\x19\xaf\x5a\xcf\xf5\xd2\x33\
+\x03\x32\x4c\x6b\x5e\x0e\xf1\xa2\xa7\x2c\xbe\xd8\x51\xfe\x5c\x33\
+\x28\x10\xa7\xe1\x6d\x67\xec\xa7\xcc\x32\x74\xfe\x27\x99\xa6\xb2\
+\xd5\x0d\x56\x4d\x72\xdf\x1f\xf1\xb3\x62\xf6\x58\xc8\xbb\x79\x0f\
+\xbf\xf6\x61\x48\x2f\x31\x7a\xd2\x46\xad\xcb\x3b\xb6\x55\x71\xc6\
+\x58\x4c\xe8\xa8\x9b\x74\x71\xdf\x59\x6d\x8b\x9a\x7f\x33\x06\x5d\
+\x2d\x47\x94\xb7\xaf\x5e\xf7\x99\x15\xd2\xef\xc7\x00\xe6\x5e\xc3\
+\x2f\xa1\xeb\x06\x47\x63\xe0\xbe\xf4\xc4\x8a\xa7\x1d\x97\xd1\x90\
+\xd4\xed\x6f\xc6\xbe\xfc\xbc\xe0\xfe\xf8\x76\xa8\x1f\x47\xbc\x7c\
+\x74\xcf\x5f\xb0\x71\x4f\xbb\x72\x64\x20\xfc\xea\x21\x00\x63\x77\
+\xd2\x83\x37\x55\xe4\x7f\x88\xd6\x7d\x80\x0e\x65\x20\x5b\xb7\xee\
+\x3f\x2b\xfc\xfb\xd5\x9d\x82\x3c\xd8\x8e\x75\xca\x3a\xc9\xb1\x8e\
+\x62\xce\x97\xa0\xaf\x32\x9c\xcb\xe7\x4c\xc7\x71\x01\xdf\xe7\x26\
+\x47\x06\x7c\x8c\x49\x0c\x30\xc5\xa4\x8b\xea\x1f\x9f\x84\xfa\xd3\
+\x4c\xef\x33\xae\xaa\xfb\x7c\x9c\x58\x13\xb0\xc8\x67\xd6\xfa\x59\
+\xd1\xf4\xfa\x97\x75\xdb\xe9\x69\xc9\xd7\x23\x53\x30\xca\xf8\xeb\
+\xbb\xba\x59\xa8\xa5\xf7\xc7\x6b\xd7\x95\xf8\x2c\xb8\x6f\xf0\xf2\
+\x22\x58\x9b\xa0\x6d\xaf\x9a\xfa\xe0\xcc\x0f\x01\xe8\xa3\xcb\xd4\
+\x21\x66\x7c\x0c\x28\xf2\x74\x96\xf6\x0b\xff\x7e\x75\xcf\xef\xcb\
+\xc0\x07\x83\x6f\x33\xf4\xeb\xb2\xdc\x4b\x1b\xd3\x44\x87\x64\x3f\
+\x77\xf0\x22\x65\x0a\x3d\xd7\x1f\x67\x6c\xd2\xb8\xa5\x6e\xe2\xc5\
+\xb3\x7b\xfc\xbd\x65\x86\xfb\xec\x95\x2b\x97\xfd\x99\xb5\xc8\xf4\
+\x71\xb3\xb4\x84\x4a\x53\xe7\x5a\xb7\xfe\x6c\xa7\x75\xaa\x87\xda\
+\xbf\xba\x6a\x61\xea\x7e\xaf\xc6\xa4\x19\xfa\x1b\x25\xef\x67\x52\
+\x37\xb8\x7a\x7d\xdf\x3f\xba\xe7\x4d\x18\x6f\x40\x3b\x55\xb7\x3c\
+\xc0\x6e\xb8\x61\x7d\x13\xbc\xc1\x67\x9c\xae\x82\xec\xe3\x51\xb7\
+\xad\x1d\x77\x32\x4a\x51\x77\x10\x30\x29\x75\x47\xd5\x4c\xc1\xb0\
+\xc5\x08\xee\x85\x8b\x8e\xef\xa5\xa1\x0f\xf2\xb3\xf7\xe1\xd2\xa0\
+\x78\x2f\x08\x60\x32\x32\x69\xdd\xde\x3a\xed\xf2\x7d\x9f\x57\x75\
+\x9f\xf5\xb3\xc2\x03\x0a\x7d\x94\xf3\xe5\xcd\x69\x86\xe5\x65\x9a\
+\xec\x43\xbc\x2c\xf8\x3a\xbc\xea\xb8\x6c\x86\xd6\xb6\xe5\x28\x8f\
+\x22\x83\xdd\x99\xd6\x33\xbf\x4e\x26\x78\xf4\x80\x5f\x7c\xa7\x7a\
+\xb5\xae\xe9\x8d\x75\xbc\xc1\x67\x8c\x4e\xbc\xf1\x1b\xb5\xba\xeb\
+\xf4\xfc\x67\x08\x85\x90\xee\x81\x65\xe1\xcf\xa8\xae\xce\x6b\x39\
+\x92\x36\xa2\xf3\x05\xf3\x53\x76\xe2\xfe\x40\xcb\xf7\x55\x83\xf7\
+\x6e\x9c\x46\xeb\x39\xc6\xd8\xd4\x5a\xc6\xec\x9e\x2f\xdc\x3e\xd5\
+\x3c\xd7\x38\x68\x7f\xed\x92\x65\x6d\xfb\x72\x26\x1f\xc4\xeb\xf3\
+\xb1\xc1\x00\x73\xdd\xd9\x1b\xfb\x25\x2e\x3d\x90\xee\xa1\xba\x41\
+\xdf\x4f\x6a\xf3\xbf\xd4\x7d\x99\x5c\x6a\x7f\x3c\x47\x1b\xb8\x88\
+\xff\xf1\xe8\x01\x0d\xc6\xa5\x8e\x52\xeb\x26\x2d\xa4\xb5\x5b\x50\
+\x9a\x51\x3d\x1c\xec\x2e\x3e\x7a\xd3\x9a\xbf\xbf\x18\x50\x59\xd4\
+\xfd\x2e\xd3\xd2\xb2\x2f\xd3\xf9\xb8\xc6\x77\x53\x42\x9f\x6e\x36\
+\xe0\xf2\xdd\x6e\xaa\x0f\xb7\x91\x81\x59\xca\xf3\x6c\x2c\xf7\x0c\
+\xe3\x69\xb3\x72\xd4\xe9\x57\xb2\x2f\xb3\xb7\x7d\x17\x19\xdb\xbd\
+\x49\x75\x9c\x35\x35\xde\xc8\xf0\x19\x67\x05\x5e\x82\xe3\x42\xca\
+\x66\x68\xea\x06\x74\x63\xcc\xa8\xa8\x97\x25\xa9\xed\xab\xfb\x12\
+\xf7\x72\xbd\x3f\xc5\xa3\x07\x7e\x80\xec\xcb\xf6\x9d\x36\xf9\xe0\
+\x8b\x3b\x8f\x6a\x44\x18\x89\xd8\xf8\x99\x2e\x3e\x62\x99\x02\x6d\
+\x43\xca\x56\xcf\xb1\x19\xdf\x69\x61\xdf\x29\xc7\xf9\x8c\xa5\xaf\
+\x53\xc2\xa0\xfa\xe5\xc0\xcb\xb8\xb1\xef\x97\x36\x33\x89\x2f\xa0\
+\x63\x10\x73\xd1\xd1\xf7\x8b\x7d\xc8\xdf\x83\x75\xd4\x69\x41\x86\
+\x8c\xf8\xdd\x7b\xfe\xad\x65\x86\x36\xf6\xcc\x95\xcb\x2e\xb6\x37\
+\xb9\x02\xd9\xfb\x4d\x04\x7d\x52\xc0\xa5\xf6\xc6\x3d\x25\xad\x7d\
+\x99\x5e\xc6\xd5\xed\x47\x5f\x34\xbc\xd3\x7b\x5f\xe5\x88\xc5\x1c\
+\x17\xf6\xb2\xe4\x34\x43\x3f\xf3\xbf\xe3\x94\x47\x0f\xbc\x11\xe7\
+\xc1\x34\xe3\x2e\x06\x17\x4d\x47\xd2\x0f\x82\xac\x5a\x86\xef\xb9\
+\x07\xe6\xe8\xd5\xde\x91\x6f\x48\xd3\x89\xd3\x3a\x3b\x75\x07\x67\
+\xbb\x55\x67\xe9\x4d\x21\x1d\xeb\x37\xa1\xfe\x74\xa6\xe5\x88\x96\
+\x95\xd8\xed\xf8\x7a\xc5\x81\xd0\x64\xe0\x65\x3c\x6d\x7a\xea\x5f\
+\xbc\x8f\xab\x23\x06\x30\xf7\x42\x3b\x2f\xa3\x97\x29\x78\xf0\x7b\
+\xf5\x77\x0f\xd6\x59\x11\xd0\x93\x31\x55\xdb\x01\x85\xfd\x26\x67\
+\xd1\xd5\x68\x7f\x77\xfb\x9a\x15\x9a\x79\xfa\x78\xd4\xd4\xfa\x97\
+\x39\x5e\x84\x9e\x95\x70\x9d\xd2\x73\x2c\xc7\xcb\x61\x53\xc6\x7f\
+\x5e\xa7\xeb\xb6\x37\xc5\xbc\x2c\x49\x41\xf7\x1c\xed\xde\x7c\xfd\
+\x0f\x8f\x3a\xbe\x11\xb9\x9f\x57\x0d\x67\x5f\xae\x1f\x02\x02\x3b\
+\x0c\xd5\x91\x75\x2e\x09\xf5\xd7\xd6\x5b\x0c\xb0\x4c\x72\x3c\xd3\
+\x8f\xbb\xce\x0e\x48\x7f\x3f\xc7\x74\xa6\x31\x65\x90\x3d\xeb\xf8\
+\xef\xbf\x1c\x49\x39\xb7\xb2\x16\x55\x0a\x62\xc6\xb5\xcc\xff\x5f\
+\xea\xd3\x5d\x64\xec\xd7\x2d\xd2\xbd\xf1\xa4\xfa\x1b\x31\x68\xf9\
+\x46\xd0\x92\x0e\xda\xf9\x69\x0f\x9f\x8f\xd1\x59\xc3\x9b\xc3\xdc\
+\xb7\x1c\x63\x50\xe1\x73\x3a\x7a\x29\xf5\xe9\x73\x2e\x7d\xd6\xc4\
+\xfa\x97\x39\xda\xe0\xed\xae\xaf\x53\x2a\x97\x8f\xa1\x7e\x16\xdd\
+\x55\x4a\x84\xe3\x66\x39\x66\x43\xed\x77\x9d\x50\x90\xda\xba\x1c\
+\x41\xd4\xf9\x66\xd2\x51\x9d\xe0\xa5\x4a\xd7\xbe\xd8\x58\x34\x3a\
+\x35\xaf\x81\x87\x00\x94\x62\x6e\x9d\x4b\x52\x70\x6b\x52\xf3\x63\
+\x86\x18\x00\x9f\x87\x3c\x01\x8e\xce\x06\x67\x19\x3b\x4a\x39\xde\
+\x7c\xf7\xe5\x7e\x88\x65\x56\xf7\x7a\x2d\x6a\xfc\xfd\x78\x2f\x4e\
+\xc3\x38\xec\xb7\x99\x39\x93\xa6\x93\xc7\xe7\x5e\x9c\x6d\x10\x03\
+\x99\x71\x73\x9f\x18\xcc\x3c\x49\xf7\xfb\xe2\x17\xc7\x3c\xfd\xbb\
+\xf1\x77\xf6\xaa\xcf\xd8\x8a\x99\x9d\x29\x60\xe9\x25\x20\x5d\x6a\
+\xb5\xcd\x4a\x01\xfa\x45\xa6\x73\xff\x5c\x42\x00\x33\x05\x36\xce\
+\xd2\xd8\x32\x66\x5f\xf6\x76\x5a\x7b\xea\xdb\xe7\xba\x3e\xf1\x99\
+\xf4\x31\x77\x5b\x1c\xf2\xc4\x4d\xba\xbe\x4e\xa7\x21\xcf\x4c\x0d\
+\x09\x70\xb7\xd7\x97\xd8\xff\x5c\x66\xf8\xa8\xe3\xae\xb2\xbd\x33\
+\x06\xba\x43\xf8\x21\x99\xe0\x71\x8d\x82\x5d\x56\x27\x16\x6f\xc4\
+\x99\x6a\xd6\xaa\x59\x55\xee\xef\x9a\xec\x38\xc6\xce\x6e\xf5\x37\
+\xfe\x08\x76\xc7\x63\x38\xee\x1d\x94\xdf\x78\xb3\x7f\x65\xa0\x36\
+\x28\x39\xb2\x9f\xbe\x0c\xad\x50\x62\xe7\x3a\x3e\x5b\x32\x94\xcf\
+\x76\x1a\x9c\x3d\x4f\xd3\xd1\xdb\xea\x28\xc5\x0e\xf5\xe7\x4c\x1d\
+\xa5\x77\x23\x5a\x5a\x22\xc7\x40\xa8\x4e\x27\xfb\x55\x18\x8f\x58\
+\x37\xf7\x43\x47\x2f\xff\x6d\xb8\xc9\x80\x74\x91\xad\x1d\x07\xd0\
+\xd3\x4c\xed\xc0\xd7\xea\x99\x75\xd0\x45\xf6\x59\x7a\x61\x74\x76\
+\xc3\x77\x89\xe3\xcb\x2f\x3d\xce\x88\x8b\xd9\xe6\x7f\x65\xea\x03\
+\xc4\x65\x3e\xe2\x4b\x9a\x37\x19\xcf\xef\x5d\xa6\x71\x75\xbc\x4e\
+\xf1\xe7\x51\x5b\xfd\x94\x14\x88\x8a\x81\xcb\x59\x86\x8f\x8b\xe7\
+\x2c\x91\xe4\x6e\xed\x4d\x8e\xfe\x59\x4c\x28\x08\x6d\xde\xd7\x1b\
+\x89\x04\x93\x0c\x1f\xb7\xf8\x71\x76\xc7\xa3\x0c\x05\x4b\xfb\x1a\
+\xdf\x18\x21\x2d\xfe\xbe\x50\xd4\x0c\x40\x7c\x50\xde\x79\x9d\xcb\
+\xb4\xfe\xcf\xd7\xf0\x7d\x2a\xcd\xd7\x3e\xbf\x91\xe6\x1f\xd7\x36\
+\x76\x1c\x73\xbc\x35\x1e\x6a\xdb\xf8\x36\xe4\xc9\xbe\x5c\x07\x30\
+\x5f\xb7\x78\x5d\xbf\x66\x1a\xb4\x8c\xa6\x63\x9d\xda\xb5\xba\xf7\
+\xc3\x55\xcd\x69\xc3\xb3\x30\x2e\xaf\x02\xd0\xf5\x73\xfc\xde\x41\
+\xfc\xf4\x32\x2e\xe7\xb3\x3f\x06\x15\x4e\xdb\xca\xc6\x8e\x7f\x27\
+\x65\x5b\xc6\x67\xe5\xf4\x96\x73\x9a\xf6\xb1\x5e\x34\xb0\xfe\xe5\
+\x71\xce\xb2\x48\xcf\xc9\x5c\x7d\x8b\x59\xea\x63\x4d\x5a\xa8\x37\
+\x93\x34\x16\xca\xf5\xac\x7e\x67\xdf\x81\x3b\xd5\x97\x79\xc8\x93\
+\x7d\xb9\xbe\xaf\x5b\x19\xc7\xa6\xd9\x6d\x9f\x43\xbe\xb5\xd4\xff\
+\x75\x4f\x3f\xca\x70\x23\x2e\x54\xb1\xd6\x4d\x5b\x4a\x03\x7e\x1e\
+\xbc\xa5\xa7\xdf\xe2\x03\x72\xef\x9e\x83\xeb\x9b\x06\xf4\xb3\x92\
+\x76\xfa\xe3\x41\x0f\xd4\x78\x4d\x73\x64\x5d\x5e\x0e\xb5\xe3\x95\
+\xbe\x57\xce\xe9\x3c\x71\x60\xd6\x58\x07\x3b\x7e\x6e\xfc\xfc\x90\
+\xf7\x85\xde\xc9\xd0\x3b\xd6\x71\x40\x96\x5e\xd0\xe4\xe8\x47\x2c\
+\x6a\x9c\x47\xfc\xfb\xdb\x61\x5c\x76\xfb\x1a\x1c\x80\x02\xda\xae\
+\x1c\x6b\x1a\x2f\x6b\xb4\xf1\xb9\x93\x76\xae\x5f\xbc\x35\x39\xa6\
+\x4b\x41\xcb\xf8\xf9\x5f\x53\xd9\xfd\xaa\xcd\xfd\xd8\x46\x50\xac\
+\xa1\x3e\x4c\x9c\x6e\x9b\xf3\xe5\x63\xee\xf5\x2f\x4f\x42\xbe\xf5\
+\x87\x77\x53\xdd\x79\xdd\x60\xdd\x59\xbf\x18\xce\x15\x88\x5a\x66\
+\xce\x66\x1d\xba\x9c\xc1\xf8\x38\x8e\xfd\xda\x54\xff\x23\xb5\x33\
+\xb1\x2f\x9e\x6b\xaa\x78\xf4\xf6\xa6\xf1\xfb\xa3\x4c\x37\x22\xed\
+\x6b\xfc\x6d\x5d\x7a\xb8\x3f\x0f\x36\xf0\xa1\xbf\xee\xb5\x41\xcf\
+\x2f\xde\xe8\xef\x2a\xce\x22\x07\x33\x93\x3b\xfc\x3b\x39\xa7\x14\
+\x2f\x86\x5c\x9e\xa9\x63\x99\xf3\xa5\x55\xec\x28\xfd\x15\xdf\xfa\
+\xe6\x1a\x10\xa5\xa0\x65\x7c\xc9\xf0\x57\xc8\xbb\x5e\xe2\x62\xa8\
+\xeb\xe2\xa6\x32\x9b\xa5\x60\x6f\xce\xb7\xe2\x75\x76\x0c\x1d\x6b\
+\x16\xe2\xcb\x00\xdc\xb7\xfd\xca\x35\x30\x7e\xf0\x33\x3c\x65\x5f\
+\xe6\x5e\x0f\x39\x3e\x17\xe3\xf3\xf1\xaf\xd4\x46\x6f\x67\x2a\xb3\
+\xdd\x54\x66\xf1\x39\x79\x9f\x29\x9c\xd7\x6b\xd5\xf5\x75\x07\xf2\
+\x14\x97\xc8\xd5\x87\xc9\xba\x49\x4e\x1a\x57\xe7\xdc\x57\x62\x3b\
+\xc5\x03\xfe\xca\x19\x00\x4f\xf5\x30\xd6\x9b\xd3\x90\xf7\x05\xe3\
+\x41\xa0\xcb\xf6\xe6\x7a\x2c\x94\xfa\xe3\xbb\x99\xea\xca\x3a\xa3\
+\x3b\xd6\x97\x9c\x81\xf4\xab\xf0\x93\x18\xe3\xe3\x1c\x05\x5b\x9d\
+\xf4\x22\x8c\x67\xc1\xf5\x52\xac\xd7\x9f\x38\x68\xf8\xc6\x89\x6b\
+\x9b\xee\x65\x1c\xf8\x43\x5b\xee\xb5\x9e\x50\xea\xa8\x1d\x2b\xb6\
+\xde\x59\x77\xb2\xe3\x03\xfe\x4b\x7a\xe0\x5d\xa6\x87\x74\xfc\xdf\
+\xe3\x4e\xca\xb3\x8c\x7f\xef\xc3\x18\xee\x9d\xb0\x7a\xdb\x9e\x53\
+\xbc\x06\xb1\x43\x1c\xaf\x53\x0c\x78\x5d\xdc\x27\xfb\x25\x5d\xe3\
+\xfd\x74\x3d\x9b\xc8\x82\xce\x3d\xa8\xa8\xeb\x65\xf5\x9d\x9f\x66\
+\xea\x2b\x34\xf5\xe2\xe5\xc1\x1b\x1b\x65\xdc\x28\xa8\x8b\xf5\x67\
+\xeb\x3e\x27\xe2\x7d\x70\x64\xea\x5c\xaf\xc4\x00\x41\x89\xd7\xeb\
+\xc3\xd0\x76\xed\x4d\x2f\xb9\x26\xe9\xbf\xc6\xb1\xe5\x1f\x99\xdb\
+\xfc\xba\x6d\xc6\x51\x3a\xaf\xdc\x63\xa2\xf8\x9d\xcf\x52\x5d\x5b\
+\xf7\x67\x16\x77\x9d\x39\xb4\xb1\xf9\xd9\xd3\xf4\x73\x52\x33\xc8\
+\xd1\xf8\x18\xb3\xa1\x71\x6b\x5c\xbf\x3b\x67\x1f\xe6\x3a\x08\x9c\
+\x96\x53\xcb\x71\x7e\x71\x5f\x89\x97\x21\x6f\xdc\xe4\xba\xee\x54\
+\x9f\x7b\x9c\xfa\xa8\x17\xf7\x5d\xab\x3f\x3d\x93\x5f\xa6\x7b\x6d\
+\xd2\xc0\xa5\x79\xdb\xe6\x3a\xe8\x03\xeb\x8f\xe7\x6e\x6f\xd6\xfd\
+\xf1\x45\xaa\x2f\x8b\xfb\x2e\xff\x93\xb2\xe0\xd7\xfd\xf1\x26\xe2\
+\x43\x07\x3f\xeb\x23\x3d\xce\xf4\x07\x4e\x82\xe0\x65\x17\x62\xc5\
+\xfb\xd0\x74\x63\x10\x1b\xc0\xb8\xf9\x42\xc8\xf8\xf6\x09\x1a\x36\
+\x7f\x40\x87\xfe\x57\xd3\x69\x96\x8a\xb5\xb8\x41\xce\x66\x60\xe6\
+\x75\x68\x7e\x93\xb1\xe5\x18\x36\x6f\x4a\x6d\xfe\x49\x68\x26\x98\
+\xbf\x9f\x8e\xd8\xd1\x5e\x6f\x20\xf2\x77\xf8\x1e\x74\xde\xec\x8c\
+\xc7\xe3\xb7\x74\x8d\x9b\xce\x7c\x3e\x29\xec\xda\x4e\x1a\x1a\x40\
+\xe4\x54\x67\xed\xaa\x1c\x59\x97\x07\x35\xd7\xdb\x7c\x68\xbb\x93\
+\x23\x98\x12\x07\x0f\x36\x2d\xe8\x8f\x52\x67\x5e\x94\xb2\x79\x5c\
+\x5c\x8a\xe2\xff\x7a\x70\x1d\xaf\xea\x06\x7b\x53\x52\x47\x7c\x3e\
+\x36\xb5\xff\xc0\xf6\x3a\xb8\x90\xda\x9b\xf8\x63\x3d\xce\x8b\xcf\
+\xa8\xff\xa4\x7f\xfe\x63\xa3\xcf\xda\xc4\x18\x3c\x8e\x31\xff\xee\
+\xe3\x34\xdf\xd4\x87\x39\xca\x78\x8d\x5e\xa7\xcd\x8c\x72\x65\xc1\
+\xe5\xdc\x5c\xe8\xc7\x7e\x43\xec\xb7\x1d\xa7\x97\x2d\x97\x1b\x6d\
+\xc4\xe2\x87\x3a\xb6\x6e\xd3\x9e\x86\xef\x2f\xfb\x9b\x12\xcf\xc3\
+\x4c\xdd\x87\xd5\xe5\x75\x30\xfe\x63\x13\xed\xf6\xba\xed\xa8\xfe\
+\xc6\x32\x5d\xa7\x3f\x6f\xe9\x8f\xff\x4f\xaa\x2b\xd3\x86\xbf\xf6\
+\xfc\xb6\x7b\xed\x51\xa6\x82\x5d\x04\x6b\x5f\x76\xe5\xac\x8d\xd4\
+\xfe\x74\x8d\xa5\x7b\xd3\x07\xb1\xd1\xbb\x57\x5d\x4d\x6f\xac\x7f\
+\x15\xf8\xba\x50\xb4\xc5\x99\xb6\xfc\xf7\x3e\x8c\xa5\x60\xd3\x80\
+\xa5\xe9\xe7\xfa\x6e\x1a\xa0\x1d\xa7\x41\xc6\xe7\x8d\xe3\x2c\xfd\
+\xef\xb3\x16\x02\x07\xf3\xa1\x4e\x17\x6f\x32\x08\x10\x1e\x18\x7c\
+\xdb\xc8\xa2\xad\x35\x18\xea\x22\x70\x99\xb1\x1d\xb0\x71\x0f\xb4\
+\x2f\xcb\x9a\xce\xe9\x79\xd1\x66\x9f\x70\x1d\x64\x78\x9d\x9e\x8b\
+\xc7\xa9\x0d\x9d\x36\xdc\x0f\x3a\xee\xeb\x7a\xef\xe9\x1a\xe5\xec\
+\xc3\x64\x5b\xfa\x66\x63\x59\xb6\x26\x6d\xa7\xba\xb1\xae\x2f\x9b\
+\xfd\xab\x8f\x1b\xff\xfb\x34\x34\x1b\xb8\xbc\xde\x48\xc9\x4c\x83\
+\x5a\xf5\x25\xf7\x5a\xae\x37\x99\xa4\x36\xe5\xb6\xfe\xf8\xeb\x16\
+\xc6\x5d\x31\x68\x7a\x6b\x96\xf3\xa3\x8c\x7f\x4c\x44\xbd\x1b\x93\
+\xd0\xd2\x54\xd7\xf4\xb6\x52\x00\x93\x92\xdd\x3b\x70\xb9\xee\x94\
+\xfc\xe2\xff\xbf\xf0\xe0\x2d\xd2\xd3\x96\xff\xde\xd8\x02\x5c\x63\
+\xd8\xb4\xed\x97\x1d\x25\x6e\xee\xf3\xd5\x68\x13\x67\x19\x06\x4b\
+\xef\xba\xfa\xe2\x69\x20\x51\xf7\x79\x30\xb1\x09\x1c\xb4\xea\xc1\
+\x2f\x5c\x7e\xe2\x20\x8c\x63\x53\xd3\x6c\xeb\xe3\x75\xd4\x87\xc9\
+\xd5\x77\xbf\x5e\x0b\x34\xe3\x73\x64\x31\x92\x31\xf5\xc1\x18\x66\
+\x2c\xb5\xd0\xef\x88\xfd\xd4\xa1\x27\xd1\xac\x37\xd9\xbd\xf5\x9e\
+\x7d\x94\xf9\x26\x5c\xa8\x5e\x9d\x78\xdd\xd6\xee\x95\x02\x98\x14\
+\xec\x41\x81\xcb\xb4\xc8\xf5\xaf\xee\x9f\x0f\x8a\xb7\x48\xd3\x96\
+\xeb\xd7\xa8\x02\xd8\xe9\xfb\xee\x85\xe1\x6e\xda\x76\x79\x97\x8e\
+\x12\xff\x52\x77\x63\xa3\x1c\x59\x87\x5d\x77\xe2\xe7\x19\x3e\xc3\
+\xc6\x3d\xd0\x9e\x77\x39\xdb\xfa\x11\x6d\x6a\xba\x1d\x7a\x9a\x29\
+\x9e\xae\x51\xce\x31\xeb\x6e\xda\x2c\x30\xe7\x98\x7a\x3e\xe0\xba\
+\x73\x90\x71\xaa\x3d\xc3\x7e\x61\x72\xa7\xc0\x65\xf4\x28\xf3\x1f\
+\x96\x7d\xd9\x9d\xd6\x76\x86\x13\xc0\xa4\x40\x0f\x0d\x5c\xae\x37\
+\xbe\xfa\x55\x9d\xf7\xf0\x2d\x4c\x9a\xbe\xd3\x56\x36\xc0\xd5\x58\
+\x9f\x6f\x03\x0e\x60\x0a\x5c\x3e\xfc\x5e\x78\x5e\xe3\xbe\x9d\x86\
+\xfa\x6b\x79\x96\xf0\x22\x21\xc7\x0b\xad\xfd\x5c\xd3\x10\x81\xdb\
+\xdb\xfb\x26\xd6\x6e\x4c\x4b\x57\x0c\xf9\x05\xdf\xfa\x59\xd9\xdb\
+\xd9\x09\x0d\x4c\xb9\x9d\xe5\xdc\xd9\x3b\x8d\x5d\xe6\x03\xac\x37\
+\x07\x43\xdb\x4c\xac\xa0\xfe\xf8\xd0\x02\x98\xeb\xc0\xe5\x9d\xbe\
+\xd7\xa3\xcc\x85\xba\x08\xb2\x2f\xbb\x12\x83\x30\x67\x2d\xde\x40\
+\xb1\x41\x12\xc0\xa4\x04\x0f\x9d\x2a\x1e\xd2\x3d\xf3\xab\xa0\xbf\
+\x87\x6f\x99\xa6\x2d\xfe\xad\x77\x1d\xae\xaf\x57\x42\x87\x29\x76\
+\x28\x9e\x0c\xa8\xc3\x24\x70\x59\xaf\x83\x59\xa7\xdc\x72\x64\x1b\
+\x7e\x2a\xe4\x9e\xc8\x71\x3f\x58\xfb\x12\x5a\x68\xb7\x1a\x6e\x0b\
+\x86\x1a\xc0\xbc\x18\xc8\xb3\xf2\x24\x73\xff\xe5\x34\xe7\x54\xfa\
+\x34\x86\x19\xd2\xb2\x44\x02\x97\xcd\xb5\x37\x43\x0b\x60\xde\x2b\
+\x70\x19\x3d\x6a\xe0\x24\xac\x1d\xd5\x9d\xf8\x16\xff\x75\x8b\x37\
+\x50\x6c\x98\x04\x30\xe9\xd2\x83\x03\x97\x69\xbd\xb1\xbb\xac\x39\
+\x26\xa3\xbc\x4c\x6d\xad\x77\x79\xd9\xc7\xdd\x36\x1b\x68\xef\x97\
+\xa9\xc3\xb4\x30\x18\x1b\x6f\x00\xa0\xce\xda\x55\x29\xd3\x7d\x56\
+\xf3\x3c\x96\x05\x65\xc2\xe7\x58\x77\x73\xa6\x6a\x41\xe3\xed\x56\
+\xa3\xed\xfd\x00\x5f\xf0\x5d\xf7\x7d\xab\xef\xf5\x7c\x08\xcf\xca\
+\x06\xa6\x8f\x5f\x27\x0c\xe5\x9c\xf1\x98\xd6\x34\x3c\x18\xc0\xfd\
+\xf6\x5c\xe0\xb2\xf9\xfa\x5c\x1d\xb1\xbd\xe9\x7b\x39\x5f\xb7\x9b\
+\xf7\xed\x57\x3e\x6a\xa0\x40\x2f\x83\x4c\xa5\x2e\x9d\xb6\xb9\xb0\
+\xb2\x00\x26\x1d\xaa\x13\xb8\xbc\x6b\xa6\xf2\x62\xcc\x19\x77\x85\
+\x9b\xb6\xd4\x11\xd3\xbe\xfd\xb3\xc3\x14\x03\x98\x7d\xcd\x10\x18\
+\xcc\x60\xac\x0f\x1d\xcc\x1b\xe4\x78\xb9\x5a\xd2\x12\x1e\x39\xce\
+\x65\x3b\xe7\x14\x44\xe0\x1f\xed\xd6\x5e\x5b\x9b\x85\x6c\xbc\xe0\
+\xeb\xfb\x32\x43\xcb\x54\x6e\x6f\x06\xd6\x7f\xc9\x3d\xfd\x3d\x8e\
+\xb5\x4f\x33\x9f\x63\x1c\x53\x3f\x49\xd7\xa0\xaf\xfd\x04\xcb\x6c\
+\xb5\x57\xa7\x0f\xd2\x18\xa5\x8f\x7d\xda\x79\x6a\x67\xee\x5d\xd7\
+\x1f\x35\x74\x42\x32\x95\xba\xd5\xda\xfa\x97\x3f\x34\xb6\x06\x84\
+\xb4\x19\x84\xa8\x13\x54\x8a\x3b\x06\xde\xe5\x1e\xd1\x96\x15\x28\
+\xad\x13\x37\x69\xe1\x4f\x1d\xd9\x25\xf1\xc6\x36\xff\x28\x0d\xd2\
+\xfa\xd2\xc1\x5e\xa6\x4e\xf5\x1b\x57\xef\x41\x6d\xed\x93\x4c\x2f\
+\x71\x72\x4c\x19\x7f\x57\xd0\x7d\x70\x15\x6c\xdc\x03\x25\x5a\x67\
+\xd8\x5f\xb6\xdd\x26\xc4\x17\x64\x61\x15\x24\xeb\xe3\x98\xe8\x6d\
+\x7a\x56\x2e\x06\xda\x77\x89\xdf\x2f\xe7\x77\x9b\xe5\x9e\xf1\xb8\
+\x91\xc5\xdb\xa7\x20\x60\xce\x7e\x02\xf7\xab\x2f\xf3\xd0\xaf\x69\
+\xe4\xeb\xec\xdc\x83\x87\x26\x12\x3c\x6a\xa8\x20\x97\x06\xfd\x9d\
+\x8a\x83\xfa\x8f\x2d\xdf\x3c\x43\x5e\xf3\x85\xb2\x1c\xd4\x09\x42\
+\xa4\x8e\xc6\xf4\x0e\xff\xea\x62\xa8\x1d\xb8\x01\xd8\x6f\xa9\x9e\
+\xcd\x15\xf5\x4f\xdb\xfc\x45\xea\x60\x97\x9c\x85\x79\x95\x3a\xd5\
+\xbf\x0b\x42\xdf\xdb\x22\x64\x0c\xf8\xa6\x65\x3a\x26\x35\x3f\xe6\
+\xb2\xc0\xc1\x51\x8e\x8d\x7b\xa6\x6d\xce\x98\x81\x01\x5b\xa6\x81\
+\x71\xa7\x19\xf6\x29\x48\xd6\xa7\x00\xd4\xba\xbd\x3f\x1a\xc1\xcc\
+\x84\xdc\x3b\xc4\x67\x9f\xf1\xb8\x11\x04\x2f\xfd\x25\x71\xd6\x7e\
+\x02\x0f\xae\x2f\x97\x69\x1a\x79\xe9\x2f\x4d\xe2\x98\xea\xf7\xba\
+\xd9\xb9\x8f\x1a\x3c\xc1\xb7\x41\x20\xab\x4b\xb1\x33\x7c\xda\xf6\
+\xcd\x13\x2b\x65\x18\xde\x2e\x58\x94\x13\x88\xd8\xab\x13\x50\x4a\
+\x1d\x8c\xbb\xde\x17\xef\x14\x79\xb1\x9e\x36\x5c\xcf\xac\xd9\x73\
+\xf7\x0e\xf6\x51\x6a\xf7\x4b\x2b\xaf\xb9\x4e\xf5\x83\xac\x33\x96\
+\x72\x67\x2d\x0d\x2a\xeb\x72\xe3\x1e\x58\x64\x1a\x5c\xda\xb8\x07\
+\x1e\x2e\xde\x83\x07\xe9\x45\x55\x11\x01\xc3\xf8\xa2\x65\x23\x00\
+\xb5\x28\xb4\xdc\x16\x0d\xb5\xf7\x45\xf7\x5b\x42\xfe\xe5\x80\x1a\
+\x99\xf1\x18\x9f\x2f\xb1\x4e\xa7\xf3\x5d\x16\x76\xbf\x3d\x1f\x53\
+\xbd\xe9\x49\xdd\x7e\x9b\xfa\xe3\xa5\x25\x15\x2c\x52\x7f\xfc\x20\
+\xc7\xcb\x91\x47\x0d\x37\x0e\x36\xef\xe9\xd6\xeb\xb6\xd7\x52\xda\
+\xd8\x05\xcb\x9a\x17\xe4\x7e\x50\xee\xd5\xc9\x84\x4c\x1d\x8b\xbb\
+\x66\x24\x2f\xac\xdb\x52\xb4\x69\xc3\x0f\x58\xd7\xfe\xfe\x83\xb4\
+\x83\xf0\x3d\x88\xd9\xd5\x8b\xcb\xab\xd4\x69\xfb\x3d\x75\x92\x96\
+\xae\xce\x9d\xac\xd7\x02\xfb\x3d\x65\x2c\x65\x1d\x68\xa7\x65\x1e\
+\x72\x64\x4b\x97\x7a\x5f\xe6\xc8\xbe\xdc\x6f\x73\xb9\x1f\x18\x80\
+\xf5\xb2\x0d\x7b\x29\x68\x39\x2f\xf4\xf9\xb8\x48\x6b\x45\x97\x34\
+\x36\x9a\xa7\xbe\xce\xde\x18\x67\x18\xa5\x3e\x5e\xce\x00\x4f\x7c\
+\xc6\x9d\x35\x78\xbe\xf3\x42\x82\x98\xb1\xae\x14\xf5\x92\x80\x7f\
+\xd5\x95\x75\x52\xc1\xff\x0b\xab\x59\xd0\x5d\x26\x12\xae\xdb\xe7\
+\xac\x41\xee\xc7\x0d\x17\xe0\xbc\xea\x8c\xbd\x0c\xed\x6c\xac\xc0\
+\xcd\xe2\x6e\x68\x97\x6d\xbe\x19\x49\x01\xcc\xe7\xd5\xdf\x7d\x53\
+\xfd\x3c\x76\x09\xc8\xf0\xb0\xcc\x31\x05\xe8\x63\xb8\xfb\xb4\xc5\
+\x0f\x8a\xbd\xf8\x3a\xb1\x9f\xf9\xf3\x4e\x2c\x13\x50\xbb\xed\x8f\
+\x9d\xea\x83\xaa\xed\x3f\x4a\xd7\x27\x66\x93\xb5\x31\x1d\x36\x3e\
+\xdf\x62\x56\xde\x85\xcd\x78\xee\x5c\xdf\x63\x99\xfd\x19\xda\xd9\
+\x94\x2c\x47\x56\x61\xc9\xd7\x76\x9e\xa1\xaf\xb3\x9d\xee\x99\xb9\
+\xea\x09\x37\x5a\xa6\xe3\x4b\xe8\xe1\xb2\x3e\xe9\x7c\x17\x1b\x2f\
+\x73\x5e\x85\x76\xd6\xee\xfe\x6f\x1b\x5a\x1d\x9f\x3c\x27\xff\xeb\
+\x24\xc5\x27\x72\xf5\x51\xe2\x0b\xa8\xd7\x29\xfb\xad\xa9\x3a\x14\
+\x9f\x0f\x31\xb6\x12\xcf\xfb\x65\xaa\x47\x4d\xbf\xf4\x5a\xbf\x24\
+\xf8\x20\xcb\xb2\x57\xed\x4d\xbc\x6e\x6f\xe2\x91\x12\xd9\x9e\x85\
+\x76\x96\xdc\xba\x4c\x63\xe8\x8b\xa6\xfa\x96\x8f\x5b\xf8\x12\x71\
+\x10\xf3\x55\x35\xea\xd4\xe7\xaa\xe2\x76\xb1\x70\x75\xbc\x61\xe2\
+\xdf\x3c\x6b\xa1\x71\x65\x98\xde\xa6\x37\x48\xb5\x54\xf5\xf0\x2c\
+\xdc\xfd\x25\xca\xd2\x94\xe1\xe2\x1f\xca\xcf\x37\x06\x00\xcf\xc2\
+\xc3\x5e\x90\xc5\xb6\x69\x51\x60\x87\xac\xee\x80\x6c\x59\xc0\xf5\
+\x59\x77\x76\xe7\xe9\x3a\x4d\x37\xae\x53\x8e\x67\xc1\x32\x5d\xbf\
+\x4f\xa1\x9d\xe0\xdb\x43\xcf\xb1\xeb\xb5\xbf\xaf\xc2\x3f\x97\x71\
+\xb9\xec\x68\xd0\xfa\x67\x86\xb2\x28\x36\xcb\x23\xd6\xbf\x14\xb0\
+\xd7\xcf\xa9\x5f\xef\x97\x03\xbe\x1f\x4b\x7c\x5e\x6c\x2a\xa9\x7c\
+\x2e\xc3\xf7\x8c\xa1\xab\x21\x05\x4d\xd2\xf3\x2a\x06\xb8\xde\x6e\
+\xf4\x63\x9e\x66\x7c\x3e\x6e\xd6\x8d\x58\x6e\x5f\x5a\xcc\x92\x2b\
+\xf5\xfe\xbf\xb1\x9f\x52\x95\xff\x41\xc8\x1b\xd0\xd9\x6e\xe9\xdc\
+\x17\xe9\xfa\x1e\xa4\xf5\xa4\xd7\xf5\x67\x37\x63\xdd\x89\x2f\x09\
+\x2e\x0a\xbd\xf7\x3e\xa4\xf3\xe3\x6e\xf5\x65\xdd\x1f\xdf\xfe\xa1\
+\xbd\x99\x64\xea\x67\x6e\xd6\x97\xc6\xef\xe1\xad\x36\x0a\x2d\xad\
+\xbd\xf8\x5a\xf5\xe9\xbc\x43\xf9\xa4\x8b\x81\x4b\x5a\x67\xf0\x2c\
+\xb4\x93\x81\xc3\x30\x5c\xaf\x49\x93\xa3\xc3\x95\xde\x38\xdd\x67\
+\x3a\x87\x8d\x5a\x7a\x28\xbd\x89\xde\xfe\x45\x3b\xb3\x0e\xe6\x5c\
+\xca\x3c\xe8\xec\x3a\x4d\x52\x87\x69\x9a\xfe\xa7\xbb\xac\x5f\xfa\
+\x65\xa3\x43\xbd\x34\x1d\x1c\x80\x01\x3f\x1f\x77\x53\x7f\xe6\x8f\
+\xf0\xeb\x80\x58\xec\xcb\xfc\xb9\xf1\x8c\xbc\x92\x21\x37\xfa\xbe\
+\xf0\xba\x1e\xfd\x16\x7e\x1d\xa0\x8a\x75\xe5\x3f\x29\x4e\x70\xa9\
+\xee\x8c\xaa\xae\xac\xc7\x4c\xf7\x69\x6f\x3a\xef\x8f\x6f\xb5\x58\
+\x38\x7f\x05\x6f\xa5\xbb\x76\xbd\x23\x78\x47\x01\xcc\x78\xed\x63\
+\x10\x7b\xe6\x32\x70\x87\x7a\xfa\x3c\x47\x83\x98\x1e\xe2\x9f\xef\
+\xf3\xb7\xd3\x8e\x6d\x00\x00\x00\x40\x01\xb6\xda\xfa\x43\x29\xad\
+\xf9\xa3\x22\xef\x5c\x67\x01\xcc\x8d\x7a\x60\x1a\x39\x3f\x93\x65\
+\x9a\x78\xaa\x6b\xf1\x4d\xd2\xe7\x7b\xd6\xb5\x3d\xeb\x1e\x02\x00\
+\x00\x40\x39\xb6\xda\xfc\x63\x3b\x87\xe7\x31\x78\xb9\xaf\xd8\x3b\
+\xd7\x75\x00\x73\x12\x56\x01\xcc\xa9\x4b\x41\xb2\x0c\xab\xe9\xda\
+\x8b\x8c\x75\x2c\xae\xb5\x7b\x9f\xc0\xe5\x7a\x47\x48\x00\x00\x00\
+\xa0\x10\x8f\x5a\xfe\x7b\x71\x61\x5c\xeb\x8c\x75\xef\x3a\x23\x2d\
+\x4d\xe5\x6e\x5d\x9c\x0e\x9c\x82\x44\x47\xea\x03\x61\xb5\x11\xc3\
+\x93\x8c\x81\xcb\x58\xaf\xe3\x8b\x92\xfb\xd6\xef\x23\x97\x02\x00\
+\x00\x00\xca\xb2\xd5\xf6\x1f\xdc\x39\x3c\x8f\x1b\xf7\x9c\x2a\xfa\
+\x22\x74\x9a\x81\x99\xea\xc3\x24\xc8\xc2\x1c\xab\x65\xc8\x98\x6d\
+\x99\xea\x53\x0c\x58\xc6\xa9\xe2\xf7\xdd\x1c\x6a\x5e\x9d\xc7\x81\
+\x4b\x02\x00\x00\x00\x65\xd9\xea\xe2\x8f\xee\x1c\x9e\xc7\xe0\xc2\
+\x54\xf1\x17\xa1\xf3\x00\x66\xaa\x13\x31\xa8\x7d\x1c\xac\x85\x39\
+\x16\x6f\xab\xe3\x24\x67\xbd\xab\x11\xb8\x8c\xe7\xf0\xbb\xdd\xa7\
+\x01\x00\x00\xa0\x3c\x8f\x3a\xfa\xbb\xa6\x8f\x97\xa3\xd3\x29\xe4\
+\x6b\xdf\xde\xbf\x88\xc1\xac\xdf\xab\x63\xee\x92\x0c\x5a\x0c\x96\
+\xc7\x29\xe2\x47\x85\x04\x2e\xa3\x13\x81\x4b\x00\x00\x00\x28\xd3\
+\x56\x57\x7f\xd8\xee\xe3\xc5\x29\x22\x03\x33\xd5\x8d\x69\x58\x2d\
+\x2d\xb0\xeb\xb2\x0c\x46\xac\x57\x31\x60\x39\x6f\xa0\xbe\xd4\x09\
+\x5c\x5e\x56\xe7\xf4\xc4\xe5\x01\x00\x00\x80\x32\x75\x95\x79\x19\
+\x33\xed\xe2\x26\x1d\x17\x2e\x41\x31\x62\xe0\xe7\xaf\x9d\xc3\xf3\
+\xce\x03\x86\x71\x0d\xc4\x14\x50\x8a\x19\xba\x4b\x97\xa6\xf7\x4e\
+\xc2\x6a\x5a\xf6\x3c\xf7\x07\xa7\x35\x53\x1f\x1a\xb8\x8c\x6c\xd2\
+\x03\x00\x00\x00\x05\xdb\xea\xf2\x8f\xa7\x8c\xa9\xaf\xd5\x31\x71\
+\x29\x8a\x11\x33\xe4\x9e\xe7\xdc\x44\x25\x43\x1d\x89\xeb\x61\xbe\
+\x0a\xd6\xc3\xec\x9b\x79\x58\x4d\xc9\x5e\x36\x54\x37\xae\x97\x3c\
+\xa8\x51\x2f\xde\xc6\xe9\xeb\x2e\x13\x00\x00\x00\x94\x6b\xab\xeb\
+\x13\x48\x53\x84\x3f\xbb\x14\xc5\x39\x68\x22\x53\xae\x46\x3d\x11\
+\xc4\xec\x8f\x58\x6f\x1a\x0b\x5a\x6e\xb4\x1b\x1f\x6b\xd4\x85\x78\
+\x6e\x4f\xac\x75\x09\x00\x00\x00\x65\xdb\x2a\xe1\x24\x76\x0e\xcf\
+\xdf\x84\xd5\x4e\xd3\x94\x65\xfe\xed\xfd\x8b\x83\x92\x4e\x48\x10\
+\xb3\xec\xfa\x12\x1a\x0e\x5a\xa6\x3a\x30\xab\x7e\x9c\xd5\xfc\x98\
+\xbd\x52\xb2\x8b\x01\x00\x00\x80\x9f\xdb\x2a\xe5\x44\x76\x0e\xcf\
+\x63\xf6\xe5\xd4\x25\x29\x4e\x31\x1b\xf9\xfc\x50\x5f\x04\x31\xcb\
+\x31\x0f\x2d\x04\x2d\xd3\x75\x3f\x4d\xd7\xbd\x0e\xd3\xc5\x01\x00\
+\x00\xa0\x27\x4a\x0a\x5e\xc6\x00\xd4\x5f\x41\x20\xaa\x44\x45\xad\
+\x83\x79\x43\xdd\x99\x85\x55\xe6\xee\xc4\xa5\x6a\xb5\x4e\xbc\x0b\
+\xab\xec\xdc\x65\x4b\xed\x43\xcc\xb6\xdc\xaf\xf9\x51\xf1\x5c\x4d\
+\x17\x07\x00\x00\x80\x9e\xd8\x2a\xe9\x64\xac\x7f\x59\xbc\x98\x5d\
+\xf7\xa6\xd4\x93\x4b\xf5\xe7\x65\x75\xcc\x5c\xaa\xc6\xc4\x4c\xdc\
+\x77\x6d\xae\x87\x9a\x36\xe6\x89\xeb\x5b\x4e\x32\x7c\x9c\xe9\xe2\
+\x00\x00\x00\xd0\x23\x5b\xa5\x9d\x90\xf5\x2f\x8b\xb7\x08\xab\xcd\
+\x7c\x96\xa5\x9e\x60\xca\xd2\x9b\x85\xd5\x94\xf2\x89\x4b\x56\x5b\
+\xcc\x52\x9c\x57\xc7\x87\xea\xba\x5f\xb6\x7c\x2d\xe3\x75\x8c\x53\
+\xc5\x73\x64\x64\x9b\x2e\x0e\x00\x00\x00\x3d\xb3\x55\xe2\x49\xed\
+\x1c\x9e\xc7\x2c\xab\x7d\x97\xa7\x58\x31\x98\x15\x03\x98\x17\xa5\
+\x9f\x68\xca\xda\x5b\x67\x63\x5a\x92\xe0\x7e\xe2\xf5\xfd\xd0\xc5\
+\x75\x4e\x01\xe8\xd3\x90\x2f\x8b\xf6\xb2\xfa\x1e\x4f\x5c\x52\x00\
+\x00\x00\xe8\x97\x52\x83\x97\x31\x70\x11\xa7\x8f\xef\xba\x44\x45\
+\x8b\x41\xad\x83\xbe\xac\x1f\x58\xd5\xab\x18\x10\x7f\x16\x56\x81\
+\x71\x81\xcc\x9f\x5f\xd3\x4f\xf1\x67\x57\xd7\x35\xf3\x34\xf1\x28\
+\x7e\x8f\x27\x25\x67\x0b\x03\x00\x00\x00\x37\xdb\x2a\xf5\xc4\x52\
+\x00\x23\x06\x30\x05\x99\xca\x16\x03\x43\x47\x6d\xae\x81\x98\xb1\
+\x7e\xc5\x8c\xcc\x69\x18\x77\x90\x7c\x19\x56\x4b\x01\x7c\x2a\x21\
+\x93\xb6\xa1\x65\x23\x0e\xfa\x56\x3f\x01\x00\x00\x80\x95\xad\x92\
+\x4f\xce\x06\x3e\xbd\xb2\x08\x85\xaf\x85\x79\x4b\x3d\x9b\x84\x55\
+\x10\xf3\x69\xfa\x39\x19\xf0\x75\xba\x4a\xd7\xea\x4b\xfc\xd9\xf6\
+\x1a\x96\xb7\x5c\x83\x18\x40\x8e\xbb\x89\xe7\x0e\x24\xc7\xdd\xd0\
+\x0f\xdc\x9e\x00\x00\x00\xd0\x4f\x5b\xa5\x9f\x60\xda\xb0\xe3\xcc\
+\xa5\xea\x8d\x93\xb0\xda\x18\xe5\xaa\xaf\x5f\x60\x23\x98\xf9\x47\
+\x58\x05\xd3\xa6\x3d\xbe\x1e\xcb\xb0\x0a\x56\xfe\x19\x0a\x0a\x56\
+\x6e\x94\x75\xcc\xac\x7e\x1d\x9a\xd9\xa4\xcb\x3a\x97\x00\x00\x00\
+\xd0\x73\x5b\x7d\x38\xc9\x9d\xc3\xf3\x18\xbc\x9c\xb9\x5c\xbd\xb1\
+\xac\x8e\x93\x21\x4d\xd5\x4d\x59\xc0\x93\xf0\x3d\xa0\x39\x09\xe5\
+\x65\x68\x2e\x52\xd9\xc7\x40\x65\x0c\x52\x5e\x96\x1c\x44\x4e\x65\
+\x7a\xd6\x50\x39\x5a\xe7\x12\x00\x00\x00\x06\x60\xab\x2f\x27\x6a\
+\x07\xf2\x5e\x5a\x84\x55\x10\x73\x31\xd4\x2f\x98\x02\x70\xd1\xfa\
+\x67\x0c\x6e\x6e\xa7\x23\xe7\x14\xe8\x65\x3a\xa2\x18\x98\xfc\x4f\
+\xfa\x19\x83\x74\x97\x7d\xca\x74\x4d\x99\xad\xa7\x0d\xdf\xcf\x7b\
+\x43\xae\x77\x00\x00\x00\x30\x16\x7d\x0a\x5e\xda\x81\xbc\xbf\x16\
+\xa1\xa7\xeb\x61\x66\xac\xbf\x93\x70\xbf\x0c\xc3\xab\xd2\xa6\x78\
+\x67\xba\x87\xe3\x14\xf1\x57\xa1\xd9\x8d\xb8\x6c\xd0\x03\x00\x00\
+\x00\x03\xb1\xd5\xa7\x93\x4d\xc1\x8f\xaf\x61\xd8\x1b\xaa\x0c\xd9\
+\x3c\xac\x32\x31\x97\x8a\x62\x5c\xd2\xda\xb5\x31\xdb\x72\xbb\xe9\
+\x3a\x66\x83\x1e\x00\x00\x00\x18\x8e\xad\xbe\x9d\x70\xda\x95\x38\
+\x66\x60\x6e\xbb\x7c\xbd\x35\x0f\x82\x98\xa3\x90\x82\x96\x71\x33\
+\x9e\x49\x0b\x7f\xee\xa2\xaa\x53\xcf\x95\x3a\x00\x00\x00\x0c\xc7\
+\x56\x1f\x4f\x5a\x00\x73\x30\x16\x61\xe0\x6b\x62\x8e\x55\xcb\x41\
+\xcb\x28\x4e\xb1\xdf\xeb\xf3\x2e\xf7\x00\x00\x00\xc0\xbf\x6d\xf5\
+\xf5\xc4\xd3\x46\x29\x9f\x5d\xc2\x41\x88\x81\xa7\x77\xd6\x29\xec\
+\xbf\x0e\x82\x96\xd1\x32\xac\x76\x16\x17\xb8\x04\x00\x00\x80\x81\
+\xd9\xea\xf3\xc9\xa7\x40\xc9\x99\xcb\x38\x18\x31\xf8\xf4\x2e\xac\
+\xd6\x2d\x5c\x2a\x8e\xde\xdc\x87\x31\x03\x3a\xde\x8b\x71\x23\x9e\
+\x49\x07\x75\x66\x6f\x68\x9b\x1b\x01\x00\x00\x00\x2b\x5b\x7d\xff\
+\x02\x02\x98\x83\x75\x51\x1d\x9f\x64\x63\x16\x7d\xef\x4d\xc2\x2a\
+\x60\x19\xef\xc1\x2e\x96\x70\x10\xb8\x04\x00\x00\x80\x81\xdb\x1a\
+\xc2\x97\x10\xc0\x1c\xb4\x18\xa0\x8a\x81\xcc\x77\x82\x54\xc5\xdc\
+\x6f\xfb\x61\x15\xb4\x9c\x76\x7c\x2a\x7b\xd6\x4b\x05\x00\x00\x80\
+\x61\xdb\x1a\xca\x17\x11\xc0\x1c\x85\x65\x58\x05\x32\x3f\x08\x64\
+\xb6\x7e\x7f\xc5\x4d\xb2\x5e\x86\xee\xb2\x2c\x7f\x74\x20\x2b\x17\
+\x00\x00\x00\x86\x6f\x6b\x48\x5f\x46\x00\x73\x54\x96\x61\x15\xc8\
+\xfc\xf2\xed\xfd\x8b\x0b\xc5\xd1\xc8\xfd\x34\xa9\x7e\xc4\x2c\xcb\
+\x18\xb4\xdc\x2d\xe8\xd4\x04\x2e\x01\x00\x00\x60\x24\xb6\x86\xf6\
+\x85\x04\x30\x47\x29\x4e\x2d\x5f\x54\xc7\xa7\xf8\xd3\x66\x3f\xb5\
+\xee\x9f\x49\x28\x33\x60\xb9\x26\x70\x09\x00\x00\x00\x23\xb2\x35\
+\xc4\x2f\x25\x80\x39\x7a\xcb\xf0\x3d\x98\x79\x29\x98\xf9\xcb\xfb\
+\x65\x5a\xfd\x78\x16\x56\x41\xcb\x49\xc1\xa7\x2a\x70\x09\x00\x00\
+\x00\x23\xb3\x35\xd4\x2f\x26\x80\xc9\x86\x65\x58\x05\x33\xff\x0c\
+\xab\xcc\xcc\x51\xaf\x97\x99\xd6\xaf\x9c\x56\xc7\xd3\xb0\x0a\x58\
+\xf6\x81\xc0\x25\x00\x00\x00\x8c\xd0\xd6\x90\xbf\x9c\x00\x26\xb7\
+\x58\x54\x47\x0c\x62\xc6\x80\xe6\x72\xa8\xbb\x56\x57\xf7\x40\xdc\
+\x5c\x67\x33\x58\x19\xff\x79\xbb\x67\x5f\x43\xe0\x12\x00\x00\x00\
+\x46\x6a\x6b\xe8\x5f\x30\x05\x30\x4f\x43\xff\x02\x36\xb4\x6f\x99\
+\x8e\x2f\x61\xb5\x8e\x66\x0c\x6e\x2e\xfb\x32\xed\x3c\x65\x54\x4e\
+\xc2\x2a\x40\xf9\x47\xfa\x39\xe9\xf1\xf5\x88\xd7\xe0\xf9\x50\x03\
+\xcb\x00\x00\x00\xc0\xaf\x6d\x8d\xe1\x4b\xa6\xa0\xce\xe7\x20\x80\
+\xc9\xc3\xc5\x40\x66\x0c\xa6\x2d\xab\xe3\xef\xf0\x3d\xb8\x19\xb5\
+\x12\xe0\xdc\xc8\xa2\x8c\xa6\xe9\xe7\xd3\x54\xaf\x77\x07\x56\xde\
+\xb1\x7c\xf7\xc6\x3e\xc5\x1f\x00\x00\x00\xc6\x6e\x6b\x2c\x5f\x54\
+\x00\x93\x16\x2d\x7e\xf8\xef\xcb\xb0\x0a\x78\xde\xd5\xd3\x1f\xfe\
+\xfb\x74\x64\xe5\x27\x70\x09\x00\x00\x00\x5c\xdb\x1a\xd3\x97\xdd\
+\x39\x3c\x9f\x54\x3f\x3e\x86\xe1\x65\xa9\xc1\x50\xc4\x80\x65\x0c\
+\x5c\x5e\x29\x0a\x00\x00\x00\x60\x6b\x6c\x5f\x38\x4d\xbd\x8d\x19\
+\x98\x02\x98\x50\x16\x81\x4b\x00\x00\x00\xe0\x1f\xb6\xc6\xfa\xc5\
+\x77\x0e\xcf\xe3\x2e\xe4\x33\x55\x00\x8a\x30\xff\xf6\xfe\xc5\x81\
+\x62\x00\x00\x00\x00\x36\x3d\x1a\xeb\x17\x4f\x81\x92\xb7\xaa\x00\
+\x74\xee\x48\xe0\x12\x00\x00\x00\xb8\xc9\xd6\xd8\x0b\x60\xe7\xf0\
+\x7c\x56\xfd\x38\x53\x15\xa0\x75\x71\x7a\xf8\xc1\xb7\xf7\x2f\x2e\
+\x14\x05\x00\x00\x00\x70\x93\x2d\x45\x60\x27\x72\xe8\xc0\xb2\x3a\
+\x9e\xdb\x51\x1c\x00\x00\x00\xb8\xcd\x23\x45\x70\x3d\x85\x3c\x06\
+\x50\x9e\x84\xd5\x86\x21\x40\xb3\x16\xf1\x7e\x13\xb8\x04\x00\x00\
+\x00\x7e\x45\xe6\xe5\x86\xb4\x13\xf9\x69\xb0\x91\x0f\x34\xe5\xe4\
+\xdb\xfb\x17\x6f\x14\x03\x00\x00\x00\x70\x17\x82\x97\x37\xd8\x39\
+\x3c\x7f\x1d\x56\x41\x4c\x20\x8f\xb8\xbe\x65\x9c\x26\xbe\x50\x14\
+\x00\x00\x00\xc0\x5d\x09\x5e\xfe\x84\x75\x30\x21\x9b\x38\x3d\x3c\
+\x06\x2e\x97\x8a\x02\x00\x00\x00\xb8\x0f\xc1\xcb\x5b\xa4\x69\xe4\
+\x1f\xab\x63\xaa\x34\xe0\x41\x4c\x13\x07\x00\x00\x00\x1e\x4c\xf0\
+\xf2\x0e\x76\x0e\xcf\xdf\x54\x3f\x8e\x95\x04\xdc\x99\x69\xe2\x00\
+\x00\x00\x40\x6d\x82\x97\x77\xb4\x73\x78\x3e\x0d\xab\x2c\x4c\xd3\
+\xc8\xe1\x76\x17\xd5\x71\xf0\xed\xfd\x8b\x2b\x45\x01\x00\x00\x00\
+\xd4\x21\x78\x79\x0f\xa6\x91\xc3\xad\x62\xb0\xf2\xe8\xdb\xfb\x17\
+\x73\x45\x01\x00\x00\x00\xe4\x20\x78\xf9\x00\x76\x23\x87\x7f\x59\
+\x84\x55\xb6\xe5\x52\x51\x00\x00\x00\x00\xb9\x08\x5e\x3e\x50\xda\
+\x8d\xfc\xac\x3a\x76\x95\x06\x23\x16\xb3\x2d\xe3\xa6\x3c\x6f\x15\
+\x05\x00\x00\x00\x90\x9b\xe0\x65\x0d\x69\x1a\x79\xdc\xc8\xe7\xb5\
+\xd2\x60\x84\x16\x41\xb6\x25\x00\x00\x00\xd0\x20\xc1\xcb\x0c\xd2\
+\x66\x3e\x31\x0b\x73\xa2\x34\x18\x01\x6b\x5b\x02\x00\x00\x00\xad\
+\x78\xa4\x08\xea\xfb\xf6\xfe\xc5\xa2\xfa\xf1\xa4\x3a\x4c\x9d\x65\
+\xe8\xe6\xd5\xf1\xbb\xc0\x25\x00\x00\x00\xd0\x06\x99\x97\x99\xc9\
+\xc2\x64\xa0\x96\x61\x35\x45\x7c\xa1\x28\x00\x00\x00\x80\xb6\x08\
+\x5e\x36\xc0\x5a\x98\x0c\x48\x9c\x22\xfe\xee\xdb\xfb\x17\x6f\x14\
+\x05\x00\x00\x00\xd0\x36\xc1\xcb\x06\xc9\xc2\xa4\xe7\xe6\x61\xb5\
+\x93\xf8\x52\x51\x00\x00\x00\x00\x5d\x10\xbc\x6c\xc1\xce\xe1\xf9\
+\x9b\xb0\xca\xc4\x84\x3e\x58\x84\x55\xd0\x72\xa1\x28\x00\x00\x00\
+\x80\x2e\x09\x5e\xb6\x64\xe7\xf0\x7c\x12\x56\x59\x98\x53\xa5\x41\
+\xa1\x96\x61\x15\xb4\x9c\x2b\x0a\x00\x00\x00\xa0\x04\x82\x97\x2d\
+\xdb\x39\x3c\xdf\xaf\x7e\x9c\x06\x53\xc9\x29\x87\x75\x2d\x01\x00\
+\x00\x80\x22\x09\x5e\x76\x20\x6d\xe8\x13\x37\xf3\x31\x95\x9c\xae\
+\x9d\x54\xc7\xdb\x6f\xef\x5f\x5c\x29\x0a\x00\x00\x00\xa0\x34\x82\
+\x97\x1d\x32\x95\x9c\x0e\xcd\x83\xcd\x78\x00\x00\x00\x80\xc2\x09\
+\x5e\x16\xc0\xae\xe4\xb4\x68\x1e\x04\x2d\x01\x00\x00\x80\x9e\x10\
+\xbc\x2c\xc8\xce\xe1\xf9\x7a\x2a\xf9\xb6\xd2\x20\xb3\x79\x10\xb4\
+\x04\x00\x00\x00\x7a\x46\xf0\xb2\x30\xd6\xc3\x24\xb3\x79\x10\xb4\
+\x04\x00\x00\x00\x7a\x4a\xf0\xb2\x50\x69\x3d\xcc\x18\xc0\x9c\x29\
+\x0d\x1e\x60\x1e\x04\x2d\x01\x00\x00\x80\x9e\x13\xbc\x2c\x5c\x0a\
+\x62\x9e\x56\xc7\xbe\xd2\xe0\x17\xe2\x8e\xe1\xef\x82\xdd\xc3\x01\
+\x00\x00\x80\x81\x10\xbc\xec\x89\xb4\xa9\x4f\xcc\xc4\x9c\x2a\x0d\
+\x7e\xb0\xac\x8e\x93\xea\xb8\x10\xb4\x04\x00\x00\x00\x86\x44\xf0\
+\xb2\x67\x04\x31\xd9\xb0\xa8\x8e\x0f\xdf\xde\xbf\x98\x2b\x0a\x00\
+\x00\x00\x60\x88\x04\x2f\x7b\x4a\x10\x73\xd4\xe6\xd5\xf1\xee\xdb\
+\xfb\x17\x97\x8a\x02\x00\x00\x00\x18\x32\xc1\xcb\x9e\x13\xc4\x1c\
+\x8d\x65\x58\xad\x67\x39\x37\x35\x1c\x00\x00\x00\x18\x0b\xc1\xcb\
+\x81\x48\x41\xcc\x97\xc1\xee\xe4\x43\x73\x11\x56\x53\xc3\x2f\x14\
+\x05\x00\x00\x00\x30\x36\x82\x97\x03\x93\x76\x27\x8f\x99\x98\x33\
+\xa5\xd1\x5b\xcb\xb0\xca\xb2\x8c\x1b\xf0\x2c\x15\x07\x00\x00\x00\
+\x30\x56\x82\x97\x03\x95\x82\x98\xb3\xea\x78\x55\x1d\xdb\x4a\xa4\
+\x78\x71\x2a\xf8\x3a\xcb\x72\xa1\x38\x00\x00\x00\x00\x04\x2f\x07\
+\x6f\xe7\xf0\x3c\x06\x2e\xf7\xc3\x2a\x1b\x73\xa2\x44\x8a\x13\x03\
+\x96\x9f\xc2\x2a\xcb\xd2\x5a\x96\x00\x00\x00\x00\x1b\x04\x2f\x47\
+\x64\xe7\xf0\x3c\x06\x31\x63\x26\xe6\x54\x69\x74\x2a\xee\x12\xfe\
+\x21\x98\x16\x0e\x00\x00\x00\x70\x2b\xc1\xcb\x11\x4a\x53\xca\x63\
+\x10\x73\x16\x4c\x29\x6f\xcb\x32\x58\xc7\x12\x00\x00\x00\xe0\x5e\
+\x04\x2f\x47\x6c\x63\x4a\x79\x0c\x64\xee\x2a\x91\xec\x62\x86\xe5\
+\x7a\x4a\xf8\xa5\xe2\x00\x00\x00\x00\xb8\x1f\xc1\x4b\xae\xed\x1c\
+\x9e\xc7\xe0\x65\x0c\x62\xc6\x60\xa6\x6c\xcc\x87\x33\x25\x1c\x00\
+\x00\x00\x20\x13\xc1\x4b\xfe\x65\xe7\xf0\x7c\x56\xfd\x78\x19\xac\
+\x8d\x79\x57\xeb\x4d\x77\x16\x02\x96\x00\x00\x00\x00\xf9\x08\x5e\
+\xf2\x53\x69\x6d\xcc\x59\x58\x05\x32\x27\x4a\xe4\xbf\x96\x61\x15\
+\xb0\xfc\xf2\xed\xfd\x8b\x0b\xc5\x01\x00\x00\x00\xd0\x0c\xc1\x4b\
+\xee\x24\x4d\x2b\x8f\x41\xcc\x59\x18\xdf\xb4\xf2\xab\xea\x58\x54\
+\xc7\x97\x60\x3a\x38\x00\x00\x00\x40\x6b\x04\x2f\xb9\xb7\x9d\xc3\
+\xf3\xb8\x2e\xe6\xb3\x30\xec\xf5\x31\x17\x61\x15\xac\x8c\x53\xc1\
+\x17\xae\x3a\x00\x00\x00\x40\xfb\x04\x2f\xa9\x65\x40\x81\xcc\x45\
+\x10\xac\x04\x00\x00\x00\x28\x8a\xe0\x25\xd9\xec\x1c\x9e\x4f\xc3\
+\xf7\x40\xe6\xa4\xe0\x53\x5d\x4f\x03\xff\x33\x08\x56\x02\x00\x00\
+\x00\x14\x4b\xf0\x92\x46\xa4\x35\x32\xa7\x61\x15\xcc\x9c\x76\x7c\
+\x3a\x8b\xea\xb8\x0c\xdf\x83\x95\x4b\x57\x08\x00\x00\x00\xa0\x7c\
+\x82\x97\x34\x6e\xe7\xf0\x3c\x4e\x27\x9f\x86\xef\x81\xcc\x49\x83\
+\x7f\x6e\x11\xbe\x07\x2a\x2f\xbf\xbd\x7f\x71\xe9\x0a\x00\x00\x00\
+\x00\xf4\x93\xe0\x25\xad\xdb\x39\x3c\x9f\x84\x55\x10\xf3\x69\x78\
+\x78\x30\x73\x51\x1d\xcb\xea\xf8\x7b\xfd\xcf\x32\x2a\x01\x00\x00\
+\x00\x86\x45\xf0\x92\xce\x6d\x64\x66\xc6\xa9\xe6\x4f\x7f\xf8\xbf\
+\x97\x61\x15\xa0\x5c\xa6\x23\x66\x53\x5e\x29\x35\x00\x00\x00\x80\
+\xe1\xfb\xff\x02\x0c\x00\x09\x49\x0a\xdd\x73\x41\xda\xaa\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x0f\
+\x00\x40\x3d\x47\
+\x00\x68\
+\x00\x65\x00\x6c\x00\x70\x00\x5f\x00\x67\x00\x72\x00\x61\x00\x70\x00\x68\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x14\
+\x02\x26\x8e\xa7\
+\x00\x61\
+\x00\x70\x00\x70\x00\x6c\x00\x69\x00\x63\x00\x61\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\
+\x00\x70\x00\x6e\x00\x67\
+\x00\x13\
+\x04\x36\x7d\xe7\
+\x00\x6d\
+\x00\x61\x00\x78\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x5f\x00\x62\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x2e\x00\x70\
+\x00\x6e\x00\x67\
+\x00\x0f\
+\x06\x80\x48\x47\
+\x00\x6d\
+\x00\x61\x00\x69\x00\x6e\x00\x5f\x00\x67\x00\x72\x00\x61\x00\x70\x00\x68\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x07\x82\x60\x47\
+\x00\x72\
+\x00\x65\x00\x73\x00\x65\x00\x61\x00\x72\x00\x63\x00\x68\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x10\
+\x08\x50\xe3\x87\
+\x00\x63\
+\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x5f\x00\x62\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x08\x97\xa2\x07\
+\x00\x73\
+\x00\x74\x00\x61\x00\x72\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x13\
+\x0a\x5e\x7d\xc7\
+\x00\x6d\
+\x00\x69\x00\x6e\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x5f\x00\x62\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x2e\x00\x70\
+\x00\x6e\x00\x67\
+\x00\x0d\
+\x0b\xa5\x3a\xc7\
+\x00\x73\
+\x00\x69\x00\x64\x00\x65\x00\x5f\x00\x6d\x00\x65\x00\x6e\x00\x75\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x0b\xdf\x21\x47\
+\x00\x73\
+\x00\x65\x00\x74\x00\x74\x00\x69\x00\x6e\x00\x67\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x0c\xa4\x7a\x87\
+\x00\x62\
+\x00\x61\x00\x63\x00\x6b\x00\x5f\x00\x6d\x00\x65\x00\x6e\x00\x75\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0f\
+\x0e\x53\x1a\xa7\
+\x00\x75\
+\x00\x6e\x00\x6e\x00\x5f\x00\x6c\x00\x6f\x00\x67\x00\x6f\x00\x5f\x00\x72\x00\x75\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0c\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x34\x00\x00\x00\x00\x00\x01\x00\x00\x04\x93\
+\x00\x00\x00\x62\x00\x00\x00\x00\x00\x01\x00\x00\x0c\xfd\
+\x00\x00\x00\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x15\xdc\
+\x00\x00\x00\xb2\x00\x00\x00\x00\x00\x01\x00\x00\x1b\x53\
+\x00\x00\x00\xd0\x00\x00\x00\x00\x00\x01\x00\x00\x1d\x0f\
+\x00\x00\x00\xf6\x00\x00\x00\x00\x00\x01\x00\x00\x25\x0c\
+\x00\x00\x01\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x2c\x1c\
+\x00\x00\x01\x3a\x00\x00\x00\x00\x00\x01\x00\x00\x34\x8a\
+\x00\x00\x01\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x35\x89\
+\x00\x00\x01\x78\x00\x00\x00\x00\x00\x01\x00\x00\x3d\x0f\
+\x00\x00\x01\x98\x00\x00\x00\x00\x00\x01\x00\x00\x41\x94\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0c\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x84\xc4\xa6\x6c\xc0\
+\x00\x00\x00\x34\x00\x00\x00\x00\x00\x01\x00\x00\x04\x93\
+\x00\x00\x01\x84\xc4\xa6\x6c\xc0\
+\x00\x00\x00\x62\x00\x00\x00\x00\x00\x01\x00\x00\x0c\xfd\
+\x00\x00\x01\x84\xc4\xa6\x6c\xc0\
+\x00\x00\x00\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x15\xdc\
+\x00\x00\x01\x84\xc4\xa6\x6c\xc0\
+\x00\x00\x00\xb2\x00\x00\x00\x00\x00\x01\x00\x00\x1b\x53\
+\x00\x00\x01\x84\xc4\xa6\x6c\xc0\
+\x00\x00\x00\xd0\x00\x00\x00\x00\x00\x01\x00\x00\x1d\x0f\
+\x00\x00\x01\x84\xc4\xa6\x6c\xc0\
+\x00\x00\x00\xf6\x00\x00\x00\x00\x00\x01\x00\x00\x25\x0c\
+\x00\x00\x01\x84\xc4\xa6\x6c\xc0\
+\x00\x00\x01\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x2c\x1c\
+\x00\x00\x01\x84\xc4\xa6\x6c\xc0\
+\x00\x00\x01\x3a\x00\x00\x00\x00\x00\x01\x00\x00\x34\x8a\
+\x00\x00\x01\x84\xc4\xa6\x6c\xc0\
+\x00\x00\x01\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x35\x89\
+\x00\x00\x01\x84\xc4\xa6\x6c\xc0\
+\x00\x00\x01\x78\x00\x00\x00\x00\x00\x01\x00\x00\x3d\x0f\
+\x00\x00\x01\x84\xc4\xa6\x6c\xc0\
+\x00\x00\x01\x98\x00\x00\x00\x00\x00\x01\x00\x00\x41\x94\
+\x00\x00\x01\x84\xc4\xa6\x6c\xc0\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,215 @@
+import json
+import os
+import sqlite3
+import time
+from collections import namedtuple
+
+from defaults import RESULTS_STORE_PATH
+from enums import ModulationType
+from research_cache import get_code_version
+
+
+# Показатели точки исследования, сохраняемые помимо количества исходов (статистика ошибок и обнаружения)
+POINT_METRICS = ("bias", "std", "rmse", "crb", "p5", "p25", "p50", "p75", "p95", "pd", "pfa", "false_alarms")
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS sweeps (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created REAL NOT NULL,
+    code_version TEXT NOT NULL,
+    seed TEXT,
+    average_count INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    parameters TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sweeps_created ON sweeps (created);
+CREATE TABLE IF NOT EXISTS sweep_parameters (
+    sweep_id INTEGER NOT NULL REFERENCES sweeps (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value,
+    PRIMARY KEY (sweep_id, name)
+);
+CREATE INDEX IF NOT EXISTS sweep_parameters_value ON sweep_parameters (name, value, sweep_id);
+CREATE TABLE IF NOT EXISTS points (
+    sweep_id INTEGER NOT NULL REFERENCES sweeps (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    snr REAL NOT NULL,
+    modulation TEXT NOT NULL,
+    trials_count INTEGER NOT NULL,
+    good_count INTEGER NOT NULL,
+    probability REAL NOT NULL,
+    error REAL,
+    duration REAL,
+    cached_trials INTEGER NOT NULL DEFAULT 0,
+    {", ".join(f"{metric} REAL" for metric in POINT_METRICS)},
+    PRIMARY KEY (sweep_id, snr, modulation)
+);
+"""
+
+# Запись об исследовании: параметры - словарь из get_research_parameters
+StoredSweep = namedtuple("StoredSweep", ["id", "created", "code_version", "seed", "average_count", "duration",
+                                         "parameters"])
+
+
+def flatten_parameters(parameters: dict, prefix: str = ""):
+    """
+    Плоский словарь параметров для индексирования: вложенные словари - через точку,
+    списки - в виде JSON, перечисления - по имени.
+    """
+    flat = {}
+    for name, value in parameters.items():
+        name = prefix + name
+        value = getattr(value, "name", value)
+        if isinstance(value, dict):
+            flat.update(flatten_parameters(value, name + "."))
+        elif isinstance(value, (list, tuple)):
+            flat[name] = json.dumps(value)
+        else:
+            flat[name] = value
+    return flat
+
+
+class ResultsStore:
+    """
+    Локальная история исследований в SQLite (журнал WAL): параметры, зерно, версия кода,
+    исходы и статистика по точкам, время расчета
+    """
+    def __init__(self, path: str = RESULTS_STORE_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(_SCHEMA)
+
+    def add_sweep(self, parameters: dict, average_count: int, results: dict, seed=None,
+                  statistics: dict = None, detection: dict = None, timings: dict = None,
+                  cached_trials: dict = None):
+        """
+        Сохранение исследования одной транзакцией с пакетной вставкой точек.
+
+        Время расчета хранится только для точек без испытаний из кэша (у остальных - NULL).
+        Исследование, все точки которого взяты из кэша, повторно не сохраняется, если запись
+        с теми же параметрами, зерном и версией кода уже есть.
+
+        :param parameters: Параметры исследования (get_research_parameters без ОСШ).
+        :param results: Результаты {ModulationType: ResearchResult}.
+        :param statistics: Статистика ошибок {ОСШ: {ModulationType: DelayErrorStatistics}}.
+        :param detection: Исходы обнаружения {ОСШ: {ModulationType: DetectionCounts}}.
+        :param timings: Время расчета точек {ОСШ: с}.
+        :param cached_trials: Количество испытаний, взятых из кэша, {ОСШ: количество}.
+        :return: Номер записи исследования.
+        """
+        statistics = statistics or {}
+        detection = detection or {}
+        timings = timings or {}
+        cached_trials = cached_trials or {}
+        code_version = get_code_version()
+        seed = None if seed is None else json.dumps(seed)
+        parameters_json = json.dumps(parameters, sort_keys=True)
+        snr_values = {snr for result in results.values() for snr in result.snr_values}
+        if snr_values and all(cached_trials.get(snr, 0) >= average_count for snr in snr_values):
+            row = self.connection.execute(
+                "SELECT id FROM sweeps WHERE code_version = ? AND seed IS ? AND average_count = ? AND parameters = ? "
+                "ORDER BY created DESC, id DESC LIMIT 1",
+                (code_version, seed, average_count, parameters_json)).fetchone()
+            if row is not None:
+                return row[0]
+
+        points = []
+        for modulation_type, result in results.items():
+            for position, (snr, probability, error) in enumerate(zip(result.snr_values, result.probabilities,
+                                                                      result.errors)):
+                metrics = {}
+                if snr in statistics:
+                    metrics.update(statistics[snr][modulation_type].get_summary() or {})
+                if snr in detection:
+                    metrics.update(detection[snr][modulation_type].get_summary() or {})
+                # Из кэша может быть взято больше испытаний, чем запрошено
+                trials_count = metrics.get("count", average_count)
+                points.append((position, snr, modulation_type.name, trials_count,
+                               int(round(probability * trials_count)), probability, error, timings.get(snr),
+                               cached_trials.get(snr, 0))
+                              + tuple(metrics.get(metric) for metric in POINT_METRICS))
+
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO sweeps (created, code_version, seed, average_count, duration, parameters) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (time.time(), code_version, seed, average_count, sum(timings.values()), parameters_json))
+            sweep_id = cursor.lastrowid
+            self.connection.executemany("INSERT INTO sweep_parameters (sweep_id, name, value) VALUES (?, ?, ?)",
+                                        [(sweep_id, name, value)
+                                         for name, value in flatten_parameters(parameters).items()])
+            columns = ("sweep_id", "position", "snr", "modulation", "trials_count", "good_count", "probability",
+                       "error", "duration", "cached_trials") + POINT_METRICS
+            self.connection.executemany(
+                f"INSERT INTO points ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                [(sweep_id,) + point for point in points])
+        return sweep_id
+
+    def find_sweeps(self, conditions: dict = None, limit: int = None):
+        """
+        Исследования с заданными значениями параметров (имена вложенных параметров - через точку),
+        начиная с последнего.
+        """
+        query = "SELECT id, created, code_version, seed, average_count, duration, parameters FROM sweeps AS s"
+        arguments = []
+        filters = []
+        for name, value in flatten_parameters(conditions or {}).items():
+            filters.append("EXISTS (SELECT 1 FROM sweep_parameters AS p "
+                           "WHERE p.sweep_id = s.id AND p.name = ? AND p.value = ?)")
+            arguments.extend((name, value))
+        if filters:
+            query += " WHERE " + " AND ".join(filters)
+        query += " ORDER BY created DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            arguments.append(int(limit))
+
+        return [StoredSweep(sweep_id, created, code_version, None if seed is None else json.loads(seed),
+                            average_count, duration, json.loads(parameters))
+                for sweep_id, created, code_version, seed, average_count, duration, parameters
+                in self.connection.execute(query, arguments)]
+
+    def load_points(self, sweep_id: int):
+        """
+        Все сохраненные показатели точек исследования (список словарей).
+        """
+        cursor = self.connection.execute("SELECT * FROM points WHERE sweep_id = ? ORDER BY modulation, position",
+                                         (sweep_id,))
+        names = [description[0] for description in cursor.description]
+        return [dict(zip(names, row)) for row in cursor]
+
+    def load_results(self, sweep_id: int):
+        """
+        Кривые исследования в виде {ModulationType: ResearchResult} (без повторного расчета).
+        """
+        from research_logic import ResearchResult
+
+        curves = {}
+        for point in self.load_points(sweep_id):
+            curve = curves.setdefault(ModulationType[point["modulation"]], ([], [], []))
+            curve[0].append(point["snr"])
+            curve[1].append(point["probability"])
+            curve[2].append(point["error"])
+        return {modulation_type: ResearchResult(*curves[modulation_type])
+                for modulation_type in ModulationType if modulation_type in curves}
+
+    def delete_sweep(self, sweep_id: int):
+        """
+        Удаление исследования вместе с его точками.
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM sweeps WHERE id = ?", (sweep_id,))
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
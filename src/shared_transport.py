@@ -0,0 +1,89 @@
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+# Описание массива в разделяемой памяти, передаваемое процессам-исполнителям вместо данных
+SharedArrayInfo = namedtuple("SharedArrayInfo", ["name", "shape", "dtype"])
+
+# Массивы, подключенные в текущем процессе: имя блока -> (блок, массив)
+_attached = {}
+
+
+class SharedArrays:
+    """
+    Набор массивов в разделяемой памяти, которыми владеет родительский процесс.
+
+    Исполнители получают только описания массивов (SharedArrayInfo) и подключаются к ним без копирования;
+    при закрытии набора блоки освобождаются.
+    """
+    def __init__(self):
+        self._blocks = {}
+        self.arrays = {}
+        self.infos = {}
+
+    def create(self, key: str, shape: tuple, dtype=np.float64, fill=None):
+        """
+        Выделение массива заданной формы (с заполнением значением fill, если оно задано).
+        """
+        dtype = np.dtype(dtype)
+        shape = tuple(int(size) for size in shape)
+        block = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+        array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        if fill is not None:
+            array.fill(fill)
+
+        self._blocks[key] = block
+        self.arrays[key] = array
+        self.infos[key] = SharedArrayInfo(block.name, shape, dtype.str)
+        return array
+
+    def put(self, key: str, values):
+        """
+        Копирование значений в новый массив разделяемой памяти.
+        """
+        values = np.asarray(values)
+        array = self.create(key, values.shape, values.dtype)
+        array[...] = values
+        return array
+
+    def close(self):
+        """
+        Освобождение всех блоков разделяемой памяти.
+        """
+        self.arrays.clear()
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+        self.infos.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def attach_array(info: SharedArrayInfo):
+    """
+    Массив разделяемой памяти по его описанию (без копирования).
+
+    Подключение сохраняется на время жизни процесса, поэтому повторные задания того же
+    исследования не открывают блок заново.
+    """
+    attached = _attached.get(info.name)
+    if attached is None:
+        block = shared_memory.SharedMemory(name=info.name)
+        attached = block, np.ndarray(info.shape, dtype=np.dtype(info.dtype), buffer=block.buf)
+        _attached[info.name] = attached
+    return attached[1]
+
+
+def attach_arrays(infos: dict):
+    """
+    Подключение набора массивов по словарю описаний.
+    """
+    return {key: attach_array(info) for key, info in infos.items()}
+
@@ -0,0 +1,162 @@
+from collections import namedtuple
+
+import numpy as np
+
+from enums import SignalType, ModulationType
+from random_utils import get_substream
+from signals_generator import SignalGenerator
+from spectrum_analysis import WELCH_SEGMENT_BITS, AMBIGUITY_MAX_DOPPLER_BITRATE, get_welch_psd, \
+    get_ambiguity_function
+
+
+# Результат этапа расчета: значение и его версия (меняется при каждом пересчете этапа)
+StageResult = namedtuple("StageResult", ["value", "version"])
+
+
+class SignalPipeline:
+    """
+    Инкрементальный расчет сигналов главной страницы.
+
+    Каждый этап (биты -> манипулированный сигнал -> исследуемый сигнал -> канал -> шум -> корреляция -> задержка)
+    кэширует результат по ключу из параметров и версий предыдущих этапов, поэтому после изменения
+    параметра пересчитываются только зависящие от него этапы.
+    """
+    def __init__(self, signal_generator: SignalGenerator):
+        self.signal_generator = signal_generator
+        # Зерно реализации случайных величин, входит в ключи случайных этапов
+        self.seed = None
+        self.new_realization()
+        self._cache = {}
+        # Этапы, пересчитанные при последнем запуске
+        self.recalculated = []
+
+    def new_realization(self):
+        """
+        Новое зерно реализации: при следующем запуске биты и шум генерируются заново.
+        """
+        self.seed = np.random.SeedSequence().entropy
+
+    def _stage(self, name: str, key: tuple, calc):
+        """
+        Результат этапа из кэша или его пересчет при изменении ключа.
+        """
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        result = StageResult(calc(), cached[1].version + 1 if cached is not None else 0)
+        self._cache[name] = (key, result)
+        self.recalculated.append(name)
+        return result
+
+    def _seeded(self, stream: int, calc):
+        """
+        Расчет случайного этапа на собственном подпотоке зерна реализации.
+        """
+        def seeded_calc():
+            self.signal_generator.set_seed(get_substream(np.random.SeedSequence(self.seed), stream))
+            return calc()
+        return seeded_calc
+
+    def _modulate(self, signal_type: SignalType, modulation_type: ModulationType, bits: list, initial_phase: float):
+        """
+        Манипулированный сигнал с заданной начальной фазой и полная фаза его последнего отсчета.
+
+        В отличие от calc_modulated_signal, скрытая фаза генератора не используется и не меняется.
+        """
+        t, y, last_phase = self.signal_generator.modulate_bits(bits, signal_type, modulation_type, initial_phase)
+        if not len(t):
+            return ([], []), float(last_phase)
+        if y is None:
+            return (None, None), float(last_phase)
+        return (t.tolist(), y.tolist()), float(last_phase)
+
+    def run(self, modulation_type: ModulationType):
+        """
+        Расчет сигналов с переиспользованием неизменившихся этапов; возвращает результаты этапов.
+        """
+        sg = self.signal_generator
+        sg.recalc_parameters()
+        self.recalculated = []
+
+        # Параметры, общие для формирования опорного и исследуемого сигналов
+        signal_key = (modulation_type, sg.sampling_rate, sg.signal_freq, sg.bits_per_second)
+
+        bits = self._stage("bits", (sg.bits_source, sg.bits_count, sg.code_index, self.seed),
+                           self._seeded(0, lambda: sg.get_bits(SignalType.GENERAL)))
+        research_bits = self._stage("research_bits", (sg.rsch_bits_count, self.seed),
+                                    self._seeded(1, lambda: sg.get_bits(SignalType.RESEARCH)))
+
+        # Опорный сигнал начинается с нулевой фазы, исследуемый продолжает его фазу (как в calc_research)
+        modulated_stage = self._stage("modulated", (signal_key, bits.version),
+                                      lambda: self._modulate(SignalType.GENERAL, modulation_type, bits.value, 0.))
+        modulated = StageResult(modulated_stage.value[0], modulated_stage.version)
+        end_phase = modulated_stage.value[1]
+        research_modulated_stage = self._stage("research_modulated", (signal_key, research_bits.version, end_phase),
+                                               lambda: self._modulate(SignalType.RESEARCH, modulation_type,
+                                                                      research_bits.value, end_phase))
+        research_modulated = StageResult(research_modulated_stage.value[0], research_modulated_stage.version)
+
+        # Вставка маленького сигнала в большой
+        research = self._stage("research", (modulated.version, research_modulated.version, sg.time_delay),
+                               lambda: sg.calc_research_signal(modulated.value, research_modulated.value))
+
+        # Прохождение исследуемого сигнала через канал распространения
+        channel = self._stage("channel", (research.version, tuple(sg.channel.paths), sg.channel.doppler_shift),
+                              lambda: sg.apply_channel([research.value])[0])
+
+        # Добавление шума
+        noisy_modulated = self._stage("noisy_modulated", (modulated.version, self.seed),
+                                      self._seeded(2, lambda: sg.generate_noise(SignalType.GENERAL,
+                                                                                modulated.value)))
+        noisy_research = self._stage("noisy_research", (channel.version, sg.snr, sg.channel.noise_type, self.seed),
+                                     self._seeded(3, lambda: sg.generate_noise(SignalType.RESEARCH,
+                                                                               channel.value)))
+
+        # Расчет взаимной корреляционной функции и оценка временной задержки
+        correlation = self._stage("correlation", (noisy_modulated.version, noisy_research.version,
+                                                  sg.correlation_type, sg.baseband_mode),
+                                  lambda: sg.get_correlation(noisy_modulated.value, noisy_research.value,
+                                                             sg.correlation_type, sg.baseband_mode))
+        time_delay = self._stage("time_delay", (correlation.version,),
+                                 lambda: sg.find_correlation_max(correlation.value))
+
+        # Буферы генератора соответствуют последнему расчету
+        sg.bits = bits.value
+        sg.modulated_signal = noisy_modulated.value
+        sg.research_signal = noisy_research.value
+        sg.correlation_signal = correlation.value
+
+        return {
+            "bits": bits,
+            "reference": modulated,
+            "modulated": noisy_modulated,
+            "research": noisy_research,
+            "correlation": correlation,
+            "time_delay": time_delay,
+        }
+
+    def run_spectra(self, results: dict):
+        """
+        Спектральные плотности мощности манипулированного и исследуемого сигналов по результатам run.
+
+        Спектры пересчитываются только при изменении версий сигналов.
+        """
+        sg = self.signal_generator
+        segment_len = round(WELCH_SEGMENT_BITS * sg.sampling_rate / sg.bits_per_second)
+        return {
+            stage: self._stage(f"{stage}_psd", (results[stage].version, sg.sampling_rate, segment_len),
+                               lambda stage=stage: get_welch_psd(results[stage].value[1], sg.sampling_rate,
+                                                                 segment_len))
+            for stage in ("modulated", "research")
+        }
+
+    def run_ambiguity(self, results: dict):
+        """
+        Функция неопределенности опорного (незашумленного манипулированного) сигнала по результатам run.
+        """
+        sg = self.signal_generator
+        max_doppler = AMBIGUITY_MAX_DOPPLER_BITRATE * sg.bits_per_second
+        reference = results["reference"]
+        return self._stage("ambiguity", (reference.version, sg.sampling_rate, max_doppler),
+                           lambda: get_ambiguity_function(reference.value[1], sg.sampling_rate, max_doppler))
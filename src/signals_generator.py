@@ -1,8 +1,21 @@
-import random
+from collections import namedtuple
+
 import numpy as np
 
+from code_sequences import get_code_sequence
 from defaults import *
-from enums import SignalType, ModulationType
+from baseband import get_baseband_correlation
+from channel_model import ChannelModel
+from enums import SignalType, ModulationType, BitsSourceType, CorrelationType, BasebandMode, CfarType
+from fft_utils import get_correlation_nfft, correlate_spectra
+from fixed_point import FIXED_POINT_ACCUMULATOR_BITS, quantize, correlate_integer
+from generalized_correlation import get_generalized_correlation
+from kernels import get_kernel
+
+
+# Схема манипуляции: амплитуды, круговые частоты и начальные фазы для значений бита 0 и 1;
+# при непрерывной фазе к фазе каждого отсчета добавляется полная фаза предыдущего отсчета
+ModulationScheme = namedtuple("ModulationScheme", ["amplitudes", "frequencies", "phases", "continuous_phase"])
 
 
 class SignalGenerator:
@@ -12,7 +25,7 @@ class SignalGenerator:
     def __init__(self,
                  s_r=DEFAULT_SAMPLING_RATE, s_freq=DEFAULT_SIGNAL_FREQ,
                  b_count=DEFAULT_BITS_COUNT, bps=DEFAULT_BITS_PER_SECOND,
-                 t_delay=DEFAULT_TIME_DELAY, snr=DEFAULT_SNR):
+                 t_delay=DEFAULT_TIME_DELAY, snr=DEFAULT_SNR, seed=None):
 
         # Параметры сигнала
         self.sampling_rate = float(s_r)
@@ -23,6 +36,25 @@ class SignalGenerator:
         self.snr = float(snr)
         self.signal_phase = 0.
 
+        # Генератор случайных чисел (бит и шума)
+        self.rng = np.random.default_rng(seed)
+
+        # Источник информационной последовательности опорного сигнала
+        self.bits_source = BitsSourceType.RANDOM
+        self.code_index = 0
+
+        # Тип взаимной корреляционной функции
+        self.correlation_type = CorrelationType.CC
+        self.baseband_mode = BasebandMode.PASSBAND
+        self.cfar_type = CfarType.CA
+
+        # Канал распространения исследуемого сигнала
+        self.channel = ChannelModel()
+
+        # Целочисленный тракт приемника: разрядность АЦП (None - расчет с плавающей точкой) и накопителя
+        self.quantization_bits = None
+        self.accumulator_bits = FIXED_POINT_ACCUMULATOR_BITS
+
         # Буферы для хранения сигналов
         self.bits = []
         self.general_signal = []
@@ -44,17 +76,17 @@ class SignalGenerator:
         self.rsch_signal_freq = self.signal_freq
         self.rsch_bits_count = int(self.bits_count * 3)
 
-    @staticmethod
-    def _generate_bits(bits_count):
+    def set_seed(self, seed=None):
         """
-        Формирование случайной битовой информационной последовательности.
+        Задание генератора случайных чисел: зерно, SeedSequence или numpy.random.Generator.
         """
-        bits = []
-        for i in range(int(bits_count)):
-            x = random.randint(0, 1)
-            bits.append(x)
+        self.rng = np.random.default_rng(seed)
 
-        return bits
+    def _generate_bits(self, bits_count):
+        """
+        Формирование случайной битовой информационной последовательности.
+        """
+        return self.rng.integers(0, 2, int(bits_count)).tolist()
 
     def recalc_parameters(self):
         """
@@ -84,9 +116,36 @@ class SignalGenerator:
         timestep = signal_duration / n
         return signal_duration, timestep, bit_time, w
 
-    def calc_modulated_signal(self, signal_type: SignalType, modulation_type: ModulationType):
+    def get_bits(self, signal_type: SignalType):
         """
-        Построить амплитудно-манипулированный сигнал.
+        Формирование информационной последовательности сигнала заданного типа.
+        """
+        if signal_type == SignalType.RESEARCH:
+            return self._generate_bits(self.rsch_bits_count)
+
+        # Опорный сигнал может использовать кодовую последовательность
+        if self.bits_source != BitsSourceType.RANDOM:
+            return get_code_sequence(self.bits_source, self.bits_count, self.code_index)
+        return self._generate_bits(self.bits_count)
+
+    def get_modulation_scheme(self, modulation_type: ModulationType, w: float):
+        """
+        Схема манипуляции для заданного вида модуляции (w - круговая частота несущей сигнала).
+        """
+        if modulation_type == ModulationType.AM:
+            return ModulationScheme((self.low_ampl, self.high_ampl), (w, w), (0., 0.), False)
+        if modulation_type == ModulationType.FM:
+            return ModulationScheme((1., 1.), (self.low_freq, self.high_freq), (0., 0.), True)
+        if modulation_type == ModulationType.PM:
+            return ModulationScheme((1., 1.), (w, w), (0., np.pi), False)
+        return None
+
+    def modulate_bits(self, bits, signal_type: SignalType, modulation_type: ModulationType, initial_phase=0.):
+        """
+        Манипулированные сигналы для пакета информационных последовательностей (по последней оси).
+
+        Возвращает отсчеты времени, значения сигналов и полные фазы их последних отсчетов
+        (для продолжения сигнала с непрерывной фазой).
         """
         # Характеристики сигнала в зависимости от его типа
         bits_count = self.bits_count
@@ -95,38 +154,57 @@ class SignalGenerator:
             bits_count = self.rsch_bits_count
             signal_freq = self.rsch_signal_freq
 
-        # Перегенерация случайных бит
-        bits = self._generate_bits(bits_count)
+        # Получение параметров сигнала
+        signal_duration, timestep, bit_time, w = self._get_signal_parameters(signal_freq, bits_count)
+        t = np.arange(0, signal_duration, timestep)
+        scheme = self.get_modulation_scheme(modulation_type, w)
+        if not len(t) or scheme is None:
+            return t, None, initial_phase
+
+        # Ускоренное ядро с циклом по отсчетам (если выбрано)
+        kernel = get_kernel("modulate")
+        if kernel is not None:
+            bits = np.asarray(bits, dtype=np.int64)
+            rows = bits.reshape(-1, bits.shape[-1])
+            initial_phases = np.broadcast_to(np.asarray(initial_phase, dtype=float), bits.shape[:-1]).reshape(-1)
+            y, last_phases = kernel(t, bit_time, rows, np.asarray(scheme.amplitudes, dtype=float),
+                                    np.asarray(scheme.frequencies, dtype=float), np.asarray(scheme.phases, dtype=float),
+                                    scheme.continuous_phase, np.ascontiguousarray(initial_phases))
+            last_phase = last_phases.reshape(bits.shape[:-1]) if scheme.continuous_phase else initial_phase
+            return t, y.reshape(bits.shape[:-1] + (len(t),)), last_phase
+
+        # Текущий бит для каждого отсчета
+        bit_values = np.asarray(bits, dtype=int)[..., (t / bit_time).astype(int)]
+        # Модуляция
+        phases = np.asarray(scheme.frequencies)[bit_values] * t
+        offsets = np.asarray(scheme.phases)[bit_values]
+        last_phase = initial_phase
+        if scheme.continuous_phase:
+            # Фаза каждого отсчета продолжает полную фазу предыдущего
+            first_phase = np.broadcast_to(np.asarray(initial_phase, dtype=float)[..., None], phases.shape[:-1] + (1,))
+            offsets = offsets + np.concatenate((first_phase, phases[..., :-1]), axis=-1)
+            last_phase = phases[..., -1]
+        y = np.asarray(scheme.amplitudes)[bit_values] * np.cos(phases + offsets)
+        return t, y, last_phase
+
+    def calc_modulated_signal(self, signal_type: SignalType, modulation_type: ModulationType, bits: list = None):
+        """
+        Построить амплитудно-манипулированный сигнал.
+        """
+        # Информационная последовательность генерируется, если не передана явно
+        if bits is None:
+            bits = self.get_bits(signal_type)
 
         # Перегенерация случайных бит
         if signal_type == SignalType.GENERAL:
             self.bits = bits
 
-        # Получение параметров сигнала
-        x, y = [], []
-        signal_duration, timestep, bit_time, w = self._get_signal_parameters(signal_freq, bits_count)
-        for t in np.arange(0, signal_duration, timestep):
-            # Получение текущего бита
-            bit_index = int(t / bit_time)
-            # Модуляция
-            if modulation_type == ModulationType.AM:
-                ampl_value = self.low_ampl if bits[bit_index] == 0 else self.high_ampl
-                value = ampl_value * np.cos(w * t)
-            elif modulation_type == ModulationType.FM:
-                freq = self.low_freq if bits[bit_index] == 0 else self.high_freq
-                value = np.cos(freq * t + self.signal_phase)
-                self.signal_phase = freq * t
-            elif modulation_type == ModulationType.PM:
-                ph = 0 if bits[bit_index] == 0 else np.pi
-                value = np.cos(w * t + ph)
-            else:
-                return None, None
-
-            # Заполнение списка отсчетов\значений
-            x.append(t)
-            y.append(value)
-
-        return x, y
+        t, y, self.signal_phase = self.modulate_bits(bits, signal_type, modulation_type, self.signal_phase)
+        if not len(t):
+            return [], []
+        if y is None:
+            return None, None
+        return t.tolist(), y.tolist()
 
     def calc_research_signal(self, modulated: list, researched: list):
         """
@@ -137,47 +215,58 @@ class SignalGenerator:
 
         researched = list(researched)
 
-        # Полученые временной задержки
-        time_delay = self.time_delay / 1000
-        if time_delay > researched[0][-1] - modulated[0][-1]:
-            return
-
         # Замена участка исследуемого сигнала на манипулированный сигнал
-        idx = 0
-        for i in range(len(researched[0])):
-            if researched[0][i] >= time_delay:
-                idx = i
-                break
+        idx = self.get_insertion_index(researched[0], modulated[0])
+        if idx is None:
+            return
 
         signal_len = len(modulated[0])
         new_signal = researched[1][:idx] + modulated[1] + researched[1][idx+signal_len:]
         researched[1] = new_signal
         return researched
 
-    @staticmethod
-    def _calc_signal_energy(signal: list):
+    def get_insertion_index(self, research_times, modulated_times):
         """
-        Расчет энергии сигнала
+        Индекс отсчета исследуемого сигнала, с которого вставляется опорный (None, если он не помещается).
         """
-        energy = 0.
-        for i in range(len(signal[1])):
-            energy += signal[1][i] ** 2
-        return energy
+        time_delay = self.time_delay / 1000
+        if time_delay > research_times[-1] - modulated_times[-1]:
+            return
+        return int(np.searchsorted(research_times, time_delay))
 
-    @staticmethod
-    def _get_random_value():
+    def apply_channel(self, signals: list):
+        """
+        Прохождение пакета исследуемых сигналов через канал распространения.
+        """
+        if self.channel.is_transparent() or not signals or any(not signal for signal in signals):
+            return signals
+
+        values = self.channel.apply([signal[1] for signal in signals], self.sampling_rate, self.signal_freq)
+        return [[signal[0], channel_values.tolist()] for signal, channel_values in zip(signals, values)]
+
+    def _get_random_values(self, shape):
         """
         Рандомизация чисел для шума
         """
         av = 20
-        value = 0.
-        for i in range(av):
-            value += random.uniform(-1, 1)
-        return value / av
+        shape = tuple(np.atleast_1d(shape))
+        kernel = get_kernel("uniform_mean")
+        if kernel is not None:
+            return kernel(self.rng.random((int(np.prod(shape)), av))).reshape(shape)
+        return self.rng.uniform(-1, 1, shape + (av,)).mean(axis=-1)
 
-    def generate_noise(self, signal_type: SignalType, signal: list):
+    def get_noise_values(self, signal_type: SignalType, shape):
         """
-        Генерация шума для сигнала
+        Случайная шумовая добавка (до нормировки по ОСШ) для пакета сигналов заданной формы.
+        """
+        noise = self._get_random_values(shape)
+        if signal_type == SignalType.RESEARCH:
+            noise = self.channel.shape_noise(noise, self.rng)
+        return noise
+
+    def add_noise(self, signal_type: SignalType, values: np.ndarray, noise: np.ndarray = None):
+        """
+        Добавление шума к пакету сигналов (по последней оси): энергия шума каждого сигнала задается ОСШ.
         """
         snr = None
         if signal_type == SignalType.GENERAL:
@@ -185,28 +274,27 @@ class SignalGenerator:
         elif signal_type == SignalType.RESEARCH:
             snr = self.snr
 
-        if not signal:
-            return
-
         # Расчет энергии шума
-        signal_energy = self._calc_signal_energy(signal)
-        noise_energy = signal_energy / (10 ** (snr / 10))
+        values = np.asarray(values, dtype=float)
+        noise_energy = np.sum(values ** 2, axis=-1, keepdims=True) / (10 ** (snr / 10))
 
         # Случайная шумовая добавка к каждому отсчету
-        noise = []
-        random_energy = 0.
-        for i in range(len(signal[1])):
-            random_value = self._get_random_value()
-            noise.append(random_value)
-            random_energy += random_value ** 2
+        if noise is None:
+            noise = self.get_noise_values(signal_type, values.shape)
+        random_energy = np.sum(noise ** 2, axis=-1, keepdims=True)
 
         # Зашумленный сигнал
         alpha = np.sqrt(noise_energy / random_energy)
-        noise_signal = []
-        for i in range(len(signal[1])):
-            noise_signal.append(signal[1][i] + alpha * noise[i])
+        return values + alpha * noise
 
-        return signal[0], noise_signal
+    def generate_noise(self, signal_type: SignalType, signal: list):
+        """
+        Генерация шума для сигнала
+        """
+        if not signal:
+            return
+
+        return signal[0], self.add_noise(signal_type, signal[1]).tolist()
 
     def get_bits_to_plot(self):
         """
@@ -230,20 +318,87 @@ class SignalGenerator:
 
         return x, y
 
-    @staticmethod
-    def get_correlation(modulated: list, researched: list):
+    def get_signal_band(self):
+        """
+        Полоса частот, занимаемая манипулированными сигналами всех видов, Гц.
+        """
+        margin = SIGNAL_BAND_BITRATE_FACTOR * self.bits_per_second
+        return max(self.low_freq / (2. * np.pi) - margin, 0.), self.high_freq / (2. * np.pi) + margin
+
+    def get_correlation(self, modulated: list, researched: list,
+                        correlation_type: CorrelationType = CorrelationType.CC,
+                        baseband_mode: BasebandMode = BasebandMode.PASSBAND):
         """
         Расчет взаимной корреляционной функции опорного и исследуемого сигналов.
         """
         if not modulated or not researched:
             return
 
+        # Корреляция комплексных огибающих на пониженной частоте дискретизации
+        if baseband_mode != BasebandMode.PASSBAND:
+            return get_baseband_correlation(modulated, researched, baseband_mode, correlation_type,
+                                            self.get_signal_band())
+
+        # Обобщенная корреляция с частотным взвешиванием
+        if correlation_type != CorrelationType.CC:
+            return get_generalized_correlation(modulated, researched, correlation_type)
+
         research = np.array(researched[1])
         modulate = np.array(modulated[1])
         y = np.correlate(research, modulate, 'valid').tolist()
         x = researched[0][:len(y)]
         return x, y
 
+    def get_correlation_batch(self, modulated_times, modulated: np.ndarray, research_times, researched: np.ndarray,
+                              correlation_type: CorrelationType = CorrelationType.CC,
+                              baseband_mode: BasebandMode = BasebandMode.PASSBAND):
+        """
+        Взаимные корреляционные функции пакета пар сигналов (по последней оси): задержки (с) и значения.
+
+        Обычная ВКФ полосовых сигналов рассчитывается для всего пакета одним проходом БПФ,
+        остальные виды корреляции - поочередно для каждой пары.
+        """
+        batch_shape = modulated.shape[:-1]
+        if baseband_mode == BasebandMode.PASSBAND and correlation_type == CorrelationType.CC:
+            lags = researched.shape[-1] - modulated.shape[-1] + 1
+            nfft = get_correlation_nfft(researched.shape[-1], modulated.shape[-1])
+            y = correlate_spectra(np.fft.rfft(researched, nfft, axis=-1), np.fft.rfft(modulated, nfft, axis=-1),
+                                  nfft, lags)
+            return np.asarray(research_times[:lags]), y
+
+        correlations = [self.get_correlation([modulated_times, reference], [research_times, research],
+                                             correlation_type, baseband_mode)
+                        for reference, research in zip(modulated.reshape(-1, modulated.shape[-1]),
+                                                       researched.reshape(-1, researched.shape[-1]))]
+        y = np.array([correlation[1] for correlation in correlations])
+        return np.asarray(correlations[0][0]), y.reshape(batch_shape + y.shape[-1:])
+
+    def get_fixed_point_correlation_batch(self, modulated_times, modulated: np.ndarray, research_times,
+                                          researched: np.ndarray,
+                                          correlation_type: CorrelationType = CorrelationType.CC,
+                                          baseband_mode: BasebandMode = BasebandMode.PASSBAND):
+        """
+        Взаимные корреляционные функции пакета пар сигналов, оцифрованных АЦП разрядности quantization_bits.
+
+        Обычная ВКФ полосовых сигналов рассчитывается в целых числах с накопителем разрядности accumulator_bits
+        (значения приводятся к единицам сигналов), для остальных видов корреляции используются
+        восстановленные по кодам значения. Возвращает задержки (с), значения корреляции,
+        количества насыщенных отсчетов и переполненных значений накопителя для каждой пары.
+        """
+        modulated_codes, modulated_scale, modulated_saturated = quantize(modulated, self.quantization_bits)
+        research_codes, research_scale, research_saturated = quantize(researched, self.quantization_bits)
+        saturated = modulated_saturated + research_saturated
+
+        if baseband_mode == BasebandMode.PASSBAND and correlation_type == CorrelationType.CC:
+            lags = researched.shape[-1] - modulated.shape[-1] + 1
+            accumulator, overflows = correlate_integer(research_codes, modulated_codes, self.accumulator_bits)
+            y = accumulator / (research_scale * modulated_scale)
+            return np.asarray(research_times[:lags]), y, saturated, overflows
+
+        lags, y = self.get_correlation_batch(modulated_times, modulated_codes / modulated_scale, research_times,
+                                             research_codes / research_scale, correlation_type, baseband_mode)
+        return lags, y, saturated, np.zeros(saturated.shape, dtype=np.int64)
+
     @staticmethod
     def find_correlation_max(correlation: list):
         """
@@ -0,0 +1,90 @@
+from collections import namedtuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from baseband import get_analytic_signal
+from fft_utils import next_fast_len
+
+
+# Длина сегмента метода Уэлча в битах (разрешение по частоте - доля битовой скорости)
+WELCH_SEGMENT_BITS = 4
+# Перекрытие соседних сегментов метода Уэлча
+WELCH_OVERLAP = 0.5
+# Диапазон доплеровских сдвигов функции неопределенности (±) в долях битовой скорости
+AMBIGUITY_MAX_DOPPLER_BITRATE = 1.
+# Количество доплеровских каналов функции неопределенности (нечетное - с нулевым сдвигом в центре)
+AMBIGUITY_DOPPLER_BINS = 65
+# Максимальное количество отсчетов задержки функции неопределенности (остальные прореживаются по максимуму)
+AMBIGUITY_DELAY_POINTS = 1024
+# Максимальное количество элементов пакета БПФ по доплеровским каналам (ограничение памяти)
+AMBIGUITY_BATCH_ELEMENTS = 2 ** 21
+
+# Спектральная плотность мощности: частоты (Гц) и значения (1/Гц)
+PowerSpectrum = namedtuple("PowerSpectrum", ["frequencies", "psd"])
+# Модуль функции неопределенности (доплеровские каналы x задержки), нормированный на максимум
+AmbiguityFunction = namedtuple("AmbiguityFunction", ["delays", "doppler_shifts", "values"])
+
+
+def get_hann_window(length: int):
+    """
+    Периодическое окно Ханна (для спектрального оценивания).
+    """
+    return 0.5 - 0.5 * np.cos(2 * np.pi * np.arange(length) / length)
+
+
+def get_welch_psd(values, sampling_rate: float, segment_len: int, overlap: float = WELCH_OVERLAP):
+    """
+    Односторонняя спектральная плотность мощности методом Уэлча (окно Ханна, удаление среднего сегментов).
+
+    Спектры всех сегментов рассчитываются одним пакетным БПФ.
+    """
+    values = np.asarray(values, dtype=float)
+    segment_len = max(min(int(segment_len), values.shape[-1]), 1)
+    step = max(int(segment_len * (1. - overlap)), 1)
+    segments = sliding_window_view(values, segment_len, axis=-1)[..., ::step, :]
+    window = get_hann_window(segment_len)
+
+    spectra = np.fft.rfft((segments - np.mean(segments, axis=-1, keepdims=True)) * window, axis=-1)
+    psd = np.mean(np.abs(spectra) ** 2, axis=-2) / (sampling_rate * np.sum(window ** 2))
+    # Учет мощности отрицательных частот (кроме нулевой частоты и частоты Найквиста)
+    psd[..., 1:segment_len - segment_len // 2] *= 2
+    return PowerSpectrum(np.fft.rfftfreq(segment_len, 1. / sampling_rate), psd)
+
+
+def get_ambiguity_function(values, sampling_rate: float, max_doppler: float,
+                           doppler_bins: int = AMBIGUITY_DOPPLER_BINS, delay_points: int = AMBIGUITY_DELAY_POINTS):
+    """
+    Узкополосная функция неопределенности |X(tau, nu)| = |sum s(t + tau) s*(t) exp(j 2 pi nu t)| сигнала.
+
+    Для каждого пакета доплеровских каналов сдвинутые по частоте копии аналитического сигнала
+    коррелируются с ним пакетным БПФ; задержки прореживаются до delay_points с сохранением максимумов
+    (блоками нечетной длины с центрами в кратных длине блока задержках, поэтому нулевая задержка - центр блока).
+    """
+    signal = get_analytic_signal(np.asarray(values, dtype=float))
+    samples_count = signal.shape[-1]
+    doppler_shifts = np.linspace(-max_doppler, max_doppler, doppler_bins)
+    nfft = next_fast_len(2 * samples_count - 1)
+    reference_spectrum = np.conj(np.fft.fft(signal, nfft))
+    phases = 2 * np.pi * np.arange(samples_count) / sampling_rate
+
+    # Задержки -(N - 1)..(N - 1), дополненные нулями с обеих сторон до целого количества блоков
+    decimation = -(-(2 * samples_count - 1) // delay_points) | 1
+    half = decimation // 2
+    blocks_half_count = max(-(-(samples_count - 1 - half) // decimation), 0)
+    padding = blocks_half_count * decimation + half - (samples_count - 1)
+
+    rows_count = max(AMBIGUITY_BATCH_ELEMENTS // nfft, 1)
+    ambiguity = np.empty((doppler_bins, 2 * blocks_half_count + 1))
+    for start in range(0, doppler_bins, rows_count):
+        shifted = signal * np.exp(1j * np.outer(doppler_shifts[start:start + rows_count], phases))
+        correlation = np.abs(np.fft.ifft(np.fft.fft(shifted, nfft, axis=-1) * reference_spectrum, axis=-1))
+        # Отрицательные задержки находятся в конце циклической корреляции
+        zeros = np.zeros((len(correlation), padding))
+        correlation = np.concatenate((zeros, correlation[:, nfft - samples_count + 1:], correlation[:, :samples_count],
+                                      zeros), axis=-1)
+        ambiguity[start:start + rows_count] = np.max(correlation.reshape(len(correlation), -1, decimation), axis=-1)
+
+    energy = np.sum(np.abs(signal) ** 2)
+    delays = np.arange(-blocks_half_count, blocks_half_count + 1) * decimation / sampling_rate
+    return AmbiguityFunction(delays, doppler_shifts, ambiguity / energy if energy > 0 else ambiguity)
@@ -0,0 +1,97 @@
+import sys
+import time
+
+
+class _TimedLoader:
+    """
+    Обертка загрузчика модуля, замеряющая время его выполнения
+    """
+    def __init__(self, loader, profiler, name: str):
+        self.loader = loader
+        self.profiler = profiler
+        self.name = name
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.profiler.stack.append(0.)
+        start = time.perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self.profiler.stack.pop()
+            if self.profiler.stack:
+                self.profiler.stack[-1] += elapsed
+            self.profiler.records.append((self.name, elapsed, elapsed - children))
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class StartupProfiler:
+    """
+    Профилирование запуска: время импорта модулей и контрольные точки
+    """
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.records = []
+        self.marks = []
+        self.stack = []
+        self._finding = set()
+
+    def find_spec(self, name, path=None, target=None):
+        """
+        Поиск модуля остальными поисковиками с подменой загрузчика на замеряющий.
+        """
+        if name in self._finding:
+            return None
+
+        self._finding.add(name)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self, name)
+                    return spec
+        finally:
+            self._finding.discard(name)
+        return None
+
+    def install(self):
+        """
+        Включение замера времени импорта.
+        """
+        sys.meta_path.insert(0, self)
+        return self
+
+    def uninstall(self):
+        """
+        Отключение замера времени импорта.
+        """
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def mark(self, label: str):
+        """
+        Контрольная точка запуска.
+        """
+        self.marks.append((label, time.perf_counter() - self.start_time))
+
+    def report(self, top_count: int = 15):
+        """
+        Текстовый отчет о запуске.
+        """
+        lines = ["Контрольные точки запуска:"]
+        for label, moment in self.marks:
+            lines.append(f"  {moment * 1000:9.1f} мс  {label}")
+
+        lines.append(f"Наиболее долгие импорты (из {len(self.records)}), суммарно / собственное время:")
+        records = sorted(self.records, key=lambda record: record[1], reverse=True)[:top_count]
+        for name, elapsed, own in records:
+            lines.append(f"  {elapsed * 1000:9.1f} мс  {own * 1000:9.1f} мс  {name}")
+        return "\n".join(lines)
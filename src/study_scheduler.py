@@ -0,0 +1,336 @@
+import argparse
+import csv
+import itertools
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from enums import GridType, ModulationType, CorrelationType, BasebandMode, BitsSourceType, CfarType
+from cfar_detector import DetectionCounts
+from delay_statistics import DelayErrorStatistics
+from kernels import warm_up_kernels
+from random_utils import get_seed_sequence
+from research_logic import calc_good_counts, get_confidence_interval
+from shared_transport import SharedArrays, attach_arrays
+from signals_generator import SignalGenerator
+
+
+# Варьируемые параметры исследования и соответствующие аргументы SignalGenerator
+STUDY_PARAMETERS = {
+    "sampling_rate": "s_r",
+    "signal_freq": "s_freq",
+    "bits_per_second": "bps",
+    "bits_count": "b_count",
+    "time_delay": "t_delay",
+}
+# Целочисленные параметры
+INTEGER_PARAMETERS = ("bits_count",)
+# Параметры, определяющие длины сигналов (а значит, и размеры БПФ)
+LENGTH_PARAMETERS = ("sampling_rate", "bits_per_second", "bits_count")
+# Столбцы итоговой таблицы
+RESULT_COLUMNS = tuple(STUDY_PARAMETERS) + ("snr", "modulation", "trials_count", "good_count", "probability",
+                                           "bias", "rmse", "crb", "pd", "pfa")
+# Итоговые показатели по точке, ОСШ и модуляции (рассчитываются исполнителями)
+SUMMARY_COLUMNS = ("good_count", "bias", "rmse", "crb", "pd", "pfa")
+
+# Задание исполнителю при обмене через разделяемую память: описания массивов, номера точек и настройки расчета
+SharedStudyTask = namedtuple("SharedStudyTask", ["arrays", "point_indices", "average_count", "bits_source",
+                                                 "correlation_type", "baseband_mode", "cfar_type", "seed"])
+
+
+def expand_grid(grid: dict, grid_type: GridType = GridType.CARTESIAN, samples_count: int = None, seed: int = None):
+    """
+    Развертывание сетки параметров в список точек.
+
+    Для декартовой сетки значения параметров задаются списками, для латинского гиперкуба - границами (min, max).
+    """
+    names = [name for name in STUDY_PARAMETERS if name in grid]
+    unknown = set(grid) - set(names)
+    if unknown:
+        raise ValueError(f"Неизвестные параметры исследования: {', '.join(sorted(unknown))}")
+
+    if grid_type == GridType.CARTESIAN:
+        points = [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+    elif grid_type == GridType.LATIN_HYPERCUBE:
+        if not samples_count:
+            raise ValueError("Для латинского гиперкуба необходимо задать количество точек")
+        rng = np.random.default_rng(seed)
+        # По каждому параметру - одна точка в каждом из samples_count равных интервалов
+        strata = (np.arange(samples_count)[:, None] + rng.random((samples_count, len(names)))) / samples_count
+        for column in range(len(names)):
+            strata[:, column] = rng.permutation(strata[:, column])
+        points = []
+        for row in strata:
+            point = {}
+            for name, fraction in zip(names, row):
+                low, high = grid[name]
+                point[name] = low + fraction * (high - low)
+            points.append(point)
+    else:
+        raise ValueError(f"Неизвестный тип сетки: {grid_type}")
+
+    for point in points:
+        for name in INTEGER_PARAMETERS:
+            if name in point:
+                point[name] = int(round(point[name]))
+    return points
+
+
+def group_point_indices(points: list, chunk_size: int = 4):
+    """
+    Номера точек, упорядоченные и сгруппированные по длинам сигналов: каждая группа
+    содержит точки с одинаковой стоимостью расчета, что выравнивает загрузку исполнителей.
+    """
+    def length_key(index):
+        return tuple(points[index].get(name, 0) for name in LENGTH_PARAMETERS)
+
+    ordered = sorted(range(len(points)), key=lambda index: (length_key(index), tuple(sorted(points[index].items()))))
+    groups = []
+    for _, group in itertools.groupby(ordered, key=length_key):
+        group = list(group)
+        for start in range(0, len(group), chunk_size):
+            groups.append(group[start:start + chunk_size])
+    return groups
+
+
+def _make_signal_generator(point: dict, bits_source: BitsSourceType):
+    """
+    Генератор сигналов для точки пространства параметров.
+    """
+    kwargs = {STUDY_PARAMETERS[name]: value for name, value in point.items()}
+    signal_generator = SignalGenerator(**kwargs)
+    signal_generator.recalc_parameters()
+    signal_generator.bits_source = bits_source
+    return signal_generator
+
+
+def _calc_summaries(signal_generator: SignalGenerator, snr: float, average_count: int,
+                    correlation_type: CorrelationType, baseband_mode: BasebandMode, cfar_type: CfarType,
+                    seed_sequence: np.random.SeedSequence, delays: np.ndarray = None):
+    """
+    Итоговые показатели SUMMARY_COLUMNS для каждого вида модуляции при одном значении ОСШ.
+    """
+    min_t, max_t = get_confidence_interval(signal_generator)
+    bit_time = 1. / float(signal_generator.bits_per_second)
+    signal_generator.snr = float(snr)
+    statistics = {modulation_type: DelayErrorStatistics(signal_generator.time_delay, bit_time)
+                  for modulation_type in ModulationType}
+    detection = {modulation_type: DetectionCounts() for modulation_type in ModulationType}
+    counts = calc_good_counts(average_count, signal_generator, min_t, max_t, correlation_type, baseband_mode,
+                              seed_sequence, statistics=statistics, detection=detection, delays=delays,
+                              cfar_type=cfar_type)
+
+    summaries = {}
+    for modulation_type, good_count in counts.items():
+        summary = statistics[modulation_type].get_summary()
+        detection_summary = detection[modulation_type].get_summary()
+        summaries[modulation_type] = dict(good_count=good_count, bias=summary["bias"], rmse=summary["rmse"],
+                                          crb=summary["crb"], pd=detection_summary["pd"],
+                                          pfa=detection_summary["pfa"])
+    return summaries
+
+
+def _make_rows(parameters: dict, snr: float, average_count: int, summaries: dict):
+    """
+    Строки итоговой таблицы для одной точки и одного значения ОСШ.
+    """
+    return [dict(parameters, snr=snr, modulation=modulation_type.name, trials_count=average_count,
+                 probability=summary["good_count"] / average_count, **summary)
+            for modulation_type, summary in summaries.items()]
+
+
+def run_work_unit(unit: dict, bits_source: BitsSourceType = BitsSourceType.RANDOM,
+                  correlation_type: CorrelationType = CorrelationType.CC,
+                  baseband_mode: BasebandMode = BasebandMode.PASSBAND, seed: int = None,
+                  cfar_type: CfarType = CfarType.CA):
+    """
+    Расчет единицы работы в процессе-исполнителе: строки итоговой таблицы.
+
+    При заданном зерне подпотоки определяются только ОСШ и номером испытания (общие для всех модуляций),
+    поэтому результат не зависит от разбиения на единицы работы и числа процессов.
+    """
+    seed_sequence = get_seed_sequence(seed)
+    rows = []
+    for point in unit["points"]:
+        signal_generator = _make_signal_generator(point, bits_source)
+        parameters = {name: getattr(signal_generator, name) for name in STUDY_PARAMETERS}
+        for snr in unit["snr_values"]:
+            summaries = _calc_summaries(signal_generator, snr, unit["average_count"], correlation_type,
+                                        baseband_mode, cfar_type, seed_sequence)
+            rows.extend(_make_rows(parameters, snr, unit["average_count"], summaries))
+    return rows
+
+
+def run_shared_work_unit(task: SharedStudyTask):
+    """
+    Расчет группы точек с обменом через разделяемую память.
+
+    Параметры точек и значения ОСШ читаются из общих массивов без копирования; оценки задержки
+    всех испытаний, итоговые показатели и параметры точек записываются в общие массивы результатов.
+    Возвращаются только номера рассчитанных точек.
+    """
+    arrays = attach_arrays(task.arrays)
+    seed_sequence = get_seed_sequence(task.seed)
+    for index in task.point_indices:
+        # Незаданные параметры точки (NaN) принимают значения по умолчанию
+        point = {name: int(value) if name in INTEGER_PARAMETERS else float(value)
+                 for name, value in zip(STUDY_PARAMETERS, arrays["points"][index]) if not np.isnan(value)}
+        signal_generator = _make_signal_generator(point, task.bits_source)
+        arrays["parameters"][index] = [getattr(signal_generator, name) for name in STUDY_PARAMETERS]
+
+        for snr_index, snr in enumerate(arrays["snr_values"]):
+            summaries = _calc_summaries(signal_generator, snr, task.average_count, task.correlation_type,
+                                        task.baseband_mode, task.cfar_type, seed_sequence,
+                                        arrays["delays"][index, snr_index])
+            for modulation_index, modulation_type in enumerate(ModulationType):
+                arrays["summaries"][index, snr_index, modulation_index] = [
+                    np.nan if summaries[modulation_type][column] is None else summaries[modulation_type][column]
+                    for column in SUMMARY_COLUMNS]
+    return task.point_indices
+
+
+def _read_shared_rows(shared: SharedArrays, index: int, snr_values: list, average_count: int):
+    """
+    Строки итоговой таблицы точки по общим массивам результатов.
+    """
+    parameters = {name: int(value) if name in INTEGER_PARAMETERS else float(value)
+                  for name, value in zip(STUDY_PARAMETERS, shared.arrays["parameters"][index])}
+    rows = []
+    for snr_index, snr in enumerate(snr_values):
+        summaries = {}
+        for modulation_index, modulation_type in enumerate(ModulationType):
+            values = shared.arrays["summaries"][index, snr_index, modulation_index]
+            summary = {column: None if np.isnan(value) else float(value)
+                       for column, value in zip(SUMMARY_COLUMNS, values)}
+            summary["good_count"] = int(summary["good_count"])
+            summaries[modulation_type] = summary
+        rows.extend(_make_rows(parameters, snr, average_count, summaries))
+    return rows
+
+
+class StudyWriter:
+    """
+    Запись итоговой таблицы исследования (CSV - потоково, NPZ и Parquet - по завершении)
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.format = os.path.splitext(path)[1].lower().lstrip(".")
+        if self.format not in ("csv", "npz", "parquet"):
+            raise ValueError(f"Неподдерживаемый формат таблицы: {self.format}")
+
+        self.rows = []
+        self.delays = []
+        self._file = None
+        self._writer = None
+        if self.format == "csv":
+            self._file = open(path, "w", newline="", encoding="utf-8")
+            self._writer = csv.DictWriter(self._file, fieldnames=RESULT_COLUMNS)
+            self._writer.writeheader()
+
+    def write_rows(self, rows: list, delays: np.ndarray = None):
+        """
+        Добавление строк таблицы; оценки задержки испытаний (строки x испытания) сохраняются только в NPZ.
+        """
+        if self._writer is not None:
+            self._writer.writerows(rows)
+            self._file.flush()
+        else:
+            self.rows.extend(rows)
+            if delays is not None and self.format == "npz":
+                self.delays.append(np.array(delays))
+
+    def close(self):
+        """
+        Завершение записи таблицы.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        elif self.format == "npz":
+            arrays = {column: np.array([row[column] for row in self.rows]) for column in RESULT_COLUMNS}
+            if self.delays and sum(map(len, self.delays)) == len(self.rows):
+                arrays["delays"] = np.concatenate(self.delays)
+            np.savez(self.path, **arrays)
+        elif self.format == "parquet":
+            try:
+                import pandas as pd
+            except ImportError:
+                raise ImportError("Для записи в Parquet необходимы пакеты pandas и pyarrow")
+            pd.DataFrame(self.rows, columns=RESULT_COLUMNS).to_parquet(self.path, index=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def run_study(points: list, snr_values: list, average_count: int, output_path: str,
+              workers_count: int = None, bits_source: BitsSourceType = BitsSourceType.RANDOM,
+              correlation_type: CorrelationType = CorrelationType.CC,
+              baseband_mode: BasebandMode = BasebandMode.PASSBAND, seed: int = None,
+              cfar_type: CfarType = CfarType.CA):
+    """
+    Запуск исследования по набору точек пространства параметров на пуле процессов.
+
+    Параметры точек, сетка ОСШ и результаты (оценки задержки каждого испытания и итоговые показатели)
+    передаются через разделяемую память, исполнителям пересылаются только описания заданий,
+    поэтому объем сериализуемых данных не зависит от количества испытаний и длин сигналов.
+    """
+    groups = group_point_indices(points)
+    modulations_count = len(ModulationType)
+    with SharedArrays() as shared, StudyWriter(output_path) as writer, \
+            ProcessPoolExecutor(max_workers=workers_count, initializer=warm_up_kernels) as executor:
+        shared.put("points", np.array([[point.get(name, np.nan) for name in STUDY_PARAMETERS] for point in points],
+                                      dtype=float).reshape(len(points), len(STUDY_PARAMETERS)))
+        shared.put("snr_values", np.array(snr_values, dtype=float))
+        shared.create("parameters", (len(points), len(STUDY_PARAMETERS)), fill=np.nan)
+        shared.create("summaries", (len(points), len(snr_values), modulations_count, len(SUMMARY_COLUMNS)),
+                      fill=np.nan)
+        delays = shared.create("delays", (len(points), len(snr_values), modulations_count, average_count),
+                               np.float32, np.nan)
+
+        futures = [executor.submit(run_shared_work_unit, SharedStudyTask(shared.infos, group, average_count,
+                                                                          bits_source, correlation_type,
+                                                                          baseband_mode, cfar_type, seed))
+                   for group in groups]
+        for done_count, future in enumerate(as_completed(futures), start=1):
+            for index in future.result():
+                writer.write_rows(_read_shared_rows(shared, index, snr_values, average_count),
+                                  delays[index].reshape(-1, average_count))
+            print(f"Выполнено единиц работы: {done_count} из {len(groups)}")
+
+
+def _parse_grid_argument(value: str):
+    """
+    Разбор аргумента вида name=v1,v2,...
+    """
+    name, _, values = value.partition("=")
+    return name, [float(item) for item in values.split(",") if item]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пакетное исследование по сетке параметров")
+    parser.add_argument("--grid", action="append", default=[], type=_parse_grid_argument,
+                        help="Параметр и его значения: name=v1,v2,... (для lhs - name=min,max)")
+    parser.add_argument("--grid-type", choices=[grid_type.name.lower() for grid_type in GridType],
+                        default=GridType.CARTESIAN.name.lower())
+    parser.add_argument("--samples", type=int, default=None, help="Количество точек латинского гиперкуба")
+    parser.add_argument("--seed", type=int, default=None, help="Зерно сетки и случайных реализаций")
+    parser.add_argument("--snr", type=int, nargs=3, default=[10, -11, -1], metavar=("FROM", "TO", "STEP"))
+    parser.add_argument("--averages", type=int, default=100)
+    parser.add_argument("--cfar", choices=[cfar_type.name.lower() for cfar_type in CfarType],
+                        default=CfarType.CA.name.lower(), help="Вид CFAR-обнаружителя")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default="study.csv")
+    args = parser.parse_args()
+
+    points = expand_grid(dict(args.grid), GridType[args.grid_type.upper()], args.samples, args.seed)
+    run_study(points, list(range(*args.snr)), args.averages, args.output, args.workers, seed=args.seed,
+              cfar_type=CfarType[args.cfar.upper()])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,98 @@
+import hashlib
+import io
+import json
 import os
+import xml.etree.ElementTree as ElementTree
 
 
-def convert_ui_to_py():
-    pyuic_main_command = "pyuic5 ../ui/main.ui -o main_interface.py"
-    os.system(pyuic_main_command)
+# Исходные файлы интерфейса и генерируемые модули (пути относительно каталога src)
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+UI_FILE = "../ui/main.ui"
+RESOURCES_FILE = "../ui/resources.qrc"
+INTERFACE_MODULE = "main_interface.py"
+RESOURCES_MODULE = "resources_rc.py"
+BUILD_STAMP_FILE = "ui_build.json"
+
+
+def _get_path(path: str):
+    """
+    Абсолютный путь к файлу, заданному относительно каталога src.
+    """
+    return os.path.normpath(os.path.join(SRC_DIR, path))
+
+
+def _get_resource_files():
+    """
+    Список файлов, включенных в ресурсный файл Qt (пути относительно каталога src).
+    """
+    resources_dir = os.path.dirname(RESOURCES_FILE)
+    tree = ElementTree.parse(_get_path(RESOURCES_FILE))
+    return [os.path.join(resources_dir, item.text) for item in tree.iter("file")]
+
+
+def get_sources_hash():
+    """
+    Хэш исходных файлов интерфейса: формы, ресурсного файла и иконок.
+    """
+    digest = hashlib.sha256()
+    for path in [UI_FILE, RESOURCES_FILE] + _get_resource_files():
+        digest.update(path.encode("utf-8"))
+        with open(_get_path(path), "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def _read_build_stamp():
+    """
+    Хэш исходных файлов, из которых собраны текущие модули интерфейса.
+    """
+    try:
+        with open(_get_path(BUILD_STAMP_FILE), "r", encoding="utf-8") as file:
+            return json.load(file).get("sources_hash")
+    except (OSError, ValueError):
+        return None
+
+
+def _sources_exist():
+    return os.path.exists(_get_path(UI_FILE)) and os.path.exists(_get_path(RESOURCES_FILE))
+
+
+def is_ui_build_outdated():
+    """
+    Проверка без сборки: изменились ли исходные файлы интерфейса с прошлой сборки модулей.
+
+    Без исходных файлов используются ранее собранные модули, и они не считаются устаревшими.
+    """
+    if not _sources_exist():
+        return False
+    outputs_exist = os.path.exists(_get_path(INTERFACE_MODULE)) and os.path.exists(_get_path(RESOURCES_MODULE))
+    return not outputs_exist or _read_build_stamp() != get_sources_hash()
+
+
+def convert_ui_to_py(force: bool = False):
+    """
+    Сборка модулей интерфейса и ресурсов, если исходные файлы изменились с прошлой сборки.
+    """
+    if not _sources_exist() or not (force or is_ui_build_outdated()):
+        return False
+
+    from PyQt5 import uic, pyrcc_main
+
+    sources_hash = get_sources_hash()
+    # Форма передается в памяти, чтобы в заголовок модуля попал относительный путь, а не путь сборочной машины
+    with open(_get_path(UI_FILE), "rb") as file:
+        ui_form = io.BytesIO(file.read())
+    ui_form.name = UI_FILE
+    with open(_get_path(INTERFACE_MODULE), "w", encoding="utf-8") as file:
+        uic.compileUi(ui_form, file)
+    if not pyrcc_main.processResourceFile([_get_path(RESOURCES_FILE)], _get_path(RESOURCES_MODULE), False):
+        raise RuntimeError(f"Не удалось собрать ресурсы интерфейса из {RESOURCES_FILE}")
+
+    with open(_get_path(BUILD_STAMP_FILE), "w", encoding="utf-8") as file:
+        json.dump({"sources_hash": sources_hash}, file, indent=4)
+    return True
 
 
 if __name__ == "__main__":
-    convert_ui_to_py()
+    # Явная сборка интерфейса: python ui2py.py
+    convert_ui_to_py(force=True)
@@ -0,0 +1,9 @@
+from detection_predictor import PREDICTION_TOLERANCE, validate_prediction
+from signals_generator import SignalGenerator
+
+
+def test_prediction_matches_monte_carlo():
+    signal_generator = SignalGenerator(s_r=4000, b_count=10, bps=40)
+    rows = validate_prediction(signal_generator, [-8, -12, -16], 200, seed=1)
+    failed = [row for row in rows if not row["passed"]]
+    assert not failed, f"Прогноз вне допуска ±{PREDICTION_TOLERANCE:g} СКО: {failed}"
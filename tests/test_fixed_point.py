@@ -0,0 +1,24 @@
+import numpy as np
+
+from fixed_point import correlate_integer
+
+
+def correlate_direct(research_codes: np.ndarray, reference_codes: np.ndarray):
+    reference_len = reference_codes.shape[-1]
+    return np.array([[sum(int(x) * int(y) for x, y in zip(research[lag:lag + reference_len], reference))
+                      for lag in range(research.shape[-1] - reference_len + 1)]
+                     for research, reference in zip(research_codes, reference_codes)], dtype=object)
+
+
+def test_wide_codes_are_exact():
+    rng = np.random.default_rng(1)
+    research_codes = rng.integers(-2 ** 31, 2 ** 31, (2, 300))
+    reference_codes = rng.integers(-2 ** 20, 2 ** 20, (2, 100))
+    exact, overflows = correlate_integer(research_codes, reference_codes, 64)
+    assert np.array_equal(exact.astype(object), correlate_direct(research_codes, reference_codes))
+    assert not np.any(overflows)
+
+
+def test_wide_reference_with_unit_research_codes():
+    exact, _ = correlate_integer(-np.ones((1, 1000), dtype=np.int64), np.full((1, 500), 2 ** 40), 64)
+    assert np.all(exact == -500 * 2 ** 40)
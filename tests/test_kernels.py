@@ -0,0 +1,34 @@
+import pytest
+
+import kernels
+from enums import KernelBackend
+from kernels import KERNEL_PARITY_TOLERANCE, check_kernels_parity, use_kernel_backend, get_kernel_backend
+
+
+def assert_parity(backend: KernelBackend):
+    deviations = check_kernels_parity(backend)
+    assert deviations
+    failed = {check: deviation for check, deviation in deviations.items() if not deviation <= KERNEL_PARITY_TOLERANCE}
+    assert not failed, f"Отклонение ядер {backend.name} от NumPy: {failed}"
+
+
+def test_python_kernels_match_numpy():
+    assert_parity(KernelBackend.PYTHON)
+
+
+def test_numba_kernels_match_numpy():
+    pytest.importorskip("numba")
+    assert_parity(KernelBackend.NUMBA)
+
+
+def test_numba_backend_falls_back_to_numpy(monkeypatch):
+    monkeypatch.setattr(kernels, "numba", None)
+    with use_kernel_backend(KernelBackend.NUMBA):
+        assert get_kernel_backend() == KernelBackend.NUMPY
+        assert kernels.get_kernel("modulate") is None
+
+
+def test_unknown_backend_name(monkeypatch):
+    monkeypatch.setenv(kernels.KERNEL_BACKEND_ENV, "fortran")
+    with pytest.raises(ValueError):
+        kernels._get_default_backend()